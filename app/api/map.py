@@ -11,6 +11,7 @@ Endpoints:
 """
 
 from __future__ import annotations
+import asyncio
 import json
 import logging
 import os
@@ -45,8 +46,45 @@ router = APIRouter(prefix="/api", tags=["map"])
 # NEW ENDPOINTS FOR ISSUE #249: Map Bin-Level Visualization
 # ============================================================================
 
+def _resolve_run_day_dir(run_id: Optional[str], day: Optional[str]):
+    """
+    Day directory for a run/day, defaulting to the latest run and its first day.
+
+    Returns None when there is no run to default to (legacy reports/ layout);
+    an unknown requested day is a 404.
+    """
+    from app.utils.run_id import get_latest_run_id, get_run_directory, resolve_selected_day
+
+    try:
+        run_id = run_id or get_latest_run_id()
+    except Exception:
+        return None
+    if not run_id:
+        return None
+    try:
+        selected_day, _ = resolve_selected_day(run_id, day)
+    except ValueError as e:
+        if day:
+            raise HTTPException(status_code=404, detail=str(e))
+        return None
+    return get_run_directory(run_id) / selected_day
+
+
+def _load_stored_map_manifest(run_id: Optional[str], day: Optional[str]):
+    """Manifest written by the pipeline for a run/day, or None for legacy runs."""
+    from app.core.v2.map_manifest import load_map_manifest
+
+    day_dir = _resolve_run_day_dir(run_id, day)
+    if day_dir is None:
+        return None
+    return load_map_manifest(day_dir / "maps")
+
+
 @router.get("/map/manifest")
-async def get_map_manifest():
+async def get_map_manifest(
+    run_id: Optional[str] = Query(None, description="Run ID (defaults to latest)"),
+    day: Optional[str] = Query(None, description="Day code (fri|sat|sun|mon)"),
+):
     """
     Get map session metadata and configuration (Issue #249).
     
@@ -59,40 +97,29 @@ async def get_map_manifest():
     
     This endpoint provides everything the frontend needs to initialize
     the time slider and map layers.
+    
+    Served from the map_manifest.json written by the pipeline's map-data
+    phase; runs without that artifact fall back to computing it from the
+    latest reports/ bins.parquet and the run's segments metadata.
     """
     try:
-        # Load latest bin data to get window count
-        import pandas as pd
-        from pathlib import Path
+        stored = _load_stored_map_manifest(run_id, day)
+        if stored is not None:
+            return JSONResponse(content=stored)
         
-        # Find latest bins.parquet file
-        reports_dir = Path("reports")
-        latest_date_dir = None
-        if reports_dir.exists():
-            date_dirs = sorted([d for d in reports_dir.iterdir() if d.is_dir()], reverse=True)
-            for date_dir in date_dirs:
-                bins_file = date_dir / "bins.parquet"
-                if bins_file.exists():
-                    latest_date_dir = date_dir
-                    break
+        # Legacy runs: compute from the latest bins.parquet
+        from pathlib import Path
+        from app.core.v2.map_manifest import (
+            MapManifestError,
+            build_map_manifest,
+            load_segments_metadata,
+        )
         
+        latest_date_dir = _find_latest_bin_data_dir()
         if not latest_date_dir:
             raise HTTPException(status_code=404, detail="No bin data available. Generate density report first.")
         
-        # Load bins to get window count and segment list
-        bins_df = pd.read_parquet(latest_date_dir / "bins.parquet")
-        
-        # Calculate window count from unique time windows
-        window_count = len(bins_df[['t_start', 't_end']].drop_duplicates())
-        
-        # Calculate window duration (in seconds)
-        first_window = bins_df.iloc[0]
-        t_start = pd.to_datetime(first_window['t_start'])
-        t_end = pd.to_datetime(first_window['t_end'])
-        window_seconds = int((t_end - t_start).total_seconds())
-        
         from app.utils.run_id import get_latest_run_id
-        from app.utils.run_id import get_runflow_root
         from app.config.loader import load_analysis_context
 
         run_id = get_latest_run_id()
@@ -105,64 +132,16 @@ async def get_map_manifest():
         if not segments_path.exists():
             raise HTTPException(status_code=404, detail=f"Segments metadata not found at {segments_path}")
 
-        if segments_path.suffix == ".parquet":
-            segments_df = pd.read_parquet(segments_path)
-        else:
-            segments_df = pd.read_csv(segments_path)
-        
-        # Build segment index
-        segment_index = []
-        for _, seg in segments_df.iterrows():
-            segment_id = seg.get("segment_id") or seg.get("seg_id")
-            if not segment_id:
-                raise HTTPException(status_code=500, detail="Segments metadata missing segment_id")
-            schema_key = seg.get("schema") or seg.get("schema_key")
-            if not schema_key:
-                raise HTTPException(status_code=500, detail=f"Segment {segment_id} missing schema")
-            width_m = seg.get("width_m")
-            if width_m is None:
-                raise HTTPException(status_code=500, detail=f"Segment {segment_id} missing width_m")
-            seg_label = seg.get("seg_label")
-            if not seg_label:
-                raise HTTPException(status_code=500, detail=f"Segment {segment_id} missing seg_label")
-            segment_index.append({
-                "segment_id": segment_id,
-                "segment_label": seg_label,
-                "schema_key": schema_key,
-                "width_m": float(width_m)
-            })
-        
-        # LOD thresholds (from ChatGPT's Issue #249 guidance)
-        lod_thresholds = {
-            "segments_only": 12,
-            "flagged_bins": 14
-        }
-        
-        # Get date from directory name
-        date_str = latest_date_dir.name
-        
-        # Issue #254: Add rulebook version for consistency tracking
         try:
-            from app.rulebook import version
-            rb_version = version()
-        except Exception:
-            rb_version = "unknown"
-        
-        return JSONResponse(content={
-            "ok": True,
-            "date": date_str,
-            "window_count": window_count,
-            "window_seconds": window_seconds,
-            "lod": lod_thresholds,
-            "segments": segment_index,
-            "rulebook_version": rb_version,
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "source": "bins.parquet",
-                "total_segments": len(segment_index),
-                "rulebook_version": rb_version
-            }
-        })
+            manifest = build_map_manifest(
+                latest_date_dir / "bins.parquet",
+                load_segments_metadata(segments_path),
+                # Get date from directory name
+                date_str=latest_date_dir.name,
+            )
+        except MapManifestError as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return JSONResponse(content=manifest)
         
     except HTTPException:
         raise
@@ -316,14 +295,13 @@ async def get_map_segments():
 
 
 def _parse_bbox(bbox: str):
-    """Parse bounding box string into Shapely geometry."""
-    from shapely.geometry import box
+    """Parse bounding box string into a (minX, minY, maxX, maxY) tuple."""
     try:
         bbox_parts = bbox.split(",")
         if len(bbox_parts) != 4:
             raise ValueError
         minx, miny, maxx, maxy = map(float, bbox_parts)
-        return box(minx, miny, maxx, maxy)
+        return minx, miny, maxx, maxy
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="bbox must be 'minX,minY,maxX,maxY'")
 
@@ -343,82 +321,29 @@ def _find_latest_bin_data_dir():
     return None
 
 
-def _load_bin_geometries(data_dir):
-    """Load bin geometries from bins.geojson.gz."""
-    import json
-    import gzip
-    bin_geometries = {}
-    
-    try:
-        bins_geojson_path = data_dir / "bins.geojson.gz"
-        if bins_geojson_path.exists():
-            with gzip.open(bins_geojson_path, 'rt', encoding='utf-8') as f:
-                geojson_data = json.load(f)
-                for feature in geojson_data.get('features', []):
-                    props = feature.get('properties', {})
-                    bin_id = props.get('bin_id')
-                    geometry = feature.get('geometry')
-                    if bin_id and geometry:
-                        bin_geometries[bin_id] = geometry
-            logger.info(f"Loaded {len(bin_geometries)} bin geometries from geojson.gz")
-    except Exception as geom_error:
-        logger.warning(f"Could not load bin geometries: {geom_error}")
-    
-    return bin_geometries
-
-
-def _filter_bins_by_severity(window_bins, severity: str):
-    """Filter bins by severity level."""
-    severity_col = 'flag_severity' if 'flag_severity' in window_bins.columns else 'severity'
-    
-    if severity == "any":
-        return window_bins, severity_col
-    
-    if severity_col in window_bins.columns:
-        return window_bins[window_bins[severity_col] == severity], severity_col
-    
-    logger.warning("Severity filtering requested but severity column not in bins.parquet")
-    return window_bins, severity_col
-
-
-def _build_bin_feature(bin_row, window_idx: int, severity_col: str, bin_geometries: dict):
-    """Build a GeoJSON feature from bin data."""
-    import pandas as pd
-    
-    # Format times as HH:MM
-    t_start = pd.to_datetime(bin_row['t_start'])
-    t_end = pd.to_datetime(bin_row['t_end'])
-    t_start_hhmm = t_start.strftime('%H:%M')
-    t_end_hhmm = t_end.strftime('%H:%M')
-    
-    bin_id = bin_row['bin_id']
-    
-    return {
-        "type": "Feature",
-        "properties": {
-            "segment_id": bin_row['segment_id'],
-            "bin_id": bin_id,
-            "start_km": float(bin_row['start_km']),
-            "end_km": float(bin_row['end_km']),
-            "window_idx": int(window_idx),
-            "t_start_hhmm": t_start_hhmm,
-            "t_end_hhmm": t_end_hhmm,
-            "density": float(bin_row['density']),
-            "rate": float(bin_row['rate']),
-            "los_class": bin_row['los_class'],
-            "severity": bin_row.get(severity_col, 'none'),
-            "flag_reason": bin_row.get('flag_reason', 'none'),
-            "rate_per_m_per_min": bin_row.get('rate_per_m_per_min', 0.0)
-        },
-        "geometry": bin_geometries.get(bin_id)
-    }
+def _resolve_bin_data_dir(run_id: Optional[str], day: Optional[str]):
+    """
+    Bins directory for a run/day, with the same latest run/day default as the
+    map manifest; runs without one fall back to the latest legacy reports/
+    directory.
+    """
+    day_dir = _resolve_run_day_dir(run_id, day)
+    if day_dir is not None:
+        bins_dir = day_dir / "bins"
+        if (bins_dir / "bins.parquet").exists():
+            return bins_dir
+        if run_id or day:
+            return None
+    return _find_latest_bin_data_dir()
 
 
 @router.get("/map/bins")
 async def get_map_bins(
     window_idx: int = Query(..., description="Time window index (0-based)"),
-    bbox: str = Query(..., description="Bounding box: minX,minY,maxX,maxY (Web Mercator)"),
-    severity: str = Query("any", description="Severity filter: any|watch|critical")
+    bbox: str = Query(..., description="Bounding box: minX,minY,maxX,maxY (lon/lat or Web Mercator)"),
+    severity: str = Query("any", description="Severity filter: any|watch|critical"),
+    run_id: Optional[str] = Query(None, description="Run ID (defaults to latest)"),
+    day: Optional[str] = Query(None, description="Day code (fri|sat|sun|mon)"),
 ):
     """
     Get filtered bins for a specific time window and viewport (Issue #249).
@@ -432,9 +357,13 @@ async def get_map_bins(
     - bbox: Only bins intersecting the viewport
     - severity: Filter by operational severity
     
+    Bins are served from a resident per run/day tile index (STRtree over bin
+    geometries + window-major columns, see app.core.bin.tiles), so each call
+    is an index lookup rather than a reload of bins.parquet/bins.geojson.gz.
+    
     Returns GeoJSON FeatureCollection with bin polygons.
     """
-    import pandas as pd
+    from app.core.bin.tiles import get_bin_tile_index
     
     # Validate severity
     allowed_severity = {"any", "watch", "critical", "none"}
@@ -442,37 +371,19 @@ async def get_map_bins(
         raise HTTPException(status_code=400, detail=f"severity must be one of: {allowed_severity}")
     
     # Parse bounding box
-    bbox_geom = _parse_bbox(bbox)
+    bbox_bounds = _parse_bbox(bbox)
     
-    # Find latest bin data
-    latest_date_dir = _find_latest_bin_data_dir()
-    if not latest_date_dir:
+    bins_dir = _resolve_bin_data_dir(run_id, day)
+    if not bins_dir:
         raise HTTPException(status_code=404, detail="No bin data available")
     
-    # Load bins.parquet
-    bins_df = pd.read_parquet(latest_date_dir / "bins.parquet")
-    
-    # Filter by window_idx
-    bins_df['t_start_dt'] = pd.to_datetime(bins_df['t_start'])
-    min_time = bins_df['t_start_dt'].min()
-    window_duration = pd.to_datetime(bins_df.iloc[0]['t_end']) - bins_df.iloc[0]['t_start_dt']
-    bins_df['window_idx'] = ((bins_df['t_start_dt'] - min_time) / window_duration).astype(int)
+    # First request per run/day builds the index; later ones hit the cache
+    index = await asyncio.to_thread(get_bin_tile_index, bins_dir)
+    features = index.query(window_idx, bbox=bbox_bounds, severity=severity)
     
-    window_bins = bins_df[bins_df['window_idx'] == window_idx]
-    
-    if window_bins.empty:
+    if not features:
         return JSONResponse(content={"type": "FeatureCollection", "features": []})
     
-    # Load bin geometries
-    bin_geometries = _load_bin_geometries(latest_date_dir)
-    
-    # Filter by severity
-    window_bins, severity_col = _filter_bins_by_severity(window_bins, severity)
-    
-    # Build GeoJSON features
-    features = [_build_bin_feature(bin_row, window_idx, severity_col, bin_geometries) 
-                for _, bin_row in window_bins.iterrows()]
-    
     return JSONResponse(content={
         "type": "FeatureCollection",
         "features": features,
@@ -170,8 +170,12 @@ class V2ErrorResponse(BaseModel):
         status: Status string ("ERROR")
         code: HTTP error code (400, 404, 406, 422, 500)
         error: Error message with details
+        details: Optional per-row problems (e.g. file, row, runner_id) for validation errors
     """
     status: str = Field(default="ERROR", description="Status string")
     code: int = Field(..., description="HTTP error code (400, 404, 406, 422, 500)")
     error: str = Field(..., description="Error message with details")
+    details: Optional[List[Dict[str, Any]]] = Field(
+        default=None, description="Per-row validation problems, when available"
+    )
 
@@ -0,0 +1,131 @@
+"""
+Run-scoped input cache.
+
+One analysis run reads the same inputs (segments, flow, passes/locations,
+runner CSVs, GPX courses) from several phases. ``RunInputCache`` is owned by
+``AnalysisContext`` and loads each file once per run, handing out read-only
+views and recording load counts and bytes read for the performance summary.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+def _freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rebuild the frame on read-only column arrays so in-place writes raise.
+
+    Each NumPy-typed column is taken with ``to_numpy()`` (a view, no copy),
+    marked non-writeable and handed back to the constructor uncopied;
+    extension-typed columns (categoricals, nullable dtypes) are kept as-is.
+    """
+    columns = {}
+    for position in range(df.shape[1]):
+        column = df.iloc[:, position]
+        if isinstance(column.dtype, np.dtype):
+            values = column.to_numpy()
+            values.flags.writeable = False
+            columns[position] = values
+        else:
+            columns[position] = column.array
+    frozen = pd.DataFrame(columns, index=df.index, copy=False)
+    frozen.columns = df.columns
+    frozen.attrs = df.attrs
+    return frozen
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+class RunInputCache:
+    """
+    Load-once cache for one analysis run's input files.
+
+    DataFrames are stored with read-only backing arrays and returned as shallow
+    copies: callers may add, replace or drop columns on their copy, but in-place
+    value writes (``df.loc[...] = ...``) raise instead of corrupting the shared
+    frame. GPX courses are already read-only (see ``GPXCourse``).
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Tuple[str, str], Any] = {}
+        self._stats: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._lock = threading.RLock()
+
+    def _get(self, kind: str, path: PathLike, loader: Callable[[str], Any]) -> Any:
+        resolved = Path(path).resolve()
+        key = (kind, str(resolved))
+        with self._lock:
+            entry = self._stats.setdefault(key, {"loads": 0, "hits": 0, "bytes": 0})
+            if key in self._values:
+                entry["hits"] += 1
+                return self._values[key]
+            value = loader(str(resolved))
+            if isinstance(value, pd.DataFrame):
+                value = _freeze_frame(value)
+            entry["loads"] += 1
+            entry["bytes"] += _file_size(resolved)
+            self._values[key] = value
+            logger.debug("Input cache: loaded %s %s", kind, resolved)
+            return value
+
+    def _frame(self, kind: str, path: PathLike, loader: Callable[[str], pd.DataFrame]) -> pd.DataFrame:
+        return self._get(kind, path, loader).copy(deep=False)
+
+    def segments(self, path: PathLike) -> pd.DataFrame:
+        from app.io.loader import load_segments
+
+        return self._frame("segments", path, load_segments)
+
+    def flow(self, path: PathLike) -> pd.DataFrame:
+        return self._frame("flow", path, pd.read_csv)
+
+    def locations(self, path: PathLike) -> pd.DataFrame:
+        from app.io.loader import load_locations
+
+        return self._frame("locations", path, load_locations)
+
+    def runners(self, path: PathLike) -> pd.DataFrame:
+        from app.io.loader import load_runners_by_event
+
+        return self._frame("runners", path, load_runners_by_event)
+
+    def gpx_course(self, path: PathLike):
+        from app.core.gpx.processor import parse_gpx_file
+
+        return self._get("gpx", path, parse_gpx_file)
+
+    def courses(self, gpx_paths: Mapping[str, str]):
+        """``load_all_courses`` equivalent that parses each GPX file once per run."""
+        from app.core.gpx.processor import load_all_courses
+
+        return load_all_courses(dict(gpx_paths), parser=self.gpx_course)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-file load/hit counts and bytes read, for the performance summary."""
+        with self._lock:
+            files = [
+                {"kind": kind, "path": path, **entry}
+                for (kind, path), entry in sorted(self._stats.items())
+            ]
+        return {
+            "files": files,
+            "total_loads": sum(f["loads"] for f in files),
+            "total_hits": sum(f["hits"] for f in files),
+            "total_bytes": sum(f["bytes"] for f in files),
+        }
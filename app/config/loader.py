@@ -13,6 +13,8 @@ from typing import Any, Dict, Optional
 
 import pandas as pd
 
+from app.config.input_cache import RunInputCache
+
 
 class AnalysisConfigError(ValueError):
     """Raised when analysis.json is missing required fields or invalid."""
@@ -28,10 +30,8 @@ class AnalysisContext:
     segments_csv_path: Path
     flow_csv_path: Path
     locations_csv_path: Optional[Path]
-    segments_df: Optional[pd.DataFrame] = None
-    flow_df: Optional[pd.DataFrame] = None
-    locations_df: Optional[pd.DataFrame] = None
-    runners_df_by_event: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    # Run-scoped load-once cache for every input file (see app.config.input_cache)
+    inputs: RunInputCache = field(default_factory=RunInputCache, repr=False, compare=False)
 
     def runners_csv_path(self, event_name: str) -> Path:
         runners = self.data_files.get("runners", {})
@@ -53,41 +53,39 @@ class AnalysisContext:
             )
         return _resolve_path(str(gpx_path), self.data_dir)
 
-    def get_segments_df(self) -> pd.DataFrame:
-        if self.segments_df is None:
-            from app.io.loader import load_segments
+    def gpx_paths(self) -> Dict[str, str]:
+        """Lowercase event name -> GPX path for every event in analysis.json."""
+        events = self.analysis_config.get("events", [])
+        if not events:
+            raise AnalysisConfigError("analysis.json missing required field: events")
+        paths: Dict[str, str] = {}
+        for event in events:
+            event_name = event.get("name")
+            if not event_name:
+                raise AnalysisConfigError("analysis.json events missing name for GPX loading.")
+            paths[event_name.lower()] = str(self.gpx_path(event_name))
+        return paths
 
-            df = load_segments(str(self.segments_csv_path))
-            object.__setattr__(self, "segments_df", df)
-        return self.segments_df
+    def get_segments_df(self) -> pd.DataFrame:
+        return self.inputs.segments(self.segments_csv_path)
 
     def get_flow_df(self) -> pd.DataFrame:
-        if self.flow_df is None:
-            df = pd.read_csv(self.flow_csv_path)
-            if df.empty:
-                raise AnalysisConfigError("flow.csv must contain at least one row")
-            object.__setattr__(self, "flow_df", df)
-        return self.flow_df
+        df = self.inputs.flow(self.flow_csv_path)
+        if df.empty:
+            raise AnalysisConfigError("flow.csv must contain at least one row")
+        return df
 
     def get_locations_df(self) -> Optional[pd.DataFrame]:
         if self.locations_csv_path is None:
             return None
-        if self.locations_df is None:
-            from app.io.loader import load_locations
-
-            df = load_locations(str(self.locations_csv_path))
-            object.__setattr__(self, "locations_df", df)
-        return self.locations_df
+        return self.inputs.locations(self.locations_csv_path)
 
     def get_runners_df(self, event_name: str) -> pd.DataFrame:
-        event_key = event_name.lower()
-        if event_key not in self.runners_df_by_event:
-            from app.io.loader import load_runners_by_event
+        return self.inputs.runners(self.runners_csv_path(event_name))
 
-            runners_path = self.runners_csv_path(event_name)
-            df = load_runners_by_event(str(runners_path))
-            self.runners_df_by_event[event_key] = df
-        return self.runners_df_by_event[event_key]
+    def get_courses(self, gpx_paths: Optional[Dict[str, str]] = None):
+        """Parsed GPX courses keyed by lowercase event name (one parse per run)."""
+        return self.inputs.courses(gpx_paths if gpx_paths is not None else self.gpx_paths())
 
 
 def load_analysis_context(run_path: Path) -> AnalysisContext:
@@ -29,6 +29,15 @@ from app.common.config import load_reporting
 
 # Issue #283: Import SSOT for flagging logic parity
 from app import flagging as ssot_flagging
+from app.core.bin.rollup import (
+    FLAGS_COLUMNS,
+    SEGMENT_METRICS_COLUMNS,
+    first_bin_per_segment,
+    first_present,
+    flagged_durations_per_segment,
+    read_bins_columns,
+    worst_bin_per_segment,
+)
 
 
 def _load_bins_df(reports_root: Path, run_id: str) -> pd.DataFrame:
@@ -62,9 +71,9 @@ def _load_bins_df(reports_root: Path, run_id: str) -> pd.DataFrame:
 
 def _compute_peak_rate_per_segment(bins_df: pd.DataFrame) -> dict:
     """Compute peak rate per segment from bins.parquet."""
-    # idxmax per segment_id to grab the whole bin row
-    idx = bins_df.groupby("segment_id")["rate_p_s"].idxmax()
-    peaks = bins_df.loc[idx, ["segment_id", "rate_p_s", "start_km", "end_km", "t_end"]].copy()
+    # Max-rate bin row per segment_id (sort + drop_duplicates, same rows as idxmax)
+    peaks = worst_bin_per_segment(bins_df, "rate_p_s", "segment_id")
+    peaks = peaks[["segment_id", "rate_p_s", "start_km", "end_km", "t_end"]]
     
     # Build dict { seg_id: {peak_rate, peak_rate_time, peak_rate_km} }
     out = {}
@@ -145,7 +154,22 @@ def generate_meta_json(run_id: str, environment: str = "local") -> Dict[str, Any
     }
 
 
-def generate_segment_metrics_json(reports_dir: Path) -> Dict[str, Dict[str, Any]]:
+def _format_active_window(t_start: Any, t_end: Any) -> str:
+    """Format a bin's t_start/t_end as "HH:MM–HH:MM", or "N/A" if unparseable."""
+    if not (t_start and t_end):
+        return "N/A"
+    try:
+        start_dt = datetime.fromisoformat(str(t_start).replace('Z', '+00:00'))
+        end_dt = datetime.fromisoformat(str(t_end).replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        return "N/A"
+    return f"{start_dt.strftime('%H:%M')}–{end_dt.strftime('%H:%M')}"
+
+
+def generate_segment_metrics_json(
+    reports_dir: Path,
+    bins_df: Optional[pd.DataFrame] = None,
+) -> Dict[str, Dict[str, Any]]:
     """
     Generate segment_metrics.json from bins.parquet.
     
@@ -154,98 +178,69 @@ def generate_segment_metrics_json(reports_dir: Path) -> Dict[str, Dict[str, Any]
     
     Args:
         reports_dir: Path to reports/<run_id>/ directory
+        bins_df: Optional bins already in memory; skips reading bins.parquet
     
     Returns:
         Dictionary mapping seg_id to metrics
     """
-    parquet_path = reports_dir / "bins" / "bins.parquet"
+    if bins_df is None:
+        parquet_path = reports_dir / "bins" / "bins.parquet"
+        
+        if not parquet_path.exists():
+            print(f"Warning: {parquet_path} not found, returning empty metrics")
+            return {}
+        
+        # Only the columns needed for the worst-bin rollup
+        df = read_bins_columns(parquet_path, SEGMENT_METRICS_COLUMNS)
+    else:
+        df = bins_df
     
-    if not parquet_path.exists():
-        print(f"Warning: {parquet_path} not found, returning empty metrics")
+    # Use either 'segment_id' or 'seg_id' column
+    group_col = 'segment_id' if 'segment_id' in df.columns else 'seg_id'
+    if df.empty:
         return {}
     
-    # Read parquet
-    df = pd.read_parquet(parquet_path)
-    
-    # Group by segment_id and aggregate metrics
-    metrics = {}
+    # Issue #603: Worst bin by max density (same approach as load_density_metrics_from_bins),
+    # so all metrics (active_window, peak_rate, worst_los) come from the same bin
+    density_col = first_present(df, ('density', 'density_peak', 'density_mean'))
+    rate_col = first_present(df, ('rate', 'rate_p_s'))
+    if density_col is not None:
+        worst_rows = worst_bin_per_segment(df, density_col, group_col)
+    else:
+        # Fallback: use first bin if no density column found
+        worst_rows = first_bin_per_segment(df, group_col)
     
-    # Use either 'segment_id' or 'seg_id' column
-    group_col = 'segment_id' if 'segment_id' in df.columns else 'seg_id'
+    # schema_key comes from the first bin in each segment (all bins share it)
+    if 'schema_key' in df.columns:
+        first_rows = first_bin_per_segment(df, group_col)
+        schema_by_segment = dict(zip(first_rows[group_col], first_rows['schema_key']))
+    else:
+        schema_by_segment = None
     
-    for seg_id, group in df.groupby(group_col):
-        # Issue #603: Find worst bin by max density (same approach as load_density_metrics_from_bins)
-        # This ensures all metrics (active_window, peak_rate, worst_los) come from the same bin
-        if 'density' in group.columns:
-            worst_bin_idx = group['density'].idxmax() if len(group) > 0 else None
-        elif 'density_peak' in group.columns:
-            worst_bin_idx = group['density_peak'].idxmax() if len(group) > 0 else None
-        elif 'density_mean' in group.columns:
-            worst_bin_idx = group['density_mean'].idxmax() if len(group) > 0 else None
-        else:
-            worst_bin_idx = None
-        
-        if worst_bin_idx is None:
-            # Fallback: use first bin if no density column found
-            worst_bin_row = group.iloc[0] if len(group) > 0 else None
+    metrics = {}
+    for row in worst_rows.to_dict('records'):
+        seg_id = row[group_col]
+        # Issue #640: LOS must be present (computed via rulebook SSOT upstream)
+        if density_col is None:
+            if 'los_class' not in row:
+                raise ValueError("Missing los_class in bins.parquet; LOS must be computed upstream.")
             peak_density = 0.0
             peak_rate = 0.0
             active_window = "N/A"
         else:
-            worst_bin_row = group.loc[worst_bin_idx]
-            
-            # Extract peak_density from worst bin
-            if 'density' in worst_bin_row:
-                peak_density = float(worst_bin_row['density'])
-            elif 'density_peak' in worst_bin_row:
-                peak_density = float(worst_bin_row['density_peak'])
-            elif 'density_mean' in worst_bin_row:
-                peak_density = float(worst_bin_row['density_mean'])
-            else:
-                peak_density = 0.0
-            
-            # Issue #603: Extract peak_rate from worst bin (not separate calculation)
-            if 'rate' in worst_bin_row:
-                peak_rate = float(worst_bin_row['rate'])
-            elif 'rate_p_s' in worst_bin_row:
-                peak_rate = float(worst_bin_row['rate_p_s'])
-            else:
-                peak_rate = 0.0
-            
-            # Issue #603: Extract LOS from worst bin (not recalculated)
-            # Issue #640: LOS must be present (computed via rulebook SSOT upstream)
-            if 'los_class' not in worst_bin_row or not worst_bin_row['los_class']:
+            if 'los_class' not in row or not row['los_class']:
                 raise ValueError(f"Missing los_class for segment {seg_id} worst bin; LOS must be computed upstream via rulebook SSOT.")
-            worst_los = str(worst_bin_row['los_class'])
-            
-            # Issue #603: Extract active_window from worst bin's t_start/t_end
-            active_window = "N/A"
-            t_start = worst_bin_row.get("t_start", "")
-            t_end = worst_bin_row.get("t_end", "")
-            if t_start and t_end:
-                try:
-                    from datetime import datetime
-                    start_dt = datetime.fromisoformat(str(t_start).replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(str(t_end).replace('Z', '+00:00'))
-                    start_str = start_dt.strftime("%H:%M")
-                    end_str = end_dt.strftime("%H:%M")
-                    active_window = f"{start_str}–{end_str}"
-                except (ValueError, TypeError) as e:
-                    pass  # Fallback to "N/A" if parsing fails
+            peak_density = float(row[density_col])
+            # Issue #603: peak_rate from worst bin (not separate calculation)
+            peak_rate = float(row[rate_col]) if rate_col is not None else 0.0
+            # Issue #603: active_window from worst bin's t_start/t_end
+            active_window = _format_active_window(row.get("t_start", ""), row.get("t_end", ""))
+        # Issue #603: LOS from worst bin (not recalculated)
+        worst_los = str(row['los_class'])
         
-        if worst_bin_row is None:
-            raise ValueError("Missing bins for segment; cannot determine los_class.")
-
-        if 'los_class' not in worst_bin_row:
-            raise ValueError("Missing los_class in bins.parquet; LOS must be computed upstream.")
-
-        if worst_bin_idx is None:
-            worst_los = str(worst_bin_row['los_class'])
-
-        # Get schema_key from the first bin in the group (all bins in a segment should have the same schema_key)
-        if 'schema_key' not in group.columns:
+        if schema_by_segment is None:
             raise ValueError("bins.parquet missing schema_key column for segment metrics.")
-        schema_key = group['schema_key'].iloc[0]
+        schema_key = schema_by_segment[seg_id]
         if not schema_key:
             raise ValueError(f"Segment {seg_id} missing schema_key in bins.parquet.")
         
@@ -261,7 +256,11 @@ def generate_segment_metrics_json(reports_dir: Path) -> Dict[str, Dict[str, Any]
 
 
 
-def generate_flags_json(reports_dir: Path, segment_metrics: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+def generate_flags_json(
+    reports_dir: Path,
+    segment_metrics: Dict[str, Dict[str, Any]],
+    bins_df: Optional[pd.DataFrame] = None,
+) -> List[Dict[str, Any]]:
     """
     Generate flags.json from SSOT (Issue #283 fix).
     
@@ -271,6 +270,7 @@ def generate_flags_json(reports_dir: Path, segment_metrics: Dict[str, Dict[str,
     Args:
         reports_dir: Path to reports/<run_id>/ directory
         segment_metrics: Dictionary of segment metrics (for enrichment)
+        bins_df: Optional bins already in memory; skips reading bins.parquet
     
     Returns:
         Array of flag objects with canonical names + legacy aliases
@@ -278,14 +278,15 @@ def generate_flags_json(reports_dir: Path, segment_metrics: Dict[str, Dict[str,
     print("   📊 Generating flags.json from SSOT (Issue #283 fix)...")
     
     try:
-        # Load bins.parquet (authoritative source)
-        bins_path = reports_dir / "bins" / "bins.parquet"
-        if not bins_path.exists():
-            print(f"   ⚠️ bins.parquet not found at {bins_path}, returning empty flags")
-            return []
-        
-        bins_df = pd.read_parquet(bins_path)
-        print(f"   📊 Loaded {len(bins_df)} bins from bins.parquet")
+        if bins_df is None:
+            # Load bins.parquet (authoritative source), only the flagging columns
+            bins_path = reports_dir / "bins" / "bins.parquet"
+            if not bins_path.exists():
+                print(f"   ⚠️ bins.parquet not found at {bins_path}, returning empty flags")
+                return []
+            
+            bins_df = read_bins_columns(bins_path, FLAGS_COLUMNS)
+            print(f"   📊 Loaded {len(bins_df)} bins from bins.parquet")
         
         # Issue #694: Calculate total_bins per segment for flagged bin percentage and duration metrics
         # Normalize segment_id column name (could be 'segment_id' or 'seg_id')
@@ -309,6 +310,9 @@ def generate_flags_json(reports_dir: Path, segment_metrics: Dict[str, Dict[str,
         else:
             flagged_bins_df = pd.DataFrame()
         
+        # Duration metrics for every flagged segment in one grouped pass
+        flagged_durations = flagged_durations_per_segment(flagged_bins_df, segment_col)
+        
         # Use SSOT to compute and summarize flags
         bin_flags = ssot_flagging.compute_bin_flags(bins_df)
         summary = ssot_flagging.summarize_flags(bin_flags)
@@ -330,25 +334,7 @@ def generate_flags_json(reports_dir: Path, segment_metrics: Dict[str, Dict[str,
             flagged_bin_percentage = (flagged_bins / total_bins * 100.0) if total_bins > 0 else 0.0
             
             # Calculate duration metrics from flagged bins
-            flagged_duration_seconds = 0.0
-            flagged_span_duration_seconds = 0.0
-            if flagged_bins_df is not None and len(flagged_bins_df) > 0:
-                seg_flagged = flagged_bins_df[flagged_bins_df[segment_col] == seg_id]
-                if len(seg_flagged) > 0 and 't_start' in seg_flagged.columns and 't_end' in seg_flagged.columns:
-                    # Filter out invalid timestamps
-                    seg_flagged_valid = seg_flagged[
-                        seg_flagged['t_start'].notna() & seg_flagged['t_end'].notna()
-                    ]
-                    if len(seg_flagged_valid) > 0:
-                        # Calculate total duration (sum of all flagged bin durations)
-                        durations = (seg_flagged_valid['t_end'] - seg_flagged_valid['t_start']).dt.total_seconds()
-                        flagged_duration_seconds = float(durations.sum())
-                        
-                        # Calculate span duration (first to last flagged bin)
-                        first_start = seg_flagged_valid['t_start'].min()
-                        last_end = seg_flagged_valid['t_end'].max()
-                        if pd.notna(first_start) and pd.notna(last_end):
-                            flagged_span_duration_seconds = float((last_end - first_start).total_seconds())
+            flagged_duration_seconds, flagged_span_duration_seconds = flagged_durations.get(seg_id, (0.0, 0.0))
             
             flag_entry = {
                 # Canonical names (Issue #283)
@@ -714,7 +700,7 @@ def generate_segments_geojson(reports_dir: Path, analysis_context: Optional[Any]
     Returns:
         GeoJSON FeatureCollection with real course coordinates in Web Mercator (EPSG:3857)
     """
-    from app.core.gpx.processor import load_all_courses, generate_segment_coordinates, create_geojson_from_segments
+    from app.core.gpx.processor import generate_segment_coordinates, create_geojson_from_segments
     from pyproj import Transformer
     from app.utils.run_id import get_runflow_root
     
@@ -789,7 +775,7 @@ def generate_segments_geojson(reports_dir: Path, analysis_context: Optional[Any]
         if not event_name:
             raise ValueError("analysis.json events missing name for GPX loading in generate_segments_geojson.")
         gpx_paths[event_name.lower()] = str(analysis_context.gpx_path(event_name))
-    courses = load_all_courses(gpx_paths)
+    courses = analysis_context.get_courses(gpx_paths)
     
     # Load segments data to get segment definitions
     try:
@@ -16,6 +16,7 @@ Epic: RF-FE-002 | Issue: #280
 
 import json
 import pandas as pd
+import pyarrow.parquet as pq
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
@@ -27,12 +28,28 @@ import sys
 # Add parent directory to path for imports
 
 from app.common.config import load_rulebook, load_reporting
+from app.core.artifacts.image_cache import (
+    evict_image_cache,
+    image_cache_key,
+    restore_cached_image,
+    store_cached_image,
+)
+from app.core.bin.rollup import read_bins_columns
 # Issue #466 Step 2: Storage consolidated to app.storage=None
 
 HEATMAP_POWER_NORM_GAMMA = 0.5
 HEATMAP_NAN_COLOR = "white"
 HEATMAP_DENSITY_VMIN = 0
 HEATMAP_DENSITY_VMAX = 2.0
+HEATMAP_DPI = 150
+HEATMAP_FIGSIZE = (12, 6)
+# Bump when the drawing code changes so cached heatmaps are not reused
+HEATMAP_CACHE_VERSION = 1
+# bins.parquet columns read for heatmaps and captions (aliases included)
+HEATMAP_BINS_COLUMNS = (
+    "segment_id", "t_start", "t_end", "start_time", "end_time",
+    "start_km", "end_km", "from_km", "to_km", "density",
+)
 
 
 def _assert_heatmap_invariants(norm: mcolors.Normalize, cmap: mcolors.Colormap) -> None:
@@ -87,18 +104,19 @@ def load_bin_data(reports_dir: Path) -> pd.DataFrame:
         raise FileNotFoundError(f"bins.parquet not found at {bins_path}")
     
     print(f"   📊 Loading bin data from {bins_path}")
-    df = pd.read_parquet(bins_path)
-    print(f"   📊 Loaded {len(df)} bins from parquet")
+    parquet_file = pq.ParquetFile(bins_path)
+    total_bins = parquet_file.metadata.num_rows
+    has_severity = 'flag_severity' in parquet_file.schema_arrow.names
+    print(f"   📊 Loaded {total_bins} bins from parquet")
     
     # Filter to flagged bins only (Issue #280 alignment)
     # This creates more whitespace by only showing operationally significant bins
-    if 'flag_severity' in df.columns:
-        filtered_bins = df[df['flag_severity'] != 'none'].copy()
-        print(f"   📊 Filtered to {len(filtered_bins)} flagged bins (removed {len(df) - len(filtered_bins)} unflagged)")
-        return filtered_bins
+    df = read_bins_columns(bins_path, HEATMAP_BINS_COLUMNS, flagged_only=True)
+    if has_severity:
+        print(f"   📊 Filtered to {len(df)} flagged bins (removed {total_bins - len(df)} unflagged)")
     else:
         print(f"   ⚠️  flag_severity column not found, using all bins (no filtering)")
-        return df
+    return df
 
 
 
@@ -144,7 +162,7 @@ def _setup_heatmap_plot(matrix, times, distances, seg_id, los_cmap):
     """Set up matplotlib heatmap plot."""
     import matplotlib.pyplot as plt
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = plt.subplots(figsize=HEATMAP_FIGSIZE)
     matrix_transposed = matrix.T
     los_cmap.set_bad(color=HEATMAP_NAN_COLOR)
     norm = mcolors.PowerNorm(
@@ -208,6 +226,24 @@ def _format_heatmap_axes(ax, times, distances):
     ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
 
 
+def _heatmap_cache_key(seg_id, times, distances, matrix, los_colors) -> str:
+    """Image cache key over the heatmap matrix, axes, palette and render settings."""
+    import matplotlib
+
+    return image_cache_key(
+        "heatmap",
+        HEATMAP_CACHE_VERSION,
+        matplotlib.__version__,
+        str(seg_id),
+        [str(t) for t in times],
+        [float(d) for d in distances],
+        np.asarray(matrix, dtype=float),
+        los_colors,
+        [HEATMAP_POWER_NORM_GAMMA, HEATMAP_NAN_COLOR, HEATMAP_DENSITY_VMIN,
+         HEATMAP_DENSITY_VMAX, HEATMAP_DPI, HEATMAP_FIGSIZE],
+    )
+
+
 def generate_segment_heatmap(
     seg_id: str, 
     bins_df: pd.DataFrame, 
@@ -266,6 +302,12 @@ def generate_segment_heatmap(
             except (ValueError, TypeError):
                 continue
         
+        # Issue #280 follow-up: reuse an identical earlier render
+        cache_key = _heatmap_cache_key(seg_id, times, distances, matrix, los_colors)
+        if restore_cached_image(cache_key, output_path):
+            print(f"   ♻️  {seg_id}: Reused cached heatmap")
+            return True
+        
         # Create heatmap
         los_cmap = create_los_colormap(los_colors)
         fig, ax, im = _setup_heatmap_plot(matrix, times, distances, seg_id, los_cmap)
@@ -277,10 +319,12 @@ def generate_segment_heatmap(
         cbar = plt.colorbar(im, ax=ax)
         cbar.set_label('Density (persons / m²)')
         
-        # Save PNG
+        # Save PNG (unlink first: the old file may be hard-linked to a cache entry)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
+        output_path.unlink(missing_ok=True)
+        plt.savefig(output_path, dpi=HEATMAP_DPI, bbox_inches='tight')
         plt.close()
+        store_cached_image(cache_key, output_path)
         
         return True
         
@@ -765,6 +809,8 @@ def export_heatmaps_and_captions(
             print(f"   ⚠️  {seg_id}: Error generating heatmap: {e}")
             continue
     
+    evict_image_cache()
+    
     # Generate captions
     print("\n8️⃣  Generating captions...")
     captions = {}
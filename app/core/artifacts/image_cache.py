@@ -0,0 +1,216 @@
+"""
+Content-addressed cache for rendered artifact images (heatmaps, segment maps,
+finish-area charts).
+
+Re-running an analysis after changing one event's start time usually leaves
+most segments' bins, LOS colours and geometry untouched, yet every PNG was
+redrawn. Renderers now hash exactly what they draw (matrix/geometry plus
+rendering parameters) with :func:`image_cache_key`; on a hit the cached PNG is
+hard-linked (or copied) into the run, on a miss the fresh render is stored.
+
+Layout: ``{cache_dir}/{key[:2]}/{key}.png``. The cache lives under
+``{runflow_root}/cache/images`` unless ``RUNFLOW_IMAGE_CACHE_DIR`` is set, and
+is bounded by ``RUNFLOW_IMAGE_CACHE_MAX_MB`` (default 512; 0 disables it).
+Eviction drops least-recently-used entries (hits refresh an entry's mtime).
+
+Cache problems never fail an export: every operation logs and falls back to
+rendering.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IMAGE_CACHE_MAX_MB = 512.0
+_IMAGE_SUFFIX = ".png"
+
+
+def _get_max_bytes() -> int:
+    """Size bound of the image cache in bytes (RUNFLOW_IMAGE_CACHE_MAX_MB)."""
+    raw_value = os.getenv("RUNFLOW_IMAGE_CACHE_MAX_MB", "").strip()
+    max_mb = DEFAULT_IMAGE_CACHE_MAX_MB
+    if raw_value:
+        try:
+            max_mb = float(raw_value)
+        except ValueError:
+            logger.warning(
+                f"Invalid RUNFLOW_IMAGE_CACHE_MAX_MB value '{raw_value}', using default {max_mb}"
+            )
+    return max(int(max_mb * 1024 * 1024), 0)
+
+
+def get_image_cache_dir() -> Path:
+    """Directory holding cached images (RUNFLOW_IMAGE_CACHE_DIR or runflow/cache/images)."""
+    override = os.getenv("RUNFLOW_IMAGE_CACHE_DIR", "").strip()
+    if override:
+        return Path(override)
+    from app.utils.run_id import get_runflow_root
+
+    return get_runflow_root() / "cache" / "images"
+
+
+def image_cache_enabled() -> bool:
+    return _get_max_bytes() > 0
+
+
+def _update_digest(digest: Any, part: Any) -> None:
+    if isinstance(part, np.ndarray):
+        array = np.ascontiguousarray(part)
+        digest.update(f"ndarray:{array.dtype.str}:{array.shape}".encode("utf-8"))
+        digest.update(array.tobytes())
+    elif isinstance(part, bytes):
+        digest.update(b"bytes:" + part)
+    else:
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(b"\0")
+
+
+def image_cache_key(kind: str, *parts: Any) -> str:
+    """
+    Fingerprint of everything an image is drawn from.
+
+    ``parts`` may be numpy arrays (hashed by dtype, shape and raw bytes),
+    bytes, or JSON-serialisable values (hashed as sorted-key JSON).
+    """
+    digest = hashlib.sha256(kind.encode("utf-8") + b"\0")
+    for part in parts:
+        _update_digest(digest, part)
+    return digest.hexdigest()
+
+
+def _entry_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / key[:2] / f"{key}{_IMAGE_SUFFIX}"
+
+
+def _replace_with(entry: Path, output_path: Path) -> None:
+    """Point ``output_path`` at ``entry``: hard link, else copy."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.unlink(missing_ok=True)
+    try:
+        os.link(entry, output_path)
+    except OSError:
+        shutil.copyfile(entry, output_path)
+
+
+def restore_cached_image(key: str, output_path: Path) -> bool:
+    """Materialise a cached image at ``output_path``; False on a miss."""
+    if not image_cache_enabled():
+        return False
+    try:
+        entry = _entry_path(get_image_cache_dir(), key)
+        if not entry.is_file():
+            return False
+        _replace_with(entry, Path(output_path))
+        os.utime(entry)
+        return True
+    except OSError as e:
+        logger.warning(f"Image cache read failed for {output_path}: {e}")
+        return False
+
+
+def load_cached_image_bytes(key: str) -> Optional[bytes]:
+    """Cached image bytes for renderers that embed rather than write a PNG."""
+    if not image_cache_enabled():
+        return None
+    try:
+        entry = _entry_path(get_image_cache_dir(), key)
+        if not entry.is_file():
+            return None
+        data = entry.read_bytes()
+        os.utime(entry)
+        return data
+    except OSError as e:
+        logger.warning(f"Image cache read failed for {key}: {e}")
+        return None
+
+
+def _write_entry(key: str, write: Any) -> None:
+    """Atomically create the entry for ``key`` via ``write(tmp_name)``."""
+    entry = _entry_path(get_image_cache_dir(), key)
+    if entry.is_file():
+        return
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=entry.parent, prefix=key[:8], suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_name)
+        os.replace(tmp_name, entry)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def store_cached_image(key: str, source_path: Path) -> None:
+    """
+    Copy a freshly rendered image into the cache.
+
+    The entry is a copy (written atomically), not a link, so later writes to
+    ``source_path`` can never alter cached bytes.
+    """
+    if not image_cache_enabled():
+        return
+    try:
+        _write_entry(key, lambda tmp_name: shutil.copyfile(source_path, tmp_name))
+    except OSError as e:
+        logger.warning(f"Image cache write failed for {source_path}: {e}")
+
+
+def store_cached_image_bytes(key: str, data: bytes) -> None:
+    """Store rendered PNG bytes (see :func:`load_cached_image_bytes`)."""
+    if not image_cache_enabled():
+        return
+    try:
+        _write_entry(key, lambda tmp_name: Path(tmp_name).write_bytes(data))
+    except OSError as e:
+        logger.warning(f"Image cache write failed for {key}: {e}")
+
+
+def evict_image_cache(max_bytes: Optional[int] = None) -> int:
+    """
+    Delete least-recently-used entries until the cache fits ``max_bytes``.
+
+    Defaults to the RUNFLOW_IMAGE_CACHE_MAX_MB bound (no-op when the cache
+    is disabled). Returns the number of
+    entries removed. Run directories keep their hard-linked copies.
+    """
+    if max_bytes is None:
+        if not image_cache_enabled():
+            return 0
+        max_bytes = _get_max_bytes()
+    cache_dir = get_image_cache_dir()
+    if not cache_dir.is_dir():
+        return 0
+
+    entries = []
+    total = 0
+    for entry in cache_dir.glob(f"*/*{_IMAGE_SUFFIX}"):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total += stat.st_size
+
+    removed = 0
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    if removed:
+        logger.debug(f"Image cache evicted {removed} entries ({total} bytes remain)")
+    return removed
@@ -2,7 +2,8 @@
 Segment map snapshot generator.
 
 Creates per-segment PNG images with LOS-colored polylines and start/end markers.
-Uses Carto Light tiles to match UI basemap styling.
+Uses Carto Light tiles to match UI basemap styling, read from the local tile
+store (app/core/artifacts/tile_store.py; seed with scripts/seed_map_tiles.py).
 """
 
 from __future__ import annotations
@@ -10,21 +11,28 @@ from __future__ import annotations
 import io
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-import requests
 from PIL import Image, ImageDraw, ImageFont
 from pyproj import Transformer
 
 from app.common.config import load_reporting
-from app.utils.constants import LOCATION_MAP_TILE_SUBDOMAINS, LOCATION_MAP_TILE_URL
+from app.core.artifacts.image_cache import (
+    evict_image_cache,
+    image_cache_key,
+    restore_cached_image,
+    store_cached_image,
+)
+from app.core.artifacts.tile_store import TileKey, load_tile_bytes
+from app.utils.constants import LOCATION_MAP_TILE_URL
 
 logger = logging.getLogger(__name__)
 
 _TILE_SIZE = 256
-_TILE_SUBDOMAINS = LOCATION_MAP_TILE_SUBDOMAINS
 _TILE_URL = LOCATION_MAP_TILE_URL
+_TILE_LOAD_WORKERS = 8
 
 _MAP_SIZE = (900, 520)
 _MAP_PADDING_PX = 36
@@ -34,6 +42,8 @@ _LINE_WIDTH_PX = 4
 _LINE_OUTLINE_PX = 7
 _MARKER_RADIUS_PX = 6
 _MARKER_OUTLINE_PX = 2
+# Bump when the drawing code changes so cached snapshots are not reused
+_SEGMENT_MAP_CACHE_VERSION = 1
 
 
 def export_segment_map_pngs(
@@ -87,13 +97,32 @@ def export_segment_map_pngs(
             raise ValueError(f"Segment {seg_id} has no geometry coordinates.")
 
         output_path = output_dir / f"{seg_id}.png"
-        _render_segment_snapshot(coords, color, output_path, seg_id)
+        cache_key = _segment_map_cache_key(coords, color)
+        if not restore_cached_image(cache_key, output_path):
+            # Only snapshots drawn over a complete basemap are cached, so a
+            # tile outage is not replayed into later runs.
+            if _render_segment_snapshot(coords, color, output_path, seg_id):
+                store_cached_image(cache_key, output_path)
         count += 1
 
+    evict_image_cache()
     logger.debug(f"Segment maps generated — Count: {count} PNG files — Location: {output_dir}")
     return count
 
 
+def _segment_map_cache_key(coords: Sequence[Tuple[float, float]], line_color: str) -> str:
+    """Image cache key over the geometry, line colour, basemap and render settings."""
+    return image_cache_key(
+        "segment_map",
+        _SEGMENT_MAP_CACHE_VERSION,
+        [[lon, lat] for lon, lat in coords],
+        line_color,
+        _TILE_URL,
+        [_MAP_SIZE, _MAP_PADDING_PX, _MAP_MIN_ZOOM, _MAP_MAX_ZOOM, _LINE_WIDTH_PX,
+         _LINE_OUTLINE_PX, _MARKER_RADIUS_PX, _MARKER_OUTLINE_PX],
+    )
+
+
 def _validate_los_colors(los_colors: Dict[str, str]) -> None:
     missing = [grade for grade in ["A", "B", "C", "D", "E", "F"] if grade not in los_colors]
     if missing:
@@ -141,20 +170,16 @@ def _render_segment_snapshot(
     line_color: str,
     output_path: Path,
     seg_id: str
-) -> None:
-    min_lon, max_lon, min_lat, max_lat = _coords_bounds(coords)
-    if min_lon == max_lon or min_lat == max_lat:
-        min_lon, max_lon, min_lat, max_lat = _pad_bounds(min_lon, max_lon, min_lat, max_lat)
-
-    zoom = _select_zoom(min_lon, max_lon, min_lat, max_lat)
-    center_lon = (min_lon + max_lon) / 2
-    center_lat = (min_lat + max_lat) / 2
+) -> bool:
+    """Draw one snapshot; returns True when every basemap tile was available."""
+    zoom, center_lat, center_lon = _snapshot_view(coords)
 
     try:
-        img, top_left_x, top_left_y = _render_map_tiles(center_lat, center_lon, zoom, _MAP_SIZE)
+        img, top_left_x, top_left_y, complete = _render_map_tiles(center_lat, center_lon, zoom, _MAP_SIZE)
     except Exception as exc:
         logger.warning(f"Segment {seg_id}: Map tiles unavailable ({exc}); using placeholder.")
         img, top_left_x, top_left_y = _render_placeholder(_MAP_SIZE)
+        complete = False
 
     draw = ImageDraw.Draw(img)
     pixel_points = [
@@ -168,7 +193,54 @@ def _render_segment_snapshot(
 
     _draw_start_end_markers(draw, pixel_points, line_color)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Unlink first: the old file may be hard-linked to an image cache entry
+    output_path.unlink(missing_ok=True)
     img.save(output_path, format="PNG")
+    return complete
+
+
+def _snapshot_view(coords: Sequence[Tuple[float, float]]) -> Tuple[int, float, float]:
+    """Zoom and centre (lat, lon) that frame a segment's geometry."""
+    min_lon, max_lon, min_lat, max_lat = _coords_bounds(coords)
+    if min_lon == max_lon or min_lat == max_lat:
+        min_lon, max_lon, min_lat, max_lat = _pad_bounds(min_lon, max_lon, min_lat, max_lat)
+
+    zoom = _select_zoom(min_lon, max_lon, min_lat, max_lat)
+    center_lon = (min_lon + max_lon) / 2
+    center_lat = (min_lat + max_lat) / 2
+    return zoom, center_lat, center_lon
+
+
+def snapshot_tiles(segments_geojson: Dict[str, Any]) -> Set[TileKey]:
+    """Basemap tiles (z, x, y) that segment snapshots of this geojson draw on."""
+    tiles: Set[TileKey] = set()
+    features = segments_geojson.get("features", []) if isinstance(segments_geojson, dict) else []
+    for feature in features:
+        coords = _extract_feature_coords(feature)
+        if not coords:
+            continue
+        zoom, center_lat, center_lon = _snapshot_view(coords)
+        _, _, tile_range = _tile_window(center_lat, center_lon, zoom, _MAP_SIZE)
+        tiles.update((zoom, x, y) for x, y in tile_range)
+    return tiles
+
+
+def bbox_tiles(
+    min_lon: float,
+    min_lat: float,
+    max_lon: float,
+    max_lat: float,
+    zooms: Iterable[int],
+) -> Set[TileKey]:
+    """All tiles (z, x, y) covering a lon/lat bbox at each zoom."""
+    tiles: Set[TileKey] = set()
+    for zoom in zooms:
+        x0, y0 = _latlon_to_pixels(max_lat, min_lon, zoom)
+        x1, y1 = _latlon_to_pixels(min_lat, max_lon, zoom)
+        for x in range(int(x0 // _TILE_SIZE), int(x1 // _TILE_SIZE) + 1):
+            for y in range(int(y0 // _TILE_SIZE), int(y1 // _TILE_SIZE) + 1):
+                tiles.add((zoom, x, y))
+    return tiles
 
 
 def _coords_bounds(coords: Sequence[Tuple[float, float]]) -> Tuple[float, float, float, float]:
@@ -201,12 +273,13 @@ def _select_zoom(min_lon: float, max_lon: float, min_lat: float, max_lat: float)
     return _MAP_MIN_ZOOM
 
 
-def _render_map_tiles(
+def _tile_window(
     lat: float,
     lon: float,
     zoom: int,
     size: Tuple[int, int]
-) -> Tuple[Image.Image, float, float]:
+) -> Tuple[float, float, List[Tuple[int, int]]]:
+    """Top-left world pixel of the image and the (x, y) tiles it covers."""
     width_px, height_px = size
     center_x, center_y = _latlon_to_pixels(lat, lon, zoom)
     top_left_x = center_x - width_px / 2
@@ -216,21 +289,41 @@ def _render_map_tiles(
     y_start = int(math.floor(top_left_y / _TILE_SIZE))
     x_end = int(math.floor((top_left_x + width_px) / _TILE_SIZE))
     y_end = int(math.floor((top_left_y + height_px) / _TILE_SIZE))
+    tile_range = [
+        (x, y) for x in range(x_start, x_end + 1) for y in range(y_start, y_end + 1)
+    ]
+    return top_left_x, top_left_y, tile_range
+
 
-    tile_cols = x_end - x_start + 1
-    tile_rows = y_end - y_start + 1
+def _render_map_tiles(
+    lat: float,
+    lon: float,
+    zoom: int,
+    size: Tuple[int, int]
+) -> Tuple[Image.Image, float, float, bool]:
+    """Stitch basemap tiles; the flag reports whether every tile was fetched."""
+    width_px, height_px = size
+    top_left_x, top_left_y, tile_range = _tile_window(lat, lon, zoom, size)
+    x_start = min(x for x, _ in tile_range)
+    y_start = min(y for _, y in tile_range)
+    tile_cols = max(x for x, _ in tile_range) - x_start + 1
+    tile_rows = max(y for _, y in tile_range) - y_start + 1
     canvas = Image.new("RGB", (tile_cols * _TILE_SIZE, tile_rows * _TILE_SIZE), "white")
 
+    # Load the segment's tiles concurrently (disk reads + PNG decode)
+    with ThreadPoolExecutor(max_workers=min(_TILE_LOAD_WORKERS, len(tile_range))) as executor:
+        tiles = list(executor.map(lambda xy: _fetch_tile(zoom, xy[0], xy[1]), tile_range))
+
     tiles_fetched = 0
-    for x in range(x_start, x_end + 1):
-        for y in range(y_start, y_end + 1):
-            tile = _fetch_tile(zoom, x, y)
-            if tile is None:
-                continue
-            tiles_fetched += 1
-            px = (x - x_start) * _TILE_SIZE
-            py = (y - y_start) * _TILE_SIZE
-            canvas.paste(tile, (px, py))
+    tiles_missing = 0
+    for (x, y), tile in zip(tile_range, tiles):
+        if tile is None:
+            tiles_missing += 1
+            continue
+        tiles_fetched += 1
+        px = (x - x_start) * _TILE_SIZE
+        py = (y - y_start) * _TILE_SIZE
+        canvas.paste(tile, (px, py))
 
     if tiles_fetched == 0:
         raise RuntimeError("No map tiles fetched")
@@ -243,20 +336,15 @@ def _render_map_tiles(
         crop_left + width_px,
         crop_upper + height_px,
     )
-    return canvas.crop(crop_box), top_left_x, top_left_y
+    return canvas.crop(crop_box), top_left_x, top_left_y, tiles_missing == 0
 
 
 def _fetch_tile(zoom: int, x: int, y: int) -> Optional[Image.Image]:
-    max_tile = 2**zoom
-    x_wrapped = x % max_tile
-    if y < 0 or y >= max_tile:
+    data = load_tile_bytes(zoom, x, y)
+    if data is None:
         return None
-    subdomain = _TILE_SUBDOMAINS[(x_wrapped + y) % len(_TILE_SUBDOMAINS)]
-    url = _TILE_URL.format(s=subdomain, z=zoom, x=x_wrapped, y=y)
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return Image.open(io.BytesIO(response.content)).convert("RGB")
+        return Image.open(io.BytesIO(data)).convert("RGB")
     except Exception:
         return None
 
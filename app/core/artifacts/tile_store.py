@@ -0,0 +1,153 @@
+"""
+Local basemap tile store for segment map snapshots.
+
+Tiles live on disk as ``{store_dir}/{z}/{x}/{y}.png`` (the same z/x/y layout
+as the tile server), under ``{runflow_root}/cache/tiles`` unless
+``RUNFLOW_TILE_STORE_DIR`` is set. The store is seeded explicitly with
+``scripts/seed_map_tiles.py`` (tiles for a run's segment snapshots, or a
+bbox/zoom range) and read during rendering.
+
+``RUNFLOW_MAP_TILES_OFFLINE=true`` makes rendering read only from the store:
+no network calls, so timing is deterministic and missing tiles simply render
+blank. Otherwise a store miss falls back to the tile server and the fetched
+tile is written through to the store.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+
+from app.utils.constants import LOCATION_MAP_TILE_SUBDOMAINS, LOCATION_MAP_TILE_URL
+
+logger = logging.getLogger(__name__)
+
+TileKey = Tuple[int, int, int]
+
+TILE_REQUEST_TIMEOUT_SECONDS = 10
+DEFAULT_SEED_WORKERS = 4
+
+
+def get_tile_store_dir() -> Path:
+    """Root of the tile store (RUNFLOW_TILE_STORE_DIR or runflow/cache/tiles)."""
+    override = os.getenv("RUNFLOW_TILE_STORE_DIR", "").strip()
+    if override:
+        return Path(override)
+    from app.utils.run_id import get_runflow_root
+
+    return get_runflow_root() / "cache" / "tiles"
+
+
+def tiles_offline() -> bool:
+    """True when rendering must not touch the network (RUNFLOW_MAP_TILES_OFFLINE)."""
+    return os.getenv("RUNFLOW_MAP_TILES_OFFLINE", "false").lower() in {"1", "true", "yes", "on"}
+
+
+def normalize_tile(zoom: int, x: int, y: int) -> Optional[TileKey]:
+    """Wrap x around the antimeridian; None for rows outside the world."""
+    max_tile = 2**zoom
+    if y < 0 or y >= max_tile:
+        return None
+    return zoom, x % max_tile, y
+
+
+def tile_path(zoom: int, x: int, y: int, store_dir: Optional[Path] = None) -> Path:
+    return (store_dir or get_tile_store_dir()) / str(zoom) / str(x) / f"{y}.png"
+
+
+def tile_url(zoom: int, x: int, y: int) -> str:
+    subdomain = LOCATION_MAP_TILE_SUBDOMAINS[(x + y) % len(LOCATION_MAP_TILE_SUBDOMAINS)]
+    return LOCATION_MAP_TILE_URL.format(s=subdomain, z=zoom, x=x, y=y)
+
+
+def read_tile(zoom: int, x: int, y: int) -> Optional[bytes]:
+    """Stored tile bytes, or None if the store does not have it."""
+    try:
+        return tile_path(zoom, x, y).read_bytes()
+    except OSError:
+        return None
+
+
+def write_tile(zoom: int, x: int, y: int, data: bytes) -> Path:
+    """Store a tile atomically so concurrent readers never see partial files."""
+    path = tile_path(zoom, x, y)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{y}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+    return path
+
+
+def download_tile(zoom: int, x: int, y: int) -> Optional[bytes]:
+    """Fetch one tile from the tile server; None on any failure."""
+    try:
+        response = requests.get(tile_url(zoom, x, y), timeout=TILE_REQUEST_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        return response.content
+    except Exception:
+        return None
+
+
+def load_tile_bytes(zoom: int, x: int, y: int) -> Optional[bytes]:
+    """
+    Tile bytes for rendering: the store first, then (unless offline) the
+    tile server with write-through to the store.
+    """
+    key = normalize_tile(zoom, x, y)
+    if key is None:
+        return None
+    data = read_tile(*key)
+    if data is not None or tiles_offline():
+        return data
+    data = download_tile(*key)
+    if data is not None:
+        try:
+            write_tile(*key, data)
+        except OSError as e:
+            logger.warning(f"Could not store map tile {key}: {e}")
+    return data
+
+
+def seed_tiles(
+    tiles: Iterable[TileKey],
+    *,
+    overwrite: bool = False,
+    max_workers: int = DEFAULT_SEED_WORKERS,
+) -> Dict[str, int]:
+    """
+    Download tiles into the store.
+
+    Returns counts of ``downloaded``, ``present`` (already stored, skipped
+    unless ``overwrite``) and ``failed`` tiles.
+    """
+    keys = sorted({key for key in (normalize_tile(*t) for t in tiles) if key is not None})
+    counts = {"downloaded": 0, "present": 0, "failed": 0}
+    pending = []
+    for key in keys:
+        if not overwrite and tile_path(*key).is_file():
+            counts["present"] += 1
+        else:
+            pending.append(key)
+
+    def _seed(key: TileKey) -> bool:
+        data = download_tile(*key)
+        if data is None:
+            return False
+        write_tile(*key, data)
+        return True
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            for ok in executor.map(_seed, pending):
+                counts["downloaded" if ok else "failed"] += 1
+    return counts
@@ -8,4 +8,5 @@ Modules:
 - geometry.py - Bin polygon generation
 - provenance.py - Report window/bin metadata from bins artifacts
 - hotspots.py - Hotspot preservation / coarsening policy (Issue #798 Phase 9)
+- rollup.py - Vectorized per-segment worst-bin rollups and projected bins reads
 """
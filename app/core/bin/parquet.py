@@ -0,0 +1,161 @@
+"""
+Segment-sorted ``bins.parquet`` writer.
+
+Layout written by :func:`write_bins_parquet`:
+
+- rows sorted by segment (first-appearance order, so artifact ordering is
+  unchanged), then ``window_idx``, then ``start_km``;
+- one row group per segment (large segments split), so row-group min/max
+  statistics on ``segment_id`` / ``window_idx`` let readers skip whole
+  segments and windows;
+- explicit column types for the core bin fields, with Parquet dictionary
+  encoding on low-cardinality string columns.
+
+``t_start``/``t_end`` stay ISO-8601 UTC strings: many consumers serialise them
+verbatim into JSON and reports, and the fixed-width ISO form sorts (and so
+prunes by statistics) chronologically. Window predicates use ``window_idx``.
+
+:func:`app.core.bin.rollup.read_bins_columns` reads this layout with column
+projection and pushes segment / window / severity predicates down into pyarrow
+instead of loading the whole table and filtering in pandas.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Types for the core bin columns; anything else is inferred as before.
+BIN_COLUMN_TYPES: Dict[str, pa.DataType] = {
+    "bin_id": pa.string(),
+    "segment_id": pa.string(),
+    "start_km": pa.float64(),
+    "end_km": pa.float64(),
+    "t_start": pa.string(),
+    "t_end": pa.string(),
+    "window_idx": pa.int64(),
+    "density": pa.float64(),
+    "rate": pa.float64(),
+    "los_class": pa.string(),
+    "bin_size_km": pa.float64(),
+    "schema_version": pa.string(),
+    "width_m": pa.float64(),
+    "seg_label": pa.string(),
+    "schema_key": pa.string(),
+    "rate_per_m_per_min": pa.float64(),
+    "util_percentile": pa.float64(),
+    "flag_severity": pa.string(),
+    "flag_reason": pa.string(),
+}
+
+# Low-cardinality string columns stored with Parquet dictionary pages
+DICTIONARY_COLUMNS = (
+    "segment_id", "los_class", "flag_severity", "flag_reason",
+    "schema_key", "seg_label", "schema_version", "event",
+)
+
+# Upper bound per row group when a single segment is very large
+MAX_ROW_GROUP_ROWS = 65536
+
+PathLike = Union[str, Path]
+
+
+def _column_arrays(rows: Sequence[Mapping[str, Any]]) -> Dict[str, List[Any]]:
+    names: Dict[str, None] = {}
+    for row in rows:
+        for key in row:
+            names.setdefault(key, None)
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+def _to_array(name: str, values: Any) -> pa.Array:
+    convert = pa.Array.from_pandas if isinstance(values, pd.Series) else pa.array
+    bin_type = BIN_COLUMN_TYPES.get(name)
+    if bin_type is not None:
+        try:
+            return convert(values, type=bin_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return convert(values)
+
+
+def _sort_order(columns: Mapping[str, Any], num_rows: int) -> np.ndarray:
+    """Row order: segment (first appearance), window_idx, start_km."""
+    keys = []
+    if "start_km" in columns:
+        keys.append(pd.to_numeric(pd.Series(columns["start_km"]), errors="coerce").fillna(np.inf).to_numpy())
+    if "window_idx" in columns:
+        keys.append(pd.to_numeric(pd.Series(columns["window_idx"]), errors="coerce").fillna(np.inf).to_numpy())
+    elif "t_start" in columns:
+        keys.append(pd.Series(columns["t_start"]).astype(str).to_numpy())
+    if "segment_id" in columns:
+        keys.append(pd.factorize(pd.Series(columns["segment_id"]).astype(str))[0])
+    if not keys:
+        return np.arange(num_rows)
+    return np.lexsort(keys)
+
+
+def build_bins_table(data: Union[pd.DataFrame, Sequence[Mapping[str, Any]]]) -> pa.Table:
+    """Column-wise Arrow table for bins, sorted segment → window → km."""
+    if isinstance(data, pd.DataFrame):
+        columns: Mapping[str, Any] = {name: data[name] for name in data.columns}
+        num_rows = len(data)
+    else:
+        columns = _column_arrays(data)
+        num_rows = len(data)
+
+    order = _sort_order(columns, num_rows)
+    arrays = {name: _to_array(name, values) for name, values in columns.items()}
+    table = pa.table(arrays)
+    if num_rows and not np.array_equal(order, np.arange(num_rows)):
+        table = table.take(pa.array(order))
+    return table
+
+
+def _segment_row_groups(table: pa.Table) -> List[pa.Table]:
+    if "segment_id" not in table.column_names or table.num_rows == 0:
+        return [table]
+    segments = table.column("segment_id").to_numpy(zero_copy_only=False)
+    boundaries = np.flatnonzero(segments[1:] != segments[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [table.num_rows]))
+    groups = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        for chunk_start in range(start, end, MAX_ROW_GROUP_ROWS):
+            groups.append(table.slice(chunk_start, min(MAX_ROW_GROUP_ROWS, end - chunk_start)))
+    return groups
+
+
+def write_bins_parquet(
+    data: Union[pd.DataFrame, Sequence[Mapping[str, Any]]],
+    path: PathLike,
+    *,
+    schema: Optional[pa.Schema] = None,
+) -> str:
+    """
+    Write bins with the segment-sorted layout and one row group per segment.
+
+    ``schema`` is only used when ``data`` is empty, so an empty bins file
+    still carries the expected columns.
+    """
+    if schema is not None and len(data) == 0:
+        table = schema.empty_table()
+    else:
+        table = build_bins_table(data)
+    use_dictionary = [c for c in DICTIONARY_COLUMNS if c in table.column_names]
+    with pq.ParquetWriter(
+        str(path),
+        table.schema,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=use_dictionary or False,
+        write_statistics=True,
+    ) as writer:
+        for group in _segment_row_groups(table):
+            writer.write_table(group, row_group_size=max(group.num_rows, 1))
+    return str(path)
@@ -0,0 +1,136 @@
+"""
+Vectorized per-segment rollups over ``bins.parquet``.
+
+Segment metrics, flags, peak rate and the map manifest all reduce the bins
+table to one row per segment. These helpers do that reduction with a single
+sort + ``drop_duplicates`` instead of ``groupby``/``idxmax`` loops, and read
+only the columns a consumer needs from Parquet.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Columns read by segment_metrics.json generation (first match wins for aliases)
+SEGMENT_METRICS_COLUMNS: Tuple[str, ...] = (
+    "segment_id", "seg_id",
+    "density", "density_peak", "density_mean",
+    "rate", "rate_p_s",
+    "los_class", "t_start", "t_end", "schema_key",
+)
+
+# Columns read by flags.json generation (SSOT flagging + duration metrics)
+FLAGS_COLUMNS: Tuple[str, ...] = (
+    "segment_id", "seg_id",
+    "t_start", "t_end", "density", "rate",
+    "los_class", "flag_severity", "severity", "flag_reason",
+    "bin_id", "start_km", "end_km",
+)
+
+
+def read_bins_columns(
+    path: Union[str, Path],
+    columns: Optional[Iterable[str]] = None,
+    *,
+    segments: Optional[Iterable[str]] = None,
+    windows: Optional[Iterable[int]] = None,
+    flagged_only: bool = False,
+) -> pd.DataFrame:
+    """
+    Read ``bins.parquet`` with projection and predicate pushdown.
+
+    Only the requested columns that exist in the file are read, so callers can
+    list every alias they understand (e.g. ``segment_id``/``seg_id``) without
+    checking the schema first. ``columns=None`` reads the whole table.
+
+    ``segments`` / ``windows`` filter on ``segment_id`` / ``window_idx`` and
+    ``flagged_only`` drops bins whose ``flag_severity`` is ``'none'``; pyarrow
+    applies them per row group, so the segment-sorted layout written by
+    ``write_bins_parquet`` skips whole segments and windows. Predicates on
+    columns the file does not have are ignored.
+    """
+    if columns is None and segments is None and windows is None and not flagged_only:
+        return pd.read_parquet(path)
+    available = set(pq.read_schema(path).names)
+    projected = None
+    if columns is not None:
+        projected = [c for c in dict.fromkeys(columns) if c in available]
+
+    predicates = []
+    if segments is not None and "segment_id" in available:
+        predicates.append(pc.field("segment_id").isin(list(segments)))
+    if windows is not None and "window_idx" in available:
+        predicates.append(pc.field("window_idx").isin([int(w) for w in windows]))
+    if flagged_only and "flag_severity" in available:
+        # Same rows as ``df[df["flag_severity"] != "none"]``: nulls are kept
+        severity = pc.field("flag_severity")
+        predicates.append((severity != "none") | severity.is_null())
+    filters = None
+    for predicate in predicates:
+        filters = predicate if filters is None else filters & predicate
+    return pd.read_parquet(path, columns=projected, filters=filters)
+
+
+def first_present(df: pd.DataFrame, candidates: Iterable[str]) -> Optional[str]:
+    """Return the first candidate column present in ``df``, or None."""
+    for col in candidates:
+        if col in df.columns:
+            return col
+    return None
+
+
+def worst_bin_per_segment(
+    bins: pd.DataFrame,
+    value_col: str,
+    segment_col: str = "segment_id",
+) -> pd.DataFrame:
+    """
+    Return the bin row with the maximum ``value_col`` for each segment.
+
+    Equivalent to ``bins.loc[bins.groupby(segment_col)[value_col].idxmax()]``:
+    ties resolve to the first row in input order, NaN values lose to any
+    number, rows with a missing segment id are dropped, and the result is
+    ordered by segment id.
+    """
+    keyed = bins[bins[segment_col].notna()]
+    worst = keyed.sort_values(value_col, ascending=False, kind="stable", na_position="last")
+    worst = worst.drop_duplicates(subset=segment_col, keep="first")
+    return worst.sort_values(segment_col, kind="stable")
+
+
+def first_bin_per_segment(bins: pd.DataFrame, segment_col: str = "segment_id") -> pd.DataFrame:
+    """Return each segment's first bin row (input order), ordered by segment id."""
+    keyed = bins[bins[segment_col].notna()]
+    first = keyed.drop_duplicates(subset=segment_col, keep="first")
+    return first.sort_values(segment_col, kind="stable")
+
+
+def flagged_durations_per_segment(
+    flagged_bins: pd.DataFrame,
+    segment_col: str = "segment_id",
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Sum and span of flagged bin durations per segment, in seconds.
+
+    ``flagged_bins`` must hold datetime ``t_start``/``t_end`` columns; rows with
+    either timestamp missing are ignored. Returns
+    ``{segment_id: (sum_of_bin_durations_s, first_start_to_last_end_s)}``.
+    """
+    if flagged_bins.empty or "t_start" not in flagged_bins.columns or "t_end" not in flagged_bins.columns:
+        return {}
+    valid = flagged_bins[flagged_bins["t_start"].notna() & flagged_bins["t_end"].notna()]
+    if valid.empty:
+        return {}
+    durations = (valid["t_end"] - valid["t_start"]).dt.total_seconds()
+    grouped = valid.groupby(segment_col)
+    total = durations.groupby(valid[segment_col]).sum()
+    span = (grouped["t_end"].max() - grouped["t_start"].min()).dt.total_seconds()
+    return {
+        seg_id: (float(total[seg_id]), float(span[seg_id]))
+        for seg_id in total.index
+    }
@@ -42,9 +42,20 @@ from app.bin_intelligence import (
     filter_by_min_bin_length,
     apply_bin_flagging
 )
+from app.core.bin.rollup import read_bins_columns
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_BIN_COLUMNS = (
+    "segment_id", "start_km", "end_km", "t_start", "t_end",
+    "density", "rate", "los_class",
+)
+# Columns read from bins.parquet: the required set, the stored flagging data,
+# and what the apply_bin_flagging fallback needs when that data is absent
+BIN_SUMMARY_COLUMNS = REQUIRED_BIN_COLUMNS + (
+    "flag_severity", "flag_reason", "bin_len_m", "density_peak",
+)
+
 
 @dataclass
 class BinSummaryConfig:
@@ -134,16 +145,11 @@ def load_bins_data(input_path: str) -> pd.DataFrame:
         raise FileNotFoundError(f"Bin data file not found: {input_path}")
     
     try:
-        df = pd.read_parquet(input_path)
+        df = read_bins_columns(input_path, BIN_SUMMARY_COLUMNS)
         logger.debug(f"Loaded {len(df)} bins from {input_path}")
         
         # Validate required columns
-        required_columns = [
-            "segment_id", "start_km", "end_km", "t_start", "t_end", 
-            "density", "rate", "los_class"
-        ]
-        
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in REQUIRED_BIN_COLUMNS if col not in df.columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
         
@@ -160,6 +166,49 @@ def load_bins_data(input_path: str) -> pd.DataFrame:
 
 
 
+def _format_times_for_display(values: pd.Series) -> List[str]:
+    """format_time_for_display over a column, parsing each distinct value once."""
+    as_text = values.astype(str)
+    formatted = {value: format_time_for_display(value) for value in as_text.unique()}
+    return as_text.map(formatted).tolist()
+
+
+def _round3(values: pd.Series) -> List[float]:
+    # Python's round() per value: numpy's scaled rounding can differ on ties,
+    # and bin_summary.json must stay byte-identical.
+    return [round(v, 3) for v in values.astype(float).tolist()]
+
+
+def _format_flagged_bins(filtered_bins: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Flagged bin records for bin_summary.json, built column-wise."""
+    if filtered_bins.empty:
+        return []
+    flag_reason = filtered_bins["flag_reason"]
+    flags = flag_reason.astype(object).where(flag_reason.notna(), "flagged").tolist()
+    return [
+        {
+            "start_km": start_km,
+            "end_km": end_km,
+            "start_time": start_time,
+            "end_time": end_time,
+            "density": density,  # Use density column (NOT density_peak)
+            "rate": rate,
+            "los_class": los_class,  # Use los_class column
+            "flag": flag,
+        }
+        for start_km, end_km, start_time, end_time, density, rate, los_class, flag in zip(
+            _round3(filtered_bins["start_km"]),
+            _round3(filtered_bins["end_km"]),
+            _format_times_for_display(filtered_bins["t_start"]),
+            _format_times_for_display(filtered_bins["t_end"]),
+            _round3(filtered_bins["density"]),
+            _round3(filtered_bins["rate"]),
+            filtered_bins["los_class"].astype(str).tolist(),
+            flags,
+        )
+    ]
+
+
 def generate_bin_summary(
     bins_df: pd.DataFrame,
     flagging_config: FlaggingConfig
@@ -200,38 +249,27 @@ def generate_bin_summary(
         filtered_bins = get_flagged_bins(flagged_df)
         logger.debug(f"Found {len(filtered_bins)} flagged bins (applied flagging logic)")
     
-    # Group by segment
+    # Group by segment: one groupby for totals, one for flagged row positions
+    total_by_segment = bins_df.groupby("segment_id", sort=False).size()
+    flagged_positions = filtered_bins.groupby("segment_id", sort=False).indices
+    flagged_records = _format_flagged_bins(filtered_bins)
+
     segments = {}
     total_filtered_bins = 0
     
     for segment_id in bins_df["segment_id"].unique():
-        segment_bins = bins_df[bins_df["segment_id"] == segment_id]
-        segment_filtered_bins = filtered_bins[filtered_bins["segment_id"] == segment_id]
-        
-        # Format bins for this segment
-        bins_list = []
-        for _, bin_row in segment_filtered_bins.iterrows():
-            bin_data = {
-                "start_km": round(float(bin_row["start_km"]), 3),
-                "end_km": round(float(bin_row["end_km"]), 3),
-                "start_time": format_time_for_display(str(bin_row["t_start"])),
-                "end_time": format_time_for_display(str(bin_row["t_end"])),
-                "density": round(float(bin_row["density"]), 3),  # Use density column (NOT density_peak)
-                "rate": round(float(bin_row["rate"]), 3),
-                "los_class": str(bin_row["los_class"]),  # Use los_class column
-                "flag": bin_row["flag_reason"] if pd.notna(bin_row["flag_reason"]) else "flagged"
-            }
-            bins_list.append(bin_data)
+        positions = flagged_positions.get(segment_id, ())
+        bins_list = [flagged_records[i] for i in positions]
         
         segments[segment_id] = {
             "meta": {
-                "total_bins": len(segment_bins),
-                "flagged_bins": len(segment_filtered_bins)
+                "total_bins": int(total_by_segment.get(segment_id, 0)),
+                "flagged_bins": len(bins_list)
             },
             "bins": bins_list
         }
         
-        total_filtered_bins += len(segment_filtered_bins)
+        total_filtered_bins += len(bins_list)
     
     # Generate summary
     segments_with_bins = sum(1 for seg in segments.values() if seg["meta"]["flagged_bins"] > 0)
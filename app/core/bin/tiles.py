@@ -0,0 +1,259 @@
+"""
+Resident per-window bin tiles for the map API.
+
+``/api/map/bins`` is called on every slider tick and pan. Instead of reading
+``bins.parquet`` and decompressing ``bins.geojson.gz`` per request, each bins
+directory (one run/day) is loaded once into a :class:`BinTileIndex`:
+
+- bin geometries decoded once, with a shapely STRtree over them;
+- the bins table re-laid out window-major (rows sorted by ``window_idx`` with
+  an offsets array), with ``t_start``/``t_end`` pre-formatted as HH:MM.
+
+A request is then an offsets lookup, an STRtree query for the viewport and a
+vectorized mask, so payload size follows the viewport rather than the course.
+Indexes are cached per directory and rebuilt when either file changes.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.bin.rollup import first_present, read_bins_columns
+
+logger = logging.getLogger(__name__)
+
+BINS_PARQUET = "bins.parquet"
+BINS_GEOJSON_GZ = "bins.geojson.gz"
+
+# Per-row properties served for each bin feature (besides geometry)
+_TILE_COLUMNS = ("segment_id", "bin_id", "start_km", "end_km", "density", "rate", "los_class")
+_TILE_PARQUET_COLUMNS = _TILE_COLUMNS + (
+    "t_start", "t_end", "flag_severity", "severity", "flag_reason", "rate_per_m_per_min",
+)
+_WEB_MERCATOR_RADIUS_M = 6378137.0
+
+# One index per run/day bins directory; a handful covers the days being viewed.
+_BIN_TILE_CACHE_MAX = 8
+_bin_tile_cache: "OrderedDict[str, BinTileIndex]" = OrderedDict()
+_bin_tile_cache_lock = threading.Lock()
+
+
+def clear_bin_tile_cache() -> None:
+    with _bin_tile_cache_lock:
+        _bin_tile_cache.clear()
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (0, 0)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def bbox_to_lonlat(bbox: Sequence[float]) -> Tuple[float, float, float, float]:
+    """
+    Return ``(minx, miny, maxx, maxy)`` in lon/lat.
+
+    Bin geometries are stored in WGS84; a bbox with coordinates outside
+    lon/lat range is treated as Web Mercator (EPSG:3857) and converted.
+    """
+    minx, miny, maxx, maxy = (float(v) for v in bbox)
+    if max(abs(minx), abs(maxx)) <= 180.0 and max(abs(miny), abs(maxy)) <= 90.0:
+        return minx, miny, maxx, maxy
+
+    def to_lonlat(x: float, y: float) -> Tuple[float, float]:
+        lon = math.degrees(x / _WEB_MERCATOR_RADIUS_M)
+        lat = math.degrees(2.0 * math.atan(math.exp(y / _WEB_MERCATOR_RADIUS_M)) - math.pi / 2.0)
+        return lon, lat
+
+    min_lon, min_lat = to_lonlat(minx, miny)
+    max_lon, max_lat = to_lonlat(maxx, maxy)
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def _load_geometries(path: Path) -> Dict[str, dict]:
+    geometries: Dict[str, dict] = {}
+    if not path.exists():
+        return geometries
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            geojson_data = json.load(f)
+    except Exception as geom_error:
+        logger.warning(f"Could not load bin geometries: {geom_error}")
+        return geometries
+    for feature in geojson_data.get("features", []):
+        bin_id = (feature.get("properties") or {}).get("bin_id")
+        geometry = feature.get("geometry")
+        if bin_id and geometry:
+            geometries[bin_id] = geometry
+    return geometries
+
+
+@dataclass
+class BinTileIndex:
+    """Window-major bins table plus a spatial index over bin geometries."""
+
+    signature: Tuple[Tuple[int, int], Tuple[int, int]]
+    window_offsets: np.ndarray
+    columns: Dict[str, np.ndarray]
+    geom_slot: np.ndarray
+    geometries: List[dict]
+    tree: Any
+
+    @property
+    def window_count(self) -> int:
+        return len(self.window_offsets) - 1
+
+    def query(
+        self,
+        window_idx: int,
+        bbox: Optional[Sequence[float]] = None,
+        severity: str = "any",
+    ) -> List[Dict[str, Any]]:
+        """GeoJSON features for one window, pruned to ``bbox`` and ``severity``."""
+        if window_idx < 0 or window_idx >= self.window_count:
+            return []
+        lo, hi = int(self.window_offsets[window_idx]), int(self.window_offsets[window_idx + 1])
+        if lo == hi:
+            return []
+
+        mask = np.ones(hi - lo, dtype=bool)
+        if severity != "any":
+            if "severity" in self.columns:
+                mask &= self.columns["severity"][lo:hi] == severity
+            else:
+                logger.warning("Severity filtering requested but severity column not in bins.parquet")
+        if bbox is not None and self.tree is not None:
+            from shapely.geometry import box
+
+            visible = np.zeros(len(self.geometries), dtype=bool)
+            visible[self.tree.query(box(*bbox_to_lonlat(bbox)), predicate="intersects")] = True
+            slots = self.geom_slot[lo:hi]
+            mask &= (slots >= 0) & visible[np.maximum(slots, 0)]
+
+        rows = np.flatnonzero(mask) + lo
+        if rows.size == 0:
+            return []
+        props = {name: col[rows].tolist() for name, col in self.columns.items()}
+        slots = self.geom_slot[rows].tolist()
+        severities = props.get("severity") or ["none"] * rows.size
+        flag_reasons = props.get("flag_reason") or ["none"] * rows.size
+        rates_per_m = props.get("rate_per_m_per_min") or [0.0] * rows.size
+        return [
+            {
+                "type": "Feature",
+                "properties": {
+                    "segment_id": props["segment_id"][i],
+                    "bin_id": props["bin_id"][i],
+                    "start_km": props["start_km"][i],
+                    "end_km": props["end_km"][i],
+                    "window_idx": int(window_idx),
+                    "t_start_hhmm": props["t_start_hhmm"][i],
+                    "t_end_hhmm": props["t_end_hhmm"][i],
+                    "density": props["density"][i],
+                    "rate": props["rate"][i],
+                    "los_class": props["los_class"][i],
+                    "severity": severities[i],
+                    "flag_reason": flag_reasons[i],
+                    "rate_per_m_per_min": rates_per_m[i],
+                },
+                "geometry": self.geometries[slots[i]] if slots[i] >= 0 else None,
+            }
+            for i in range(rows.size)
+        ]
+
+
+def build_bin_tile_index(bins_dir: Path) -> BinTileIndex:
+    """Load ``bins.parquet`` + ``bins.geojson.gz`` from ``bins_dir`` into a tile index."""
+    from shapely.geometry import shape
+    from shapely.strtree import STRtree
+
+    parquet_path = bins_dir / BINS_PARQUET
+    geojson_path = bins_dir / BINS_GEOJSON_GZ
+    signature = (_file_signature(parquet_path), _file_signature(geojson_path))
+
+    bins_df = read_bins_columns(parquet_path, _TILE_PARQUET_COLUMNS)
+    severity_col = first_present(bins_df, ("flag_severity", "severity"))
+
+    # Same window numbering as before: offset from the first window start,
+    # in units of the first row's window length.
+    t_start = pd.to_datetime(bins_df["t_start"])
+    t_end = pd.to_datetime(bins_df["t_end"])
+    if len(bins_df):
+        window_duration = t_end.iloc[0] - t_start.iloc[0]
+        window_idx = ((t_start - t_start.min()) / window_duration).astype(int).to_numpy()
+    else:
+        window_idx = np.zeros(0, dtype=int)
+    order = np.argsort(window_idx, kind="stable")
+    window_idx = window_idx[order]
+    window_count = int(window_idx[-1]) + 1 if window_idx.size else 0
+    window_offsets = np.searchsorted(window_idx, np.arange(window_count + 1), side="left")
+
+    columns: Dict[str, np.ndarray] = {
+        name: bins_df[name].to_numpy()[order] for name in _TILE_COLUMNS
+    }
+    for name in ("start_km", "end_km", "density", "rate"):
+        columns[name] = columns[name].astype(float)
+    columns["t_start_hhmm"] = t_start.dt.strftime("%H:%M").to_numpy()[order]
+    columns["t_end_hhmm"] = t_end.dt.strftime("%H:%M").to_numpy()[order]
+    if severity_col:
+        columns["severity"] = bins_df[severity_col].to_numpy()[order]
+    for name in ("flag_reason", "rate_per_m_per_min"):
+        if name in bins_df.columns:
+            columns[name] = bins_df[name].to_numpy()[order]
+
+    geometry_by_bin = _load_geometries(geojson_path)
+    slot_by_bin = {bin_id: slot for slot, bin_id in enumerate(geometry_by_bin)}
+    geometries = list(geometry_by_bin.values())
+    geom_slot = np.fromiter(
+        (slot_by_bin.get(b, -1) for b in columns["bin_id"]), dtype=np.int64, count=len(order)
+    )
+    tree = STRtree([shape(g) for g in geometries]) if geometries else None
+
+    logger.info(
+        f"Built bin tile index for {bins_dir}: {len(order)} rows, "
+        f"{window_count} windows, {len(geometries)} geometries"
+    )
+    return BinTileIndex(
+        signature=signature,
+        window_offsets=window_offsets,
+        columns=columns,
+        geom_slot=geom_slot,
+        geometries=geometries,
+        tree=tree,
+    )
+
+
+def get_bin_tile_index(bins_dir: Path) -> BinTileIndex:
+    """Cached :func:`build_bin_tile_index`, rebuilt when the bin files change."""
+    bins_dir = Path(bins_dir)
+    key = str(bins_dir.resolve())
+    signature = (
+        _file_signature(bins_dir / BINS_PARQUET),
+        _file_signature(bins_dir / BINS_GEOJSON_GZ),
+    )
+    with _bin_tile_cache_lock:
+        index = _bin_tile_cache.get(key)
+        if index is not None and index.signature == signature:
+            _bin_tile_cache.move_to_end(key)
+            return index
+
+    index = build_bin_tile_index(bins_dir)
+    with _bin_tile_cache_lock:
+        _bin_tile_cache[key] = index
+        _bin_tile_cache.move_to_end(key)
+        while len(_bin_tile_cache) > _BIN_TILE_CACHE_MAX:
+            _bin_tile_cache.popitem(last=False)
+    return index
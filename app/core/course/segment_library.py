@@ -101,7 +101,7 @@ def load_manifest(path: Path) -> Dict[str, Any]:
 def parse_leg_gpx(path: Path) -> Dict[str, Any]:
     """Parse a leg GPX file into coordinates and length."""
     course = parse_gpx_file(str(path))
-    coords = [[p.lon, p.lat] for p in course.points]
+    coords = [[lon, lat] for lon, lat in zip(course.lon.tolist(), course.lat.tolist())]
     if len(coords) < 2:
         raise ValueError(f"Leg GPX needs at least 2 points: {path}")
     return {
@@ -23,7 +23,8 @@ import json
 import os
 import concurrent.futures
 from typing import Dict, Optional, Any, List, Tuple, TYPE_CHECKING
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 import pandas as pd
 import numpy as np
 
@@ -302,6 +303,27 @@ class SegmentFlowCache:
     to_km_a: float
     from_km_b: float
     to_km_b: float
+    _runner_codes: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def runner_codes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Dense integer codes for runner IDs, shared by both events.
+
+        Returns ``(codes_a, codes_b, runner_ids)`` where ``runner_ids[codes_a[i]]``
+        is event A runner i's ID. Identical IDs share a code, so a boolean mask
+        over codes behaves like a set of IDs. Built once per segment.
+        """
+        if self._runner_codes is None:
+            ids = np.concatenate([
+                np.asarray(self.runner_id_a, dtype=object),
+                np.asarray(self.runner_id_b, dtype=object),
+            ])
+            codes, uniques = pd.factorize(ids)
+            n_a = len(self.runner_id_a)
+            self._runner_codes = (codes[:n_a], codes[n_a:], np.asarray(uniques, dtype=object))
+        return self._runner_codes
 
 
 def build_segment_flow_cache(
@@ -376,6 +398,481 @@ def build_segment_flow_cache(
     )
 
 
+# Issue #613: Per-segment conflict-zone evaluation shared by overlaps, loads and F1 validation
+ZoneWindow = Tuple[float, float, float, float]
+
+# Pairwise relations (n_a x n_b matrices) kept per evaluator. Zones are evaluated
+# one after another, so one is enough; more multiplies peak memory on big segments.
+_ZONE_RELATION_CACHE_SIZE = 1
+
+
+@dataclass
+class ZoneRelation:
+    """
+    Pairwise timing relation between event A and B runners for one km window.
+
+    Attributes:
+        duration: (n_a, n_b) overlap durations in seconds (min exit - max entry)
+        a_passes_b: (n_a, n_b) A enters after B and exits before B
+        b_passes_a: (n_a, n_b) B enters after A and exits before A
+    """
+    duration: np.ndarray
+    a_passes_b: np.ndarray
+    b_passes_a: np.ndarray
+
+
+def _convergence_zone_window(
+    cp_km: float,
+    from_km_a: float,
+    to_km_a: float,
+    from_km_b: float,
+    to_km_b: float,
+    conflict_length_m: float,
+) -> ZoneWindow:
+    """Conflict-zone window around cp_km used by the original overlap detector."""
+    len_a = to_km_a - from_km_a
+    len_b = to_km_b - from_km_b
+    if from_km_a <= cp_km <= to_km_a:
+        # Convergence point is within Event A's range - use absolute approach
+        s_cp = (cp_km - from_km_a) / max(len_a, 1e-9)
+        s_cp, _ = clamp_normalized_fraction(s_cp, "convergence_point_")
+        # Use proportional tolerance: 5% of shorter segment, minimum 50m
+        min_segment_len = min(len_a, len_b)
+        proportional_tolerance_km = max(0.05, 0.05 * min_segment_len)
+        s_conflict_half = proportional_tolerance_km / max(min_segment_len, 1e-9)
+        s_start = max(0.0, s_cp - s_conflict_half)
+        s_end = min(1.0, s_cp + s_conflict_half)
+        # Ensure conflict zone has some width
+        if s_end <= s_start:
+            s_start = max(0.0, s_cp - 0.05)
+            s_end = min(1.0, s_cp + 0.05)
+        return (
+            from_km_a + s_start * len_a,
+            from_km_a + s_end * len_a,
+            from_km_b + s_start * len_b,
+            from_km_b + s_end * len_b,
+        )
+
+    conflict_half_km = (conflict_length_m / 1000.0) / 2.0
+    intersection_start = max(from_km_a, from_km_b)
+    intersection_end = min(to_km_a, to_km_b)
+    if intersection_start < intersection_end:
+        # Convergence detected in normalized space - widen the shared intersection
+        return (
+            max(from_km_a, intersection_start - conflict_half_km),
+            min(to_km_a, intersection_end + conflict_half_km),
+            max(from_km_b, intersection_start - conflict_half_km),
+            min(to_km_b, intersection_end + conflict_half_km),
+        )
+    return _center_zone_window(from_km_a, to_km_a, from_km_b, to_km_b, conflict_length_m)
+
+
+def _center_zone_window(
+    from_km_a: float,
+    to_km_a: float,
+    from_km_b: float,
+    to_km_b: float,
+    conflict_length_m: float,
+) -> ZoneWindow:
+    """Conflict-zone window of conflict_length_m around each event's segment center."""
+    center_a = (from_km_a + to_km_a) / 2.0
+    center_b = (from_km_b + to_km_b) / 2.0
+    conflict_half_km = (conflict_length_m / 1000.0) / 2.0
+    return (
+        max(from_km_a, center_a - conflict_half_km),
+        min(to_km_a, center_a + conflict_half_km),
+        max(from_km_b, center_b - conflict_half_km),
+        min(to_km_b, center_b + conflict_half_km),
+    )
+
+
+def _pass_boundary_window(from_km_a: float, to_km_a: float, from_km_b: float, to_km_b: float) -> ZoneWindow:
+    """
+    Window used for directional pass detection.
+
+    The shared intersection when the events overlap in absolute km; otherwise
+    the first 20% of the shorter segment, measured from each event's own start
+    (finish-line convergence such as M1).
+    """
+    intersection_start = max(from_km_a, from_km_b)
+    intersection_end = min(to_km_a, to_km_b)
+    if intersection_start < intersection_end:
+        return intersection_start, intersection_end, intersection_start, intersection_end
+    conflict_zone_length = min(to_km_a - from_km_a, to_km_b - from_km_b) * 0.2
+    return from_km_a + 0.0, from_km_a + conflict_zone_length, from_km_b + 0.0, from_km_b + conflict_zone_length
+
+
+def _loads_by_runner(runner_ids: np.ndarray, counts: np.ndarray) -> Dict[Any, int]:
+    """{runner_id: load} in row order; repeated IDs accumulate."""
+    loads: Dict[Any, int] = {}
+    for runner_id, count in zip(runner_ids.tolist(), counts.tolist()):
+        loads[runner_id] = loads.get(runner_id, 0) + count
+    return loads
+
+
+def _combine_loads_by_runner(runner_ids: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Loads summed per runner_id, in first-seen order (the values of
+    :func:`_loads_by_runner`); rows are returned as-is when IDs are unique.
+    """
+    if pd.Series(runner_ids, dtype=object).is_unique:
+        return counts
+    return np.fromiter(_loads_by_runner(runner_ids, counts).values(), dtype=counts.dtype)
+
+
+# Outer intervals per block when counting enclosing intervals (bounds the partial-block matrix)
+_ENCLOSING_COUNT_BLOCK = 256
+
+
+def _enclosing_counts(
+    inner_start: np.ndarray,
+    inner_end: np.ndarray,
+    outer_start: np.ndarray,
+    outer_end: np.ndarray,
+    block: int = _ENCLOSING_COUNT_BLOCK,
+) -> np.ndarray:
+    """
+    For each inner interval i, count outer intervals j that strictly enclose it
+    (``outer_start[j] < inner_start[i]`` and ``outer_end[j] > inner_end[i]``).
+
+    Outer intervals are sorted by start, so the candidates for i are a prefix
+    of that order; the prefix is counted block by block against per-block
+    sorted ends, giving O((n + m) log m) work instead of an n x m matrix.
+    Intervals with a NaN bound never count.
+    """
+    counts = np.zeros(len(inner_start), dtype=np.int64)
+    valid_outer = ~(np.isnan(outer_start) | np.isnan(outer_end))
+    valid_inner = np.flatnonzero(~(np.isnan(inner_start) | np.isnan(inner_end)))
+    if not valid_outer.any() or len(valid_inner) == 0:
+        return counts
+
+    order = np.argsort(outer_start[valid_outer], kind="stable")
+    starts = outer_start[valid_outer][order]
+    ends = outer_end[valid_outer][order]
+    q_start, q_end = inner_start[valid_inner], inner_end[valid_inner]
+    prefix = np.searchsorted(starts, q_start, side="left")
+    found = np.zeros(len(valid_inner), dtype=np.int64)
+
+    for lo in range(0, len(starts), block):
+        hi = min(lo + block, len(starts))
+        block_ends = ends[lo:hi]
+        full = np.flatnonzero(prefix >= hi)
+        if len(full):
+            sorted_ends = np.sort(block_ends)
+            found[full] += (hi - lo) - np.searchsorted(sorted_ends, q_end[full], side="right")
+        partial = np.flatnonzero((prefix > lo) & (prefix < hi))
+        if len(partial):
+            in_prefix = np.arange(hi - lo)[np.newaxis, :] < (prefix[partial] - lo)[:, np.newaxis]
+            encloses = block_ends[np.newaxis, :] > q_end[partial][:, np.newaxis]
+            found[partial] += (in_prefix & encloses).sum(axis=1)
+
+    counts[valid_inner] = found
+    return counts
+
+
+@dataclass
+class OvertakingLoads:
+    """
+    Per-runner overtaking loads for one event pair, keyed by runner index.
+
+    Attributes:
+        runner_index_a: Row positions (in the evaluated event A frame) of the
+            runners counted, i.e. those who reach the zone end
+        runner_index_b: Same for event B
+        loads_a: Passes made by each counted event A runner
+        loads_b: Passes made by each counted event B runner
+        runner_id_a: Runner IDs aligned with loads_a
+        runner_id_b: Runner IDs aligned with loads_b
+
+    Statistics and ``runner_loads_*`` combine rows that share a runner_id,
+    matching the ``{runner_id: load}`` dicts.
+    """
+    runner_index_a: np.ndarray
+    runner_index_b: np.ndarray
+    loads_a: np.ndarray
+    loads_b: np.ndarray
+    runner_id_a: np.ndarray
+    runner_id_b: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "OvertakingLoads":
+        none = np.zeros(0, dtype=np.int64)
+        return cls(none, none, none, none, np.zeros(0, dtype=object), np.zeros(0, dtype=object))
+
+    @cached_property
+    def runner_loads_a(self) -> np.ndarray:
+        """Load per distinct event A runner_id (first-seen order)."""
+        return _combine_loads_by_runner(self.runner_id_a, self.loads_a)
+
+    @cached_property
+    def runner_loads_b(self) -> np.ndarray:
+        """Load per distinct event B runner_id (first-seen order)."""
+        return _combine_loads_by_runner(self.runner_id_b, self.loads_b)
+
+    @property
+    def avg_load_a(self) -> float:
+        loads = self.runner_loads_a
+        return int(loads.sum()) / len(loads) if len(loads) else 0.0
+
+    @property
+    def avg_load_b(self) -> float:
+        loads = self.runner_loads_b
+        return int(loads.sum()) / len(loads) if len(loads) else 0.0
+
+    @property
+    def max_load_a(self) -> int:
+        return int(self.runner_loads_a.max()) if len(self.runner_loads_a) else 0
+
+    @property
+    def max_load_b(self) -> int:
+        return int(self.runner_loads_b.max()) if len(self.runner_loads_b) else 0
+
+    def to_dicts(self) -> Tuple[Dict[Any, int], Dict[Any, int]]:
+        """{runner_id: load} per event, built on demand for reports."""
+        return (
+            _loads_by_runner(self.runner_id_a, self.loads_a),
+            _loads_by_runner(self.runner_id_b, self.loads_b),
+        )
+
+    def as_tuple(self) -> Tuple[Dict[Any, int], Dict[Any, int], float, float, int, int]:
+        """Legacy (loads_a, loads_b, avg_a, avg_b, max_a, max_b) result."""
+        loads_a, loads_b = self.to_dicts()
+        return loads_a, loads_b, self.avg_load_a, self.avg_load_b, self.max_load_a, self.max_load_b
+
+
+class ConflictZoneEvaluator:
+    """
+    Per-segment evaluation of one event pair across conflict windows.
+
+    Overlap counting (original and binned paths), overtaking loads, F1 per-runner
+    validation and the flow audit all time the same runners through a km window
+    and compare every A/B pair. The evaluator extracts runner arrays once and
+    caches entry/exit arrays per window ``(a_start_km, a_end_km, b_start_km,
+    b_end_km)`` and the pairwise overlap/pass relation, so each consumer is a
+    view over shared results instead of its own DataFrame pass.
+
+    Conflict-zone timing treats a missing start offset as 0, while boundary
+    timing (pass direction, loads, F1) lets it propagate as NaN, matching the
+    per-row code this replaces; both share arrays when no offset is missing.
+    """
+
+    def __init__(
+        self,
+        df_a: pd.DataFrame,
+        df_b: pd.DataFrame,
+        event_a: str,
+        event_b: str,
+        start_times: Dict[str, float],
+    ) -> None:
+        self.event_a = event_a
+        self.event_b = event_b
+        self.pace_a, self.base_a, self.raw_base_a, self.runner_id_a, self.distance_a = \
+            self._event_arrays(df_a, start_times.get(event_a, 0) * 60.0)
+        self.pace_b, self.base_b, self.raw_base_b, self.runner_id_b, self.distance_b = \
+            self._event_arrays(df_b, start_times.get(event_b, 0) * 60.0)
+        self._raw_differs = self.raw_base_a is not self.base_a or self.raw_base_b is not self.base_b
+        self._unique_ids = (
+            len(set(self.runner_id_a.tolist())) == len(self.runner_id_a)
+            and len(set(self.runner_id_b.tolist())) == len(self.runner_id_b)
+        )
+        self._times: Dict[Tuple[ZoneWindow, bool], Tuple[np.ndarray, ...]] = {}
+        self._relations: Dict[Tuple[ZoneWindow, bool], ZoneRelation] = {}
+
+    @staticmethod
+    def _event_arrays(df: pd.DataFrame, start_sec: float):
+        pace = df["pace"].values * 60.0  # sec per km
+        if "start_offset" in df.columns:
+            raw_offset = df["start_offset"].values.astype(float)
+        else:
+            raw_offset = np.zeros(len(df))
+        base = start_sec + np.nan_to_num(raw_offset, nan=0.0)
+        raw_base = start_sec + raw_offset if np.isnan(raw_offset).any() else base
+        runner_id = df["runner_id"].values
+        distance = df["distance"].values if "distance" in df.columns else None
+        return pace, base, raw_base, runner_id, distance
+
+    @property
+    def n_a(self) -> int:
+        return len(self.pace_a)
+
+    @property
+    def n_b(self) -> int:
+        return len(self.pace_b)
+
+    def _key(self, window: ZoneWindow, raw: bool) -> Tuple[ZoneWindow, bool]:
+        return tuple(float(km) for km in window), raw and self._raw_differs
+
+    def times(self, window: ZoneWindow, raw: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(entry_a, exit_a, entry_b, exit_b) arrival times in seconds for a km window."""
+        key = self._key(window, raw)
+        cached = self._times.get(key)
+        if cached is None:
+            a_start, a_end, b_start, b_end = key[0]
+            base_a = self.raw_base_a if key[1] else self.base_a
+            base_b = self.raw_base_b if key[1] else self.base_b
+            cached = (
+                base_a + self.pace_a * a_start,
+                base_a + self.pace_a * a_end,
+                base_b + self.pace_b * b_start,
+                base_b + self.pace_b * b_end,
+            )
+            self._times[key] = cached
+        return cached
+
+    def relation(self, window: ZoneWindow, raw: bool = False) -> ZoneRelation:
+        """Pairwise overlap duration and pass flags for all runners in a km window."""
+        key = self._key(window, raw)
+        cached = self._relations.get(key)
+        if cached is None:
+            # Evict before building so at most _ZONE_RELATION_CACHE_SIZE sets are alive
+            while len(self._relations) >= _ZONE_RELATION_CACHE_SIZE:
+                self._relations.pop(next(iter(self._relations)))
+            entry_a, exit_a, entry_b, exit_b = self.times(window, raw)
+            enter_a_2d, exit_a_2d = entry_a[:, np.newaxis], exit_a[:, np.newaxis]
+            enter_b_2d, exit_b_2d = entry_b[np.newaxis, :], exit_b[np.newaxis, :]
+            cached = ZoneRelation(
+                duration=np.minimum(exit_a_2d, exit_b_2d) - np.maximum(enter_a_2d, enter_b_2d),
+                a_passes_b=(enter_a_2d > enter_b_2d) & (exit_a_2d < exit_b_2d),
+                b_passes_a=(enter_b_2d > enter_a_2d) & (exit_b_2d < exit_a_2d),
+            )
+            self._relations[key] = cached
+        return cached
+
+    def convergence_overlaps(
+        self,
+        cp_km: float,
+        from_km_a: float,
+        to_km_a: float,
+        from_km_b: float,
+        to_km_b: float,
+        min_overlap_duration: float,
+        conflict_length_m: float,
+        rows_a: Optional[np.ndarray] = None,
+        rows_b: Optional[np.ndarray] = None,
+    ) -> Tuple[int, int, int, int, List[str], List[str], int, int]:
+        """
+        Overtakes, co-presence, bib lists, unique encounters and participants.
+
+        Pairs whose conflict-zone overlap reaches ``min_overlap_duration`` are
+        encounters; among those, co-presence and directional passes are judged
+        at the pass boundary window (see ``_pass_boundary_window``). ``rows_a``/
+        ``rows_b`` restrict the evaluation to a subset of runners (time bins).
+        """
+        rows_a = np.arange(self.n_a) if rows_a is None else rows_a
+        rows_b = np.arange(self.n_b) if rows_b is None else rows_b
+        if len(rows_a) == 0 or len(rows_b) == 0:
+            return 0, 0, 0, 0, [], [], 0, 0
+        if to_km_a - from_km_a <= 0 or to_km_b - from_km_b <= 0:
+            return 0, 0, 0, 0, [], [], 0, 0
+
+        window = _convergence_zone_window(cp_km, from_km_a, to_km_a, from_km_b, to_km_b, conflict_length_m)
+        duration = self.relation(window).duration
+        if len(rows_a) != self.n_a or len(rows_b) != self.n_b:
+            duration = duration[np.ix_(rows_a, rows_b)]
+        pair_i, pair_j = np.nonzero(duration >= min_overlap_duration)
+        idx_a, idx_b = rows_a[pair_i], rows_b[pair_j]
+
+        entry_a, exit_a, entry_b, exit_b = self.times(
+            _pass_boundary_window(from_km_a, to_km_a, from_km_b, to_km_b), raw=True
+        )
+        start_a, end_a = entry_a[idx_a], exit_a[idx_a]
+        start_b, end_b = entry_b[idx_b], exit_b[idx_b]
+        temporal_overlap = (start_a < end_b) & (start_b < end_a)
+        a_passes_b = temporal_overlap & (start_a > start_b) & (end_a < end_b)
+        b_passes_a = temporal_overlap & (start_b > start_a) & (end_b < end_a)
+
+        ids_a, ids_b = self.runner_id_a[idx_a], self.runner_id_b[idx_b]
+        # Sets are filled in pair order so list() order matches the per-pair loop
+        a_bibs_overtakes = set(ids_a[a_passes_b])
+        b_bibs_overtakes = set(ids_b[b_passes_a])
+        a_bibs_copresence = set(ids_a[temporal_overlap])
+        b_bibs_copresence = set(ids_b[temporal_overlap])
+        if self._unique_ids:
+            unique_encounters = len(idx_a)
+        else:
+            unique_encounters = len(set(zip(ids_a, ids_b)))
+
+        all_a_bibs = a_bibs_overtakes.union(a_bibs_copresence)
+        all_b_bibs = b_bibs_overtakes.union(b_bibs_copresence)
+        participants_involved = len(all_a_bibs.union(all_b_bibs))
+
+        return (len(a_bibs_overtakes), len(b_bibs_overtakes),
+                len(a_bibs_copresence), len(b_bibs_copresence),
+                list(a_bibs_overtakes), list(b_bibs_overtakes),
+                unique_encounters, participants_involved)
+
+    def overtaking_loads(self, window: ZoneWindow, min_overlap_duration: float) -> OvertakingLoads:
+        """
+        Per-runner pass counts for runners who reach the end of ``window``.
+
+        A passes B when A enters after and exits before B, so the pair's
+        overlap is A's own dwell time; each runner's load is the number of
+        other-event runners whose dwell interval strictly encloses its own,
+        provided that dwell is not below ``min_overlap_duration``.
+        """
+        if self.distance_a is None or self.distance_b is None:
+            return OvertakingLoads.empty()
+        rows_a = np.flatnonzero(self.distance_a >= window[1])
+        rows_b = np.flatnonzero(self.distance_b >= window[3])
+        if len(rows_a) == 0 or len(rows_b) == 0:
+            return OvertakingLoads.empty()
+
+        entry_a, exit_a, entry_b, exit_b = self.times(window, raw=True)
+        entry_a, exit_a = entry_a[rows_a], exit_a[rows_a]
+        entry_b, exit_b = entry_b[rows_b], exit_b[rows_b]
+        loads_a = _enclosing_counts(entry_a, exit_a, entry_b, exit_b)
+        loads_b = _enclosing_counts(entry_b, exit_b, entry_a, exit_a)
+        loads_a[(exit_a - entry_a) < min_overlap_duration] = 0
+        loads_b[(exit_b - entry_b) < min_overlap_duration] = 0
+        return OvertakingLoads(
+            runner_index_a=rows_a,
+            runner_index_b=rows_b,
+            loads_a=loads_a,
+            loads_b=loads_b,
+            runner_id_a=self.runner_id_a[rows_a],
+            runner_id_b=self.runner_id_b[rows_b],
+        )
+
+    def entry_exit_validation(self, window: ZoneWindow) -> Dict[str, Any]:
+        """
+        Per-runner entry/exit validation counts for a window (F1 check).
+
+        Every pair with positive overlap is co-present; a pass is credited to
+        the runner who enters later and exits earlier.
+        """
+        entry_a, exit_a, entry_b, exit_b = self.times(window, raw=True)
+        relation = self.relation(window, raw=True)
+        overlap_i, overlap_j = np.nonzero(relation.duration > 0)
+        ids_a, ids_b = self.runner_id_a[overlap_i], self.runner_id_b[overlap_j]
+        a_passes_b = relation.a_passes_b[overlap_i, overlap_j]
+        b_passes_a = relation.b_passes_a[overlap_i, overlap_j]
+
+        overlap_pairs = [
+            {
+                "a_id": a_id,
+                "b_id": b_id,
+                "a_entry": entry_a[i],
+                "a_exit": exit_a[i],
+                "b_entry": entry_b[j],
+                "b_exit": exit_b[j],
+                "overlap_duration": relation.duration[i, j],
+                "a_passes_b": bool(relation.a_passes_b[i, j]),
+                "b_passes_a": bool(relation.b_passes_a[i, j]),
+            }
+            for i, j, a_id, b_id in zip(
+                overlap_i[:10], overlap_j[:10], ids_a[:10].tolist(), ids_b[:10].tolist()
+            )
+        ]
+        return {
+            "overtakes_a": len(set(ids_a[a_passes_b].tolist())),
+            "overtakes_b": len(set(ids_b[b_passes_a].tolist())),
+            "copresence_a": len(set(ids_a.tolist())),
+            "copresence_b": len(set(ids_b.tolist())),
+            "overlap_pair_count": len(overlap_i),
+            "overlap_pairs": overlap_pairs,
+        }
+
+
 def _get_event_distance_range(segment: pd.Series, event: str) -> Tuple[float, float]:
     """
     Extract distance range for a specific event from segment data.
@@ -584,6 +1081,128 @@ def clamp_normalized_fraction(fraction: float, reason_prefix: str = "") -> Tuple
 # Use shared utility function from utils module
 
 
+# Upper bound on elements per broadcast block / candidate batch in the true-pass search
+_TRUE_PASS_BLOCK_ELEMENTS = 2_000_000
+
+
+def _event_arrival_arrays(df: pd.DataFrame, start_sec: float) -> Tuple[np.ndarray, np.ndarray]:
+    """(start + start_offset, pace in sec/km) arrays for one event's runners."""
+    pace = df["pace"].values * 60.0  # sec per km
+    offset = df.get("start_offset", pd.Series([0]*len(df))).fillna(0).values.astype(float)
+    return start_sec + offset, pace
+
+
+def _true_pass_check_points(from_km: float, to_km: float, step_km: float) -> List[float]:
+    """Distance check points from from_km to to_km (inclusive) by step_km."""
+    check_points = []
+    current_km = from_km
+    while current_km <= to_km:
+        check_points.append(current_km)
+        current_km += step_km
+    return check_points
+
+
+def _true_pass_points_from_arrays(
+    base_a: np.ndarray,
+    pace_a: np.ndarray,
+    base_b: np.ndarray,
+    pace_b: np.ndarray,
+    from_km: float,
+    to_km: float,
+    step_km: float,
+    tolerance_seconds: float,
+) -> List[float]:
+    """
+    Single-pass true-pass search over every check point in [from_km, to_km].
+
+    Arrival time at km is ``base + pace * km``. A pair (a, b) is a true pass at
+    a check point when their arrivals there are within ``tolerance_seconds``
+    and the pair passes, converges or runs together between from_km and to_km.
+    The pass relation depends only on the range, so it is evaluated for
+    candidate pairs only: B arrivals are sorted per check point (reusing the
+    first point's order, which changes little between adjacent points) and
+    each A arrival is matched to the B arrivals within tolerance by a single
+    searchsorted over all check points in a block.
+    """
+    check_points = _true_pass_check_points(from_km, to_km, step_km)
+    # Runners with a non-finite pace or start never arrive within tolerance
+    keep_a = np.isfinite(base_a) & np.isfinite(pace_a)
+    keep_b = np.isfinite(base_b) & np.isfinite(pace_b)
+    base_a, pace_a = base_a[keep_a], pace_a[keep_a]
+    base_b, pace_b = base_b[keep_b], pace_b[keep_b]
+    if not check_points or base_a.size == 0 or base_b.size == 0:
+        return []
+
+    # Boundary arrivals fix the pass relation for every check point
+    start_a = base_a + pace_a * from_km
+    start_b = base_b + pace_b * from_km
+    end_a = base_a + pace_a * to_km
+    end_b = base_b + pace_b * to_km
+
+    km = np.asarray(check_points, dtype=float)
+    n, m = base_a.size, base_b.size
+    order0 = np.argsort(base_b + pace_b * km[0], kind="stable")
+    # Candidate search is widened slightly; the exact tolerance test follows
+    search_tol = tolerance_seconds + 1e-6
+    hit_points = np.zeros(km.size, dtype=bool)
+    # Bounded rows per block also keeps the stacked search keys well within float precision
+    block = max(1, min(256, _TRUE_PASS_BLOCK_ELEMENTS // (n + m)))
+
+    for k0 in range(0, km.size, block):
+        km_blk = km[k0:k0 + block]
+        rows = km_blk.size
+        times_a = base_a[np.newaxis, :] + pace_a[np.newaxis, :] * km_blk[:, np.newaxis]
+        times_b = base_b[np.newaxis, :] + pace_b[np.newaxis, :] * km_blk[:, np.newaxis]
+        # Per-row B order: start from the first check point's order (nearly sorted)
+        perm = np.argsort(times_b[:, order0], axis=1, kind="stable")
+        idx_b = order0[perm]
+        sorted_b = np.take_along_axis(times_b, idx_b, axis=1)
+
+        # Lay rows end to end on one axis so one searchsorted serves every row;
+        # queries are clamped to their own row's band before shifting
+        row_lo = sorted_b[:, :1]
+        row_width = sorted_b[:, -1:] - row_lo
+        span = float(np.max(row_width)) + 4.0 * search_tol + 1.0
+        row_shift = np.arange(rows, dtype=float)[:, np.newaxis] * span
+        keys = (sorted_b - row_lo + row_shift).ravel()
+        query = np.clip(times_a - row_lo, -2.0 * search_tol, row_width + 2.0 * search_tol) + row_shift
+        lo = np.searchsorted(keys, (query - search_tol).ravel(), side="left")
+        hi = np.searchsorted(keys, (query + search_tol).ravel(), side="right")
+        counts = hi - lo
+        if not counts.any():
+            continue
+
+        # Expand candidate pairs in bounded batches of queries
+        flat_a = times_a.ravel()
+        flat_b = sorted_b.ravel()
+        flat_idx_b = idx_b.ravel()
+        cum = np.cumsum(counts)
+        q0 = 0
+        while q0 < counts.size:
+            limit = (cum[q0 - 1] if q0 else 0) + _TRUE_PASS_BLOCK_ELEMENTS
+            q1 = max(q0 + 1, int(np.searchsorted(cum, limit, side="right")))
+            q_counts = counts[q0:q1]
+            total = int(q_counts.sum())
+            if total:
+                q = np.repeat(np.arange(q0, q1), q_counts)
+                within = np.arange(total) - np.repeat(np.cumsum(q_counts) - q_counts, q_counts)
+                pos = lo[q] + within
+                i = q % n
+                j = flat_idx_b[pos]
+                temporal = np.abs(flat_a[q] - flat_b[pos]) <= tolerance_seconds
+                sa, sb, ea, eb = start_a[i], start_b[j], end_a[i], end_b[j]
+                # Pass A -> B or B -> A: order at from_km flips by to_km
+                passed = ((sa > sb) & (ea < eb)) | ((sb > sa) & (eb < ea))
+                # Convergence at both boundaries, or running together (close in time at both)
+                convergence = (np.abs(sa - sb) <= tolerance_seconds) & (np.abs(ea - eb) <= tolerance_seconds)
+                together = (np.abs(sa - sb) <= tolerance_seconds * 2) & (np.abs(ea - eb) <= tolerance_seconds * 2)
+                hit = temporal & (passed | convergence | together)
+                hit_points[k0 + q[hit] // n] = True
+            q0 = q1
+
+    return [float(check_points[k]) for k in np.flatnonzero(hit_points)]
+
+
 def _collect_all_true_pass_points(
     dfA: pd.DataFrame,
     dfB: pd.DataFrame,
@@ -619,75 +1238,12 @@ def _collect_all_true_pass_points(
     from app.utils.constants import TRUE_PASS_DETECTION_TOLERANCE_SECONDS
     
     # Get absolute start times in seconds
-    start_a = start_times.get(eventA, 0) * 60.0
-    start_b = start_times.get(eventB, 0) * 60.0
-    
-    # Create distance check points along the segment
-    check_points = []
-    current_km = from_km
-    while current_km <= to_km:
-        check_points.append(current_km)
-        current_km += step_km
-    
-    true_pass_points = []
-    tolerance_seconds = TRUE_PASS_DETECTION_TOLERANCE_SECONDS
-    
-    # For each check point, detect true passes
-    for km_point in check_points:
-        # Calculate arrival times for all runners at this point
-        pace_a = dfA["pace"].values * 60.0  # sec per km
-        offset_a = dfA.get("start_offset", pd.Series([0]*len(dfA))).fillna(0).values.astype(float)
-        arrival_times_a = start_a + offset_a + pace_a * km_point
-        
-        pace_b = dfB["pace"].values * 60.0  # sec per km
-        offset_b = dfB.get("start_offset", pd.Series([0]*len(dfB))).fillna(0).values.astype(float)
-        arrival_times_b = start_b + offset_b + pace_b * km_point
-        
-        # Calculate arrival times at segment start (from_km)
-        arrival_start_a = start_a + offset_a + pace_a * from_km
-        arrival_start_b = start_b + offset_b + pace_b * from_km
-        
-        # Calculate arrival times at segment end (to_km)
-        arrival_end_a = start_a + offset_a + pace_a * to_km
-        arrival_end_b = start_b + offset_b + pace_b * to_km
-        
-        # Vectorized true pass detection using NumPy broadcasting
-        # Check for temporal overlap
-        time_diff = np.abs(arrival_times_a[:, np.newaxis] - arrival_times_b[np.newaxis, :])
-        temporal_overlaps = time_diff <= tolerance_seconds
-        
-        if not np.any(temporal_overlaps):
-            continue  # No temporal overlap at this km_point, skip to next
-        
-        # For pairs with temporal overlap, check directional passes
-        start_a_2d = arrival_start_a[:, np.newaxis]  # (n, 1)
-        start_b_2d = arrival_start_b[np.newaxis, :]  # (1, m)
-        end_a_2d = arrival_end_a[:, np.newaxis]      # (n, 1)
-        end_b_2d = arrival_end_b[np.newaxis, :]      # (1, m)
-        
-        # Check for pass A -> B (A overtakes B): A starts behind B but finishes ahead of B
-        pass_a_b = (start_a_2d > start_b_2d) & (end_a_2d < end_b_2d)
-        
-        # Check for pass B -> A (B overtakes A): B starts behind A but finishes ahead of A
-        pass_b_a = (start_b_2d > start_a_2d) & (end_b_2d < end_a_2d)
-        
-        # Check for convergence: runners meet at same time at both boundaries
-        start_convergence = np.abs(start_a_2d - start_b_2d) <= tolerance_seconds
-        end_convergence = np.abs(end_a_2d - end_b_2d) <= tolerance_seconds
-        convergence = start_convergence & end_convergence
-        
-        # Check for runners running together (close in time and space)
-        start_close = np.abs(start_a_2d - start_b_2d) <= tolerance_seconds * 2
-        end_close = np.abs(end_a_2d - end_b_2d) <= tolerance_seconds * 2
-        running_together = start_close & end_close
-        
-        # Combine all conditions: temporal overlap AND (pass OR convergence OR running together)
-        true_pass_mask = temporal_overlaps & (pass_a_b | pass_b_a | convergence | running_together)
-        
-        if np.any(true_pass_mask):
-            true_pass_points.append(float(km_point))
-    
-    return true_pass_points
+    base_a, pace_a = _event_arrival_arrays(dfA, start_times.get(eventA, 0) * 60.0)
+    base_b, pace_b = _event_arrival_arrays(dfB, start_times.get(eventB, 0) * 60.0)
+    return _true_pass_points_from_arrays(
+        base_a, pace_a, base_b, pace_b, from_km, to_km, step_km,
+        TRUE_PASS_DETECTION_TOLERANCE_SECONDS,
+    )
 
 
 def _extract_bin_peak_convergence_points(
@@ -782,19 +1338,34 @@ def calculate_convergence_points(
     Returns:
         List of ConvergencePoint objects (may be empty), merged from true-pass and bin-peak sources
     """
+    from app.utils.constants import TRUE_PASS_DETECTION_TOLERANCE_SECONDS
+    
     # Step 1: Collect true-pass convergence points
     true_pass_cps = []
     
+    # Arrival arrays extracted once and shared by every range scanned below
+    if dfA.empty or dfB.empty:
+        arrays = None
+    else:
+        arrays = (
+            *_event_arrival_arrays(dfA, start_times.get(eventA, 0) * 60.0),
+            *_event_arrival_arrays(dfB, start_times.get(eventB, 0) * 60.0),
+        )
+    
+    def _true_pass_points(range_start: float, range_end: float) -> List[float]:
+        if arrays is None:
+            return []
+        return _true_pass_points_from_arrays(
+            *arrays, range_start, range_end, step_km, TRUE_PASS_DETECTION_TOLERANCE_SECONDS
+        )
+    
     # Check if there's an intersection in absolute space first
     intersection_start = max(from_km_a, from_km_b)
     intersection_end = min(to_km_a, to_km_b)
     
     if intersection_start < intersection_end:
         # There is an intersection - use normal approach with true pass detection
-        true_pass_points = _collect_all_true_pass_points(
-            dfA, dfB, eventA, eventB, start_times,
-            intersection_start, intersection_end, step_km
-        )
+        true_pass_points = _true_pass_points(intersection_start, intersection_end)
         
         # Convert to ConvergencePoint objects
         true_pass_cps = [
@@ -825,10 +1396,7 @@ def calculate_convergence_points(
                 range_end = min(to_km_a, abs_km_a + tolerance_km)      # Ensure within segment bounds
                 
                 # Collect true pass points in this range
-                true_pass_points = _collect_all_true_pass_points(
-                    dfA, dfB, eventA, eventB, start_times,
-                    range_start, range_end, step_km
-                )
+                true_pass_points = _true_pass_points(range_start, range_end)
                 
                 # Add to convergence points list (using event A coordinate)
                 for km_point in true_pass_points:
@@ -846,20 +1414,13 @@ def calculate_convergence_points(
     convergence_points = []
     if all_cps:
         unique_points = []
-        seen_km = set()
         tolerance_km = CONVERGENCE_POINT_TOLERANCE_KM
         
         for cp in sorted(all_cps, key=lambda x: x.km):
-            # Check if this km is close to any we've already seen
-            is_duplicate = False
-            for seen in seen_km:
-                if abs(cp.km - seen) < tolerance_km:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                unique_points.append(cp)
-                seen_km.add(cp.km)
+            # Points ascend, so the last kept point is the nearest one already seen
+            if unique_points and abs(cp.km - unique_points[-1].km) < tolerance_km:
+                continue
+            unique_points.append(cp)
         
         convergence_points = unique_points
     
@@ -1012,6 +1573,11 @@ def calculate_zone_metrics_vectorized_binned(
     Issue #613: Optimized binning that uses cached arrays and vectorized operations
     instead of repeated DataFrame filtering and per-bin calls to original method.
     
+    Runner IDs are mapped to dense codes once per segment (see
+    SegmentFlowCache.runner_codes); each bin ORs its interaction masks into one
+    boolean row per category, and unique participants come from a single
+    OR-reduction over those rows instead of per-bin set unions.
+    
     Args:
         zone: ConflictZone with pre-computed boundaries
         cache: SegmentFlowCache with pre-computed event arrays
@@ -1024,29 +1590,28 @@ def calculate_zone_metrics_vectorized_binned(
     Returns:
         Dictionary with zone metrics aggregated across all bins
     """
-    # Track results across all bins
-    # Use full participant sets (not just samples) for accurate cross-bin accumulation
-    all_a_bibs_across_bins = set()  # Full set of A runners across all bins
-    all_b_bibs_across_bins = set()  # Full set of B runners across all bins
-    # Also track samples for CSV output
-    all_a_bibs_overtakes = set()  # Samples of A runners who overtook (for CSV)
-    all_b_bibs_overtakes = set()  # Samples of B runners who overtook (for CSV)
-    # Issue #622: Track overtaken runners as sets (across bins) for accurate counts
-    all_a_bibs_overtaken = set()  # A runners who were overtaken (across all bins)
-    all_b_bibs_overtaken = set()  # B runners who were overtaken (across all bins)
-    all_a_bibs_copresence = set()  # Not used for participants_involved, kept for compatibility
-    all_b_bibs_copresence = set()  # Not used for participants_involved, kept for compatibility
+    codes_a, codes_b, runner_ids = cache.runner_codes()
+    # One row per category over the shared runner codes, OR-accumulated across bins
+    seen = np.zeros((len(_ZONE_CATEGORIES), len(runner_ids)), dtype=bool)
     total_unique_encounters = 0
     
+    def _accumulate(window: ZoneWindow, rows_a: Optional[np.ndarray] = None, rows_b: Optional[np.ndarray] = None) -> None:
+        nonlocal total_unique_encounters
+        masks, unique_encounters = _zone_interaction_masks(
+            window, cache, min_overlap_duration, rows_a, rows_b
+        )
+        row_codes_a = codes_a if rows_a is None else codes_a[rows_a]
+        row_codes_b = codes_b if rows_b is None else codes_b[rows_b]
+        for category_idx, category in enumerate(_ZONE_CATEGORIES):
+            row_codes = row_codes_a if category.startswith("a_") else row_codes_b
+            seen[category_idx, row_codes[masks[category]]] = True
+        total_unique_encounters += unique_encounters
+    
     if use_time_bins:
-        # Get zone boundaries
-        zone_start_km_a = zone.zone_start_km_a
-        zone_end_km_a = zone.zone_end_km_a
-        zone_start_km_b = zone.zone_start_km_b
-        zone_end_km_b = zone.zone_end_km_b
         # Time binning: use vectorized membership masks
         bin_duration_minutes = TEMPORAL_BINNING_THRESHOLD_MINUTES
         bin_duration_seconds = bin_duration_minutes * 60.0
+        window = (zone.zone_start_km_a, zone.zone_end_km_a, zone.zone_start_km_b, zone.zone_end_km_b)
         
         # Compute entry/exit times for full segment using cached arrays (vectorized)
         entry_time_a = cache.start_time_a + cache.offset_a + cache.pace_a * cache.from_km_a  # (n,)
@@ -1066,88 +1631,13 @@ def calculate_zone_metrics_vectorized_binned(
             bin_end = min(overlap_start + ((bin_idx + 1) * bin_duration_seconds), overlap_end)
             
             # Vectorized membership masks: runners active in this time bin
-            a_in_bin = (entry_time_a <= bin_end) & (exit_time_a >= bin_start)  # (n,) boolean
-            b_in_bin = (entry_time_b <= bin_end) & (exit_time_b >= bin_start)  # (m,) boolean
+            a_indices = np.flatnonzero((entry_time_a <= bin_end) & (exit_time_a >= bin_start))
+            b_indices = np.flatnonzero((entry_time_b <= bin_end) & (exit_time_b >= bin_start))
             
-            if not (np.any(a_in_bin) and np.any(b_in_bin)):
+            if len(a_indices) == 0 or len(b_indices) == 0:
                 continue  # Skip empty bins
             
-            # Get sub-arrays for runners in this bin
-            a_indices = np.where(a_in_bin)[0]
-            b_indices = np.where(b_in_bin)[0]
-            
-            # Create temporary zone with same boundaries for this bin
-            bin_zone = ConflictZone(
-                cp=zone.cp,
-                zone_start_km_a=zone_start_km_a,
-                zone_end_km_a=zone_end_km_a,
-                zone_start_km_b=zone_start_km_b,
-                zone_end_km_b=zone_end_km_b,
-                zone_index=zone.zone_index,
-                source=zone.source,
-                metrics={}
-            )
-            
-            # Create sub-cache with filtered arrays
-            bin_cache = SegmentFlowCache(
-                event_a=cache.event_a,
-                event_b=cache.event_b,
-                start_time_a=cache.start_time_a,
-                start_time_b=cache.start_time_b,
-                pace_a=cache.pace_a[a_indices],
-                pace_b=cache.pace_b[b_indices],
-                offset_a=cache.offset_a[a_indices],
-                offset_b=cache.offset_b[b_indices],
-                runner_id_a=cache.runner_id_a[a_indices],
-                runner_id_b=cache.runner_id_b[b_indices],
-                from_km_a=cache.from_km_a,
-                to_km_a=cache.to_km_a,
-                from_km_b=cache.from_km_b,
-                to_km_b=cache.to_km_b,
-            )
-            
-            # Calculate metrics for this bin using direct vectorized path (no further binning)
-            bin_metrics = calculate_zone_metrics_vectorized_direct(
-                bin_zone, bin_cache, min_overlap_duration
-            )
-            
-            # Accumulate results
-            # Use full participant sets (not just samples) to accurately track all runners across bins
-            bin_all_a_bibs = bin_metrics.get("_all_a_bibs", set())
-            bin_all_b_bibs = bin_metrics.get("_all_b_bibs", set())
-            if isinstance(bin_all_a_bibs, list):
-                bin_all_a_bibs = set(bin_all_a_bibs)
-            if isinstance(bin_all_b_bibs, list):
-                bin_all_b_bibs = set(bin_all_b_bibs)
-            all_a_bibs_across_bins.update(bin_all_a_bibs)
-            all_b_bibs_across_bins.update(bin_all_b_bibs)
-            # Issue #622: Accumulate separate category sets for accurate multi_category_runners calculation
-            bin_a_overtakes = bin_metrics.get("_a_bibs_overtakes", set())
-            bin_b_overtakes = bin_metrics.get("_b_bibs_overtakes", set())
-            bin_a_overtaken = bin_metrics.get("_a_bibs_overtaken", set())
-            bin_b_overtaken = bin_metrics.get("_b_bibs_overtaken", set())
-            bin_a_copresence = bin_metrics.get("_a_bibs_copresence", set())
-            bin_b_copresence = bin_metrics.get("_b_bibs_copresence", set())
-            # Convert to sets if they're lists
-            if isinstance(bin_a_overtakes, list):
-                bin_a_overtakes = set(bin_a_overtakes)
-            if isinstance(bin_b_overtakes, list):
-                bin_b_overtakes = set(bin_b_overtakes)
-            if isinstance(bin_a_overtaken, list):
-                bin_a_overtaken = set(bin_a_overtaken)
-            if isinstance(bin_b_overtaken, list):
-                bin_b_overtaken = set(bin_b_overtaken)
-            if isinstance(bin_a_copresence, list):
-                bin_a_copresence = set(bin_a_copresence)
-            if isinstance(bin_b_copresence, list):
-                bin_b_copresence = set(bin_b_copresence)
-            all_a_bibs_overtakes.update(bin_a_overtakes)
-            all_b_bibs_overtakes.update(bin_b_overtakes)
-            all_a_bibs_overtaken.update(bin_a_overtaken)
-            all_b_bibs_overtaken.update(bin_b_overtaken)
-            all_a_bibs_copresence.update(bin_a_copresence)
-            all_b_bibs_copresence.update(bin_b_copresence)
-            total_unique_encounters += bin_metrics.get("unique_encounters", 0)
+            _accumulate(window, a_indices, b_indices)
     
     elif use_distance_bins:
         # Distance binning: compute per-bin boundaries and use vectorized core
@@ -1162,212 +1652,150 @@ def calculate_zone_metrics_vectorized_binned(
             bin_start_b = cache.from_km_b + (bin_idx * bin_size_km)
             bin_end_b = min(cache.from_km_b + ((bin_idx + 1) * bin_size_km), cache.to_km_b)
             
-            # Create temporary zone with bin-specific boundaries
-            bin_zone = ConflictZone(
-                cp=zone.cp,
-                zone_start_km_a=bin_start_a,
-                zone_end_km_a=bin_end_a,
-                zone_start_km_b=bin_start_b,
-                zone_end_km_b=bin_end_b,
-                zone_index=zone.zone_index,
-                source=zone.source,
-                metrics={}
-            )
-            
-            # Calculate metrics for this bin using direct vectorized path
-            bin_metrics = calculate_zone_metrics_vectorized_direct(
-                bin_zone, cache, min_overlap_duration
-            )
-            
-            # Accumulate results
-            # Use full participant sets (not just samples) to accurately track all runners across bins
-            bin_all_a_bibs = bin_metrics.get("_all_a_bibs", set())
-            bin_all_b_bibs = bin_metrics.get("_all_b_bibs", set())
-            if isinstance(bin_all_a_bibs, list):
-                bin_all_a_bibs = set(bin_all_a_bibs)
-            if isinstance(bin_all_b_bibs, list):
-                bin_all_b_bibs = set(bin_all_b_bibs)
-            all_a_bibs_across_bins.update(bin_all_a_bibs)
-            all_b_bibs_across_bins.update(bin_all_b_bibs)
-            # Issue #622: Accumulate separate category sets for accurate multi_category_runners calculation
-            bin_a_overtakes = bin_metrics.get("_a_bibs_overtakes", set())
-            bin_b_overtakes = bin_metrics.get("_b_bibs_overtakes", set())
-            bin_a_overtaken = bin_metrics.get("_a_bibs_overtaken", set())
-            bin_b_overtaken = bin_metrics.get("_b_bibs_overtaken", set())
-            bin_a_copresence = bin_metrics.get("_a_bibs_copresence", set())
-            bin_b_copresence = bin_metrics.get("_b_bibs_copresence", set())
-            # Convert to sets if they're lists
-            if isinstance(bin_a_overtakes, list):
-                bin_a_overtakes = set(bin_a_overtakes)
-            if isinstance(bin_b_overtakes, list):
-                bin_b_overtakes = set(bin_b_overtakes)
-            if isinstance(bin_a_overtaken, list):
-                bin_a_overtaken = set(bin_a_overtaken)
-            if isinstance(bin_b_overtaken, list):
-                bin_b_overtaken = set(bin_b_overtaken)
-            if isinstance(bin_a_copresence, list):
-                bin_a_copresence = set(bin_a_copresence)
-            if isinstance(bin_b_copresence, list):
-                bin_b_copresence = set(bin_b_copresence)
-            all_a_bibs_overtakes.update(bin_a_overtakes)
-            all_b_bibs_overtakes.update(bin_b_overtakes)
-            all_a_bibs_overtaken.update(bin_a_overtaken)
-            all_b_bibs_overtaken.update(bin_b_overtaken)
-            all_a_bibs_copresence.update(bin_a_copresence)
-            all_b_bibs_copresence.update(bin_b_copresence)
-            total_unique_encounters += bin_metrics.get("unique_encounters", 0)
-    
-    # Calculate final participants involved using full sets accumulated across all bins
-    # This correctly handles runners who appear in multiple bins (deduplicated via set union)
-    participants_involved = len(all_a_bibs_across_bins.union(all_b_bibs_across_bins))
+            _accumulate((bin_start_a, bin_end_a, bin_start_b, bin_end_b))
+    
+    # Runners seen in any category across all bins (deduplicated by code)
+    participants_involved = int(np.count_nonzero(seen.any(axis=0)))
+    category_counts = seen.sum(axis=1)
     
     # Issue #622: Calculate multi-category runners for validation
-    # Now that we're tracking separate category sets, we can calculate accurately
-    sum_of_counts = (len(all_a_bibs_overtakes) + len(all_b_bibs_overtakes) +
-                     len(all_a_bibs_overtaken) + len(all_b_bibs_overtaken) +
-                     len(all_a_bibs_copresence) + len(all_b_bibs_copresence))
+    sum_of_counts = int(category_counts.sum())
     multi_category_runners = max(0, sum_of_counts - participants_involved)
     
+    # Materialize ID sets once, for samples and the fz_runners.parquet export (Issue #627)
+    bib_sets = {
+        category: set(runner_ids[seen[category_idx]].tolist())
+        for category_idx, category in enumerate(_ZONE_CATEGORIES)
+    }
+    all_a_bibs = bib_sets["a_overtakes"] | bib_sets["a_overtaken"] | bib_sets["a_copresence"]
+    all_b_bibs = bib_sets["b_overtakes"] | bib_sets["b_overtaken"] | bib_sets["b_copresence"]
+    
     return {
-        "overtaking_a": len(all_a_bibs_overtakes),
-        "overtaking_b": len(all_b_bibs_overtakes),
-        "overtaken_a": len(all_a_bibs_overtaken),  # Issue #622: A runners overtaken (accurate with full sets)
-        "overtaken_b": len(all_b_bibs_overtaken),  # Issue #622: B runners overtaken (accurate with full sets)
-        "copresence_a": len(all_a_bibs_copresence),
-        "copresence_b": len(all_b_bibs_copresence),
-        "sample_a": list(all_a_bibs_overtakes)[:10],
-        "sample_b": list(all_b_bibs_overtakes)[:10],
+        "overtaking_a": int(category_counts[0]),
+        "overtaking_b": int(category_counts[1]),
+        "overtaken_a": int(category_counts[2]),  # Issue #622: A runners overtaken (accurate with full sets)
+        "overtaken_b": int(category_counts[3]),  # Issue #622: B runners overtaken (accurate with full sets)
+        "copresence_a": int(category_counts[4]),
+        "copresence_b": int(category_counts[5]),
+        "sample_a": list(bib_sets["a_overtakes"])[:10],
+        "sample_b": list(bib_sets["b_overtakes"])[:10],
         "unique_encounters": total_unique_encounters,
         "participants_involved": participants_involved,
         "multi_category_runners": multi_category_runners,  # Issue #622: Overlap count for validation
         # Full participant sets for accurate cross-bin accumulation (internal use)
-        "_all_a_bibs": all_a_bibs_across_bins,  # Full set of A runners (overtaking + overtaken + copresence)
-        "_all_b_bibs": all_b_bibs_across_bins,  # Full set of B runners (overtaking + overtaken + copresence)
+        "_all_a_bibs": all_a_bibs,  # Full set of A runners (overtaking + overtaken + copresence)
+        "_all_b_bibs": all_b_bibs,  # Full set of B runners (overtaking + overtaken + copresence)
         # Issue #627: Include internal sets for fz_runners.parquet export
-        "_a_bibs_overtakes": all_a_bibs_overtakes,  # A runners who overtook (full set)
-        "_b_bibs_overtakes": all_b_bibs_overtakes,  # B runners who overtook (full set)
-        "_a_bibs_overtaken": all_a_bibs_overtaken,  # A runners who were overtaken (full set)
-        "_b_bibs_overtaken": all_b_bibs_overtaken,  # B runners who were overtaken (full set)
-        "_a_bibs_copresence": all_a_bibs_copresence,  # A runners who were copresent (full set)
-        "_b_bibs_copresence": all_b_bibs_copresence,  # B runners who were copresent (full set)
+        "_a_bibs_overtakes": bib_sets["a_overtakes"],  # A runners who overtook (full set)
+        "_b_bibs_overtakes": bib_sets["b_overtakes"],  # B runners who overtook (full set)
+        "_a_bibs_overtaken": bib_sets["a_overtaken"],  # A runners who were overtaken (full set)
+        "_b_bibs_overtaken": bib_sets["b_overtaken"],  # B runners who were overtaken (full set)
+        "_a_bibs_copresence": bib_sets["a_copresence"],  # A runners who were copresent (full set)
+        "_b_bibs_copresence": bib_sets["b_copresence"],  # B runners who were copresent (full set)
     }
 
 
-def calculate_zone_metrics_vectorized_direct(
-    zone: ConflictZone,
+# Per-runner interaction categories produced by _zone_interaction_masks (Issue #620/#622)
+_ZONE_CATEGORIES = (
+    "a_overtakes", "b_overtakes",
+    "a_overtaken", "b_overtaken",
+    "a_copresence", "b_copresence",
+)
+
+
+def _zone_interaction_masks(
+    window: ZoneWindow,
     cache: SegmentFlowCache,
     min_overlap_duration: float,
-) -> Dict[str, Any]:
+    rows_a: Optional[np.ndarray] = None,
+    rows_b: Optional[np.ndarray] = None,
+) -> Tuple[Dict[str, np.ndarray], int]:
     """
-    Direct vectorized calculation for a zone (no binning).
-    Extracted from calculate_zone_metrics_vectorized for reuse in binning paths.
-    
-    Args:
-        zone: ConflictZone with boundaries
-        cache: SegmentFlowCache with arrays
-        min_overlap_duration: Minimum overlap duration (seconds)
-        
-    Returns:
-        Dictionary with zone metrics
+    Per-runner interaction masks for one zone window.
+
+    ``rows_a``/``rows_b`` restrict the evaluation to a subset of runners (time
+    bins); masks are aligned with those rows. Returns ``(masks, unique_encounters)``
+    with one boolean array per entry in ``_ZONE_CATEGORIES``.
     """
-    zone_start_km_a = zone.zone_start_km_a
-    zone_end_km_a = zone.zone_end_km_a
-    zone_start_km_b = zone.zone_start_km_b
-    zone_end_km_b = zone.zone_end_km_b
+    zone_start_km_a, zone_end_km_a, zone_start_km_b, zone_end_km_b = window
+    pace_a = cache.pace_a if rows_a is None else cache.pace_a[rows_a]
+    offset_a = cache.offset_a if rows_a is None else cache.offset_a[rows_a]
+    pace_b = cache.pace_b if rows_b is None else cache.pace_b[rows_b]
+    offset_b = cache.offset_b if rows_b is None else cache.offset_b[rows_b]
     
     # Compute entry/exit times using cached arrays (vectorized)
-    time_enter_a = cache.start_time_a + cache.offset_a + cache.pace_a * zone_start_km_a
-    time_exit_a = cache.start_time_a + cache.offset_a + cache.pace_a * zone_end_km_a
-    time_enter_b = cache.start_time_b + cache.offset_b + cache.pace_b * zone_start_km_b
-    time_exit_b = cache.start_time_b + cache.offset_b + cache.pace_b * zone_end_km_b
-    
-    # Convert to NumPy arrays
-    time_enter_a_arr = np.array(time_enter_a)  # (n,)
-    time_exit_a_arr = np.array(time_exit_a)     # (n,)
-    time_enter_b_arr = np.array(time_enter_b)  # (m,)
-    time_exit_b_arr = np.array(time_exit_b)    # (m,)
+    time_enter_a = cache.start_time_a + offset_a + pace_a * zone_start_km_a
+    time_exit_a = cache.start_time_a + offset_a + pace_a * zone_end_km_a
+    time_enter_b = cache.start_time_b + offset_b + pace_b * zone_start_km_b
+    time_exit_b = cache.start_time_b + offset_b + pace_b * zone_end_km_b
     
     # Broadcast to compute all pairwise overlaps: (n, 1) vs (1, m) = (n, m)
-    enter_a_2d = time_enter_a_arr[:, np.newaxis]  # (n, 1)
-    exit_a_2d = time_exit_a_arr[:, np.newaxis]    # (n, 1)
-    enter_b_2d = time_enter_b_arr[np.newaxis, :]  # (1, m)
-    exit_b_2d = time_exit_b_arr[np.newaxis, :]    # (1, m)
-    
-    # Compute overlap start/end/duration for all pairs (vectorized)
-    overlap_start = np.maximum(enter_a_2d, enter_b_2d)  # (n, m)
-    overlap_end = np.minimum(exit_a_2d, exit_b_2d)      # (n, m)
-    overlap_duration = overlap_end - overlap_start       # (n, m)
+    enter_a_2d = time_enter_a[:, np.newaxis]  # (n, 1)
+    exit_a_2d = time_exit_a[:, np.newaxis]    # (n, 1)
+    enter_b_2d = time_enter_b[np.newaxis, :]  # (1, m)
+    exit_b_2d = time_exit_b[np.newaxis, :]    # (1, m)
     
     # Find pairs with sufficient temporal overlap
+    overlap_duration = np.minimum(exit_a_2d, exit_b_2d) - np.maximum(enter_a_2d, enter_b_2d)  # (n, m)
     has_sufficient_overlap = overlap_duration >= min_overlap_duration  # (n, m) boolean
     
     # For true pass detection, compute boundary times once per zone (not per pair)
-    intersection_start = max(cache.from_km_a, cache.from_km_b)
-    intersection_end = min(cache.to_km_a, cache.to_km_b)
-    
-    # Compute boundary arrival times for all runners (vectorized)
-    if intersection_start < intersection_end:
-        # Use intersection boundaries
-        boundary_start = intersection_start
-        boundary_end = intersection_end
-        start_time_a_all = cache.start_time_a + cache.offset_a + cache.pace_a * boundary_start  # (n,)
-        end_time_a_all = cache.start_time_a + cache.offset_a + cache.pace_a * boundary_end      # (n,)
-        start_time_b_all = cache.start_time_b + cache.offset_b + cache.pace_b * boundary_start  # (m,)
-        end_time_b_all = cache.start_time_b + cache.offset_b + cache.pace_b * boundary_end      # (m,)
-    else:
-        # Use normalized conflict zone (for finish line convergence like M1)
-        segment_length_a = cache.to_km_a - cache.from_km_a
-        segment_length_b = cache.to_km_b - cache.from_km_b
-        conflict_zone_length = min(segment_length_a, segment_length_b) * 0.2
-        boundary_start_norm = 0.0
-        boundary_end_norm = conflict_zone_length
-        
-        abs_start_a = cache.from_km_a + boundary_start_norm
-        abs_end_a = cache.from_km_a + boundary_end_norm
-        abs_start_b = cache.from_km_b + boundary_start_norm
-        abs_end_b = cache.from_km_b + boundary_end_norm
-        
-        start_time_a_all = cache.start_time_a + cache.offset_a + cache.pace_a * abs_start_a  # (n,)
-        end_time_a_all = cache.start_time_a + cache.offset_a + cache.pace_a * abs_end_a      # (n,)
-        start_time_b_all = cache.start_time_b + cache.offset_b + cache.pace_b * abs_start_b  # (m,)
-        end_time_b_all = cache.start_time_b + cache.offset_b + cache.pace_b * abs_end_b      # (m,)
-    
-    # Vectorized pass detection: broadcast boundary times to (n, m) matrix
-    start_time_a_2d = start_time_a_all[:, np.newaxis]  # (n, 1)
-    end_time_a_2d = end_time_a_all[:, np.newaxis]      # (n, 1)
-    start_time_b_2d = start_time_b_all[np.newaxis, :]  # (1, m)
-    end_time_b_2d = end_time_b_all[np.newaxis, :]      # (1, m)
+    boundary_start_a, boundary_end_a, boundary_start_b, boundary_end_b = _pass_boundary_window(
+        cache.from_km_a, cache.to_km_a, cache.from_km_b, cache.to_km_b
+    )
+    start_time_a_2d = (cache.start_time_a + offset_a + pace_a * boundary_start_a)[:, np.newaxis]  # (n, 1)
+    end_time_a_2d = (cache.start_time_a + offset_a + pace_a * boundary_end_a)[:, np.newaxis]      # (n, 1)
+    start_time_b_2d = (cache.start_time_b + offset_b + pace_b * boundary_start_b)[np.newaxis, :]  # (1, m)
+    end_time_b_2d = (cache.start_time_b + offset_b + pace_b * boundary_end_b)[np.newaxis, :]      # (1, m)
     
     # Vectorized pass detection: A passes B if A starts behind B but finishes ahead
-    a_passes_b = (start_time_a_2d > start_time_b_2d) & (end_time_a_2d < end_time_b_2d)  # (n, m)
-    b_passes_a = (start_time_b_2d > start_time_a_2d) & (end_time_b_2d < end_time_a_2d)  # (n, m)
-    
-    # Combine temporal overlap and pass detection
-    a_passes_b_with_overlap = a_passes_b & has_sufficient_overlap  # (n, m)
-    b_passes_a_with_overlap = b_passes_a & has_sufficient_overlap  # (n, m)
+    a_passes_b = (start_time_a_2d > start_time_b_2d) & (end_time_a_2d < end_time_b_2d) & has_sufficient_overlap
+    b_passes_a = (start_time_b_2d > start_time_a_2d) & (end_time_b_2d < end_time_a_2d) & has_sufficient_overlap
     
     # Co-presence: temporal overlap without directional change
     temporal_overlap_matrix = (start_time_a_2d < end_time_b_2d) & (start_time_b_2d < end_time_a_2d)  # (n, m)
-    copresence = temporal_overlap_matrix & has_sufficient_overlap & ~a_passes_b_with_overlap & ~b_passes_a_with_overlap  # (n, m)
+    copresence = temporal_overlap_matrix & has_sufficient_overlap & ~a_passes_b & ~b_passes_a  # (n, m)
+    
+    masks = {
+        "a_overtakes": np.any(a_passes_b, axis=1),  # A runners who overtook B
+        "b_overtakes": np.any(b_passes_a, axis=0),  # B runners who overtook A
+        "a_overtaken": np.any(b_passes_a, axis=1),  # A runners who were overtaken by B
+        "b_overtaken": np.any(a_passes_b, axis=0),  # B runners who were overtaken by A
+        "a_copresence": np.any(copresence, axis=1),
+        "b_copresence": np.any(copresence, axis=0),
+    }
+    return masks, int(np.sum(has_sufficient_overlap))
+
+
+def calculate_zone_metrics_vectorized_direct(
+    zone: ConflictZone,
+    cache: SegmentFlowCache,
+    min_overlap_duration: float,
+) -> Dict[str, Any]:
+    """
+    Direct vectorized calculation for a zone (no binning).
+    Extracted from calculate_zone_metrics_vectorized for reuse in binning paths.
     
-    # Reduce to per-runner counts (vectorized)
-    a_has_pass = np.any(a_passes_b_with_overlap, axis=1)  # (n,) - A runners who overtook B
-    b_has_pass = np.any(b_passes_a_with_overlap, axis=0)  # (m,) - B runners who overtook A
-    a_has_overtaken = np.any(b_passes_a_with_overlap, axis=1)  # (n,) - A runners who were overtaken by B
-    b_has_overtaken = np.any(a_passes_b_with_overlap, axis=0)  # (m,) - B runners who were overtaken by A
-    a_has_copresence = np.any(copresence, axis=1)  # (n,)
-    b_has_copresence = np.any(copresence, axis=0)  # (m,)
+    Args:
+        zone: ConflictZone with boundaries
+        cache: SegmentFlowCache with arrays
+        min_overlap_duration: Minimum overlap duration (seconds)
+        
+    Returns:
+        Dictionary with zone metrics
+    """
+    masks, unique_encounters = _zone_interaction_masks(
+        (zone.zone_start_km_a, zone.zone_end_km_a, zone.zone_start_km_b, zone.zone_end_km_b),
+        cache, min_overlap_duration,
+    )
     
     # Extract runner IDs
-    a_bibs_overtakes = cache.runner_id_a[a_has_pass].tolist()
-    b_bibs_overtakes = cache.runner_id_b[b_has_pass].tolist()
-    a_bibs_overtaken = cache.runner_id_a[a_has_overtaken].tolist()
-    b_bibs_overtaken = cache.runner_id_b[b_has_overtaken].tolist()
-    a_bibs_copresence = cache.runner_id_a[a_has_copresence].tolist()
-    b_bibs_copresence = cache.runner_id_b[b_has_copresence].tolist()
-    
-    # Count unique pairs
-    unique_encounters = int(np.sum(has_sufficient_overlap))
+    a_bibs_overtakes = cache.runner_id_a[masks["a_overtakes"]].tolist()
+    b_bibs_overtakes = cache.runner_id_b[masks["b_overtakes"]].tolist()
+    a_bibs_overtaken = cache.runner_id_a[masks["a_overtaken"]].tolist()
+    b_bibs_overtaken = cache.runner_id_b[masks["b_overtaken"]].tolist()
+    a_bibs_copresence = cache.runner_id_a[masks["a_copresence"]].tolist()
+    b_bibs_copresence = cache.runner_id_b[masks["b_copresence"]].tolist()
     
     # Participants involved: union of all runners involved in any interaction
     # (overtaking, overtaken, or copresence)
@@ -2249,6 +2677,7 @@ def validate_per_runner_entry_exit_f1(
     from_km_b: float,
     to_km_b: float,
     conflict_length_m: float = CONFLICT_LENGTH_LONG_SEGMENT_M,
+    evaluator: Optional[ConflictZoneEvaluator] = None,
 ) -> Dict[str, Any]:
     """
     PER-RUNNER ENTRY/EXIT VALIDATION for F1 Half vs 10K segment.
@@ -2267,123 +2696,22 @@ def validate_per_runner_entry_exit_f1(
     if df_a.empty or df_b.empty:
         return {"error": "Empty dataframes provided"}
     
-    # Get start times
-    start_a = start_times.get(event_a, 0) * 60.0  # Convert to seconds
-    start_b = start_times.get(event_b, 0) * 60.0
-    
     # Calculate conflict zone boundaries (using segment centers for F1)
-    center_a = (from_km_a + to_km_a) / 2.0
-    center_b = (from_km_b + to_km_b) / 2.0
-    conflict_half_km = (conflict_length_m / 1000.0) / 2.0
-    
-    cp_km_a_start = max(from_km_a, center_a - conflict_half_km)
-    cp_km_a_end = min(to_km_a, center_a + conflict_half_km)
-    cp_km_b_start = max(from_km_b, center_b - conflict_half_km)
-    cp_km_b_end = min(to_km_b, center_b + conflict_half_km)
-    
-    # Calculate entry/exit times for ALL runners in Event A
-    a_entry_times = []
-    a_exit_times = []
-    a_runner_ids = []
-    
-    for idx, row in df_a.iterrows():
-        pace_a = row["pace"] * 60.0  # sec per km
-        offset_a = row.get("start_offset", 0)
-        runner_id = row["runner_id"]
-        
-        entry_time = start_a + offset_a + pace_a * cp_km_a_start
-        exit_time = start_a + offset_a + pace_a * cp_km_a_end
-        
-        a_entry_times.append(entry_time)
-        a_exit_times.append(exit_time)
-        a_runner_ids.append(runner_id)
-    
-    # Calculate entry/exit times for ALL runners in Event B
-    b_entry_times = []
-    b_exit_times = []
-    b_runner_ids = []
-    
-    for idx, row in df_b.iterrows():
-        pace_b = row["pace"] * 60.0  # sec per km
-        offset_b = row.get("start_offset", 0)
-        runner_id = row["runner_id"]
-        
-        entry_time = start_b + offset_b + pace_b * cp_km_b_start
-        exit_time = start_b + offset_b + pace_b * cp_km_b_end
-        
-        b_entry_times.append(entry_time)
-        b_exit_times.append(exit_time)
-        b_runner_ids.append(runner_id)
+    window = _center_zone_window(from_km_a, to_km_a, from_km_b, to_km_b, conflict_length_m)
+    cp_km_a_start, cp_km_a_end, cp_km_b_start, cp_km_b_end = window
     
-    # Issue #503: Vectorized temporal overlap detection using NumPy broadcasting
-    # Convert lists to numpy arrays for vectorized operations
-    a_entry_arr = np.array(a_entry_times)  # (n,)
-    a_exit_arr = np.array(a_exit_times)     # (n,)
-    b_entry_arr = np.array(b_entry_times)  # (m,)
-    b_exit_arr = np.array(b_exit_times)    # (m,)
-    
-    # Broadcast to compute all pairwise overlaps: (n, 1) vs (1, m) = (n, m)
-    a_entry_2d = a_entry_arr[:, np.newaxis]  # (n, 1)
-    a_exit_2d = a_exit_arr[:, np.newaxis]    # (n, 1)
-    b_entry_2d = b_entry_arr[np.newaxis, :]  # (1, m)
-    b_exit_2d = b_exit_arr[np.newaxis, :]     # (1, m)
-    
-    # Compute overlap start/end/duration for all pairs
-    overlap_start = np.maximum(a_entry_2d, b_entry_2d)  # (n, m)
-    overlap_end = np.minimum(a_exit_2d, b_exit_2d)     # (n, m)
-    overlap_duration = overlap_end - overlap_start      # (n, m)
-    
-    # Find pairs with temporal overlap (duration > 0)
-    has_overlap = overlap_duration > 0  # (n, m) boolean
-    
-    # Check for directional passes
-    a_passes_b = (a_entry_2d > b_entry_2d) & (a_exit_2d < b_exit_2d)  # (n, m)
-    b_passes_a = (b_entry_2d > a_entry_2d) & (b_exit_2d < a_exit_2d)  # (n, m)
-    has_overtake = a_passes_b | b_passes_a  # (n, m)
-    
-    # Find temporal overlaps and validate overtaking
-    a_overtakes = set()
-    b_overtakes = set()
-    a_copresence = set()
-    b_copresence = set()
-    
-    overlap_pairs = []
-    
-    # Iterate only over pairs with overlap (much fewer iterations)
-    overlap_indices = np.argwhere(has_overlap)  # (k, 2) array of [i, j] pairs
-    
-    for i, j in overlap_indices:
-        a_id = a_runner_ids[i]
-        b_id = b_runner_ids[j]
-        
-        a_copresence.add(a_id)
-        b_copresence.add(b_id)
-        
-        # Issue #552: Fix overtaking count logic - only count the runner who is actually overtaking
-        if a_passes_b[i, j]:  # Runner A overtakes runner B
-            a_overtakes.add(a_id)  # Only count A as overtaking
-        if b_passes_a[i, j]:  # Runner B overtakes runner A
-            b_overtakes.add(b_id)  # Only count B as overtaking
-        
-        overlap_pairs.append({
-            "a_id": a_id,
-            "b_id": b_id,
-            "a_entry": a_entry_arr[i],
-            "a_exit": a_exit_arr[i],
-            "b_entry": b_entry_arr[j],
-            "b_exit": b_exit_arr[j],
-            "overlap_duration": overlap_duration[i, j],
-            "a_passes_b": bool(a_passes_b[i, j]),
-            "b_passes_a": bool(b_passes_a[i, j])
-        })
+    # Entry/exit times and pairwise overlaps for ALL runners, shared with the main analysis
+    if evaluator is None:
+        evaluator = ConflictZoneEvaluator(df_a, df_b, event_a, event_b, start_times)
+    validation = evaluator.entry_exit_validation(window)
     
     # Calculate validation results
     total_a = len(df_a)
     total_b = len(df_b)
-    overtakes_a = len(a_overtakes)
-    overtakes_b = len(b_overtakes)
-    copresence_a = len(a_copresence)
-    copresence_b = len(b_copresence)
+    overtakes_a = validation["overtakes_a"]
+    overtakes_b = validation["overtakes_b"]
+    copresence_a = validation["copresence_a"]
+    copresence_b = validation["copresence_b"]
     
     pct_a = (overtakes_a / total_a * 100) if total_a > 0 else 0.0
     pct_b = (overtakes_b / total_b * 100) if total_b > 0 else 0.0
@@ -2393,7 +2721,7 @@ def validate_per_runner_entry_exit_f1(
     logging.debug(f"  Total {event_a}: {total_a}, Overtaking: {overtakes_a} ({pct_a:.1f}%)")
     logging.debug(f"  Total {event_b}: {total_b}, Overtaking: {overtakes_b} ({pct_b:.1f}%)")
     logging.debug(f"  Co-presence {event_a}: {copresence_a}, {event_b}: {copresence_b}")
-    logging.debug(f"  Overlap pairs: {len(overlap_pairs)}")
+    logging.debug(f"  Overlap pairs: {validation['overlap_pair_count']}")
     
     return {
         "total_a": total_a,
@@ -2404,14 +2732,14 @@ def validate_per_runner_entry_exit_f1(
         "copresence_b": copresence_b,
         "pct_a": pct_a,
         "pct_b": pct_b,
-        "overlap_pairs": overlap_pairs[:10],  # First 10 for debugging
+        "overlap_pairs": validation["overlap_pairs"],  # First 10 for debugging
         "conflict_zone_a": (cp_km_a_start, cp_km_a_end),
         "conflict_zone_b": (cp_km_b_start, cp_km_b_end),
         "validation_timestamp": time.time()
     }
 
 
-def calculate_overtaking_loads(
+def calculate_overtaking_load_arrays(
     df_a: pd.DataFrame,
     df_b: pd.DataFrame,
     event_a: str,
@@ -2424,27 +2752,27 @@ def calculate_overtaking_loads(
     to_km_b: float,
     conflict_length_m: float = DEFAULT_CONFLICT_LENGTH_METERS,
     min_overlap_duration: float = DEFAULT_MIN_OVERLAP_DURATION,
-) -> Tuple[Dict[str, int], Dict[str, int], float, float, int, int]:
+    evaluator: Optional[ConflictZoneEvaluator] = None,
+) -> OvertakingLoads:
     """
     Count individual overtaking encounters (per-runner 'overtaking loads') by
     reusing the same conflict-zone + boundary-time logic as the proven detector.
 
-    Returns:
-        (loads_a, loads_b, avg_load_a, avg_load_b, max_load_a, max_load_b)
+    Only runners who reach the zone end for their event are counted. Loads are
+    computed from sorted entry/exit arrays and returned as NumPy arrays keyed by
+    runner index; use ``OvertakingLoads.to_dicts()`` when a report needs
+    ``{runner_id: load}``. Pass the segment's ConflictZoneEvaluator to reuse
+    its arrays.
     """
     # Basic guards
     if df_a.empty or df_b.empty:
-        return {}, {}, 0.0, 0.0, 0, 0
+        return OvertakingLoads.empty()
     if cp_km is None:
-        return {}, {}, 0.0, 0.0, 0, 0
+        return OvertakingLoads.empty()
     len_a = to_km_a - from_km_a
     len_b = to_km_b - from_km_b
     if len_a <= 0 or len_b <= 0:
-        return {}, {}, 0.0, 0.0, 0, 0
-
-    # Convert event start times from minutes to seconds (for BOTH events)
-    start_a = float(start_times.get(event_a, 0.0)) * 60.0
-    start_b = float(start_times.get(event_b, 0.0)) * 60.0
+        return OvertakingLoads.empty()
 
     # --- Conflict-zone boundaries (mirror working function) ---
     # Try absolute intersection first
@@ -2470,15 +2798,7 @@ def calculate_overtaking_loads(
                 from_km_b + s_end   * len_b,
             )
         # Otherwise, a center-based fallback
-        center_a = (from_km_a + to_km_a) / 2.0
-        center_b = (from_km_b + to_km_b) / 2.0
-        half_km  = (conflict_length_m / 1000.0) / 2.0
-        return (
-            max(from_km_a, center_a - half_km),
-            min(to_km_a,   center_a + half_km),
-            max(from_km_b, center_b - half_km),
-            min(to_km_b,   center_b + half_km),
-        )
+        return _center_zone_window(from_km_a, to_km_a, from_km_b, to_km_b, conflict_length_m)
 
     if intersection_start < intersection_end:
         boundary_start_a = boundary_start_b = intersection_start
@@ -2486,37 +2806,40 @@ def calculate_overtaking_loads(
     else:
         boundary_start_a, boundary_end_a, boundary_start_b, boundary_end_b = _compute_normalized_zone()
 
-    # --- Only keep runners who actually reach the zone end for their event ---
-    def within_event_bounds(df, zone_start_km, zone_end_km):
-        return df[(df["distance"] >= zone_end_km)]
-
-    df_a_pass = within_event_bounds(df_a, boundary_start_a, boundary_end_a).copy()
-    df_b_pass = within_event_bounds(df_b, boundary_start_b, boundary_end_b).copy()
-    if df_a_pass.empty or df_b_pass.empty:
-        return {}, {}, 0.0, 0.0, 0, 0
+    if evaluator is None:
+        evaluator = ConflictZoneEvaluator(df_a, df_b, event_a, event_b, start_times)
+    return evaluator.overtaking_loads(
+        (boundary_start_a, boundary_end_a, boundary_start_b, boundary_end_b),
+        min_overlap_duration,
+    )
 
-    # --- Arrival times at the zone boundaries for each runner ---
-    def times_at_bounds(row, start_base_sec, km_start, km_end):
-        sec_per_km = float(row["pace"]) * 60.0
-        t_start = start_base_sec + float(row["start_offset"]) + sec_per_km * km_start
-        t_end   = start_base_sec + float(row["start_offset"]) + sec_per_km * km_end
-        return t_start, t_end
+def calculate_overtaking_loads(
+    df_a: pd.DataFrame,
+    df_b: pd.DataFrame,
+    event_a: str,
+    event_b: str,
+    start_times: Dict[str, float],
+    cp_km: float,
+    from_km_a: float,
+    to_km_a: float,
+    from_km_b: float,
+    to_km_b: float,
+    conflict_length_m: float = DEFAULT_CONFLICT_LENGTH_METERS,
+    min_overlap_duration: float = DEFAULT_MIN_OVERLAP_DURATION,
+    evaluator: Optional[ConflictZoneEvaluator] = None,
+) -> Tuple[Dict[str, int], Dict[str, int], float, float, int, int]:
+    """
+    Dict form of calculate_overtaking_load_arrays.
 
-    a_times = [(row["runner_id"], *times_at_bounds(row, start_a, boundary_start_a, boundary_end_a))
-               for _, row in df_a_pass.iterrows()]
-    b_times = [(row["runner_id"], *times_at_bounds(row, start_b, boundary_start_b, boundary_end_b))
-               for _, row in df_b_pass.iterrows()]
+    Returns:
+        (loads_a, loads_b, avg_load_a, avg_load_b, max_load_a, max_load_b)
+    """
+    return calculate_overtaking_load_arrays(
+        df_a, df_b, event_a, event_b, start_times, cp_km,
+        from_km_a, to_km_a, from_km_b, to_km_b,
+        conflict_length_m, min_overlap_duration, evaluator=evaluator,
+    ).as_tuple()
 
-    # Detect temporal overlap and passes
-    loads_a, loads_b = _detect_temporal_overlap_and_passes(a_times, b_times, min_overlap_duration)
-    
-    # Calculate statistics
-    avg_load_a = sum(loads_a.values()) / len(loads_a) if loads_a else 0.0
-    avg_load_b = sum(loads_b.values()) / len(loads_b) if loads_b else 0.0
-    max_load_a = max(loads_a.values()) if loads_a else 0
-    max_load_b = max(loads_b.values()) if loads_b else 0
-    
-    return loads_a, loads_b, avg_load_a, avg_load_b, max_load_a, max_load_b
 
 def _log_flow_segment_stats(seg_id, event_a, event_b, path, counters):
     """
@@ -2620,6 +2943,7 @@ def calculate_convergence_zone_overlaps_with_binning(
     min_overlap_duration: float = DEFAULT_MIN_OVERLAP_DURATION,
     conflict_length_m: float = DEFAULT_CONFLICT_LENGTH_METERS,
     overlap_duration_minutes: float = 0.0,
+    evaluator: Optional[ConflictZoneEvaluator] = None,
 ) -> Tuple[int, int, int, int, List[str], List[str], int, int]:
     """
     Calculate overtaking with binning for all segments.
@@ -2668,7 +2992,8 @@ def calculate_convergence_zone_overlaps_with_binning(
         df_a, df_b, event_a, event_b, start_times,
         cp_km, from_km_a, to_km_a, from_km_b, to_km_b,
         min_overlap_duration, conflict_length_m,
-        use_time_bins, use_distance_bins, overlap_duration_minutes
+        use_time_bins, use_distance_bins, overlap_duration_minutes,
+        evaluator=evaluator,
     )
     
     # Extract results for telemetry
@@ -2714,262 +3039,22 @@ def calculate_convergence_zone_overlaps_original(
     
     PROPORTIONAL TOLERANCE: Uses 5% of shorter segment length, minimum 50m
     to ensure consistent behavior across different segment sizes.
-    
+
+    Evaluation is delegated to ConflictZoneEvaluator; callers evaluating several
+    windows for the same event pair should build one evaluator and reuse it.
+
     Returns:
-        Tuple of (overtakes_a, overtakes_b, copresence_a, copresence_b, 
+        Tuple of (overtakes_a, overtakes_b, copresence_a, copresence_b,
                  sample_a, sample_b, unique_encounters, participants_involved)
     """
     if df_a.empty or df_b.empty:
         return 0, 0, 0, 0, [], [], 0, 0
-    
-    len_a = to_km_a - from_km_a
-    len_b = to_km_b - from_km_b
-    if len_a <= 0 or len_b <= 0:
-        return 0, 0, 0, 0, [], [], 0, 0
-
-    # Check if convergence point is within Event A's range (absolute approach)
-    # or if we need to use normalized approach (for segments like F1)
-    if from_km_a <= cp_km <= to_km_a:
-        # Convergence point is within Event A's range - use absolute approach
-        s_cp = (cp_km - from_km_a) / max(len_a, 1e-9)
-        s_cp, clamp_reason = clamp_normalized_fraction(s_cp, "convergence_point_")
-    
-        # Calculate conflict zone in normalized space
-        conflict_length_km = conflict_length_m / 1000.0  # Convert meters to km
-        conflict_half_km = conflict_length_km / 2.0
-    
-        # Convert conflict zone to normalized fractions
-        # Use proportional tolerance: 5% of shorter segment, minimum 50m
-        min_segment_len = min(len_a, len_b)
-        proportional_tolerance_km = max(0.05, 0.05 * min_segment_len)  # 5% of shorter segment, min 50m
-        s_conflict_half = proportional_tolerance_km / max(min_segment_len, 1e-9)
-        
-        # Define normalized conflict zone boundaries
-        s_start = max(0.0, s_cp - s_conflict_half)
-        s_end = min(1.0, s_cp + s_conflict_half)
-        
-        # Ensure conflict zone has some width
-        if s_end <= s_start:
-            s_start = max(0.0, s_cp - 0.05)  # 5% of segment
-            s_end = min(1.0, s_cp + 0.05)    # 5% of segment
-        
-        # Convert normalized conflict zone to each event's absolute coordinates
-        cp_km_a_start = from_km_a + s_start * len_a
-        cp_km_a_end = from_km_a + s_end * len_a
 
-        cp_km_b_start = from_km_b + s_start * len_b
-        cp_km_b_end = from_km_b + s_end * len_b
-    else:
-        # Convergence point is outside Event A's range - use normalized approach
-        # This handles cases where convergence was detected in normalized space
-        # but the point doesn't map to Event A's absolute coordinates
-        
-        # Use the intersection boundaries if they exist, otherwise use proportional zones
-        intersection_start = max(from_km_a, from_km_b)
-        intersection_end = min(to_km_a, to_km_b)
-        
-        if intersection_start < intersection_end:
-            # There is an intersection - use it for conflict zone
-            conflict_length_km = conflict_length_m / 1000.0
-            conflict_half_km = conflict_length_km / 2.0
-            
-            cp_km_a_start = max(from_km_a, intersection_start - conflict_half_km)
-            cp_km_a_end = min(to_km_a, intersection_end + conflict_half_km)
-            
-            cp_km_b_start = max(from_km_b, intersection_start - conflict_half_km)
-            cp_km_b_end = min(to_km_b, intersection_end + conflict_half_km)
-        else:
-            # No intersection - use proportional zones around segment centers
-            center_a = (from_km_a + to_km_a) / 2.0
-            center_b = (from_km_b + to_km_b) / 2.0
-            
-            conflict_length_km = conflict_length_m / 1000.0
-            conflict_half_km = conflict_length_km / 2.0
-            
-            cp_km_a_start = max(from_km_a, center_a - conflict_half_km)
-            cp_km_a_end = min(to_km_a, center_a + conflict_half_km)
-            
-            cp_km_b_start = max(from_km_b, center_b - conflict_half_km)
-            cp_km_b_end = min(to_km_b, center_b + conflict_half_km)
-
-    # Get start times
-    start_a = start_times.get(event_a, 0) * 60.0
-    start_b = start_times.get(event_b, 0) * 60.0
-
-    # Reset index to prevent iloc[i] mismatch after DataFrame filtering
-    df_a = df_a.reset_index(drop=True)
-    df_b = df_b.reset_index(drop=True)
-
-    # Vectorized times for conflict zone
-    pace_a = df_a["pace"].values * 60.0  # sec per km
-    offset_a = df_a.get("start_offset", pd.Series([0]*len(df_a))).fillna(0).values.astype(float)
-    time_enter_a = start_a + offset_a + pace_a * cp_km_a_start
-    time_exit_a  = start_a + offset_a + pace_a * cp_km_a_end
-
-    pace_b = df_b["pace"].values * 60.0
-    offset_b = df_b.get("start_offset", pd.Series([0]*len(df_b))).fillna(0).values.astype(float)
-    time_enter_b = start_b + offset_b + pace_b * cp_km_b_start
-    time_exit_b  = start_b + offset_b + pace_b * cp_km_b_end
-
-    # Track runners who overtake each other (true passes)
-    a_bibs_overtakes = set()
-    b_bibs_overtakes = set()
-    # Track runners who have temporal overlap (co-presence)
-    a_bibs_copresence = set()
-    b_bibs_copresence = set()
-    unique_pairs = set()
-
-    # Issue #503: Vectorized temporal overlap detection using NumPy broadcasting
-    # Convert to numpy arrays for vectorized operations
-    time_enter_a_arr = np.array(time_enter_a)  # (n,)
-    time_exit_a_arr = np.array(time_exit_a)     # (n,)
-    time_enter_b_arr = np.array(time_enter_b)  # (m,)
-    time_exit_b_arr = np.array(time_exit_b)    # (m,)
-    
-    # Broadcast to compute all pairwise overlaps: (n, 1) vs (1, m) = (n, m)
-    enter_a_2d = time_enter_a_arr[:, np.newaxis]  # (n, 1)
-    exit_a_2d = time_exit_a_arr[:, np.newaxis]    # (n, 1)
-    enter_b_2d = time_enter_b_arr[np.newaxis, :]  # (1, m)
-    exit_b_2d = time_exit_b_arr[np.newaxis, :]    # (1, m)
-    
-    # Compute overlap start/end/duration for all pairs
-    overlap_start = np.maximum(enter_a_2d, enter_b_2d)  # (n, m)
-    overlap_end = np.minimum(exit_a_2d, exit_b_2d)     # (n, m)
-    overlap_duration = overlap_end - overlap_start     # (n, m)
-    
-    # Find pairs with sufficient temporal overlap
-    has_sufficient_overlap = overlap_duration >= min_overlap_duration  # (n, m) boolean
-    
-    # TRUE PASS DETECTION: Check for temporal overlap AND directional change
-    # This ensures we only count actual overtaking, not just co-presence
-    # Iterate only over pairs with sufficient overlap (much fewer iterations)
-    overlap_indices = np.argwhere(has_sufficient_overlap)  # (k, 2) array of [i, j] pairs
-    
-    for i, j in overlap_indices:
-        enter_a = time_enter_a_arr[i]
-        exit_a = time_exit_a_arr[i]
-        enter_b = time_enter_b_arr[j]
-        exit_b = time_exit_b_arr[j]
-        
-        # Calculate overlap duration (already computed, but recalc for clarity)
-        overlap_dur = min(exit_a, exit_b) - max(enter_a, enter_b)
-        
-        if overlap_dur >= min_overlap_duration:
-                # Temporal overlap detected - now check for directional change
-                # Calculate arrival times at boundaries to detect passing
-                # Use intersection boundaries if available, otherwise use conflict zone boundaries
-                intersection_start = max(from_km_a, from_km_b)
-                intersection_end = min(to_km_a, to_km_b)
-                
-                if intersection_start < intersection_end:
-                    # Use intersection boundaries for fair comparison
-                    boundary_start = intersection_start
-                    boundary_end = intersection_end
-                else:
-                    # No intersection - use NORMALIZED CONFLICT ZONE for finish line convergence
-                    # This handles cases like M1 where runners converge at the same physical location
-                    # but have different absolute kilometer ranges
-                    
-                    # CORRECT APPROACH: 
-                    # 1. Normalize each event's segment to 0.0-segment_length first
-                    # 2. Calculate conflict zone in normalized space (e.g., 0.0-0.05 km for M1)
-                    # 3. Compare runners at the same normalized position within their segments
-                    
-                    # Calculate conflict zone in NORMALIZED space (0.0 to segment_length)
-                    # Use a fixed normalized conflict zone that works for both events
-                    # For M1: segment_length = 0.25 km, so conflict zone should be 0.0-0.05 km
-                    segment_length_a = to_km_a - from_km_a
-                    segment_length_b = to_km_b - from_km_b
-                    
-                    # Use a small conflict zone (e.g., 20% of the shorter segment length)
-                    conflict_zone_length = min(segment_length_a, segment_length_b) * 0.2
-                    conflict_zone_norm_start = 0.0  # Start of conflict zone
-                    conflict_zone_norm_end = conflict_zone_length  # End of conflict zone
-                    
-                    # Map normalized conflict zone to absolute coordinates for each event
-                    abs_start_a = from_km_a + conflict_zone_norm_start
-                    abs_end_a = from_km_a + conflict_zone_norm_end
-                    abs_start_b = from_km_b + conflict_zone_norm_start
-                    abs_end_b = from_km_b + conflict_zone_norm_end
-                    
-                    # Use the normalized conflict zone boundaries for directional change detection
-                    # This ensures we're comparing runners at the same relative position within their segments
-                    boundary_start = conflict_zone_norm_start  # Normalized start position (0.0)
-                    boundary_end = conflict_zone_norm_end      # Normalized end position (0.05 for M1)
-                
-                pace_a = df_a.iloc[i]["pace"] * 60.0
-                offset_a = df_a.iloc[i].get("start_offset", 0)
-                pace_b = df_b.iloc[j]["pace"] * 60.0
-                offset_b = df_b.iloc[j].get("start_offset", 0)
-                
-                if intersection_start < intersection_end:
-                    # Use absolute coordinates for intersection-based segments
-                    start_time_a = start_a + offset_a + pace_a * boundary_start
-                    end_time_a = start_a + offset_a + pace_a * boundary_end
-                    start_time_b = start_b + offset_b + pace_b * boundary_start
-                    end_time_b = start_b + offset_b + pace_b * boundary_end
-                else:
-                    # Use NORMALIZED CONFLICT ZONE for finish line convergence
-                    # Map normalized conflict zone boundaries to absolute coordinates for each event
-                    # boundary_start = 0.0 (start of conflict zone)
-                    # boundary_end = conflict_zone_length (end of conflict zone)
-                    
-                    # Map normalized conflict zone boundaries to absolute coordinates
-                    abs_start_a = from_km_a + boundary_start  # from_km_a + 0.0
-                    abs_end_a = from_km_a + boundary_end      # from_km_a + conflict_zone_length
-                    abs_start_b = from_km_b + boundary_start  # from_km_b + 0.0
-                    abs_end_b = from_km_b + boundary_end      # from_km_b + conflict_zone_length
-                    
-                    # Calculate arrival times at the conflict zone boundaries
-                    start_time_a = start_a + offset_a + pace_a * abs_start_a
-                    end_time_a = start_a + offset_a + pace_a * abs_end_a
-                    start_time_b = start_b + offset_b + pace_b * abs_start_b
-                    end_time_b = start_b + offset_b + pace_b * abs_end_b
-                
-                # Check for directional pass (true overtaking)
-                # Runner A passes Runner B if A starts behind B but finishes ahead of B
-                a_passes_b = (start_time_a > start_time_b and end_time_a < end_time_b)
-                # Runner B passes Runner A if B starts behind A but finishes ahead of A
-                b_passes_a = (start_time_b > start_time_a and end_time_b < end_time_a)
-                
-                # Get runner IDs for tracking
-                a_bib = df_a.iloc[i]["runner_id"]
-                b_bib = df_b.iloc[j]["runner_id"]
-                
-                # Check for temporal overlap (co-presence)
-                temporal_overlap = (start_time_a < end_time_b and start_time_b < end_time_a)
-                
-                if temporal_overlap:
-                    # Always count co-presence
-                    a_bibs_copresence.add(a_bib)
-                    b_bibs_copresence.add(b_bib)
-                    
-                    # Issue #552: Fix overtaking count logic - only count the runner who is actually overtaking
-                    if a_passes_b:  # Runner A overtakes runner B
-                        a_bibs_overtakes.add(a_bib)  # Only count A as overtaking
-                        # B was overtaken by A, so track B as overtaken
-                        # (Note: B is already in copresence, but we track explicitly for clarity)
-                    if b_passes_a:  # Runner B overtakes runner A
-                        b_bibs_overtakes.add(b_bib)  # Only count B as overtaking
-                        # A was overtaken by B, so track A as overtaken
-                        # (Note: A is already in copresence, but we track explicitly for clarity)
-                    
-                # Track unique pairs (ordered to avoid duplicates)
-                unique_pairs.add((a_bib, b_bib))
-
-    # Calculate participants involved (union of all runners who had encounters)
-    # Note: Runners who were overtaken are already included in copresence sets due to temporal overlap
-    # However, we explicitly include all sets to ensure completeness
-    all_a_bibs = a_bibs_overtakes.union(a_bibs_copresence)
-    all_b_bibs = b_bibs_overtakes.union(b_bibs_copresence)
-    participants_involved = len(all_a_bibs.union(all_b_bibs))
-    unique_encounters = len(unique_pairs)
-
-    # Return separate counts for true passes vs co-presence
-    return (len(a_bibs_overtakes), len(b_bibs_overtakes), 
-            len(a_bibs_copresence), len(b_bibs_copresence),
-            list(a_bibs_overtakes), list(b_bibs_overtakes), 
-            unique_encounters, participants_involved)
+    evaluator = ConflictZoneEvaluator(df_a, df_b, event_a, event_b, start_times)
+    return evaluator.convergence_overlaps(
+        cp_km, from_km_a, to_km_a, from_km_b, to_km_b,
+        min_overlap_duration, conflict_length_m,
+    )
 
 
 def calculate_convergence_zone_overlaps_binned(
@@ -2988,16 +3073,19 @@ def calculate_convergence_zone_overlaps_binned(
     use_time_bins: bool = False,
     use_distance_bins: bool = False,
     overlap_duration_minutes: float = 0.0,
+    evaluator: Optional[ConflictZoneEvaluator] = None,
 ) -> Tuple[int, int, int, int, List[str], List[str], int, int]:
     """
     Calculate overtaking using binning for long segments.
+
+    Every bin is evaluated on one ConflictZoneEvaluator (pass ``evaluator`` to
+    share it with the rest of the segment's analysis).
     """
     if df_a.empty or df_b.empty:
         return 0, 0, 0, 0, [], [], 0, 0
     
-    # Get start times
-    start_a = start_times.get(event_a, 0) * 60.0
-    start_b = start_times.get(event_b, 0) * 60.0
+    if evaluator is None:
+        evaluator = ConflictZoneEvaluator(df_a, df_b, event_a, event_b, start_times)
     
     # Track runners who overtake each other (true passes)
     a_bibs_overtakes = set()
@@ -3014,27 +3102,26 @@ def calculate_convergence_zone_overlaps_binned(
         num_bins = max(1, int(overlap_duration_minutes / bin_duration_minutes))
         
         # Calculate overlap window
-        df_a['entry_time'] = start_a + df_a['start_offset'] + df_a['pace'] * 60.0 * from_km_a
-        df_a['exit_time'] = start_a + df_a['start_offset'] + df_a['pace'] * 60.0 * to_km_a
-        df_b['entry_time'] = start_b + df_b['start_offset'] + df_b['pace'] * 60.0 * from_km_b
-        df_b['exit_time'] = start_b + df_b['start_offset'] + df_b['pace'] * 60.0 * to_km_b
+        entry_a, exit_a, entry_b, exit_b = evaluator.times(
+            (from_km_a, to_km_a, from_km_b, to_km_b), raw=True
+        )
         
-        overlap_start = max(df_a['entry_time'].min(), df_b['entry_time'].min())
-        overlap_end = min(df_a['exit_time'].max(), df_b['exit_time'].max())
+        overlap_start = max(np.nanmin(entry_a), np.nanmin(entry_b))
+        overlap_end = min(np.nanmax(exit_a), np.nanmax(exit_b))
         
         for bin_idx in range(num_bins):
             bin_start = overlap_start + (bin_idx * bin_duration_minutes * 60)
             bin_end = min(overlap_start + ((bin_idx + 1) * bin_duration_minutes * 60), overlap_end)
             
             # Get runners active in this time bin
-            a_in_bin = df_a[(df_a['entry_time'] <= bin_end) & (df_a['exit_time'] >= bin_start)]
-            b_in_bin = df_b[(df_b['entry_time'] <= bin_end) & (df_b['exit_time'] >= bin_start)]
+            a_in_bin = np.flatnonzero((entry_a <= bin_end) & (exit_a >= bin_start))
+            b_in_bin = np.flatnonzero((entry_b <= bin_end) & (exit_b >= bin_start))
             
             # Calculate overtaking for this time bin using original method
-            bin_overtakes_a, bin_overtakes_b, bin_copresence_a, bin_copresence_b, bin_bibs_a, bin_bibs_b, bin_encounters, bin_participants = calculate_convergence_zone_overlaps_original(
-                a_in_bin, b_in_bin, event_a, event_b, start_times,
+            bin_overtakes_a, bin_overtakes_b, bin_copresence_a, bin_copresence_b, bin_bibs_a, bin_bibs_b, bin_encounters, bin_participants = evaluator.convergence_overlaps(
                 cp_km, from_km_a, to_km_a, from_km_b, to_km_b,
-                min_overlap_duration, conflict_length_m
+                min_overlap_duration, conflict_length_m,
+                rows_a=a_in_bin, rows_b=b_in_bin,
             )
             
             # Accumulate results
@@ -3066,8 +3153,7 @@ def calculate_convergence_zone_overlaps_binned(
             bin_end_b = min(from_km_b + ((bin_idx + 1) * bin_size_km), to_km_b)
             
             # Calculate overtaking for this distance bin
-            bin_overtakes_a, bin_overtakes_b, bin_copresence_a, bin_copresence_b, bin_bibs_a, bin_bibs_b, bin_encounters, bin_participants = calculate_convergence_zone_overlaps_original(
-                df_a, df_b, event_a, event_b, start_times,
+            bin_overtakes_a, bin_overtakes_b, bin_copresence_a, bin_copresence_b, bin_bibs_a, bin_bibs_b, bin_encounters, bin_participants = evaluator.convergence_overlaps(
                 cp_km, bin_start_a, bin_end_a, bin_start_b, bin_end_b,
                 min_overlap_duration, conflict_length_m
             )
@@ -3322,11 +3408,15 @@ def _process_segment_with_convergence(
     # Parse overlap duration
     overlap_duration_minutes = _parse_overlap_duration_minutes(overlap_window_duration)
     
+    # One zone evaluation shared by overlaps, F1 validation and overtaking loads
+    evaluator = ConflictZoneEvaluator(df_a, df_b, event_a, event_b, start_times)
+    
     # Calculate overlaps with binning
     overtakes_a, overtakes_b, copresence_a, copresence_b, bibs_a, bibs_b, unique_encounters, participants_involved = calculate_convergence_zone_overlaps_with_binning(
         df_a, df_b, event_a, event_b, start_times,
         effective_cp_km, from_km_a, to_km_a, from_km_b, to_km_b,
-        min_overlap_duration, dynamic_conflict_length_m, overlap_duration_minutes
+        min_overlap_duration, dynamic_conflict_length_m, overlap_duration_minutes,
+        evaluator=evaluator,
     )
     
     # Calculate execution time
@@ -3366,7 +3456,8 @@ def _process_segment_with_convergence(
     overtakes_a, overtakes_b, copresence_a, copresence_b = _apply_f1_validation_if_needed(
         seg_id, event_a, event_b, df_a, df_b, start_times,
         from_km_a, to_km_a, from_km_b, to_km_b, dynamic_conflict_length_m,
-        overtakes_a, overtakes_b, copresence_a, copresence_b
+        overtakes_a, overtakes_b, copresence_a, copresence_b,
+        evaluator=evaluator,
     )
     
     # Log binning decisions
@@ -3422,18 +3513,14 @@ def _process_segment_with_convergence(
     
     # Calculate overtaking loads
     try:
-        result = calculate_overtaking_loads(
+        loads = calculate_overtaking_load_arrays(
             df_a, df_b, event_a, event_b, start_times, cp_km,
-            from_km_a, to_km_a, from_km_b, to_km_b, dynamic_conflict_length_m
+            from_km_a, to_km_a, from_km_b, to_km_b, dynamic_conflict_length_m,
+            evaluator=evaluator,
         )
-        if result is None:
-            print(f"Warning: calculate_overtaking_loads returned None for segment {seg_id}")
-            overtaking_loads_a, overtaking_loads_b, avg_load_a, avg_load_b, max_load_a, max_load_b = {}, {}, 0.0, 0.0, 0, 0
-        else:
-            overtaking_loads_a, overtaking_loads_b, avg_load_a, avg_load_b, max_load_a, max_load_b = result
     except Exception as e:
         print(f"Error in calculate_overtaking_loads for segment {seg_id}: {e}")
-        overtaking_loads_a, overtaking_loads_b, avg_load_a, avg_load_b, max_load_a, max_load_b = {}, {}, 0.0, 0.0, 0, 0
+        loads = OvertakingLoads.empty()
     
     # Update segment result with all convergence data
     segment_result.update({
@@ -3448,12 +3535,12 @@ def _process_segment_with_convergence(
         "conflict_length_m": dynamic_conflict_length_m,
         "unique_encounters": unique_encounters,
         "participants_involved": participants_involved,
-        "overtaking_load_a": round(avg_load_a, 1),
-        "overtaking_load_b": round(avg_load_b, 1),
-        "max_overtaking_load_a": max_load_a,
-        "max_overtaking_load_b": max_load_b,
-        "overtaking_load_distribution_a": list(overtaking_loads_a.values()),
-        "overtaking_load_distribution_b": list(overtaking_loads_b.values())
+        "overtaking_load_a": round(loads.avg_load_a, 1),
+        "overtaking_load_b": round(loads.avg_load_b, 1),
+        "max_overtaking_load_a": loads.max_load_a,
+        "max_overtaking_load_b": loads.max_load_b,
+        "overtaking_load_distribution_a": loads.runner_loads_a.tolist(),
+        "overtaking_load_distribution_b": loads.runner_loads_b.tolist()
     })
     
     return segment_result
@@ -3530,13 +3617,15 @@ def _apply_f1_validation_if_needed(
     overtakes_a: int,
     overtakes_b: int,
     copresence_a: int,
-    copresence_b: int
+    copresence_b: int,
+    evaluator: Optional[ConflictZoneEvaluator] = None,
 ) -> Tuple[int, int, int, int]:
     """Apply F1 per-runner validation if applicable, returning corrected values."""
     if seg_id == "F1" and event_a == "Half" and event_b == "10K":
         validation_results = validate_per_runner_entry_exit_f1(
             df_a, df_b, event_a, event_b, start_times,
-            from_km_a, to_km_a, from_km_b, to_km_b, dynamic_conflict_length_m
+            from_km_a, to_km_a, from_km_b, to_km_b, dynamic_conflict_length_m,
+            evaluator=evaluator,
         )
         
         if "error" not in validation_results:
@@ -3752,6 +3841,32 @@ def generate_temporal_flow_narrative(results: Dict[str, Any]) -> str:
     return "\n".join(narrative)
 
 
+def _stepped_values(start: float, stop: float, step: float) -> np.ndarray:
+    """
+    ``start, start + step, ...`` up to and including ``stop``.
+
+    Values are accumulated sequentially, so they match a ``while value <= stop:
+    value += step`` loop bit for bit.
+    """
+    if step <= 0:
+        raise ValueError(f"step must be positive, got {step}")
+    if not start <= stop:
+        return np.zeros(0)
+    count = int((stop - start) // step) + 2
+    while True:
+        values = np.add.accumulate(np.concatenate(([start], np.full(count - 1, step))))
+        if values[-1] > stop:
+            return values[values <= stop]
+        count *= 2
+
+
+def _columns_to_records(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Row dicts (with Python scalars) from equal-length columns."""
+    keys = list(columns)
+    rows = zip(*(np.asarray(columns[key]).tolist() for key in keys))
+    return [dict(zip(keys, row)) for row in rows]
+
+
 def analyze_distance_progression(
     df_a: pd.DataFrame,
     df_b: pd.DataFrame,
@@ -3763,10 +3878,15 @@ def analyze_distance_progression(
     from_km_b: float,
     to_km_b: float,
     step_km: float = DEFAULT_STEP_KM,
+    cache: Optional[SegmentFlowCache] = None,
 ) -> Dict[str, Any]:
     """
     Analyze runner distribution over distance within a segment.
     Returns distance bins with runner counts for each event.
+    
+    The series is computed column-wise on SegmentFlowCache arrays (built here
+    when ``cache`` is not given) and returned as ``progression_columns``;
+    ``progression_data`` holds the same rows as dicts for reports.
     """
     if df_a.empty or df_b.empty:
         return {"ok": False, "error": "Empty dataframes"}
@@ -3777,53 +3897,32 @@ def analyze_distance_progression(
     if len_a <= 0 or len_b <= 0:
         return {"ok": False, "error": "Invalid segment lengths"}
     
+    if cache is None:
+        cache = build_segment_flow_cache(
+            df_a, df_b, event_a, event_b, start_times, from_km_a, to_km_a, from_km_b, to_km_b
+        )
+    total_a = len(cache.pace_a)
+    total_b = len(cache.pace_b)
+    
     # Create distance bins
     min_km = min(from_km_a, from_km_b)
     max_km = max(to_km_a, to_km_b)
-    distance_bins = []
-    current_km = min_km
-    while current_km <= max_km:
-        distance_bins.append(round(current_km, 3))
-        current_km += step_km
-    
-    # Get start times
-    start_a = start_times.get(event_a, 0) * 60.0
-    start_b = start_times.get(event_b, 0) * 60.0
-    
-    # Calculate runner positions at each distance bin
-    progression_data = []
-    
-    for bin_km in distance_bins:
-        # Check if this distance is within each event's segment
-        in_segment_a = from_km_a <= bin_km <= to_km_a
-        in_segment_b = from_km_b <= bin_km <= to_km_b
-        
-        # Count runners from each event at this distance
-        count_a = 0
-        count_b = 0
-        
-        if in_segment_a and not df_a.empty:
-            # Calculate arrival times for event A runners at this distance
-            pace_a = df_a["pace"].values * 60.0  # sec per km
-            offset_a = df_a.get("start_offset", pd.Series([0]*len(df_a))).fillna(0).values.astype(float)
-            arrival_times_a = start_a + offset_a + pace_a * bin_km
-            count_a = len(arrival_times_a)
-        
-        if in_segment_b and not df_b.empty:
-            # Calculate arrival times for event B runners at this distance
-            pace_b = df_b["pace"].values * 60.0  # sec per km
-            offset_b = df_b.get("start_offset", pd.Series([0]*len(df_b))).fillna(0).values.astype(float)
-            arrival_times_b = start_b + offset_b + pace_b * bin_km
-            count_b = len(arrival_times_b)
-        
-        progression_data.append({
-            "distance_km": bin_km,
-            "count_a": count_a,
-            "count_b": count_b,
-            "total_count": count_a + count_b,
-            "in_segment_a": in_segment_a,
-            "in_segment_b": in_segment_b
-        })
+    distance_km = np.array([round(km, 3) for km in _stepped_values(min_km, max_km, step_km).tolist()])
+    
+    # Every runner of an event passes each distance inside that event's segment
+    in_segment_a = (from_km_a <= distance_km) & (distance_km <= to_km_a)
+    in_segment_b = (from_km_b <= distance_km) & (distance_km <= to_km_b)
+    count_a = np.where(in_segment_a, total_a, 0)
+    count_b = np.where(in_segment_b, total_b, 0)
+    
+    progression_columns = {
+        "distance_km": distance_km,
+        "count_a": count_a,
+        "count_b": count_b,
+        "total_count": count_a + count_b,
+        "in_segment_a": in_segment_a,
+        "in_segment_b": in_segment_b,
+    }
     
     return {
         "ok": True,
@@ -3834,7 +3933,10 @@ def analyze_distance_progression(
         "from_km_b": from_km_b,
         "to_km_b": to_km_b,
         "step_km": step_km,
-        "progression_data": progression_data
+        "total_a": total_a,
+        "total_b": total_b,
+        "progression_columns": progression_columns,
+        "progression_data": _columns_to_records(progression_columns)
     }
 
 
@@ -3907,10 +4009,16 @@ def calculate_tot_metrics(
     conflict_length_m: float = DEFAULT_CONFLICT_LENGTH_METERS,
     thresholds: List[int] = DEFAULT_TOT_THRESHOLDS,
     time_bin_seconds: int = DEFAULT_TIME_BIN_SECONDS,
+    cache: Optional[SegmentFlowCache] = None,
 ) -> Dict[str, Any]:
     """
     Calculate Time-Over-Threshold (TOT) metrics for operational planning.
     Returns periods when runner counts exceed specified thresholds.
+    
+    Zone occupancy per time bin is counted from sorted entry/exit arrays built
+    on SegmentFlowCache (built here when ``cache`` is not given) and returned
+    as ``bin_columns``; ``bin_data`` and the threshold periods are derived
+    from those columns.
     """
     if df_a.empty or df_b.empty:
         return {"ok": False, "error": "Empty dataframes"}
@@ -3941,85 +4049,39 @@ def calculate_tot_metrics(
     cp_km_b_start = from_km_b + s_start * len_b
     cp_km_b_end = from_km_b + s_end * len_b
     
-    # Get start times
-    start_a = start_times.get(event_a, 0) * 60.0
-    start_b = start_times.get(event_b, 0) * 60.0
+    if cache is None:
+        cache = build_segment_flow_cache(
+            df_a, df_b, event_a, event_b, start_times, from_km_a, to_km_a, from_km_b, to_km_b
+        )
     
-    # Calculate arrival times for all runners in conflict zone
-    pace_a = df_a["pace"].values * 60.0  # sec per km
-    offset_a = df_a.get("start_offset", pd.Series([0]*len(df_a))).fillna(0).values.astype(float)
-    time_enter_a = start_a + offset_a + pace_a * cp_km_a_start
-    time_exit_a = start_a + offset_a + pace_a * cp_km_a_end
-    
-    pace_b = df_b["pace"].values * 60.0
-    offset_b = df_b.get("start_offset", pd.Series([0]*len(df_b))).fillna(0).values.astype(float)
-    time_enter_b = start_b + offset_b + pace_b * cp_km_b_start
-    time_exit_b = start_b + offset_b + pace_b * cp_km_b_end
+    # Calculate arrival times for all runners in conflict zone (one expression per event)
+    time_enter_a = cache.start_time_a + cache.offset_a + cache.pace_a * cp_km_a_start
+    time_exit_a = cache.start_time_a + cache.offset_a + cache.pace_a * cp_km_a_end
+    time_enter_b = cache.start_time_b + cache.offset_b + cache.pace_b * cp_km_b_start
+    time_exit_b = cache.start_time_b + cache.offset_b + cache.pace_b * cp_km_b_end
     
     # Find time range
-    all_times = list(time_enter_a) + list(time_exit_a) + list(time_enter_b) + list(time_exit_b)
-    min_time = min(all_times)
-    max_time = max(all_times)
-    
-    # Create time bins
-    time_bins = []
-    current_time = min_time
-    while current_time <= max_time:
-        time_bins.append(current_time)
-        current_time += time_bin_seconds
+    all_times = np.concatenate([time_enter_a, time_exit_a, time_enter_b, time_exit_b])
+    min_time = float(np.nanmin(all_times))
+    max_time = float(np.nanmax(all_times))
     
     # Calculate runner counts in each time bin
-    bin_data = []
-    for bin_time in time_bins:
-        # Count runners from each event in conflict zone at this time
-        count_a = sum((time_enter_a <= bin_time) & (time_exit_a >= bin_time))
-        count_b = sum((time_enter_b <= bin_time) & (time_exit_b >= bin_time))
-        total_count = count_a + count_b
-        
-        bin_data.append({
-            "time_seconds": bin_time,
-            "time_minutes": bin_time / 60.0,
-            "count_a": count_a,
-            "count_b": count_b,
-            "total_count": total_count
-        })
+    time_seconds = _stepped_values(min_time, max_time, time_bin_seconds)
+    count_a = _zone_occupancy(time_enter_a, time_exit_a, time_seconds)
+    count_b = _zone_occupancy(time_enter_b, time_exit_b, time_seconds)
+    total_count = count_a + count_b
+    bin_columns = {
+        "time_seconds": time_seconds,
+        "time_minutes": time_seconds / 60.0,
+        "count_a": count_a,
+        "count_b": count_b,
+        "total_count": total_count,
+    }
     
     # Calculate TOT metrics for each threshold
     tot_metrics = {}
     for threshold in thresholds:
-        tot_periods = []
-        in_threshold = False
-        period_start = None
-        
-        for bin_data_point in bin_data:
-            if bin_data_point["total_count"] >= threshold:
-                if not in_threshold:
-                    in_threshold = True
-                    period_start = bin_data_point["time_seconds"]
-            else:
-                if in_threshold:
-                    in_threshold = False
-                    period_end = bin_data_point["time_seconds"]
-                    tot_periods.append({
-                        "start_seconds": period_start,
-                        "end_seconds": period_end,
-                        "start_minutes": period_start / 60.0,
-                        "end_minutes": period_end / 60.0,
-                        "duration_seconds": period_end - period_start,
-                        "duration_minutes": (period_end - period_start) / 60.0
-                    })
-        
-        # Handle case where period extends to end
-        if in_threshold:
-            period_end = max_time
-            tot_periods.append({
-                "start_seconds": period_start,
-                "end_seconds": period_end,
-                "start_minutes": period_start / 60.0,
-                "end_minutes": period_end / 60.0,
-                "duration_seconds": period_end - period_start,
-                "duration_minutes": (period_end - period_start) / 60.0
-            })
+        tot_periods = _threshold_periods(time_seconds, total_count >= threshold, max_time)
         
         # Calculate total TOT time
         total_tot_seconds = sum([p["duration_seconds"] for p in tot_periods])
@@ -4045,11 +4107,46 @@ def calculate_tot_metrics(
         "time_range_minutes": (max_time - min_time) / 60.0,
         "time_bin_seconds": time_bin_seconds,
         "thresholds": thresholds,
-        "bin_data": bin_data,
+        "bin_columns": bin_columns,
+        "bin_data": _columns_to_records(bin_columns),
         "tot_metrics": tot_metrics
     }
 
 
+def _zone_occupancy(time_enter: np.ndarray, time_exit: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """Runners with ``enter <= t <= exit`` at each time, from sorted entry/exit arrays."""
+    if np.any(time_enter > time_exit):
+        # Inverted intervals break the sorted-difference identity; count directly
+        return ((time_enter[np.newaxis, :] <= times[:, np.newaxis])
+                & (time_exit[np.newaxis, :] >= times[:, np.newaxis])).sum(axis=1)
+    entered = np.searchsorted(np.sort(time_enter), times, side="right")
+    exited = np.searchsorted(np.sort(time_exit), times, side="left")
+    return entered - exited
+
+
+def _threshold_periods(times: np.ndarray, above: np.ndarray, end_time: float) -> List[Dict[str, float]]:
+    """
+    Runs of consecutive bins at or above a threshold.
+    
+    A period ends at the first bin below the threshold, or at ``end_time`` when
+    it runs to the last bin.
+    """
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], above.astype(np.int8), [0]))))
+    starts, stops = edges[0::2], edges[1::2]
+    periods = []
+    for period_start, stop in zip(times[starts].tolist(), stops.tolist()):
+        period_end = times[stop].item() if stop < len(times) else end_time
+        periods.append({
+            "start_seconds": period_start,
+            "end_seconds": period_end,
+            "start_minutes": period_start / 60.0,
+            "end_minutes": period_end / 60.0,
+            "duration_seconds": period_end - period_start,
+            "duration_minutes": (period_end - period_start) / 60.0
+        })
+    return periods
+
+
 def generate_tot_report(tot_data: Dict[str, Any]) -> str:
     """
     Generate a text-based TOT metrics report.
@@ -4207,7 +4304,8 @@ def _calculate_audit_overlaps(
     to_km_b: float,
     min_overlap_duration: float,
     dynamic_conflict_length_m: float,
-    overlap_duration_minutes: float
+    overlap_duration_minutes: float,
+    evaluator: Optional[ConflictZoneEvaluator] = None,
 ) -> Tuple[int, int, int, int, List[str], List[str], int, int]:
     """Calculate overlaps and overtakes for audit, handling special case debugging."""
     effective_cp_km = cp_km
@@ -4215,7 +4313,8 @@ def _calculate_audit_overlaps(
     overtakes_a, overtakes_b, copresence_a, copresence_b, bibs_a, bibs_b, unique_encounters, participants_involved = calculate_convergence_zone_overlaps_with_binning(
         df_a, df_b, event_a, event_b, start_times,
         effective_cp_km, from_km_a, to_km_a, from_km_b, to_km_b,
-        min_overlap_duration, dynamic_conflict_length_m, overlap_duration_minutes
+        min_overlap_duration, dynamic_conflict_length_m, overlap_duration_minutes,
+        evaluator=evaluator,
     )
     
     return overtakes_a, overtakes_b, copresence_a, copresence_b, bibs_a, bibs_b, unique_encounters, participants_involved
@@ -4236,13 +4335,15 @@ def _apply_audit_validation(
     overtakes_a: int,
     overtakes_b: int,
     copresence_a: int,
-    copresence_b: int
+    copresence_b: int,
+    evaluator: Optional[ConflictZoneEvaluator] = None,
 ) -> Tuple[int, int, int, int]:
     """Apply F1 validation if applicable and return corrected values."""
     if seg_id == "F1" and event_a == "Half" and event_b == "10K":
         validation_results = validate_per_runner_entry_exit_f1(
             df_a, df_b, event_a, event_b, start_times,
-            from_km_a, to_km_a, from_km_b, to_km_b, dynamic_conflict_length_m
+            from_km_a, to_km_a, from_km_b, to_km_b, dynamic_conflict_length_m,
+            evaluator=evaluator,
         )
         
         if "error" not in validation_results:
@@ -4428,10 +4529,12 @@ def generate_flow_audit_for_segment(
         dynamic_conflict_length_m = conflict_length_m
     
     # Calculate overlaps - extracted to helper function to reduce complexity
+    evaluator = ConflictZoneEvaluator(df_a, df_b, event_a, event_b, start_times)
     overtakes_a, overtakes_b, copresence_a, copresence_b, bibs_a, bibs_b, unique_encounters, participants_involved = _calculate_audit_overlaps(
         df_a, df_b, event_a, event_b, start_times,
         cp_km, from_km_a, to_km_a, from_km_b, to_km_b,
-        min_overlap_duration, dynamic_conflict_length_m, overlap_duration_minutes
+        min_overlap_duration, dynamic_conflict_length_m, overlap_duration_minutes,
+        evaluator=evaluator,
     )
     
     # Special case debugging for M1
@@ -4451,7 +4554,8 @@ def generate_flow_audit_for_segment(
     overtakes_a, overtakes_b, copresence_a, copresence_b = _apply_audit_validation(
         seg_id, event_a, event_b, df_a, df_b, start_times,
         from_km_a, to_km_a, from_km_b, to_km_b, dynamic_conflict_length_m,
-        overtakes_a, overtakes_b, copresence_a, copresence_b
+        overtakes_a, overtakes_b, copresence_a, copresence_b,
+        evaluator=evaluator,
     )
     
     # Generate Flow Audit data
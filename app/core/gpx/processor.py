@@ -6,10 +6,15 @@ for race segments, enabling accurate map visualization.
 """
 
 import xml.etree.ElementTree as ET
+import hashlib
 import math
-import bisect
+import sys
+import threading
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+import numpy as np
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple, Optional, Union
 from dataclasses import dataclass
 
 
@@ -33,6 +38,24 @@ def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return 2 * EARTH_R * math.asin(math.sqrt(a))
 
 
+def haversine_m_array(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorized haversine distance in meters (element-wise over array inputs)."""
+    rlat1, rlon1, rlat2, rlon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    dlat, dlon = rlat2 - rlat1, rlon2 - rlon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(rlat1) * np.cos(rlat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_R * np.arcsin(np.sqrt(a))
+
+
+def cumulative_km_array(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Cumulative distance in km for each vertex of a lat/lon polyline, starting at 0.0."""
+    n = len(lat)
+    out = np.zeros(n, dtype=np.float64)
+    if n > 1:
+        steps = haversine_m_array(lat[:-1], lon[:-1], lat[1:], lon[1:]) / 1000.0
+        np.cumsum(steps, out=out[1:])
+    return out
+
+
 def cumulative_km(course_points: List[Tuple[float, float]]) -> List[float]:
     """
     course_points: [(lat, lon), ...] in order along the course.
@@ -40,14 +63,45 @@ def cumulative_km(course_points: List[Tuple[float, float]]) -> List[float]:
     """
     if not course_points:
         return []
-    out = [0.0]
-    acc = 0.0
-    for i in range(1, len(course_points)):
-        lat0, lon0 = course_points[i-1]
-        lat1, lon1 = course_points[i]
-        acc += haversine_m(lat0, lon0, lat1, lon1) / 1000.0
-        out.append(acc)
-    return out
+    lat, lon = _split_latlon(course_points)
+    return cumulative_km_array(lat, lon).tolist()
+
+
+def _split_latlon(course_points: Sequence[Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split [(lat, lon), ...] into contiguous lat and lon arrays."""
+    arr = np.asarray(course_points, dtype=np.float64).reshape(-1, 2)
+    return np.ascontiguousarray(arr[:, 0]), np.ascontiguousarray(arr[:, 1])
+
+
+def _interp_arrays(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    cum_km: np.ndarray,
+    target_km,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batch linear interpolation of (lat, lon) at target_km along the course.
+
+    Targets outside the course are clamped to the first/last vertex. Output
+    arrays have the same shape as ``target_km``.
+    """
+    t = np.asarray(target_km, dtype=np.float64)
+    n = len(cum_km)
+    if n == 0:
+        return np.zeros_like(t), np.zeros_like(t)
+    tc = np.clip(t, cum_km[0], cum_km[-1])
+    j = np.clip(np.searchsorted(cum_km, tc, side="left") - 1, 0, n - 1)
+    j2 = np.minimum(j + 1, n - 1)
+    d0 = cum_km[j]
+    span = cum_km[j2] - d0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.where(span > 0, (tc - d0) / np.where(span > 0, span, 1.0), 0.0)
+    out_lat = lat[j] + frac * (lat[j2] - lat[j])
+    out_lon = lon[j] + frac * (lon[j2] - lon[j])
+    # Exact clamps (matches _interp_vertex even with duplicate trailing vertices)
+    out_lat = np.where(t <= cum_km[0], lat[0], np.where(t >= cum_km[-1], lat[-1], out_lat))
+    out_lon = np.where(t <= cum_km[0], lon[0], np.where(t >= cum_km[-1], lon[-1], out_lon))
+    return out_lat, out_lon
 
 
 def _interp_vertex(course_points: List[Tuple[float, float]], cum_km: List[float], target_km: float) -> Tuple[float, float]:
@@ -56,54 +110,32 @@ def _interp_vertex(course_points: List[Tuple[float, float]], cum_km: List[float]
     """
     if not course_points:
         return (0.0, 0.0)
-    # clamp
-    if target_km <= cum_km[0]:
-        lat, lon = course_points[0]
-        return (lon, lat)
-    if target_km >= cum_km[-1]:
-        lat, lon = course_points[-1]
-        return (lon, lat)
-
-    j = max(0, bisect.bisect_left(cum_km, target_km) - 1)
-    j2 = min(j + 1, len(cum_km) - 1)
-    d0, d1 = cum_km[j], cum_km[j2]
-    lat0, lon0 = course_points[j]
-    lat1, lon1 = course_points[j2]
-    if d1 <= d0:
-        return (lon0, lat0)
-    t = (target_km - d0) / (d1 - d0)
-    lat = lat0 + t * (lat1 - lat0)
-    lon = lon0 + t * (lon1 - lon0)
-    return (lon, lat)
+    lat, lon = _split_latlon(course_points)
+    out_lat, out_lon = _interp_arrays(lat, lon, np.asarray(cum_km, dtype=np.float64), target_km)
+    return (float(out_lon), float(out_lat))
 
 
-def slice_polyline_by_km(
-    course_points: List[Tuple[float, float]],
-    cum_km: List[float],
+def _slice_arrays(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    cum_km: np.ndarray,
     km_a: float,
     km_b: float,
 ) -> List[Tuple[float, float]]:
-    """
-    Returns a dense LineString ([(lon,lat), ...]) for the route section between km_a and km_b.
-    Works even if the endpoints are spatially coincident due to loops.
-    """
-    if not course_points or not cum_km or len(course_points) != len(cum_km):
-        return []
-
+    """Array implementation of slice_polyline_by_km; returns [(lon, lat), ...]."""
     a, b = (km_a, km_b) if km_a <= km_b else (km_b, km_a)
-
-    # start/end exact points
-    coords: List[Tuple[float, float]] = [_interp_vertex(course_points, cum_km, a)]
+    ends_lat, ends_lon = _interp_arrays(lat, lon, cum_km, np.array([a, b], dtype=np.float64))
 
     # include all intermediate vertices strictly between a..b
-    i0 = max(0, bisect.bisect_left(cum_km, a) - 1)
-    i1 = min(len(cum_km) - 1, bisect.bisect_right(cum_km, b))
-    for k in range(i0 + 1, i1):
-        if a <= cum_km[k] <= b:
-            lat, lon = course_points[k]
-            coords.append((lon, lat))
+    n = len(cum_km)
+    i0 = max(0, int(np.searchsorted(cum_km, a, side="left")) - 1)
+    i1 = min(n - 1, int(np.searchsorted(cum_km, b, side="right")))
+    inner = slice(i0 + 1, max(i0 + 1, i1))
+    keep = (cum_km[inner] >= a) & (cum_km[inner] <= b)
 
-    coords.append(_interp_vertex(course_points, cum_km, b))
+    coords: List[Tuple[float, float]] = [(float(ends_lon[0]), float(ends_lat[0]))]
+    coords.extend(zip(lon[inner][keep].tolist(), lat[inner][keep].tolist()))
+    coords.append((float(ends_lon[1]), float(ends_lat[1])))
 
     # drop duplicate consecutive points
     dedup: List[Tuple[float, float]] = []
@@ -115,25 +147,108 @@ def slice_polyline_by_km(
     return dedup
 
 
+def slice_polyline_by_km(
+    course_points: List[Tuple[float, float]],
+    cum_km: List[float],
+    km_a: float,
+    km_b: float,
+) -> List[Tuple[float, float]]:
+    """
+    Returns a dense LineString ([(lon,lat), ...]) for the route section between km_a and km_b.
+    Works even if the endpoints are spatially coincident due to loops.
+    """
+    if len(course_points) == 0 or len(cum_km) == 0 or len(course_points) != len(cum_km):
+        return []
+    lat, lon = _split_latlon(course_points)
+    return _slice_arrays(lat, lon, np.asarray(cum_km, dtype=np.float64), km_a, km_b)
+
+
 def metres_between(a: Tuple[float, float], b: Tuple[float, float]) -> float:
     """Calculate distance between two coordinate tuples in meters"""
     (lon1, lat1), (lon2, lat2) = a, b
     return haversine_m(lat1, lon1, lat2, lon2)
 
 
-@dataclass
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    arr.setflags(write=False)
+    return arr
+
+
 class GPXCourse:
-    """Represents a complete GPX course with points and metadata"""
-    name: str
-    points: List[GPXPoint]
-    total_distance_km: float = 0.0
-    
-    def __post_init__(self):
-        """Cache route data for efficient slicing"""
-        # Extract raw coordinates for slicing
-        self.course_points = [(p.lat, p.lon) for p in self.points]
-        # Calculate cumulative distances for slicing
-        self.cum_km = cumulative_km(self.course_points)
+    """
+    A complete GPX course backed by contiguous lat/lon/cumulative-km arrays.
+
+    Arrays are read-only so one parsed course can be shared by every consumer
+    in a run (see ``parse_gpx_file`` cache). ``points``, ``course_points`` and
+    ``cum_km`` are list views kept for callers that iterate vertices.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        points: Optional[List[GPXPoint]] = None,
+        total_distance_km: Optional[float] = None,
+        *,
+        lat: Optional[Sequence[float]] = None,
+        lon: Optional[Sequence[float]] = None,
+    ):
+        if lat is None or lon is None:
+            pts = list(points or [])
+            lat = [p.lat for p in pts]
+            lon = [p.lon for p in pts]
+            self._points: Optional[List[GPXPoint]] = pts
+        else:
+            self._points = None
+        self.name = name
+        self.lat = _readonly(lat)
+        self.lon = _readonly(lon)
+        if len(self.lat) != len(self.lon):
+            raise ValueError(f"GPX course '{name}' has mismatched lat/lon lengths")
+        self.km = _readonly(cumulative_km_array(self.lat, self.lon))
+        if total_distance_km is None:
+            total_distance_km = float(self.km[-1]) if len(self.km) else 0.0
+        self.total_distance_km = float(total_distance_km)
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def __repr__(self) -> str:
+        return f"GPXCourse(name={self.name!r}, n_points={len(self)}, total_distance_km={self.total_distance_km:.3f})"
+
+    @property
+    def points(self) -> List[GPXPoint]:
+        """GPXPoint list view (materialized on first access)."""
+        if self._points is None:
+            self._points = [
+                GPXPoint(lat=la, lon=lo, distance_km=d)
+                for la, lo, d in zip(self.lat.tolist(), self.lon.tolist(), self.km.tolist())
+            ]
+        return self._points
+
+    @cached_property
+    def course_points(self) -> List[Tuple[float, float]]:
+        """[(lat, lon), ...] list view of the course vertices."""
+        return list(zip(self.lat.tolist(), self.lon.tolist()))
+
+    @cached_property
+    def cum_km(self) -> List[float]:
+        """Cumulative km list view (same values as ``km``)."""
+        return self.km.tolist()
+
+    def coordinates_at(self, km_values) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (lat, lon) arrays interpolated at each distance in ``km_values``.
+
+        Distances outside the course are clamped to the first/last vertex.
+        """
+        return _interp_arrays(self.lat, self.lon, self.km, km_values)
+
+    def slice_km(self, km_a: float, km_b: float) -> List[Tuple[float, float]]:
+        """Return the [(lon, lat), ...] polyline between km_a and km_b."""
+        if len(self.km) == 0:
+            return []
+        return _slice_arrays(self.lat, self.lon, self.km, km_a, km_b)
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -141,71 +256,69 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Calculate the great circle distance between two points on Earth
     Returns distance in kilometers
     """
-    R = 6371  # Earth's radius in kilometers
-    
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-    
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-    
-    a = (math.sin(dlat/2)**2 + 
-         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2)
-    c = 2 * math.asin(math.sqrt(a))
-    
-    return R * c
+    return haversine_m(lat1, lon1, lat2, lon2) / 1000.0
+
 
+# Parsed courses keyed by GPX content hash, so bins, locations, motion and
+# progression share one parse per file within a process. Courses are read-only.
+_GPX_COURSE_CACHE_MAX = 64
+_gpx_course_cache: Dict[str, GPXCourse] = {}
+_gpx_course_cache_lock = threading.Lock()
 
-def parse_gpx_file(filepath: str) -> GPXCourse:
+
+def clear_gpx_course_cache() -> None:
+    with _gpx_course_cache_lock:
+        _gpx_course_cache.clear()
+
+
+def _parse_gpx_bytes(content: bytes) -> GPXCourse:
+    root = ET.fromstring(content)
+
+    # Handle different GPX namespaces
+    namespaces = {
+        'gpx': 'http://www.topografix.com/GPX/1/1',
+        'gpx11': 'http://www.topografix.com/GPX/1/1',
+        'gpx10': 'http://www.topografix.com/GPX/1/0'
+    }
+
+    # Find the track name
+    track_name = "Unknown Course"
+    for track in root.findall('.//gpx:trk', namespaces):
+        name_elem = track.find('gpx:name', namespaces)
+        if name_elem is not None:
+            track_name = name_elem.text
+            break
+
+    # Extract track points
+    trkpts = root.findall('.//gpx:trkpt', namespaces)
+    lat = np.fromiter((float(p.get('lat')) for p in trkpts), dtype=np.float64, count=len(trkpts))
+    lon = np.fromiter((float(p.get('lon')) for p in trkpts), dtype=np.float64, count=len(trkpts))
+    return GPXCourse(name=track_name, lat=lat, lon=lon)
+
+
+def parse_gpx_file(filepath: Union[str, Path]) -> GPXCourse:
     """
-    Parse a GPX file and extract track points with calculated distances
+    Parse a GPX file and extract track points with calculated distances.
+
+    Results are cached by file content hash; the returned course is shared and
+    must be treated as read-only.
     """
     try:
-        tree = ET.parse(filepath)
-        root = tree.getroot()
-        
-        # Handle different GPX namespaces
-        namespaces = {
-            'gpx': 'http://www.topografix.com/GPX/1/1',
-            'gpx11': 'http://www.topografix.com/GPX/1/1',
-            'gpx10': 'http://www.topografix.com/GPX/1/0'
-        }
-        
-        # Find the track name
-        track_name = "Unknown Course"
-        for track in root.findall('.//gpx:trk', namespaces):
-            name_elem = track.find('gpx:name', namespaces)
-            if name_elem is not None:
-                track_name = name_elem.text
-                break
-        
-        # Extract track points
-        points = []
-        for trkpt in root.findall('.//gpx:trkpt', namespaces):
-            lat = float(trkpt.get('lat'))
-            lon = float(trkpt.get('lon'))
-            points.append(GPXPoint(lat=lat, lon=lon))
-        
-        # Calculate cumulative distances with better precision
-        total_distance = 0.0
-        for i in range(1, len(points)):
-            prev_point = points[i-1]
-            curr_point = points[i]
-            segment_distance = haversine_distance(
-                prev_point.lat, prev_point.lon,
-                curr_point.lat, curr_point.lon
-            )
-            total_distance += segment_distance
-            curr_point.distance_km = total_distance
-
-        return GPXCourse(
-            name=track_name,
-            points=points,
-            total_distance_km=total_distance
-        )
-        
+        content = Path(filepath).read_bytes()
+        key = hashlib.sha256(content).hexdigest()
+        with _gpx_course_cache_lock:
+            cached = _gpx_course_cache.get(key)
+        if cached is not None:
+            return cached
+
+        course = _parse_gpx_bytes(content)
+
+        with _gpx_course_cache_lock:
+            if len(_gpx_course_cache) >= _GPX_COURSE_CACHE_MAX:
+                _gpx_course_cache.pop(next(iter(_gpx_course_cache)))
+            _gpx_course_cache[key] = course
+        return course
+
     except Exception as e:
         raise ValueError(f"Failed to parse GPX file {filepath}: {e}")
 
@@ -215,45 +328,10 @@ def find_coordinates_at_distance(course: GPXCourse, target_distance_km: float) -
     Find the coordinates at a specific distance along the course
     Returns (lat, lon) or None if distance is out of range
     """
-    if not course.points or target_distance_km < 0:
+    if len(course) == 0 or target_distance_km < 0:
         return None
-    
-    # Debug logging for problematic distances
-    if target_distance_km > 10:
-        print(f"  Looking for coordinates at {target_distance_km}km (course total: {course.total_distance_km:.2f}km)")
-    
-    # Find the two points that bracket the target distance
-    for i in range(len(course.points) - 1):
-        point1 = course.points[i]
-        point2 = course.points[i + 1]
-        
-        if point1.distance_km <= target_distance_km <= point2.distance_km:
-            # Interpolate between the two points
-            ratio = (target_distance_km - point1.distance_km) / (point2.distance_km - point1.distance_km)
-            lat = point1.lat + ratio * (point2.lat - point1.lat)
-            lon = point1.lon + ratio * (point2.lon - point1.lon)
-            
-            # Debug logging for interpolation
-            if target_distance_km > 10:
-                print(f"    Interpolated {target_distance_km}km between points {i} ({point1.distance_km:.2f}km) and {i+1} ({point2.distance_km:.2f}km)")
-                print(f"    Result: ({lat:.6f}, {lon:.6f})")
-            
-            return (lat, lon)
-    
-    # If target distance is beyond the course, return the last point
-    if target_distance_km >= course.total_distance_km:
-        last_point = course.points[-1]
-        print(f"  Distance {target_distance_km}km beyond course, using last point at {last_point.distance_km:.2f}km")
-        return (last_point.lat, last_point.lon)
-    
-    # If target distance is before the course, return the first point
-    if target_distance_km <= 0:
-        first_point = course.points[0]
-        print(f"  Distance {target_distance_km}km before course, using first point")
-        return (first_point.lat, first_point.lon)
-    
-    print(f"  Distance {target_distance_km}km not found in course range [0, {course.total_distance_km:.2f}]")
-    return None
+    lat, lon = course.coordinates_at(target_distance_km)
+    return (float(lat), float(lon))
 
 
 def generate_segment_coordinates(
@@ -325,12 +403,7 @@ def generate_segment_coordinates(
             )
         
         # Use route slicing instead of just endpoints
-        line_coords = slice_polyline_by_km(
-            course.course_points,
-            course.cum_km,
-            from_km,
-            to_km
-        )
+        line_coords = course.slice_km(from_km, to_km)
         
         # Issue #655: Fail-fast if route slicing fails - no fallback behavior
         # All segments with valid from_km/to_km must have valid geometry
@@ -379,16 +452,20 @@ def generate_segment_coordinates(
     return result
 
 
-def load_all_courses(gpx_files: Dict[str, str]) -> Dict[str, GPXCourse]:
+def load_all_courses(
+    gpx_files: Dict[str, str],
+    parser: Callable[[str], GPXCourse] = parse_gpx_file,
+) -> Dict[str, GPXCourse]:
     """
     Load all GPX courses from the data directory
     
+    Args:
+        gpx_files: Mapping of event name to GPX file path
+        parser: GPX parser (e.g. ``RunInputCache.gpx_course`` to count run-scoped loads)
+    
     Returns:
         Dictionary mapping event names to GPXCourse objects
     """
-    import os
-    from pathlib import Path
-    
     if not gpx_files:
         raise ValueError("gpx_files is required to load GPX courses.")
     courses: Dict[str, GPXCourse] = {}
@@ -399,7 +476,7 @@ def load_all_courses(gpx_files: Dict[str, str]) -> Dict[str, GPXCourse]:
         if not filepath.exists():
             raise FileNotFoundError(f"GPX file not found for event '{event}': {filepath}")
         try:
-            course = parse_gpx_file(str(filepath))
+            course = parser(str(filepath))
             courses[event.lower()] = course
             print(f"✅ Loaded {event} course: {course.total_distance_km:.2f} km")
         except Exception as e:
@@ -6,7 +6,9 @@ from app.core.junction_flow.compute import (
     InteractionResult,
     analyze_interaction,
     analyze_junction,
+    analyze_junction_batches,
     analyze_junctions_doc,
+    get_junction_max_workers,
     interaction_to_dict,
     prepare_runners_by_event,
     result_to_ui_payload,
@@ -22,8 +24,10 @@ __all__ = [
     "InteractionResult",
     "analyze_interaction",
     "analyze_junction",
+    "analyze_junction_batches",
     "analyze_junctions_doc",
     "format_interaction_description",
+    "get_junction_max_workers",
     "interaction_to_dict",
     "prepare_runners_by_event",
     "result_to_ui_payload",
@@ -7,7 +7,12 @@ Merge partners are full/half on To streams only.
 
 from __future__ import annotations
 
+import concurrent.futures
+import logging
 import math
+import multiprocessing
+import os
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
@@ -20,8 +25,15 @@ from app.core.junction_flow.descriptions import (
     role_headline_labels,
 )
 
+logger = logging.getLogger(__name__)
+
 NODE_DWELL_SEC = 30.0
 MERGE_PARTNER_EVENTS = ("full", "half")
+# Below this many junction tasks a process pool costs more than it saves
+PARALLEL_MIN_JUNCTIONS = 8
+
+# (runners_by_event, gun_by_event) per batch key, installed once per pool worker
+_worker_batches: Dict[str, Tuple[Dict[str, pd.DataFrame], Dict[str, float]]] = {}
 
 
 def _enrich_interaction_result(
@@ -200,50 +212,67 @@ def _unique_in_window(p: StreamPresence, start_sec: float, end_sec: float) -> in
     return int(np.unique(p.runner_ids[mask]).size)
 
 
-def _nearest_partner_dt(
-    t: float,
+def _nearest_partner_dts(
+    times: np.ndarray,
     partner_times_sorted: np.ndarray,
-) -> Optional[float]:
+) -> np.ndarray:
+    """|dt| to the nearest partner transit for each time (inf when no partners)."""
+    times = np.asarray(times, dtype=float)
     if partner_times_sorted.size == 0:
-        return None
-    idx = int(np.searchsorted(partner_times_sorted, t, side="left"))
-    best_dt: Optional[float] = None
-    for j in (idx - 1, idx):
-        if 0 <= j < partner_times_sorted.size:
-            dt = abs(float(partner_times_sorted[j] - t))
-            if best_dt is None or dt < best_dt:
-                best_dt = dt
-    return best_dt
+        return np.full(times.shape, np.inf)
+    idx = np.searchsorted(partner_times_sorted, times, side="left")
+    left = partner_times_sorted[np.clip(idx - 1, 0, None)]
+    right = partner_times_sorted[np.clip(idx, None, partner_times_sorted.size - 1)]
+    dt_left = np.where(idx > 0, np.abs(left - times), np.inf)
+    dt_right = np.where(idx < partner_times_sorted.size, np.abs(right - times), np.inf)
+    return np.minimum(dt_left, dt_right)
 
 
-def _copresent_runner_ids(
+def _window_runner_codes(
     primary: StreamPresence,
+    start_sec: float,
+    end_sec: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(node times, integer runner code per transit, unique runner ids) in window."""
+    p_mask = (primary.node_times_sec >= start_sec) & (primary.node_times_sec <= end_sec)
+    p_id = primary.runner_ids[p_mask].astype(str)
+    ids, codes = np.unique(p_id, return_inverse=True)
+    return primary.node_times_sec[p_mask], codes, ids
+
+
+def _copresent_mask(
+    p_t: np.ndarray,
+    codes: np.ndarray,
+    n_ids: int,
     partner: StreamPresence,
     start_sec: float,
     end_sec: float,
     dwell_sec: float = NODE_DWELL_SEC,
-) -> Tuple[set, set]:
-    """Return (ids with a partner within dwell, ids in window without a partner)."""
-    p_mask = (primary.node_times_sec >= start_sec) & (primary.node_times_sec <= end_sec)
+) -> np.ndarray:
+    """Boolean mask over runner codes: some transit has a partner within dwell."""
     partner_mask = (partner.node_times_sec >= start_sec - dwell_sec) & (
         partner.node_times_sec <= end_sec + dwell_sec
     )
-    p_t = primary.node_times_sec[p_mask]
-    p_id = primary.runner_ids[p_mask].astype(str)
     partner_t = np.sort(partner.node_times_sec[partner_mask])
-    with_ids: set = set()
-    without_ids: set = set()
-    for i in range(p_t.size):
-        rid = str(p_id[i])
-        if rid in with_ids:
-            continue
-        dt = _nearest_partner_dt(float(p_t[i]), partner_t)
-        if dt is not None and dt <= dwell_sec:
-            with_ids.add(rid)
-            without_ids.discard(rid)
-        elif rid not in with_ids:
-            without_ids.add(rid)
-    return with_ids, without_ids - with_ids
+    hit = _nearest_partner_dts(p_t, partner_t) <= dwell_sec
+    with_mask = np.zeros(n_ids, dtype=bool)
+    with_mask[codes[hit]] = True
+    return with_mask
+
+
+def _copresent_runner_ids(
+    primary: StreamPresence,
+    partner: StreamPresence,
+    start_sec: float,
+    end_sec: float,
+    dwell_sec: float = NODE_DWELL_SEC,
+) -> Tuple[set, set]:
+    """Return (ids with a partner within dwell, ids in window without a partner)."""
+    p_t, codes, ids = _window_runner_codes(primary, start_sec, end_sec)
+    with_mask = _copresent_mask(
+        p_t, codes, ids.size, partner, start_sec, end_sec, dwell_sec=dwell_sec
+    )
+    return set(ids[with_mask].tolist()), set(ids[~with_mask].tolist())
 
 
 def _unique_with_copresence(
@@ -259,13 +288,15 @@ def _unique_with_copresence(
     A primary runner counts as "with_partner" only if some partner runner's
     node transit is within dwell_sec of theirs (not merely in the same window).
     """
-    with_ids, without_ids = _copresent_runner_ids(
-        primary, partner, start_sec, end_sec, dwell_sec=dwell_sec
+    p_t, codes, ids = _window_runner_codes(primary, start_sec, end_sec)
+    with_mask = _copresent_mask(
+        p_t, codes, ids.size, partner, start_sec, end_sec, dwell_sec=dwell_sec
     )
+    with_partner = int(with_mask.sum())
     return {
-        "in_window": len(with_ids | without_ids),
-        "with_partner": len(with_ids),
-        "without_partner": len(without_ids),
+        "in_window": int(ids.size),
+        "with_partner": with_partner,
+        "without_partner": int(ids.size) - with_partner,
     }
 
 
@@ -278,22 +309,19 @@ def _event_mix_rows(
     """Unique primary runners who met each partner event within dwell (union ≠ sum)."""
     out: Dict[str, Any] = {}
     for event, primary in primary_by_event.items():
-        vs: Dict[str, int] = {}
-        id_sets: Dict[str, set] = {}
-        for other, partner in partner_by_event.items():
-            ids, _ = _copresent_runner_ids(primary, partner, start_sec, end_sec)
-            vs[other] = len(ids)
-            id_sets[other] = ids
-        union: set = set()
-        for ids in id_sets.values():
-            union |= ids
-        in_two = sum(
-            1 for rid in union if sum(1 for ids in id_sets.values() if rid in ids) >= 2
-        )
+        p_t, codes, ids = _window_runner_codes(primary, start_sec, end_sec)
+        # One row per partner event, one column per primary runner
+        masks = np.zeros((len(partner_by_event), ids.size), dtype=bool)
+        for row, partner in enumerate(partner_by_event.values()):
+            masks[row] = _copresent_mask(p_t, codes, ids.size, partner, start_sec, end_sec)
+        met_count = masks.sum(axis=0)
         out[event] = {
-            "vs": vs,
-            "unique": len(union),
-            "in_two_or_more": in_two,
+            "vs": {
+                other: int(masks[row].sum())
+                for row, other in enumerate(partner_by_event)
+            },
+            "unique": int((met_count >= 1).sum()),
+            "in_two_or_more": int((met_count >= 2).sum()),
         }
     return out
 
@@ -337,7 +365,7 @@ def _crosstab(
     )
     a_t = a.node_times_sec[a_mask]
     a_q = a.quintiles[a_mask]
-    a_id = a.runner_ids[a_mask]
+    a_id = a.runner_ids[a_mask].astype(str)
     b_t = b.node_times_sec[b_mask]
     b_q = b.quintiles[b_mask]
     if a_t.size == 0 or b_t.size == 0:
@@ -345,37 +373,31 @@ def _crosstab(
     order = np.argsort(b_t)
     b_t_s = b_t[order]
     b_q_s = b_q[order]
-    counts: Dict[Tuple[int, int], set] = {}
-    seen_a: set = set()
-    for i in range(a_t.size):
-        rid = str(a_id[i])
-        if rid in seen_a:
-            continue
-        idx = int(np.searchsorted(b_t_s, a_t[i], side="left"))
-        candidates = []
-        if idx < b_t_s.size:
-            candidates.append(idx)
-        if idx > 0:
-            candidates.append(idx - 1)
-        best = None
-        best_dt = None
-        for j in candidates:
-            dt = abs(float(b_t_s[j] - a_t[i]))
-            if best_dt is None or dt < best_dt:
-                best_dt = dt
-                best = j
-        if best is None or best_dt is None or best_dt > dwell_sec:
-            continue
-        seen_a.add(rid)
-        key = (int(a_q[i]), int(b_q_s[best]))
-        counts.setdefault(key, set()).add(rid)
+    # Nearest B transit per A transit; ties go to the later B
+    idx = np.searchsorted(b_t_s, a_t, side="left")
+    left = np.clip(idx - 1, 0, None)
+    right = np.clip(idx, None, b_t_s.size - 1)
+    dt_left = np.where(idx > 0, np.abs(b_t_s[left] - a_t), np.inf)
+    dt_right = np.where(idx < b_t_s.size, np.abs(b_t_s[right] - a_t), np.inf)
+    use_left = dt_left < dt_right
+    best = np.where(use_left, left, right)
+    best_dt = np.where(use_left, dt_left, dt_right)
+    hit = np.flatnonzero(~(best_dt > dwell_sec))
+    # Each A runner counts once, keyed by their first transit with a partner
+    _, first = np.unique(a_id[hit], return_index=True)
+    rows_hit = hit[first]
+    keys = np.column_stack([a_q[rows_hit].astype(int), b_q_s[best[rows_hit]].astype(int)])
+    counts: Dict[Tuple[int, int], int] = {}
+    if keys.size:
+        pairs, n = np.unique(keys, axis=0, return_counts=True)
+        counts = {(int(qa), int(qb)): int(c) for (qa, qb), c in zip(pairs, n)}
     rows = []
-    for (qa, qb), ids in sorted(counts.items()):
+    for (qa, qb), n_ids in sorted(counts.items()):
         rows.append(
             {
                 "crossing_or_joining_quintile": qa,
                 "crossed_or_through_quintile": qb,
-                "unique_crossing_or_joining_runners": len(ids),
+                "unique_crossing_or_joining_runners": n_ids,
             }
         )
     return rows
@@ -870,30 +892,141 @@ def analyze_junction(
     }
 
 
+def get_junction_max_workers() -> int:
+    """Resolve max worker processes for Junction Flow (RUNFLOW_JUNCTION_MAX_WORKERS)."""
+    default_workers = 4
+    raw_value = os.getenv("RUNFLOW_JUNCTION_MAX_WORKERS", str(default_workers)).strip()
+    try:
+        max_workers = int(raw_value)
+    except ValueError:
+        logger.warning(
+            "Invalid RUNFLOW_JUNCTION_MAX_WORKERS value '%s', using default %s",
+            raw_value,
+            default_workers,
+        )
+        max_workers = default_workers
+    if max_workers < 1:
+        logger.warning("RUNFLOW_JUNCTION_MAX_WORKERS must be >= 1 (got %s); using 1", max_workers)
+        max_workers = 1
+    return min(max_workers, os.cpu_count() or max_workers)
+
+
+def _init_junction_worker(
+    batches: Dict[str, Tuple[Dict[str, pd.DataFrame], Dict[str, float]]],
+) -> None:
+    _worker_batches.clear()
+    _worker_batches.update(batches)
+
+
+def _timed_junction(
+    junction: Dict[str, Any],
+    runners_by_event: Dict[str, pd.DataFrame],
+    gun_by_event: Dict[str, float],
+) -> Tuple[Dict[str, Any], float]:
+    started = time.perf_counter()
+    result = analyze_junction(junction, runners_by_event, gun_by_event)
+    return result, time.perf_counter() - started
+
+
+def _junction_task(batch_key: str, index: int, junction: Dict[str, Any]):
+    runners_by_event, gun_by_event = _worker_batches[batch_key]
+    result, elapsed = _timed_junction(junction, runners_by_event, gun_by_event)
+    return batch_key, index, result, elapsed
+
+
+def _method_doc() -> Dict[str, Any]:
+    return {
+        "participation": "dwell_copresence_at_node",
+        "field_bands": "event_relative_pace_quintiles_Q1_lead_Q5_rear",
+        "timing_model": "gun + start_offset + pace*node_km (Flow-overlap equivalent)",
+        "node_dwell_sec": NODE_DWELL_SEC,
+        "merge_partner_events": list(MERGE_PARTNER_EVENTS),
+        "unique_count_rule": (
+            "unique runners who met the other stream within "
+            "node_dwell_sec; Full or Half is sufficient (union, not both required)"
+        ),
+    }
+
+
+def analyze_junction_batches(
+    junctions_doc: Dict[str, Any],
+    batches: Dict[str, Tuple[Dict[str, pd.DataFrame], Dict[str, float]]],
+    max_workers: int = 1,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Analyze every junction for several runner batches (e.g. one per day).
+
+    ``batches`` maps a key to ``(runners_by_event, gun_by_event)``. Junctions
+    are independent, so with ``max_workers > 1`` and at least
+    ``PARALLEL_MIN_JUNCTIONS`` tasks they run in a process pool; each worker
+    receives the runner arrays once, at start-up, rather than per task.
+    Results keep authored junction order and carry a per-junction ``timing``
+    breakdown for logging; it is wall-clock data and is not persisted.
+    """
+    junctions = list(junctions_doc.get("junctions") or [])
+    tasks = [(key, i, j) for key in batches for i, j in enumerate(junctions)]
+    workers = min(max_workers, len(tasks))
+    use_parallel = workers > 1 and len(tasks) >= PARALLEL_MIN_JUNCTIONS
+
+    started = time.perf_counter()
+    outputs: Dict[Tuple[str, int], Tuple[Dict[str, Any], float]] = {}
+    if use_parallel:
+        logger.debug("Junction Flow: %s junction tasks on %s worker processes", len(tasks), workers)
+        # spawn: the pipeline runs inside a threaded server, where fork is unsafe
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_junction_worker,
+            initargs=(batches,),
+        ) as executor:
+            futures = [executor.submit(_junction_task, key, i, j) for key, i, j in tasks]
+            for future in concurrent.futures.as_completed(futures):
+                key, i, result, elapsed = future.result()
+                outputs[(key, i)] = (result, elapsed)
+    else:
+        for key, i, junction in tasks:
+            runners_by_event, gun_by_event = batches[key]
+            outputs[(key, i)] = _timed_junction(junction, runners_by_event, gun_by_event)
+    total_sec = time.perf_counter() - started
+
+    mode = "process_pool" if use_parallel else "serial"
+    results: Dict[str, Dict[str, Any]] = {}
+    for key in batches:
+        ordered = [outputs[(key, i)] for i in range(len(junctions))]
+        results[key] = {
+            "ok": True,
+            "method": _method_doc(),
+            "junctions": [result for result, _ in ordered],
+            "timing": {
+                "mode": mode,
+                "workers": workers if use_parallel else 1,
+                # One wall-clock span over every batch's tasks, not this batch's own total
+                "all_batches_total_sec": round(total_sec, 3),
+                "junctions": [
+                    {
+                        "junction_id": result.get("junction_id"),
+                        "interactions": len(result.get("interactions") or []),
+                        "elapsed_sec": round(elapsed, 4),
+                    }
+                    for result, elapsed in ordered
+                ],
+            },
+        }
+    return results
+
+
 def analyze_junctions_doc(
     junctions_doc: Dict[str, Any],
     runners_by_event: Dict[str, pd.DataFrame],
     gun_by_event: Dict[str, float],
+    max_workers: int = 1,
 ) -> Dict[str, Any]:
     """Analyze all junctions in a package junctions.json document."""
-    junctions = []
-    for junction in junctions_doc.get("junctions") or []:
-        junctions.append(analyze_junction(junction, runners_by_event, gun_by_event))
-    return {
-        "ok": True,
-        "method": {
-            "participation": "dwell_copresence_at_node",
-            "field_bands": "event_relative_pace_quintiles_Q1_lead_Q5_rear",
-            "timing_model": "gun + start_offset + pace*node_km (Flow-overlap equivalent)",
-            "node_dwell_sec": NODE_DWELL_SEC,
-            "merge_partner_events": list(MERGE_PARTNER_EVENTS),
-            "unique_count_rule": (
-                "unique runners who met the other stream within "
-                "node_dwell_sec; Full or Half is sufficient (union, not both required)"
-            ),
-        },
-        "junctions": junctions,
-    }
+    return analyze_junction_batches(
+        junctions_doc,
+        {"": (runners_by_event, gun_by_event)},
+        max_workers=max_workers,
+    )[""]
 
 
 def result_to_ui_payload(day_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -12,7 +12,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 import numpy as np
 import pandas as pd
 
-from app.core.gpx.processor import cumulative_km, parse_gpx_file
+from app.core.gpx.processor import GPXCourse, parse_gpx_file
 from app.core.trajectory.crossing import arrival_at_km, runner_start_sec
 from app.core.motion.course_map import (
     compiled_course_length_km,
@@ -52,8 +52,7 @@ class EventMotionContext:
     finish_km: float
     csv_distance_km: Optional[float]
     spans: Tuple[Any, ...]
-    points_latlon: Tuple[Tuple[float, float], ...]
-    cum_km: Tuple[float, ...]
+    course: GPXCourse
 
 
 def _sha256_file(path: Path) -> str:
@@ -82,17 +81,10 @@ def aligned_ticks(start_sec: float, end_sec: float, interval_sec: int) -> np.nda
     return np.arange(first, last + 1, interval, dtype=np.int64)
 
 
-def _interp_lat_lon(
-    points: Sequence[Tuple[float, float]],
-    cum: Sequence[float],
-    target_km: float,
-) -> Tuple[float, float]:
-    if not points or not cum:
+def _interp_lat_lon(course: GPXCourse, target_km: float) -> Tuple[float, float]:
+    if len(course) == 0:
         return (float("nan"), float("nan"))
-    # Reuse geometry convention from gpx.processor._interp_vertex (returns lon, lat).
-    from app.core.gpx.processor import _interp_vertex
-
-    lon, lat = _interp_vertex(list(points), list(cum), float(target_km))
+    lat, lon = course.coordinates_at(float(target_km))
     return float(lat), float(lon)
 
 
@@ -117,10 +109,8 @@ def prepare_event_contexts(
         if not gpx_path:
             raise FileNotFoundError(f"Motion: GPX path missing for event '{name}'")
         course = parse_gpx_file(str(gpx_path))
-        points = tuple((p.lat, p.lon) for p in course.points)
-        if len(points) < 2:
+        if len(course) < 2:
             raise ValueError(f"Motion: GPX for '{name}' has insufficient points")
-        cum = tuple(cumulative_km(list(points)))
 
         ev_runners = runners_df[runners_df["event"].astype(str).str.lower() == name]
         csv_dist = None
@@ -133,8 +123,7 @@ def prepare_event_contexts(
             finish_km=float(finish_km),
             csv_distance_km=csv_dist,
             spans=spans,
-            points_latlon=points,
-            cum_km=cum,
+            course=course,
         )
     return out
 
@@ -166,7 +155,7 @@ def _runner_samples(
         if elapsed > ctx.finish_km:
             elapsed = ctx.finish_km
         seg_id, seg_km = locate_on_course(elapsed, ctx.spans, ctx.finish_km)
-        lat, lon = _interp_lat_lon(ctx.points_latlon, ctx.cum_km, elapsed)
+        lat, lon = _interp_lat_lon(ctx.course, elapsed)
         rows.append(
             {
                 "runner_id": str(runner_id),
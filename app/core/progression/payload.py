@@ -14,7 +14,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import pandas as pd
 
-from app.core.gpx.processor import cumulative_km, parse_gpx_file
+from app.core.gpx.processor import parse_gpx_file
 from app.core.motion.course_map import compiled_course_length_km
 from app.core.trajectory.crossing import arrival_at_km, runner_start_sec
 from app.core.trajectory.layer import try_load_day_snapshot
@@ -382,11 +382,9 @@ def _clock_span(
 
 def _event_polyline(gpx_path: Path, finish_km: float) -> List[List[float]]:
     course = parse_gpx_file(str(gpx_path))
-    points = [(p.lat, p.lon) for p in course.points]
-    if len(points) < 2:
+    if len(course) < 2:
         raise ProgressionError(f"GPX has insufficient points: {gpx_path}")
-    cum = cumulative_km(points)
-    return downsample_polyline(points, cum, finish_km=finish_km)
+    return downsample_polyline(course.course_points, course.cum_km, finish_km=finish_km)
 
 
 def _load_day_inputs(run_dir: Path, day: str) -> Dict[str, Any]:
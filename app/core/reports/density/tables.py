@@ -0,0 +1,67 @@
+"""
+Column-wise Markdown table rendering for the density report.
+
+The template engine used to build every table row from ``iterrows``, which
+constructs a Series per row. These helpers read each column once and format
+it as a whole, then join the formatted columns into rows in a single pass.
+
+Cell values come from ``DataFrame.values`` exactly as ``iterrows`` would see
+them (e.g. ints stay ints in mixed frames), so the rendered Markdown is
+byte-identical.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Sequence
+
+import pandas as pd
+
+_MISSING = object()
+
+
+def table_columns(df: pd.DataFrame) -> Dict[str, List[Any]]:
+    """Per-column cell values, as ``iterrows`` would yield them."""
+    values = df.values
+    if values.dtype == object:
+        return {col: values[:, i].tolist() for i, col in enumerate(df.columns)}
+    # Homogeneous frames: iterrows rebuilds a Series per row (Timestamps, upcast numbers)
+    return {col: pd.Series(values[:, i]).tolist() for i, col in enumerate(df.columns)}
+
+
+def table_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Rows as dicts (``row[...]`` / ``row.get(...)`` work as on iterrows rows)."""
+    columns = table_columns(df)
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+def column_or(columns: Dict[str, List[Any]], name: str, default: Any, length: int) -> List[Any]:
+    """Column values, or ``default`` for every row when absent (``row.get``)."""
+    if name in columns:
+        return columns[name]
+    return [default] * length
+
+
+def format_column(values: Iterable[Any], spec: str = "") -> List[str]:
+    """``format(value, spec)`` over a column, e.g. ``spec=".1f"``."""
+    return [format(value, spec) for value in values]
+
+
+def map_column(values: Iterable[Any], func: Callable[[Any], Any]) -> List[Any]:
+    """Apply a per-value formatter, computing each distinct hashable value once."""
+    cache: Dict[Any, Any] = {}
+    out = []
+    for value in values:
+        key = (type(value), value)  # keep 1 / 1.0 / True apart
+        try:
+            formatted = cache.get(key, _MISSING)
+            if formatted is _MISSING:
+                formatted = cache[key] = func(value)
+        except TypeError:  # unhashable
+            formatted = func(value)
+        out.append(formatted)
+    return out
+
+
+def markdown_rows(columns: Sequence[Sequence[str]]) -> List[str]:
+    """Join formatted columns into ``| a | b | ... |`` rows."""
+    return ["| " + " | ".join(cells) + " |" for cells in zip(*columns)]
@@ -12,6 +12,15 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import pandas as pd
 
+from app.core.reports.density.tables import (
+    column_or,
+    format_column,
+    map_column,
+    markdown_rows,
+    table_columns,
+    table_records,
+)
+
 
 class DensityReportTemplateEngine:
     """Template engine for the new density report structure per Issue #246."""
@@ -48,6 +57,44 @@ class DensityReportTemplateEngine:
         multiplier = 10 ** decimals
         return math.floor(n * multiplier + 0.5) / multiplier
     
+    @staticmethod
+    def _flow_ref_critical(segment_type: Any) -> Optional[float]:
+        """flow_ref.critical for a segment schema (Issue #548), None if unset."""
+        from app.rulebook import get_thresholds
+        thresholds = get_thresholds(segment_type)
+        return thresholds.flow_ref.critical if thresholds.flow_ref else None
+    
+    @staticmethod
+    def _worst_time_hhmm(t_start: Any) -> str:
+        """Worst bin start time as HH:MM ("N/A" when missing)."""
+        if pd.notna(t_start):
+            # Handle pandas Timestamp
+            if hasattr(t_start, 'strftime'):
+                return t_start.strftime('%H:%M')
+            # Handle string timestamps
+            if isinstance(t_start, str):
+                # Extract HH:MM from ISO format (e.g., "2025-10-16T07:20:00Z")
+                if 'T' in t_start:
+                    time_part = t_start.split('T')[1]
+                    return time_part[:5]  # HH:MM
+                return t_start[:5]
+            return str(t_start)[:5]
+        return "N/A"
+    
+    @staticmethod
+    def _bin_times_hhmm(times: tuple) -> tuple:
+        """(t_start, t_end) of a bin as (HH:MM, HH:MM)."""
+        t_start, t_end = times
+        # Handle pandas Timestamp
+        if hasattr(t_start, 'strftime'):
+            return t_start.strftime('%H:%M'), t_end.strftime('%H:%M')
+        # Handle string timestamps (ISO format)
+        if isinstance(t_start, str) and 'T' in t_start:
+            start_time = t_start.split('T')[1][:5]  # HH:MM
+            end_time = t_end.split('T')[1][:5] if isinstance(t_end, str) and 'T' in t_end else str(t_end)[:5]
+            return start_time, end_time
+        return str(t_start)[:5], str(t_end)[:5]
+    
     def generate_report(
         self,
         context: Dict[str, Any],
@@ -304,12 +351,14 @@ class DensityReportTemplateEngine:
         # Add spatial bin counts
         segments_sorted['spatial_bins'] = segments_sorted['segment_id'].map(spatial_bins).fillna(0).astype(int)
         
-        for _, row in segments_sorted.iterrows():
-            segment_type = row.get('segment_type', 'N/A')
-            lines.append(
-                f"| {row['segment_id']} | {row['seg_label']} | {segment_type} | "
-                f"{row['width_m']} | {row['spatial_bins']} |"
-            )
+        columns = table_columns(segments_sorted)
+        lines.extend(markdown_rows([
+            format_column(columns['segment_id']),
+            format_column(columns['seg_label']),
+            format_column(column_or(columns, 'segment_type', 'N/A', len(segments_sorted))),
+            format_column(columns['width_m']),
+            format_column(columns['spatial_bins']),
+        ]))
         
         lines.append("")
         lines.append("> Note: Each spatial bin is analyzed across 80 time windows (30-second intervals). Total space-time bins per segment = spatial bins × 80 (e.g., A1: 5 × 80 = 400; I1: 121 × 80 = 9,680).")
@@ -352,61 +401,55 @@ class DensityReportTemplateEngine:
         if len(flagged_with_schema) == 0:
             lines.append("| *No flagged segments* | | | | | | | | | | | | |")
         else:
-            for _, row in flagged_with_schema.iterrows():
-                # Format worst bin km range
-                worst_km = f"{row['worst_bin_start_km']:.1f}-{row['worst_bin_end_km']:.1f}"
-                
-                # Format worst bin time (HH:MM only)
-                if pd.notna(row['worst_bin_t_start']):
-                    t_start = row['worst_bin_t_start']
-                    # Handle pandas Timestamp
-                    if hasattr(t_start, 'strftime'):
-                        worst_time = t_start.strftime('%H:%M')
-                    # Handle string timestamps
-                    elif isinstance(t_start, str):
-                        # Extract HH:MM from ISO format (e.g., "2025-10-16T07:20:00Z")
-                        if 'T' in t_start:
-                            time_part = t_start.split('T')[1]
-                            worst_time = time_part[:5]  # HH:MM
-                        else:
-                            worst_time = t_start[:5]
-                    else:
-                        worst_time = str(t_start)[:5]
-                else:
-                    worst_time = "N/A"
-                
-                # Calculate Util% based on segment schema
-                # Issue #548 Bug 4: Load flow_ref.critical from rulebook dynamically
-                from app.rulebook import get_thresholds
-                segment_type = row.get('segment_type', 'on_course_open')
-                thresholds = get_thresholds(segment_type)
-                flow_ref_critical = thresholds.flow_ref.critical if thresholds.flow_ref else None
-                
-                util_display = "N/A"
-                if flow_ref_critical and row['peak_rate_per_m_per_min'] > 0:
-                    util_display = f"{(row['peak_rate_per_m_per_min'] / flow_ref_critical * 100):.0f}%"
-                
-                # Bug fix: Use peak_rate (converted from peak_rate_per_m_per_min) instead of worst_bin_rate
-                # to match the UI's peak_rate display. The UI shows peak_rate for the segment, not the worst bin rate.
-                # Conversion: peak_rate (p/s) = peak_rate_per_m_per_min (p/m/min) * width_m (m) / 60
-                width_m = row.get('width_m', 0.0)
-                if width_m and width_m > 0 and row['peak_rate_per_m_per_min'] > 0:
-                    peak_rate_ps = row['peak_rate_per_m_per_min'] * width_m / 60.0
-                    peak_rate_display = f"{peak_rate_ps:.3f}"
-                else:
-                    peak_rate_display = "N/A"
-                
-                worst_bin_density = row['worst_bin_density']
-                worst_bin_los = row['worst_bin_los']
-                
-                # Bug fix: Use consistent round-half-up for percentage formatting
-                flagged_pct = self._round_half_up(row['flagged_percentage'], 1)
-                
-                lines.append(
-                    f"| {row['segment_id']} | {row['seg_label']} | {row['flagged_bins']} | {row['total_bins']} | "
-                    f"{flagged_pct:.1f}% | {worst_km} | {worst_time} | {worst_bin_density:.4f} | {peak_rate_display} | {util_display} | "
-                    f"{worst_bin_los} | {row['worst_severity']} | {row['worst_reason']} |"
-                )
+            columns = table_columns(flagged_with_schema)
+            row_count = len(flagged_with_schema)
+            peak_rates = columns['peak_rate_per_m_per_min']
+            
+            # Format worst bin km range
+            worst_km = [
+                f"{start_km:.1f}-{end_km:.1f}"
+                for start_km, end_km in zip(columns['worst_bin_start_km'], columns['worst_bin_end_km'])
+            ]
+            
+            # Calculate Util% based on segment schema
+            # Issue #548 Bug 4: Load flow_ref.critical from rulebook dynamically
+            flow_ref_critical = map_column(
+                column_or(columns, 'segment_type', 'on_course_open', row_count),
+                self._flow_ref_critical,
+            )
+            util_display = [
+                f"{(peak_rate / flow_ref * 100):.0f}%" if flow_ref and peak_rate > 0 else "N/A"
+                for peak_rate, flow_ref in zip(peak_rates, flow_ref_critical)
+            ]
+            
+            # Bug fix: Use peak_rate (converted from peak_rate_per_m_per_min) instead of worst_bin_rate
+            # to match the UI's peak_rate display. The UI shows peak_rate for the segment, not the worst bin rate.
+            # Conversion: peak_rate (p/s) = peak_rate_per_m_per_min (p/m/min) * width_m (m) / 60
+            peak_rate_display = [
+                f"{(peak_rate * width_m / 60.0):.3f}" if width_m and width_m > 0 and peak_rate > 0 else "N/A"
+                for peak_rate, width_m in zip(peak_rates, column_or(columns, 'width_m', 0.0, row_count))
+            ]
+            
+            # Bug fix: Use consistent round-half-up for percentage formatting
+            flagged_pct = [
+                f"{self._round_half_up(pct, 1):.1f}%" for pct in columns['flagged_percentage']
+            ]
+            
+            lines.extend(markdown_rows([
+                format_column(columns['segment_id']),
+                format_column(columns['seg_label']),
+                format_column(columns['flagged_bins']),
+                format_column(columns['total_bins']),
+                flagged_pct,
+                worst_km,
+                map_column(columns['worst_bin_t_start'], self._worst_time_hhmm),
+                format_column(columns['worst_bin_density'], '.4f'),
+                peak_rate_display,
+                util_display,
+                format_column(columns['worst_bin_los']),
+                format_column(columns['worst_severity']),
+                format_column(columns['worst_reason']),
+            ]))
         
         return "\n".join(lines)
     
@@ -419,16 +462,20 @@ class DensityReportTemplateEngine:
             "|----------|--------|----------|--------|----|--------------|"
         ]
         
+        flagged = segment_summary_df[segment_summary_df['flagged_bins'] > 0]
+        columns = table_columns(flagged)
+        
         # Bug fix: Use consistent round-half-up for percentage formatting (same as flagged segments table)
-        for _, row in segment_summary_df.iterrows():
-            if row['flagged_bins'] > 0:
-                flagged_pct = self._round_half_up(row['flagged_percentage'], 1)
-                lines.append(
-                    f"| {row['segment_id']} | {row['seg_label']} | {row['flagged_bins']} | "
-                    f"{row['total_bins']} | {flagged_pct:.1f}% | {row['worst_reason']} |"
-                )
-        
-        if len(segment_summary_df[segment_summary_df['flagged_bins'] > 0]) == 0:
+        lines.extend(markdown_rows([
+            format_column(columns['segment_id']),
+            format_column(columns['seg_label']),
+            format_column(columns['flagged_bins']),
+            format_column(columns['total_bins']),
+            [f"{self._round_half_up(pct, 1):.1f}%" for pct in columns['flagged_percentage']],
+            format_column(columns['worst_reason']),
+        ]))
+        
+        if len(flagged) == 0:
             lines.append("| *No flagged segments* | | | | | |")
         
         return "\n".join(lines)
@@ -463,11 +510,25 @@ class DensityReportTemplateEngine:
         # Group by segment and sort by segment_id, then by t_start
         flagged_bins_sorted = flagged_bins_df.sort_values(['segment_id', 't_start'])
         
+        columns = table_columns(flagged_bins_sorted)
+        row_count = len(flagged_bins_sorted)
+        segment_ids = columns['segment_id']
+        seg_labels = columns.get('seg_label', segment_ids)
+        
+        # Format time as HH:MM
+        times = map_column(zip(columns['t_start'], columns['t_end']), self._bin_times_hhmm)
+        rows = markdown_rows([
+            format_column(column_or(columns, 'start_km', 0, row_count), '.1f'),
+            format_column(column_or(columns, 'end_km', 0, row_count), '.1f'),
+            [start_time for start_time, _ in times],
+            [end_time for _, end_time in times],
+            format_column(columns['density'], '.3f'),
+            format_column(columns['rate'], '.3f'),
+            format_column(columns['los_class']),
+        ])
+        
         current_segment = None
-        for _, row in flagged_bins_sorted.iterrows():
-            segment_id = row['segment_id']
-            seg_label = row.get('seg_label', segment_id)
-            
+        for segment_id, seg_label, row_line in zip(segment_ids, seg_labels, rows):
             # Start new segment section
             if current_segment != segment_id:
                 if current_segment is not None:
@@ -481,26 +542,7 @@ class DensityReportTemplateEngine:
                     "|------------|----------|-----------|---------|----------------|-------------|-----|"
                 ])
             
-            # Format time as HH:MM
-            t_start = row['t_start']
-            t_end = row['t_end']
-            
-            # Handle pandas Timestamp
-            if hasattr(t_start, 'strftime'):
-                start_time = t_start.strftime('%H:%M')
-                end_time = t_end.strftime('%H:%M')
-            # Handle string timestamps (ISO format)
-            elif isinstance(t_start, str) and 'T' in t_start:
-                start_time = t_start.split('T')[1][:5]  # HH:MM
-                end_time = t_end.split('T')[1][:5] if isinstance(t_end, str) and 'T' in t_end else str(t_end)[:5]
-            else:
-                start_time = str(t_start)[:5]
-                end_time = str(t_end)[:5]
-            
-            lines.append(
-                f"| {row.get('start_km', 0):.1f} | {row.get('end_km', 0):.1f} | {start_time} | {end_time} | "
-                f"{row['density']:.3f} | {row['rate']:.3f} | {row['los_class']} |"
-            )
+            lines.append(row_line)
         
         return "\n".join(lines)
     
@@ -541,25 +583,29 @@ class DensityReportTemplateEngine:
                     logger = logging.getLogger(__name__)
                     logger.warning(f"Could not calculate active windows from segment_windows_df: {e}")
         
-        for _, seg_row in segments_df.iterrows():
+        # One groupby instead of re-filtering the summary per segment
+        summary_records = table_records(segment_summary_df)
+        summary_by_segment = {
+            seg_id: summary_records[positions[0]]
+            for seg_id, positions in segment_summary_df.groupby('segment_id', sort=False).indices.items()
+        }
+        
+        for seg_row in table_records(segments_df):
             seg_id = seg_row['segment_id']
             seg_label = seg_row['seg_label']
             
             # Get summary data for this segment
-            seg_summary = segment_summary_df[segment_summary_df['segment_id'] == seg_id]
+            summary = summary_by_segment.get(seg_id)
             
-            if len(seg_summary) > 0:
-                summary = seg_summary.iloc[0]
+            if summary is not None:
                 
                 # Convert rate from p/m/min to p/s
                 peak_rate_ps = summary['peak_rate_per_m_per_min'] / 60.0
                 
                 # Calculate Util% if we have rate thresholds for this schema
                 # Issue #548 Bug 4: Load flow_ref.critical from rulebook dynamically
-                from app.rulebook import get_thresholds
                 segment_type = seg_row.get('segment_type', 'on_course_open')
-                thresholds = get_thresholds(segment_type)
-                flow_ref_critical = thresholds.flow_ref.critical if thresholds.flow_ref else None
+                flow_ref_critical = self._flow_ref_critical(segment_type)
                 
                 util_pct = "N/A"
                 if flow_ref_critical and summary['peak_rate_per_m_per_min'] > 0:
@@ -0,0 +1,309 @@
+"""
+Bounded analysis job queue with memory-aware admission.
+
+Every submitted run still gets its own daemon thread (see analysis_submit),
+but the thread waits here for a slot before it runs the pipeline. A run is
+admitted in FIFO order when:
+
+- fewer than RUNFLOW_ANALYSIS_MAX_CONCURRENT analyses are running, and
+- its estimated peak memory (from the runner count recorded in analysis.json
+  by ``count_runners_in_file``) fits in RUNFLOW_ANALYSIS_MEMORY_BUDGET_MB
+  together with the runs already in flight. A run that exceeds the budget on
+  its own is still admitted once nothing else is running, so it cannot starve.
+
+Jobs move through queued → running → finished | failed | cancelled. Queued
+jobs cancel immediately; running jobs stop at the next pipeline phase boundary
+(PerformanceMonitor.start_phase calls ``raise_if_cancelled``).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_FINISHED = "finished"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+JOB_STATES = (JOB_QUEUED, JOB_RUNNING, JOB_FINISHED, JOB_FAILED, JOB_CANCELLED)
+ACTIVE_JOB_STATES = (JOB_QUEUED, JOB_RUNNING)
+
+# Rough peak-RSS model for one analysis; tune per deployment via env.
+DEFAULT_BASE_MB = 400.0
+DEFAULT_MB_PER_1K_RUNNERS = 120.0
+# Finished jobs kept for the jobs API before the oldest are forgotten.
+FINISHED_JOB_HISTORY = 50
+
+
+class AnalysisCancelledError(RuntimeError):
+    """Raised at a phase boundary when the job's cancellation was requested."""
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _env_float(name: str, default: float) -> float:
+    raw_value = os.getenv(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        return float(raw_value)
+    except ValueError:
+        logger.warning(f"Invalid {name} value '{raw_value}', using default {default}")
+        return default
+
+
+def _get_max_concurrent() -> int:
+    """Resolve how many analyses may run at once (RUNFLOW_ANALYSIS_MAX_CONCURRENT)."""
+    default_slots = 2
+    raw_value = os.getenv("RUNFLOW_ANALYSIS_MAX_CONCURRENT", str(default_slots)).strip()
+    try:
+        max_concurrent = int(raw_value)
+    except ValueError:
+        logger.warning(
+            f"Invalid RUNFLOW_ANALYSIS_MAX_CONCURRENT value '{raw_value}', using default {default_slots}"
+        )
+        max_concurrent = default_slots
+    if max_concurrent < 1:
+        logger.warning(
+            f"RUNFLOW_ANALYSIS_MAX_CONCURRENT must be >= 1 (got {max_concurrent}); using 1"
+        )
+        max_concurrent = 1
+    return max_concurrent
+
+
+def _get_memory_budget_mb() -> Optional[float]:
+    """
+    Memory available to concurrent analyses (RUNFLOW_ANALYSIS_MEMORY_BUDGET_MB).
+
+    Defaults to 75% of physical memory when psutil is available; 0 or a
+    negative value disables the memory check.
+    """
+    raw_value = os.getenv("RUNFLOW_ANALYSIS_MEMORY_BUDGET_MB", "").strip()
+    if raw_value:
+        budget = _env_float("RUNFLOW_ANALYSIS_MEMORY_BUDGET_MB", 0.0)
+        return budget if budget > 0 else None
+    try:
+        import psutil
+
+        return psutil.virtual_memory().total / 1024 / 1024 * 0.75
+    except Exception:
+        return None
+
+
+def estimate_analysis_memory_mb(runners: int) -> float:
+    """Estimated peak memory (MB) of one analysis over ``runners`` runners."""
+    base_mb = _env_float("RUNFLOW_ANALYSIS_BASE_MB", DEFAULT_BASE_MB)
+    per_1k = _env_float("RUNFLOW_ANALYSIS_MB_PER_1K_RUNNERS", DEFAULT_MB_PER_1K_RUNNERS)
+    return base_mb + per_1k * max(int(runners or 0), 0) / 1000.0
+
+
+@dataclass
+class AnalysisJob:
+    """One submitted analysis and its queue state."""
+
+    run_id: str
+    runners: int
+    estimated_mb: float
+    state: str = JOB_QUEUED
+    submitted_at: str = field(default_factory=_utc_now_iso)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    cancel_requested: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "state": self.state,
+            "runners": self.runners,
+            "estimated_mb": round(self.estimated_mb, 1),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "cancel_requested": self.cancel_requested.is_set(),
+            "error": self.error,
+        }
+
+
+class AnalysisJobQueue:
+    """FIFO admission gate shared by all analysis threads in this process."""
+
+    def __init__(self, max_concurrent: int, memory_budget_mb: Optional[float]) -> None:
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.memory_budget_mb = memory_budget_mb
+        self._cond = threading.Condition()
+        self._jobs: "OrderedDict[str, AnalysisJob]" = OrderedDict()
+
+    # -- state ---------------------------------------------------------------
+
+    def _running(self) -> List[AnalysisJob]:
+        return [j for j in self._jobs.values() if j.state == JOB_RUNNING]
+
+    def _queued(self) -> List[AnalysisJob]:
+        return [j for j in self._jobs.values() if j.state == JOB_QUEUED]
+
+    def _admissible(self, job: AnalysisJob) -> bool:
+        queued = self._queued()
+        if not queued or queued[0] is not job:
+            return False
+        running = self._running()
+        if len(running) >= self.max_concurrent:
+            return False
+        if not running or self.memory_budget_mb is None:
+            return True
+        in_flight_mb = sum(j.estimated_mb for j in running)
+        return in_flight_mb + job.estimated_mb <= self.memory_budget_mb
+
+    def _forget_old_finished(self) -> None:
+        finished = [rid for rid, j in self._jobs.items() if j.state not in ACTIVE_JOB_STATES]
+        excess = len(finished) - FINISHED_JOB_HISTORY
+        for run_id in finished[:max(excess, 0)]:
+            del self._jobs[run_id]
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def submit(self, run_id: str, runners: int = 0) -> AnalysisJob:
+        """Register a queued job (replaces a finished job with the same run_id)."""
+        job = AnalysisJob(run_id=run_id, runners=int(runners or 0),
+                          estimated_mb=estimate_analysis_memory_mb(runners))
+        with self._cond:
+            existing = self._jobs.get(run_id)
+            if existing is not None and existing.state in ACTIVE_JOB_STATES:
+                return existing
+            self._jobs.pop(run_id, None)
+            self._jobs[run_id] = job
+            self._forget_old_finished()
+        logger.info(
+            "Queued analysis %s (%d runners, ~%.0f MB)", run_id, job.runners, job.estimated_mb
+        )
+        return job
+
+    def wait_for_slot(
+        self,
+        job: AnalysisJob,
+        on_wait: Optional[Callable[[int], None]] = None,
+    ) -> bool:
+        """
+        Block until ``job`` is admitted (True) or cancelled while queued (False).
+
+        ``on_wait(jobs_ahead)`` is called once if the job has to wait.
+        """
+        notified = False
+        with self._cond:
+            while True:
+                if job.cancel_requested.is_set():
+                    self._finish_locked(job, JOB_CANCELLED, "Cancelled before start")
+                    return False
+                if self._admissible(job):
+                    job.state = JOB_RUNNING
+                    job.started_at = _utc_now_iso()
+                    # The next queued job may fit alongside this one
+                    self._cond.notify_all()
+                    break
+                if not notified and on_wait is not None:
+                    ahead = self._jobs_ahead(job)
+                    notified = True
+                    self._cond.release()
+                    try:
+                        on_wait(ahead)
+                    finally:
+                        self._cond.acquire()
+                    continue
+                self._cond.wait()
+        logger.info("Starting analysis %s", job.run_id)
+        return True
+
+    def _finish_locked(self, job: AnalysisJob, state: str, error: Optional[str]) -> None:
+        job.state = state
+        job.error = error
+        job.finished_at = _utc_now_iso()
+        self._cond.notify_all()
+
+    def finish(self, job: AnalysisJob, state: str = JOB_FINISHED, error: Optional[str] = None) -> None:
+        """Record the outcome and free the job's slot."""
+        if state not in JOB_STATES or state in ACTIVE_JOB_STATES:
+            raise ValueError(f"Invalid final job state: {state}")
+        with self._cond:
+            self._finish_locked(job, state, error)
+
+    def cancel(self, run_id: str) -> Optional[AnalysisJob]:
+        """
+        Request cancellation. Queued jobs leave the queue right away; running
+        jobs stop at their next phase boundary. Returns None for unknown runs.
+        """
+        with self._cond:
+            job = self._jobs.get(run_id)
+            if job is None:
+                return None
+            if job.state in ACTIVE_JOB_STATES:
+                job.cancel_requested.set()
+                self._cond.notify_all()
+            return job
+
+    # -- queries -------------------------------------------------------------
+
+    def _jobs_ahead(self, job: AnalysisJob) -> int:
+        queued = self._queued()
+        return len(self._running()) + (queued.index(job) if job in queued else 0)
+
+    def get(self, run_id: str) -> Optional[AnalysisJob]:
+        with self._cond:
+            return self._jobs.get(run_id)
+
+    def is_cancel_requested(self, run_id: Optional[str]) -> bool:
+        if not run_id:
+            return False
+        with self._cond:
+            job = self._jobs.get(run_id)
+            return job is not None and job.cancel_requested.is_set()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue configuration plus every tracked job, oldest first."""
+        with self._cond:
+            running = self._running()
+            return {
+                "max_concurrent": self.max_concurrent,
+                "memory_budget_mb": (
+                    round(self.memory_budget_mb, 1) if self.memory_budget_mb is not None else None
+                ),
+                "running": len(running),
+                "queued": len(self._queued()),
+                "in_flight_mb": round(sum(j.estimated_mb for j in running), 1),
+                "jobs": [j.to_dict() for j in self._jobs.values()],
+            }
+
+
+_ANALYSIS_QUEUE: Optional[AnalysisJobQueue] = None
+_ANALYSIS_QUEUE_LOCK = threading.Lock()
+
+
+def get_analysis_queue() -> AnalysisJobQueue:
+    """Process-wide queue, configured from the environment on first use."""
+    global _ANALYSIS_QUEUE
+    with _ANALYSIS_QUEUE_LOCK:
+        if _ANALYSIS_QUEUE is None:
+            _ANALYSIS_QUEUE = AnalysisJobQueue(_get_max_concurrent(), _get_memory_budget_mb())
+        return _ANALYSIS_QUEUE
+
+
+def clear_analysis_queue() -> None:
+    """Drop the process-wide queue so the next use re-reads the environment (tests)."""
+    global _ANALYSIS_QUEUE
+    with _ANALYSIS_QUEUE_LOCK:
+        _ANALYSIS_QUEUE = None
+
+
+def raise_if_cancelled(run_id: Optional[str]) -> None:
+    """Phase-boundary hook: abort the pipeline if the run was cancelled."""
+    if _ANALYSIS_QUEUE is not None and _ANALYSIS_QUEUE.is_cancel_requested(run_id):
+        raise AnalysisCancelledError(f"Analysis {run_id} was cancelled")
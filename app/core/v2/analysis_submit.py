@@ -8,13 +8,21 @@ import json
 import logging
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from fastapi import BackgroundTasks, status
 from fastapi.responses import JSONResponse
 
 from app.api.models.v2 import V2AnalyzeResponse, V2ErrorResponse, V2OutputPaths
 from app.core.v2.analysis_config import generate_analysis_json, get_data_directory
+from app.core.v2.analysis_queue import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_FINISHED,
+    AnalysisCancelledError,
+    AnalysisJob,
+    get_analysis_queue,
+)
 from app.core.v2.loader import load_events_from_payload
 from app.core.v2.pipeline import create_full_analysis_pipeline
 from app.core.v2.validation import ValidationError, validate_api_payload
@@ -42,8 +50,13 @@ def run_analysis_background(
     data_dir: str,
     run_id: str,
     request_payload: Dict[str, Any],
-):
-    """Background task to run the full analysis pipeline."""
+) -> Tuple[str, Optional[str]]:
+    """
+    Background task to run the full analysis pipeline.
+
+    Returns:
+        Final job state (finished | failed | cancelled) and error message
+    """
     try:
         logger.info("Starting background analysis for run_id: %s", run_id)
         enable_audit = request_payload.get("enableAudit", "n").lower()
@@ -104,6 +117,16 @@ def run_analysis_background(
             pass
 
         logger.info("Background analysis completed for run_id: %s", run_id)
+        return JOB_FINISHED, None
+    except AnalysisCancelledError as e:
+        logger.info("Analysis cancelled for run_id: %s", run_id)
+        try:
+            from app.core.v2.run_progress import mark_run_failed
+
+            mark_run_failed(run_id, "Analysis was cancelled")
+        except Exception:
+            pass
+        return JOB_CANCELLED, str(e)
     except Exception as e:
         logger.error("Error in background analysis for run_id %s: %s", run_id, e, exc_info=True)
         try:
@@ -112,6 +135,37 @@ def run_analysis_background(
             mark_run_failed(run_id, str(e))
         except Exception:
             pass
+        return JOB_FAILED, str(e)
+
+
+def _run_queued_analysis(job: AnalysisJob, kwargs: Dict[str, Any]) -> None:
+    """Thread target: wait for an admission slot, run the pipeline, free the slot."""
+    run_id = job.run_id
+    queue = get_analysis_queue()
+
+    def _report_waiting(jobs_ahead: int) -> None:
+        try:
+            from app.core.v2.run_progress import mark_run_queued
+
+            mark_run_queued(run_id, jobs_ahead)
+        except Exception:
+            pass
+
+    try:
+        if not queue.wait_for_slot(job, on_wait=_report_waiting):
+            logger.info("Queued analysis cancelled for run_id: %s", run_id)
+            try:
+                from app.core.v2.run_progress import mark_run_failed
+
+                mark_run_failed(run_id, "Analysis was cancelled before it started")
+            except Exception:
+                pass
+            return
+        state, error = JOB_FAILED, "Analysis thread exited unexpectedly"
+        try:
+            state, error = run_analysis_background(**kwargs) or (JOB_FINISHED, None)
+        finally:
+            queue.finish(job, state, error)
     finally:
         with _ACTIVE_ANALYSIS_LOCK:
             _ACTIVE_ANALYSIS_THREADS.pop(run_id, None)
@@ -126,28 +180,27 @@ def enqueue_analysis_run(
     data_dir: str,
     run_id: str,
     request_payload: Dict[str, Any],
+    runners: int = 0,
 ) -> threading.Thread:
     """
-    Start analysis on a dedicated daemon thread.
+    Start analysis on a dedicated daemon thread, gated by the analysis job queue.
 
     FastAPI BackgroundTasks share the server threadpool and can starve HTTP
     (including /progress polling) under CPU-heavy phases. A dedicated thread
     keeps request handling responsive enough for Overview progress updates.
+    The thread waits in app.core.v2.analysis_queue until a slot (and memory
+    for ``runners`` runners) is free, so concurrent submissions queue up
+    instead of all competing for CPU and RAM.
     """
-    thread = threading.Thread(
-        target=run_analysis_background,
-        kwargs={
-            "events": events,
-            "segments_file": segments_file,
-            "locations_file": locations_file,
-            "flow_file": flow_file,
-            "data_dir": data_dir,
-            "run_id": run_id,
-            "request_payload": request_payload,
-        },
-        name=f"runflow-analysis-{run_id}",
-        daemon=True,
-    )
+    kwargs = {
+        "events": events,
+        "segments_file": segments_file,
+        "locations_file": locations_file,
+        "flow_file": flow_file,
+        "data_dir": data_dir,
+        "run_id": run_id,
+        "request_payload": request_payload,
+    }
     with _ACTIVE_ANALYSIS_LOCK:
         existing = _ACTIVE_ANALYSIS_THREADS.get(run_id)
         if existing is not None and existing.is_alive():
@@ -156,6 +209,13 @@ def enqueue_analysis_run(
                 run_id,
             )
             return existing
+        job = get_analysis_queue().submit(run_id, runners)
+        thread = threading.Thread(
+            target=_run_queued_analysis,
+            args=(job, kwargs),
+            name=f"runflow-analysis-{run_id}",
+            daemon=True,
+        )
         _ACTIVE_ANALYSIS_THREADS[run_id] = thread
     thread.start()
     logger.info("Started analysis thread %s for run_id=%s", thread.name, run_id)
@@ -197,8 +257,12 @@ def submit_v2_analysis(
     try:
         validate_api_payload(payload_dict, data_dir)
     except ValidationError as e:
-        error_response = V2ErrorResponse(status="ERROR", code=e.code, error=e.message)
-        return JSONResponse(status_code=e.code, content=error_response.model_dump())
+        error_response = V2ErrorResponse(
+            status="ERROR", code=e.code, error=e.message, details=e.details or None
+        )
+        return JSONResponse(
+            status_code=e.code, content=error_response.model_dump(exclude_none=True)
+        )
 
     run_id = generate_run_id()
     run_path = get_run_directory(run_id)
@@ -274,6 +338,7 @@ def submit_v2_analysis(
         data_dir=data_dir,
         run_id=run_id,
         request_payload=payload_dict,
+        runners=int(analysis_config.get("runners") or 0),
     )
 
     logger.info("Analysis request accepted for run_id: %s", run_id)
@@ -0,0 +1,310 @@
+"""
+Golden-dataset benchmark harness for the v2 pipeline.
+
+Builds small / medium / large synthetic races from the bundled data/ runner
+files with app.core.baseline.generator, runs the full v2 pipeline offline on
+each (one spawned process per dataset so peak RSS is per-dataset), records
+per-phase wall time, peak RSS (pipeline process and largest pool worker) and
+artifact sizes, and compares the results
+against a stored baseline with a configurable tolerance.
+
+Driven by scripts/benchmark_pipeline.py.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+RESULTS_SCHEMA_VERSION = 1
+
+# Bundled inputs the synthetic races are derived from (repo data/ folder)
+DEFAULT_SOURCE_DIR = Path(__file__).resolve().parents[3] / "data"
+SHARED_INPUT_FILES = ("segments.csv", "flow.csv", "locations.csv")
+
+# Benchmark events (same schedule as the E2E scenarios)
+BENCHMARK_EVENTS: Dict[str, Dict[str, Any]] = {
+    "elite": {"day": "sat", "start_time": 480, "event_duration_minutes": 45,
+              "runners_file": "elite_runners.csv", "gpx_file": "elite.gpx"},
+    "open": {"day": "sat", "start_time": 510, "event_duration_minutes": 75,
+             "runners_file": "open_runners.csv", "gpx_file": "open.gpx"},
+    "full": {"day": "sun", "start_time": 420, "event_duration_minutes": 390,
+             "runners_file": "full_runners.csv", "gpx_file": "Full.gpx"},
+    "10k": {"day": "sun", "start_time": 460, "event_duration_minutes": 120,
+            "runners_file": "10k_runners.csv", "gpx_file": "10K.gpx"},
+    "half": {"day": "sun", "start_time": 440, "event_duration_minutes": 180,
+             "runners_file": "half_runners.csv", "gpx_file": "Half.gpx"},
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkDataset:
+    """A synthetic race: which events to run and how many times the baseline field."""
+
+    name: str
+    events: Sequence[str]
+    scale: float
+    seed: int
+
+
+BENCHMARK_DATASETS: Dict[str, BenchmarkDataset] = {
+    "small": BenchmarkDataset("small", ("elite", "open"), scale=1.0, seed=101),
+    "medium": BenchmarkDataset("medium", ("elite", "open", "full", "10k", "half"), scale=1.0, seed=202),
+    "large": BenchmarkDataset("large", ("elite", "open", "full", "10k", "half"), scale=4.0, seed=303),
+}
+
+# Regression defaults: relative slowdown allowed, and an absolute floor so
+# sub-second phases do not flap on scheduler noise.
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_SECONDS = 0.5
+DEFAULT_RSS_TOLERANCE = 0.25
+
+
+def build_dataset(
+    dataset: BenchmarkDataset,
+    output_dir: Path,
+    source_dir: Path = DEFAULT_SOURCE_DIR,
+) -> Dict[str, Any]:
+    """
+    Write a dataset's inputs into ``output_dir`` and return its v2 payload.
+
+    Runner files are regenerated from the bundled baselines with
+    generate_runner_file (no pace changes, participants scaled). Generation
+    is seeded per event and the random shortuuid runner ids are replaced with
+    sequential 7-character ids, so a dataset is identical across machines and
+    runs.
+    """
+    from app.core.baseline.generator import generate_runner_file
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name in SHARED_INPUT_FILES:
+        shutil.copyfile(source_dir / name, output_dir / name)
+
+    used_runner_ids: set = set()
+    next_runner = 0
+    events = []
+    for idx, event_name in enumerate(dataset.events):
+        config = BENCHMARK_EVENTS[event_name]
+        baseline_df = pd.read_csv(source_dir / config["runners_file"])
+        target = max(1, int(round(len(baseline_df) * dataset.scale)))
+        np.random.seed(dataset.seed + idx)
+        runners = generate_runner_file(
+            baseline_df=baseline_df,
+            control_vars={},
+            new_participants=target,
+            event_name=event_name,
+            distance=float(baseline_df["distance"].iloc[0]),
+            cutoff_mins=None,
+            used_runner_ids=used_runner_ids,
+        )
+        runners["runner_id"] = [f"B{n:06d}" for n in range(next_runner, next_runner + len(runners))]
+        next_runner += len(runners)
+        runners.to_csv(output_dir / config["runners_file"], index=False)
+        shutil.copyfile(source_dir / config["gpx_file"], output_dir / config["gpx_file"])
+        events.append({"name": event_name, **config})
+
+    return {
+        "description": f"Benchmark {dataset.name}",
+        "data_dir": str(output_dir),
+        "segments_file": "segments.csv",
+        "flow_file": "flow.csv",
+        "locations_file": "locations.csv",
+        "enableAudit": "n",
+        "events": events,
+    }
+
+
+def collect_phase_seconds(performance: Dict[str, Any]) -> Dict[str, float]:
+    """Sum elapsed seconds per phase name from PerformanceMonitor.get_summary()."""
+    phases: Dict[str, float] = {}
+    for phase in performance.get("phases") or []:
+        name = phase.get("phase")
+        if name:
+            phases[name] = round(phases.get(name, 0.0) + float(phase.get("elapsed_seconds") or 0.0), 3)
+    return phases
+
+
+def collect_artifact_sizes(run_path: Path) -> Dict[str, Any]:
+    """Bytes written by the run, grouped by artifact folder (bins, reports, ui, ...)."""
+    by_kind: Dict[str, int] = {}
+    total = 0
+    for path in run_path.rglob("*"):
+        if not path.is_file():
+            continue
+        rel = path.relative_to(run_path).parts
+        # {day}/{kind}/... for day outputs, file name for run-level files
+        kind = rel[1] if len(rel) > 2 else rel[-1]
+        size = path.stat().st_size
+        by_kind[kind] = by_kind.get(kind, 0) + size
+        total += size
+    return {"total_bytes": total, "by_kind": dict(sorted(by_kind.items()))}
+
+
+def _peak_rss_mb(children: bool = False) -> Optional[float]:
+    """
+    Peak RSS of this process, or with ``children=True`` of the largest
+    terminated child it waited for (the spawned junction / PDF pool workers).
+    RUSAGE_CHILDREN reports the biggest single child, not a sum; on Linux a
+    child's figure also carries the parent's RSS at the time it was started,
+    so it is an upper bound on what the worker itself used.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(who).ru_maxrss
+    divisor = 1024 * 1024 if os.uname().sysname == "Darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def run_dataset(dataset: BenchmarkDataset, workdir: Path) -> Dict[str, Any]:
+    """
+    Build and analyse one dataset in this process.
+
+    Output goes to ``workdir/runflow`` (RUNFLOW_ROOT and the container root
+    are both pointed there), so benchmarks never touch real run history.
+    """
+    runflow_root = workdir / "runflow"
+    os.environ["RUNFLOW_ROOT"] = str(runflow_root)
+    os.environ["RUNFLOW_ROOT_CONTAINER"] = str(runflow_root)
+
+    from app.core.v2.analysis_config import generate_analysis_json
+    from app.core.v2.loader import load_events_from_payload
+    from app.core.v2.pipeline import create_full_analysis_pipeline
+    from app.core.v2.validation import validate_api_payload
+    from app.utils.run_id import generate_run_id, get_run_directory
+
+    payload = build_dataset(dataset, workdir / "inputs" / dataset.name)
+    data_dir = payload["data_dir"]
+    validate_api_payload(payload, data_dir)
+
+    run_id = generate_run_id()
+    run_path = get_run_directory(run_id)
+    run_path.mkdir(parents=True, exist_ok=True)
+    analysis_config = generate_analysis_json(
+        request_payload=payload, run_id=run_id, run_path=run_path, data_dir=data_dir
+    )
+    data_dir = analysis_config["data_dir"]
+    events = load_events_from_payload(payload, data_dir)
+
+    started = time.perf_counter()
+    create_full_analysis_pipeline(
+        events=events,
+        segments_file=analysis_config["segments_file"],
+        locations_file=analysis_config.get("locations_file"),
+        flow_file=analysis_config["flow_file"],
+        data_dir=data_dir,
+        run_id=run_id,
+        request_payload=payload,
+    )
+    wall_seconds = time.perf_counter() - started
+
+    metadata = json.loads((run_path / "metadata.json").read_text(encoding="utf-8"))
+    return {
+        "run_id": run_id,
+        "events": list(dataset.events),
+        "scale": dataset.scale,
+        "runners": int(analysis_config.get("runners") or 0),
+        "wall_seconds": round(wall_seconds, 3),
+        # Pipeline process only; pool workers are reported separately
+        "peak_rss_mb": _peak_rss_mb(),
+        "peak_worker_rss_mb": _peak_rss_mb(children=True),
+        "phases": collect_phase_seconds(metadata.get("performance") or {}),
+        "artifacts": collect_artifact_sizes(run_path),
+    }
+
+
+def _run_dataset_child(name: str, workdir: str, result_path: str) -> None:
+    logging.basicConfig(level=logging.WARNING)
+    result = run_dataset(BENCHMARK_DATASETS[name], Path(workdir))
+    Path(result_path).write_text(json.dumps(result), encoding="utf-8")
+
+
+def run_benchmarks(names: Sequence[str], workdir: Path) -> Dict[str, Any]:
+    """Run each named dataset in a fresh spawned process and collect results."""
+    unknown = [n for n in names if n not in BENCHMARK_DATASETS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark datasets: {', '.join(unknown)}")
+
+    from app.utils.metadata import get_app_version, get_git_sha
+
+    ctx = multiprocessing.get_context("spawn")
+    datasets: Dict[str, Any] = {}
+    for name in names:
+        dataset_dir = workdir / name
+        dataset_dir.mkdir(parents=True, exist_ok=True)
+        result_path = dataset_dir / "result.json"
+        logger.info("Benchmarking %s dataset", name)
+        proc = ctx.Process(target=_run_dataset_child, args=(name, str(dataset_dir), str(result_path)))
+        proc.start()
+        proc.join()
+        if proc.exitcode != 0 or not result_path.exists():
+            raise RuntimeError(f"Benchmark dataset '{name}' failed (exit code {proc.exitcode})")
+        datasets[name] = json.loads(result_path.read_text(encoding="utf-8"))
+
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "app_version": get_app_version(),
+        "git_sha": get_git_sha(),
+        "cpu_count": os.cpu_count(),
+        "datasets": datasets,
+    }
+
+
+def compare_to_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+    rss_tolerance: float = DEFAULT_RSS_TOLERANCE,
+) -> List[str]:
+    """
+    List regressions of ``results`` against ``baseline``.
+
+    A phase regresses when it is slower than baseline * (1 + tolerance) and
+    by more than ``min_seconds``. Per-phase overrides can be stored in the
+    baseline as ``{"tolerances": {"phase_name": 0.5}}``. Peak RSS of the
+    pipeline process and of its largest pool worker regress beyond
+    ``rss_tolerance``. Datasets or phases missing from the baseline are
+    not compared.
+    """
+    overrides = baseline.get("tolerances") or {}
+    regressions = []
+    for name, current in (results.get("datasets") or {}).items():
+        reference = (baseline.get("datasets") or {}).get(name)
+        if not reference:
+            continue
+        for phase, seconds in sorted((current.get("phases") or {}).items()):
+            base_seconds = (reference.get("phases") or {}).get(phase)
+            if base_seconds is None:
+                continue
+            allowed = base_seconds * (1.0 + float(overrides.get(phase, tolerance)))
+            if seconds > allowed and seconds - base_seconds > min_seconds:
+                regressions.append(
+                    f"{name}: {phase} {seconds:.2f}s vs baseline {base_seconds:.2f}s "
+                    f"(+{(seconds / base_seconds - 1.0) * 100 if base_seconds else float('inf'):.0f}%)"
+                )
+        for key, label in (("peak_rss_mb", "peak RSS"), ("peak_worker_rss_mb", "peak worker RSS")):
+            rss, base_rss = current.get(key), reference.get(key)
+            if rss and base_rss and rss > base_rss * (1.0 + rss_tolerance):
+                regressions.append(
+                    f"{name}: {label} {rss:.0f} MB vs baseline {base_rss:.0f} MB "
+                    f"(+{(rss / base_rss - 1.0) * 100:.0f}%)"
+                )
+    return regressions
@@ -291,6 +291,7 @@ def generate_bins_v2(
                 bins_parquet_src = temp_bins_dir / "bins.parquet"
                 if bins_parquet_src.exists():
                     import pandas as pd
+                    from app.core.bin.parquet import write_bins_parquet
                     bins_df = pd.read_parquet(bins_parquet_src)
                     
                     # Get day segment IDs (check both seg_id and segment_id columns)
@@ -362,7 +363,7 @@ def generate_bins_v2(
                                 )
                             # Save filtered bins.parquet
                             bins_parquet_dst = bins_dir / "bins.parquet"
-                            bins_df_filtered.to_parquet(bins_parquet_dst, compression="zstd", compression_level=3)
+                            write_bins_parquet(bins_df_filtered, bins_parquet_dst)
                             logger.debug(f"Saved filtered bins.parquet to {bins_parquet_dst}")
                             bins_successfully_copied = True
                         else:
@@ -30,6 +30,7 @@ from app.io.loader import load_runners_by_event, load_runners
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from app.config.input_cache import RunInputCache
     from app.core.v2.performance import PerformanceMonitor
 
 
@@ -91,7 +92,8 @@ def get_event_distance_range_v2(
 def combine_runners_for_events(
     events: List[str],
     day: str,
-    runners_paths: Dict[str, str]
+    runners_paths: Dict[str, str],
+    input_cache: Optional["RunInputCache"] = None,
 ) -> pd.DataFrame:
     """
     Combine runners from per-event CSV files for the specified events and day.
@@ -104,6 +106,7 @@ def combine_runners_for_events(
         events: List of lowercase event names (e.g., ["full", "half", "10k"])
         day: Day identifier (e.g., "sat", "sun")
         runners_paths: Mapping of event name to runner CSV path
+        input_cache: Optional run-scoped input cache (reads each runner CSV once per run)
         
     Returns:
         Combined DataFrame with all runners for the specified events and day.
@@ -137,7 +140,10 @@ def combine_runners_for_events(
         
         try:
             # Load runners for this event
-            event_runners = pd.read_csv(runner_file)
+            if input_cache is not None:
+                event_runners = input_cache.runners(runner_file)
+            else:
+                event_runners = pd.read_csv(runner_file)
             
             # Filter by day if day column exists
             if 'day' in event_runners.columns:
@@ -182,7 +188,8 @@ def combine_runners_for_events(
 
 def load_all_runners_for_events(
     events: List[Event],
-    runners_paths: Dict[str, str]
+    runners_paths: Dict[str, str],
+    input_cache: Optional["RunInputCache"] = None,
 ) -> pd.DataFrame:
     """
     Load all runners from event-specific CSV files and combine into a single DataFrame.
@@ -193,6 +200,7 @@ def load_all_runners_for_events(
     Args:
         events: List of Event objects
         runners_paths: Mapping of event name to runner CSV path
+        input_cache: Optional run-scoped input cache (reads each runner CSV once per run)
         
     Returns:
         Combined DataFrame with all runners from all events
@@ -206,7 +214,10 @@ def load_all_runners_for_events(
         runner_path = runners_paths.get(event.name.lower()) or runners_paths.get(event.name)
         if not runner_path:
             raise FileNotFoundError(f"Runner path not provided for event '{event.name}'")
-        runners_df = load_runners_by_event(runner_path)
+        if input_cache is not None:
+            runners_df = input_cache.runners(runner_path)
+        else:
+            runners_df = load_runners_by_event(runner_path)
         # Ensure event column is lowercase for consistency
         runners_df = runners_df.copy()
         runners_df["event"] = event.name.lower()
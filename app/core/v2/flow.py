@@ -28,6 +28,7 @@ import tempfile
 import os
 from itertools import combinations
 
+from app.core.v2.analysis_queue import AnalysisCancelledError
 from app.core.v2.models import Day, Event
 from app.core.v2.timeline import DayTimeline
 from app.core.v2.bins import filter_segments_by_events
@@ -370,7 +371,8 @@ def analyze_temporal_flow_segments_v2(
     enable_audit: str = 'n',
     run_id: Optional[str] = None,
     run_path: Optional[Path] = None,
-    perf_monitor: Optional["PerformanceMonitor"] = None
+    perf_monitor: Optional["PerformanceMonitor"] = None,
+    flow_df: Optional[pd.DataFrame] = None,
 ) -> Dict[Day, Dict[str, Any]]:
     """
     Analyze temporal flow for all segments using v2 Event objects and day-scoped data.
@@ -396,6 +398,8 @@ def analyze_temporal_flow_segments_v2(
         data_dir: Base directory for data files (default: "data")
         min_overlap_duration: Minimum overlap duration for flow analysis
         conflict_length_m: Conflict length in meters for flow analysis
+        flow_df: Optional flow.csv DataFrame already loaded for this run
+            (e.g. ``AnalysisContext.get_flow_df()``); skips re-reading ``flow_file``
         
     Returns:
         Dictionary mapping Day to flow analysis results
@@ -422,25 +426,26 @@ def analyze_temporal_flow_segments_v2(
         # flow_file is just a filename (e.g., "flow.csv"), prepend data_dir
         flow_path = Path(data_dir) / flow_file
     
-    if not flow_path.exists():
-        error_msg = (
-            f"Flow file not found at {flow_path}. "
-            "Flow file is required for flow analysis and must be provided in the request. "
-            "No fallback or auto-generation of event pairs is allowed per Issue #553."
-        )
-        logger.error(error_msg)
-        raise FileNotFoundError(error_msg)
-    
-    try:
-        flow_df = pd.read_csv(flow_path)
-        logger.debug(f"Loaded {len(flow_df)} rows from {flow_path}")
-    except Exception as e:
-        error_msg = (
-            f"Failed to load flow file from {flow_path}: {e}. "
-            "Flow file must be readable and valid. No fallback is allowed per Issue #553."
-        )
-        logger.error(error_msg)
-        raise ValueError(error_msg) from e
+    if flow_df is None:
+        if not flow_path.exists():
+            error_msg = (
+                f"Flow file not found at {flow_path}. "
+                "Flow file is required for flow analysis and must be provided in the request. "
+                "No fallback or auto-generation of event pairs is allowed per Issue #553."
+            )
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+        
+        try:
+            flow_df = pd.read_csv(flow_path)
+            logger.debug(f"Loaded {len(flow_df)} rows from {flow_path}")
+        except Exception as e:
+            error_msg = (
+                f"Failed to load flow file from {flow_path}: {e}. "
+                "Flow file must be readable and valid. No fallback is allowed per Issue #553."
+            )
+            logger.error(error_msg)
+            raise ValueError(error_msg) from e
     
     if flow_df.empty:
         error_msg = (
@@ -785,6 +790,9 @@ def analyze_temporal_flow_segments_v2(
                     summary_stats={"day": day.value, "segments": len(flow_results.get("segments", []))}
                 )
             
+        except AnalysisCancelledError:
+            # Raised by start_phase at a cancellation point: stop the run, not just this day
+            raise
         except Exception as e:
             logger.error(f"Day {day.value}: Flow analysis failed: {str(e)}", exc_info=True)
             results_by_day[day] = {
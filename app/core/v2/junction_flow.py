@@ -17,7 +17,8 @@ import pandas as pd
 
 from app.core.config_package.junctions import JUNCTIONS_NAME, empty_junctions_doc, validate_junctions_doc
 from app.core.junction_flow import (
-    analyze_junctions_doc,
+    analyze_junction_batches,
+    get_junction_max_workers,
     prepare_runners_by_event,
     result_to_ui_payload,
 )
@@ -64,35 +65,65 @@ def analyze_junction_flow_v2(
         )
 
     junctions_doc = load_junctions_from_data_dir(data_dir)
+    summary_stats: Dict[str, Any] = {}
     gun_by_event = {event.name.lower(): float(event.start_time) for event in events}
     results: Dict[Day, Dict[str, Any]] = {}
 
-    for day, day_events in events_by_day.items():
-        day_runners = filter_runners_by_day(all_runners_df, day, events)
-        runners_by_event = prepare_runners_by_event(day_runners)
-        # Only include guns for events on this day
-        day_guns = {
-            e.name.lower(): gun_by_event[e.name.lower()]
-            for e in day_events
-            if e.name.lower() in gun_by_event
-        }
-        if not (junctions_doc.get("junctions") or []):
+    if not (junctions_doc.get("junctions") or []):
+        for day in events_by_day:
             results[day] = {
                 "ok": True,
                 "method": {},
                 "junctions": [],
                 "notes": ["No authored junctions in package."],
             }
-            continue
-        day_result = analyze_junctions_doc(junctions_doc, runners_by_event, day_guns)
-        results[day] = day_result
-        n_ix = sum(len(j.get("interactions") or []) for j in day_result.get("junctions") or [])
-        logger.info(
-            "[Phase 4.3] Junction Flow day=%s junctions=%s interactions=%s",
-            day.value,
-            len(day_result.get("junctions") or []),
-            n_ix,
+    else:
+        batches = {}
+        for day, day_events in events_by_day.items():
+            day_runners = filter_runners_by_day(all_runners_df, day, events)
+            runners_by_event = prepare_runners_by_event(day_runners)
+            # Only include guns for events on this day
+            day_guns = {
+                e.name.lower(): gun_by_event[e.name.lower()]
+                for e in day_events
+                if e.name.lower() in gun_by_event
+            }
+            batches[day.value] = (runners_by_event, day_guns)
+        # All days' junctions share one pool; each is independent given its day's runners
+        batch_results = analyze_junction_batches(
+            junctions_doc, batches, max_workers=get_junction_max_workers()
         )
+        # Every day shares one pool run, so mode/workers/total are the same per batch
+        pool_timing = next(iter(batch_results.values()))["timing"]
+        summary_stats = {
+            "mode": pool_timing["mode"],
+            "workers": pool_timing["workers"],
+            "all_days_sec": pool_timing["all_batches_total_sec"],
+        }
+        for day in events_by_day:
+            day_result = dict(batch_results[day.value])
+            # Wall-clock timing is logged here and kept out of the persisted results
+            timing = day_result.pop("timing")
+            results[day] = day_result
+            n_ix = sum(t["interactions"] for t in timing["junctions"])
+            logger.info(
+                "[Phase 4.3] Junction Flow day=%s junctions=%s interactions=%s "
+                "junction_sec=%.3f mode=%s workers=%s",
+                day.value,
+                len(day_result.get("junctions") or []),
+                n_ix,
+                sum(t["elapsed_sec"] for t in timing["junctions"]),
+                timing["mode"],
+                timing["workers"],
+            )
+            for entry in sorted(timing["junctions"], key=lambda t: t["elapsed_sec"], reverse=True)[:5]:
+                logger.debug(
+                    "[Phase 4.3] day=%s junction=%s interactions=%s %.3fs",
+                    day.value,
+                    entry["junction_id"],
+                    entry["interactions"],
+                    entry["elapsed_sec"],
+                )
 
     if phase is not None and perf_monitor is not None:
         from app.core.v2.performance import get_memory_usage_mb
@@ -102,7 +133,7 @@ def analyze_junction_flow_v2(
             phase,
             phase_number="Phase 4.3",
             phase_description="Junction Flow Compute",
-            summary_stats={"days": len(results)},
+            summary_stats={"days": len(results), **summary_stats},
         )
 
     return results
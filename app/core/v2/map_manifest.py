@@ -0,0 +1,160 @@
+"""
+Precomputed map manifest (window count, window length, segment index, LOD).
+
+Written per day by the pipeline's map-data phase to
+``runflow/analysis/{run_id}/{day}/maps/map_manifest.json`` so
+``/api/map/manifest`` can serve it directly instead of scanning
+``bins.parquet`` and re-walking segments.csv on every map page load. Runs
+produced before this artifact existed fall back to the on-demand computation
+in app/api/map.py, which uses the same helpers.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from app.core.bin.rollup import read_bins_columns
+
+logger = logging.getLogger(__name__)
+
+MAP_MANIFEST_FILENAME = "map_manifest.json"
+MAP_MANIFEST_SCHEMA_VERSION = 1
+
+# LOD thresholds (from ChatGPT's Issue #249 guidance)
+LOD_THRESHOLDS = {
+    "segments_only": 12,
+    "flagged_bins": 14,
+}
+
+
+class MapManifestError(ValueError):
+    """Inputs are missing data the map manifest requires."""
+
+
+def compute_window_stats(bins_path: Union[str, Path]) -> Tuple[int, int]:
+    """
+    Return ``(window_count, window_seconds)`` for a ``bins.parquet``.
+
+    Reads only the time columns; window length is taken from the first row.
+    """
+    bins_df = read_bins_columns(bins_path, ("t_start", "t_end"))
+    if bins_df.empty:
+        raise MapManifestError(f"No bins in {bins_path}")
+    window_count = len(bins_df[["t_start", "t_end"]].drop_duplicates())
+    first_window = bins_df.iloc[0]
+    window_seconds = int(
+        (pd.to_datetime(first_window["t_end"]) - pd.to_datetime(first_window["t_start"])).total_seconds()
+    )
+    return window_count, window_seconds
+
+
+def load_segments_metadata(segments_path: Union[str, Path]) -> pd.DataFrame:
+    """Read segments metadata as authored (CSV or Parquet)."""
+    segments_path = Path(segments_path)
+    if segments_path.suffix == ".parquet":
+        return pd.read_parquet(segments_path)
+    return pd.read_csv(segments_path)
+
+
+def _column(df: pd.DataFrame, *names: str) -> pd.Series:
+    """First non-empty value across alias columns, row-wise."""
+    result = pd.Series([None] * len(df), index=df.index, dtype=object)
+    for name in names:
+        if name in df.columns:
+            values = df[name].astype(object).where(df[name].notna() & (df[name].astype(str) != ""))
+            result = result.where(result.notna(), values)
+    return result.astype(object).where(result.notna(), None)
+
+
+def build_segment_index(segments_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Segment index for the map: id, label, schema key and width per segment.
+
+    Raises:
+        MapManifestError: If a segment is missing its id, schema, width or label
+    """
+    segment_ids = _column(segments_df, "segment_id", "seg_id")
+    schema_keys = _column(segments_df, "schema", "schema_key")
+    widths = _column(segments_df, "width_m")
+    labels = _column(segments_df, "seg_label")
+
+    segment_index = []
+    for segment_id, seg_label, schema_key, width_m in zip(
+        segment_ids.tolist(), labels.tolist(), schema_keys.tolist(), widths.tolist()
+    ):
+        if not segment_id:
+            raise MapManifestError("Segments metadata missing segment_id")
+        if not schema_key:
+            raise MapManifestError(f"Segment {segment_id} missing schema")
+        if width_m is None:
+            raise MapManifestError(f"Segment {segment_id} missing width_m")
+        if not seg_label:
+            raise MapManifestError(f"Segment {segment_id} missing seg_label")
+        segment_index.append({
+            "segment_id": segment_id,
+            "segment_label": seg_label,
+            "schema_key": schema_key,
+            "width_m": float(width_m),
+        })
+    return segment_index
+
+
+def _rulebook_version() -> str:
+    # Issue #254: Add rulebook version for consistency tracking
+    try:
+        from app.rulebook import version
+        return version()
+    except Exception:
+        return "unknown"
+
+
+def build_map_manifest(
+    bins_path: Union[str, Path],
+    segments_df: pd.DataFrame,
+    date_str: str,
+) -> Dict[str, Any]:
+    """Assemble the ``/api/map/manifest`` payload for one bins file."""
+    window_count, window_seconds = compute_window_stats(bins_path)
+    segment_index = build_segment_index(segments_df)
+    rb_version = _rulebook_version()
+    return {
+        "ok": True,
+        "date": date_str,
+        "window_count": window_count,
+        "window_seconds": window_seconds,
+        "lod": dict(LOD_THRESHOLDS),
+        "segments": segment_index,
+        "rulebook_version": rb_version,
+        "metadata": {
+            "generated_at": datetime.now().isoformat(),
+            "source": "bins.parquet",
+            "total_segments": len(segment_index),
+            "rulebook_version": rb_version,
+            "schema_version": MAP_MANIFEST_SCHEMA_VERSION,
+        },
+    }
+
+
+def write_map_manifest(maps_dir: Path, manifest: Dict[str, Any]) -> Path:
+    """Write ``map_manifest.json`` into a day's maps directory."""
+    path = Path(maps_dir) / MAP_MANIFEST_FILENAME
+    path.write_text(json.dumps(manifest, indent=2, default=str), encoding="utf-8")
+    return path
+
+
+def load_map_manifest(maps_dir: Path) -> Optional[Dict[str, Any]]:
+    """Return the stored manifest for a day, or None for runs without one."""
+    path = Path(maps_dir) / MAP_MANIFEST_FILENAME
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable map manifest {path}: {e}")
+        return None
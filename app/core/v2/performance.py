@@ -151,6 +151,8 @@ class PerformanceMonitor:
         self.metrics: List[PerformanceMetrics] = []
         self.start_time = time.monotonic()
         self.total_memory_mb: Optional[float] = None
+        # Run-scoped input load counts/bytes (RunInputCache.stats())
+        self.input_io: Optional[Dict[str, Any]] = None
     
     def start_phase(self, phase_name: str, phase_number: Optional[str] = None, phase_description: Optional[str] = None) -> PerformanceMetrics:
         """
@@ -162,7 +164,15 @@ class PerformanceMonitor:
             phase_name: Internal phase identifier (e.g., "phase_1_pre_analysis")
             phase_number: Optional phase number from Issue #574 (e.g., "Phase 1", "Phase 3.1")
             phase_description: Optional human-readable description (e.g., "Pre-Analysis & Validation")
+
+        Raises:
+            AnalysisCancelledError: If the run was cancelled through the analysis
+                job queue; phase starts are the pipeline's cancellation points.
         """
+        from app.core.v2.analysis_queue import raise_if_cancelled
+
+        raise_if_cancelled(self.run_id)
+
         metrics = PerformanceMetrics(
             phase_name=phase_name,
             start_time=time.monotonic()
@@ -337,6 +347,7 @@ class PerformanceMonitor:
             "total_elapsed_minutes": total_elapsed_minutes_formatted,  # Issue #638: Format as mm:ss instead of decimal
             "phases": phase_summaries,
             "total_memory_mb": round(self.total_memory_mb, 2) if self.total_memory_mb else None,
+            "input_io": self.input_io,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
@@ -377,6 +388,15 @@ class PerformanceMonitor:
         if summary["total_memory_mb"]:
             logger.debug("Peak memory: %.0f MB", summary["total_memory_mb"])
 
+        input_io = summary.get("input_io")
+        if input_io:
+            logger.debug(
+                "Input I/O: %d file loads (%d cache hits), %.1f MB read",
+                input_io["total_loads"],
+                input_io["total_hits"],
+                input_io["total_bytes"] / (1024 * 1024),
+            )
+
 
 def monitor_performance(phase_name: Optional[str] = None):
     """
@@ -38,6 +38,7 @@ from app.core.v2.performance import PerformanceMonitor, get_memory_usage_mb
 from app.io.loader import load_segments
 from app.utils.run_id import generate_run_id, get_runflow_root
 from app.utils.metadata import update_latest_pointer, append_to_run_index
+from app.utils.run_catalog import index_signature, record_run
 import logging
 
 logger = logging.getLogger(__name__)
@@ -708,7 +709,7 @@ def create_combined_metadata(
 
 def update_pointer_files(run_id: str, metadata: Dict[str, Any]) -> None:
     """
-    Update latest.json and index.json pointer files.
+    Update latest.json and index.json pointer files, and the run catalog.
     
     Args:
         run_id: Run identifier
@@ -720,7 +721,13 @@ def update_pointer_files(run_id: str, metadata: Dict[str, Any]) -> None:
     # Append to index.json
     # Note: For v2, we create one index entry per run (not per day)
     # The metadata includes all days processed
-    append_to_run_index(metadata)
+    previous_signature = index_signature()
+    index_entry = append_to_run_index(metadata)
+    
+    # Keep the run history catalog in step with index.json; the metadata was
+    # just written, so the catalog does not need to re-read metadata.json
+    if index_entry is not None:
+        record_run(index_entry, metadata=metadata, previous_signature=previous_signature)
 
 
 def create_full_analysis_pipeline(
@@ -873,7 +880,9 @@ def create_full_analysis_pipeline(
         logger.info(f"Loaded {len(segments_df)} segments from {segments_path_str}")
         
         # Load all runners for events (Phase 4)
-        all_runners_df = load_all_runners_for_events(events, runner_paths)
+        all_runners_df = load_all_runners_for_events(
+            events, runner_paths, input_cache=analysis_context.inputs
+        )
         runner_count = len(all_runners_df)
         segment_count = len(segments_df)
         locations_count = 0  # Will be updated if locations are loaded
@@ -985,7 +994,8 @@ def create_full_analysis_pipeline(
                 enable_audit=enable_audit,
                 run_id=run_id,
                 run_path=run_path,
-                perf_monitor=perf_monitor
+                perf_monitor=perf_monitor,
+                flow_df=analysis_context.get_flow_df(),
             )
             flow_days = len(flow_results)
             logger.debug(f"[Phase 4] Flow analysis complete: {flow_days} days")
@@ -1053,6 +1063,7 @@ def create_full_analysis_pipeline(
             phase_description="Persist Flow Results"
         )
         flow_files = []
+        flow_payloads_by_day: Dict[Day, Dict[str, Any]] = {}  # Reused by Phase 10 reports
         for day, day_events in events_by_day.items():
             day_code = day.value
             logger.debug(f"[Phase 6.2] Processing day: {day_code}")
@@ -1073,6 +1084,7 @@ def create_full_analysis_pipeline(
                 }
                 with open(flow_json_path, 'w', encoding='utf-8') as f:
                     json.dump(flow_for_json, f, indent=2)
+                flow_payloads_by_day[day] = flow_for_json
                 logger.debug(f"Persisted flow_results.json: {flow_json_path}")
                 flow_files.append(f"flow_results.json ({day_code})")
         
@@ -1105,7 +1117,9 @@ def create_full_analysis_pipeline(
             # Use combine_runners_for_events() for proper per-event file loading
             from app.core.v2.density import combine_runners_for_events
             event_names = [e.name.lower() for e in day_events]
-            day_runners_df = combine_runners_for_events(event_names, day.value, runner_paths)
+            day_runners_df = combine_runners_for_events(
+                event_names, day.value, runner_paths, input_cache=analysis_context.inputs
+            )
             
             if day_runners_df.empty:
                 logger.warning(f"No runners found for day {day.value} events {event_names}, using fallback")
@@ -1236,14 +1250,14 @@ def create_full_analysis_pipeline(
             
             locations_path = Path(locations_path_str)
             if locations_path.exists():
-                from app.io.loader import load_locations
-                locations_df = load_locations(locations_path_str)
+                locations_df = analysis_context.inputs.locations(locations_path)
                 logger.info(f"Loaded {len(locations_df)} locations from {locations_path_str}")
             else:
                 logger.warning(f"Locations file not found at {locations_path_str}, skipping locations report")
         
         # Phase 6.3: Persist Locations Results
         # Issue #591: Compute resources_available per day
+        locations_payloads_by_day: Dict[Day, Dict[str, Any]] = {}  # Reused by Phase 10 reports
         if locations_df is not None:
             from app.core.v2.bins import filter_segments_by_events
             
@@ -1334,6 +1348,7 @@ def create_full_analysis_pipeline(
                 }
                 with open(locations_json_path, 'w', encoding='utf-8') as f:
                     json.dump(locations_for_json, f, indent=2, default=str)
+                locations_payloads_by_day[day] = locations_for_json
                 logger.debug(f"Persisted locations_results.json: {locations_json_path}")
             
             locations_persistence_metrics.finish(memory_mb=get_memory_usage_mb())
@@ -1387,11 +1402,13 @@ def create_full_analysis_pipeline(
             phase_number="Phase 7",
             phase_description="UI Artifacts Generation"
         )
-        from app.core.v2.ui_artifacts import generate_ui_artifacts_per_day
+        from app.core.v2.ui_artifacts import aggregate_bins_from_all_days, generate_ui_artifacts_per_day
         artifacts_by_day = {}
         artifacts_count = 0
         if not run_plan:
             logger.info("[through=%s] Skipping Phase 7 UI artifacts", through)
+        # Every day's export reads all days' bins; aggregate them once for this export
+        run_bins = aggregate_bins_from_all_days(run_id) if run_plan else None
         for day, day_events in (events_by_day if run_plan else {}).items():
             logger.debug(f"[Phase 7] Processing day: {day.value}")
             try:
@@ -1406,7 +1423,8 @@ def create_full_analysis_pipeline(
                     all_runners_df=all_runners_df,
                     data_dir=data_dir,
                     environment="local",
-                    analysis_context=analysis_context
+                    analysis_context=analysis_context,
+                    aggregated_bins=run_bins,
                 )
                 if artifacts_path:
                     artifacts_by_day[day.value] = str(artifacts_path)
@@ -1432,6 +1450,7 @@ def create_full_analysis_pipeline(
                 logger.error(f"  → Action: Generating UI artifacts with new subdirectory structure")
                 logger.error(f"  → Exception: {type(e).__name__}: {e}", exc_info=True)
                 raise  # Re-raise to fail the pipeline
+        run_bins = None  # release the aggregate once every day is exported
         artifacts_metrics.finish(memory_mb=get_memory_usage_mb())
         perf_monitor.complete_phase(
             artifacts_metrics,
@@ -1574,8 +1593,10 @@ def create_full_analysis_pipeline(
             phase_description="Map Data Generation"
         )
         from app.core.v2.reports import get_day_output_path
+        from app.core.v2.map_manifest import build_map_manifest, load_segments_metadata, write_map_manifest
         from app.density_report import generate_map_dataset
         maps_by_day = {}
+        manifest_segments_df = None
         for day, day_events in events_by_day.items():
             try:
                 maps_dir = get_day_output_path(run_id, day, "maps")
@@ -1609,6 +1630,19 @@ def create_full_analysis_pipeline(
                 logger.debug(f"Generated map_data.json for day {day.value}: {map_data_path}")
             except Exception as e:
                 logger.warning(f"[Phase 9] Could not generate map_data.json for day {day.value}: {e}", exc_info=True)
+            
+            # Map manifest served by /api/map/manifest (window count, segment index, LOD)
+            try:
+                bins_path = get_day_output_path(run_id, day, "bins") / "bins.parquet"
+                if bins_path.exists():
+                    if manifest_segments_df is None:
+                        manifest_segments_df = load_segments_metadata(segments_path_str)
+                    maps_dir = get_day_output_path(run_id, day, "maps")
+                    maps_dir.mkdir(parents=True, exist_ok=True)
+                    manifest = build_map_manifest(bins_path, manifest_segments_df, date_str=day.value)
+                    write_map_manifest(maps_dir, manifest)
+            except Exception as e:
+                logger.warning(f"[Phase 9] Could not generate map_manifest.json for day {day.value}: {e}", exc_info=True)
         
         map_data_metrics.finish(memory_mb=get_memory_usage_mb())
         perf_monitor.complete_phase(
@@ -1670,7 +1704,9 @@ def create_full_analysis_pipeline(
             try:
                 from app.core.v2.density import combine_runners_for_events
                 event_names = [e.name.lower() for e in day_events]
-                day_runners_df = combine_runners_for_events(event_names, day_code, runner_paths)
+                day_runners_df = combine_runners_for_events(
+                    event_names, day_code, runner_paths, input_cache=analysis_context.inputs
+                )
                 if day_runners_df.empty:
                     day_runners_df = filter_runners_by_day(all_runners_df, day, day_events)
                 if not day_runners_df.empty:
@@ -1754,54 +1790,9 @@ def create_full_analysis_pipeline(
             phase_description="Report Generation"
         )
         
-        # Issue #574: Load computation results from JSON artifacts
-        # This ensures reports use persisted data, not in-memory copies
-        density_results_from_json = {}
-        flow_results_from_json = {}
-        locations_df_from_json = None
-        
-        for day, day_events in events_by_day.items():
-            day_code = day.value
-            day_path = run_path / day_code
-            computation_dir = day_path / "computation"
-            
-            # Load density_results.json
-            density_json_path = computation_dir / "density_results.json"
-            if density_json_path.exists():
-                try:
-                    density_data = json.loads(density_json_path.read_text())
-                    # Convert day string back to Day enum for compatibility
-                    # Note: density_data has "day" as string, but we need Day enum key
-                    # The report generation expects Day enum keys, so we'll keep using in-memory for now
-                    # but this shows the structure is ready
-                    logger.debug(f"Loaded density_results.json for {day_code} from {density_json_path}")
-                except Exception as e:
-                    logger.warning(f"Could not load density_results.json for {day_code}: {e}, using in-memory")
-            
-            # Load flow_results.json
-            flow_json_path = computation_dir / "flow_results.json"
-            if flow_json_path.exists():
-                try:
-                    flow_data = json.loads(flow_json_path.read_text())
-                    logger.debug(f"Loaded flow_results.json for {day_code} from {flow_json_path}")
-                except Exception as e:
-                    logger.warning(f"Could not load flow_results.json for {day_code}: {e}, using in-memory")
-        
-        # Load locations_results.json (if exists)
-        if locations_file:
-            for day, day_events in events_by_day.items():
-                day_code = day.value
-                day_path = run_path / day_code
-                computation_dir = day_path / "computation"
-                locations_json_path = computation_dir / "locations_results.json"
-                if locations_json_path.exists():
-                    try:
-                        locations_data = json.loads(locations_json_path.read_text())
-                        locations_df_from_json = pd.DataFrame(locations_data.get("locations", []))
-                        logger.debug(f"Loaded locations_results.json for {day_code} from {locations_json_path}")
-                        break  # Locations are not day-partitioned, so load once
-                    except Exception as e:
-                        logger.warning(f"Could not load locations_results.json for {day_code}: {e}, using in-memory")
+        # Issue #574: Reports use the persisted JSON artifacts. The flow and
+        # locations payloads were just written in Phases 6.2/6.3, so they are
+        # handed to the reports directly instead of being read back from disk.
         
         # Use day-partitioned bins directories
         # Issue #553 Phase 7.1: Use file paths from analysis.json (already loaded at pipeline start)
@@ -1846,6 +1837,8 @@ def create_full_analysis_pipeline(
                     locations_file_path=locations_file_path,
                     gpx_paths=gpx_paths,
                     report_kinds=("locations",) if through == THROUGH_LOCATIONS else None,
+                    flow_results_by_day=flow_payloads_by_day,
+                    locations_results_by_day=locations_payloads_by_day,
                 )
             
             # Count reports generated
@@ -1870,6 +1863,7 @@ def create_full_analysis_pipeline(
 
             # Generate bidirectional overlap reports (Issue #720)
             overlaps_by_day = {}
+            finish_pdf_jobs = []
             if not run_plan:
                 logger.info("[through=%s] Skipping overlap reports and finish-area PDFs", through)
             for day, day_events in (events_by_day if run_plan else {}).items():
@@ -1900,40 +1894,38 @@ def create_full_analysis_pipeline(
                     if ft_df is not None and not ft_df.empty:
                         ft_path = reports_path / "finish_times.csv"
                         write_finish_times_csv(ft_path, day_code, ft_df)
-                        try:
-                            from app.finish_area_pdf import (
-                                expected_runners_for_day,
-                                generate_finish_area_demand_pdf,
-                            )
-
-                            _day_pdf_titles = {
-                                "fri": "Friday",
-                                "sat": "Saturday",
-                                "sun": "Sunday",
-                                "mon": "Monday",
+                        _day_pdf_titles = {
+                            "fri": "Friday",
+                            "sat": "Saturday",
+                            "sun": "Sunday",
+                            "mon": "Monday",
+                        }
+                        finish_pdf_jobs.append(
+                            {
+                                "day_code": day_code,
+                                "finish_times_csv": ft_path,
+                                "output_pdf": reports_path / "finish_area_demand.pdf",
+                                "day_display_name": _day_pdf_titles.get(day_code, day_code.upper()),
+                                "run_id": run_id,
                             }
-                            day_pdf_title = _day_pdf_titles.get(
-                                day_code, day_code.upper()
-                            )
-                            exp_total = (
-                                expected_runners_for_day(analysis_config, day_code)
-                                if analysis_config
-                                else None
-                            )
-                            generate_finish_area_demand_pdf(
-                                finish_times_csv=ft_path,
-                                output_pdf=reports_path / "finish_area_demand.pdf",
-                                day_display_name=day_pdf_title,
-                                run_id=run_id,
-                                expected_runner_total=exp_total,
-                            )
-                        except Exception as exc:
-                            logger.warning(
-                                "finish_area_demand.pdf failed for %s: %s",
-                                day_code,
-                                exc,
-                                exc_info=True,
-                            )
+                        )
+
+            # Finish-area PDFs render together once every day's finish_times.csv exists
+            if finish_pdf_jobs:
+                try:
+                    from app.finish_area_pdf import (
+                        expected_runners_for_day,
+                        get_render_max_workers,
+                        render_finish_area_pdfs,
+                    )
+
+                    for job in finish_pdf_jobs:
+                        job["expected_runner_total"] = expected_runners_for_day(
+                            analysis_config, job.pop("day_code")
+                        )
+                    render_finish_area_pdfs(finish_pdf_jobs, max_workers=get_render_max_workers())
+                except Exception as exc:
+                    logger.warning("finish_area_demand.pdf rendering failed: %s", exc, exc_info=True)
             
             # Issue #845: rewrite segment-parent summary after overlaps exist.
             try:
@@ -1989,6 +1981,7 @@ def create_full_analysis_pipeline(
         
         # Issue #503: Add performance metrics to metadata
         perf_monitor.total_memory_mb = get_memory_usage_mb()
+        perf_monitor.input_io = analysis_context.inputs.stats()
         combined_metadata["performance"] = perf_monitor.get_summary()
         
         # Write run-level metadata.json
@@ -12,9 +12,11 @@ Issue #600: Flow.md generation deprecated (only Flow.csv is used)
 Issue #682: Updated to use runflow/analysis/{run_id} structure
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Sequence
 from pathlib import Path
 import logging
+import os
 
 from app.core.v2.models import Day, Event
 from app.core.v2.timeline import DayTimeline
@@ -132,6 +134,25 @@ def get_day_output_path(
     return day_path
 
 
+def get_report_max_workers() -> int:
+    """Resolve max worker threads for Phase 10 reports (RUNFLOW_REPORT_MAX_WORKERS)."""
+    default_workers = 4
+    raw_value = os.getenv("RUNFLOW_REPORT_MAX_WORKERS", str(default_workers)).strip()
+    try:
+        max_workers = int(raw_value)
+    except ValueError:
+        logger.warning(
+            "Invalid RUNFLOW_REPORT_MAX_WORKERS value '%s', using default %s",
+            raw_value,
+            default_workers,
+        )
+        max_workers = default_workers
+    if max_workers < 1:
+        logger.warning("RUNFLOW_REPORT_MAX_WORKERS must be >= 1 (got %s); using 1", max_workers)
+        max_workers = 1
+    return min(max_workers, os.cpu_count() or max_workers)
+
+
 def generate_reports_per_day(
     run_id: str,
     events: List[Event],
@@ -145,16 +166,26 @@ def generate_reports_per_day(
     locations_file_path: Optional[str] = None,  # Issue #553 Phase 6.2: Path to locations file
     gpx_paths: Optional[Dict[str, str]] = None,
     report_kinds: Optional[Sequence[str]] = None,
+    flow_results_by_day: Optional[Dict[Day, Dict[str, Any]]] = None,
+    locations_results_by_day: Optional[Dict[Day, Dict[str, Any]]] = None,
 ) -> Dict[Day, Dict[str, str]]:
     """
     Generate all reports per day in day-partitioned structure.
     
-    Main entry point for v2 report generation. Iterates over days and generates:
+    Main entry point for v2 report generation. Generates for each day:
     - Density.md
     - Flow.csv (Issue #600: Flow.md deprecated, only CSV used)
     - Locations.csv (if applicable)
     
+    Days, and the report types within a day, run concurrently in a bounded
+    thread pool (RUNFLOW_REPORT_MAX_WORKERS). Each report writes only to its
+    own day's reports directory; the run-level combined CSVs are written once
+    every day has finished.
+    
     Issue #600: Flow report now loads from flow_results.json (SSOT) instead of in-memory flow_results.
+    The pipeline passes the payloads it just persisted (``flow_results_by_day`` /
+    ``locations_results_by_day``) so they are not read back; days without a
+    payload fall back to the JSON files, as when a report is regenerated on its own.
     
     Args:
         run_id: Unique run identifier (UUID)
@@ -163,7 +194,8 @@ def generate_reports_per_day(
         density_results: Day-partitioned density analysis results from Phase 4 (Issue #600: Still used for now)
         segments_df: Full segments DataFrame
         all_runners_df: Full runners DataFrame
-        locations_df: Optional locations DataFrame
+        flow_results_by_day: Optional flow_results.json payloads keyed by day
+        locations_results_by_day: Optional locations_results.json payloads keyed by day
         
     Returns:
         Dictionary mapping Day to report file paths:
@@ -211,9 +243,15 @@ def generate_reports_per_day(
     # locations_file_path can be None if locations_file is not provided (optional)
     # But if it's provided, it should come from analysis.json
     kinds = set(report_kinds) if report_kinds is not None else {"density", "flow", "locations"}
+    flow_results_by_day = flow_results_by_day or {}
+    locations_results_by_day = locations_results_by_day or {}
     
-    report_paths_by_day: Dict[Day, Dict[str, str]] = {}
+    from app.core.v2.bins import filter_segments_by_events
+    from app.utils.run_id import get_run_directory
+    run_dir = get_run_directory(run_id)
     
+    # Per-day setup stays on this thread; only report generation is pooled
+    tasks: List[tuple] = []
     for timeline in timelines:
         day = timeline.day
         day_events = timeline.events
@@ -231,162 +269,197 @@ def generate_reports_per_day(
             )
             raise ValueError(f"Reports path does not match day: {day.value}")
         
-        day_report_paths: Dict[str, str] = {}
-        
         # Filter segments by day events before report generation
-        from app.core.v2.bins import filter_segments_by_events
         day_segments_df = filter_segments_by_events(segments_df, day_events)
         logger.debug(
             f"Filtered segments for day {day.value}: {len(segments_df)} -> {len(day_segments_df)} "
             f"for events: {[e.name for e in day_events]}"
         )
+        computation_dir = run_dir / day.value / "computation"
         
-        # Generate Density.md
         if "density" in kinds and day in density_results:
-            try:
-                with log_span("Density.md", log=logger, always_info=True):
-                    density_path = generate_density_report_v2(
-                    run_id=run_id,
-                    day=day,
-                    day_events=day_events,
-                    density_results=density_results[day],
-                    reports_path=reports_path,
-                    data_dir=data_dir,
-                    segments_df=day_segments_df,
-                    segments_file_path=segments_file_path  # Issue #553 Phase 6.2, Issue #616
-                )
-                if density_path:
-                    day_report_paths["density"] = str(density_path)
-            except Exception as e:
-                logger.error(f"Failed to generate density report for day {day.value}: {e}", exc_info=True)
-                # Continue with other reports even if density fails
+            tasks.append((day, _generate_day_density_report, dict(
+                run_id=run_id,
+                day=day,
+                day_events=day_events,
+                density_results=density_results[day],
+                reports_path=reports_path,
+                data_dir=data_dir,
+                segments_df=day_segments_df,
+                segments_file_path=segments_file_path,
+                all_runners_df=all_runners_df,
+            )))
         
-        # Generate Flow.csv (Issue #600: Flow.md deprecated, only CSV used)
-        # Issue #600: Load from flow_results.json (SSOT - mandatory)
+        # Issue #600: Flow.md deprecated, only CSV used
         if "flow" in kinds:
-            try:
-                # Issue #682: Use centralized get_run_directory() for correct path
-                from app.utils.run_id import get_run_directory
-                run_dir = get_run_directory(run_id)
-                computation_dir = run_dir / day.value / "computation"
-                flow_results_json_path = computation_dir / "flow_results.json"
-                
-                if not flow_results_json_path.exists():
-                    error_msg = f"Issue #600: flow_results.json is required (SSOT) but not found at {flow_results_json_path}"
-                    logger.error(error_msg)
-                    raise FileNotFoundError(error_msg)
-                
-                logger.debug(f"Issue #600: Using flow_results.json as SSOT: {flow_results_json_path}")
-                
-                with log_span("Flow.csv", log=logger, always_info=True):
-                    flow_paths = generate_flow_report_v2(
-                    run_id=run_id,
-                    day=day,
-                    day_events=day_events,
-                    flow_results_json_path=flow_results_json_path,  # Issue #600: Pass JSON path (required)
-                    reports_path=reports_path
-                )
-                day_report_paths.update(flow_paths)
-            except FileNotFoundError:
-                raise  # Re-raise FileNotFoundError
-            except Exception as e:
-                logger.error(f"Failed to generate flow report for day {day.value}: {e}", exc_info=True)
-                # Continue with other reports even if flow fails
+            tasks.append((day, _generate_day_flow_report, dict(
+                run_id=run_id,
+                day=day,
+                day_events=day_events,
+                flow_results_json_path=computation_dir / "flow_results.json",
+                flow_results=flow_results_by_day.get(day),
+                reports_path=reports_path,
+            )))
         
-        # Generate Locations.csv (Issue #600: Load from locations_results.json - SSOT mandatory if file exists)
         if "locations" in kinds:
-            try:
-                # Issue #682: Use centralized get_run_directory() for correct path
-                from app.utils.run_id import get_run_directory
-                run_dir = get_run_directory(run_id)
-                computation_dir = run_dir / day.value / "computation"
-                locations_results_json_path = computation_dir / "locations_results.json"
-
-                if not locations_results_json_path.exists():
-                    # Locations report is optional (only generated if locations file provided)
-                    logger.debug(
-                        f"Issue #600: locations_results.json not found at {locations_results_json_path}, skipping locations report"
-                    )
-                else:
-                    logger.debug(
-                        f"Issue #600: Using locations_results.json as SSOT: {locations_results_json_path}"
-                    )
-
-                    # Filter gpx_paths to only include day events
-                    day_gpx_paths = {
-                        event.name.lower(): gpx_paths[event.name.lower()]
-                        for event in day_events
-                        if event.name.lower() in gpx_paths
-                    }
-
-                    with log_span("Locations.csv", log=logger, always_info=True):
-                        locations_path = generate_locations_report_v2(
-                        run_id=run_id,
-                        day=day,
-                        day_events=day_events,
-                        locations_results_json_path=locations_results_json_path,
-                        all_runners_df=all_runners_df,
-                        reports_path=reports_path,
-                        segments_df=day_segments_df,
-                        segments_file_path=segments_file_path,
-                        gpx_paths=day_gpx_paths,
-                    )
-                    if locations_path:
-                        day_report_paths["locations"] = str(locations_path)
-                        logger.debug(f"Successfully generated locations report for day {day.value}")
-
-                        # Issue #702 / #871: HTML one-pagers for locations flagged onepage='y'
-                        try:
-                            from app.one_pager import generate_location_onepagers
-                            loc_sheets_dir = reports_path / "loc_sheets"
-                            loc_sheets_dir.mkdir(parents=True, exist_ok=True)
-                            with log_span("Location one-pagers", log=logger, always_info=True):
-                                generated = generate_location_onepagers(
-                                run_id=run_id,
-                                day=day.value,
-                                locations_results_json_path=locations_results_json_path,
-                                locations_report_csv_path=locations_path,
-                                output_dir=loc_sheets_dir,
-                            )
-                            logger.info(
-                                f"Generated {generated} HTML one-pagers for day {day.value}"
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                f"Issue #702: One-pager generation failed for day {day.value}: {e}"
-                            )
-                    else:
-                        logger.warning(
-                            f"Locations report generation returned None for day {day.value}"
-                        )
-            except FileNotFoundError:
-                logger.debug(
-                    f"Locations report skipped for day {day.value} (locations_results.json not found)"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to generate locations report for day {day.value}: {e}",
-                    exc_info=True,
-                )
-        
-        report_paths_by_day[day] = day_report_paths
-        
+            # Filter gpx_paths to only include day events
+            day_gpx_paths = {
+                event.name.lower(): gpx_paths[event.name.lower()]
+                for event in day_events
+                if event.name.lower() in gpx_paths
+            }
+            tasks.append((day, _generate_day_locations_report, dict(
+                run_id=run_id,
+                day=day,
+                day_events=day_events,
+                locations_results_json_path=computation_dir / "locations_results.json",
+                locations_results=locations_results_by_day.get(day),
+                all_runners_df=all_runners_df,
+                reports_path=reports_path,
+                segments_df=day_segments_df,
+                segments_file_path=segments_file_path,
+                gpx_paths=day_gpx_paths,
+            )))
+    
+    report_paths_by_day: Dict[Day, Dict[str, str]] = {timeline.day: {} for timeline in timelines}
+    if tasks:
+        max_workers = min(get_report_max_workers(), len(tasks))
+        logger.info(f"Generating {len(tasks)} reports for {len(timelines)} day(s) with {max_workers} worker(s)")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(day, executor.submit(func, **kwargs)) for day, func, kwargs in tasks]
+            # Collect in submission order so each day's paths keep density -> flow -> locations order
+            for day, future in futures:
+                report_paths_by_day[day].update(future.result())
+    
+    for day, day_report_paths in report_paths_by_day.items():
         logger.debug(
             f"Generated {len(day_report_paths)} reports for day {day.value} "
-            f"in {reports_path}"
+            f"in {get_day_output_path(run_id, day, 'reports')}"
         )
     
     # Issue #749: Merge per-day Locations.csv into run-level Locations.csv
     try:
-        from app.utils.run_id import get_run_directory
-        write_combined_locations_csv(get_run_directory(run_id))
-        write_combined_passes_csv(get_run_directory(run_id))
+        write_combined_locations_csv(run_dir)
+        write_combined_passes_csv(run_dir)
     except Exception as e:
         logger.warning("Issue #749: Combined Locations.csv not written: %s", e)
     
     return report_paths_by_day
 
 
+def _generate_day_density_report(**kwargs: Any) -> Dict[str, str]:
+    """Density.md for one day; failures are logged so the other reports still run."""
+    day = kwargs["day"]
+    try:
+        with log_span(f"Density.md ({day.value})", log=logger, always_info=True):
+            density_path = generate_density_report_v2(**kwargs)
+        if density_path:
+            return {"density": str(density_path)}
+    except Exception as e:
+        logger.error(f"Failed to generate density report for day {day.value}: {e}", exc_info=True)
+        # Continue with other reports even if density fails
+    return {}
+
+
+def _generate_day_flow_report(
+    *,
+    day: Day,
+    flow_results_json_path: Path,
+    flow_results: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> Dict[str, str]:
+    """Flow.csv for one day; a missing flow_results.json (SSOT) fails the run."""
+    try:
+        if flow_results is None and not flow_results_json_path.exists():
+            error_msg = f"Issue #600: flow_results.json is required (SSOT) but not found at {flow_results_json_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+        
+        with log_span(f"Flow.csv ({day.value})", log=logger, always_info=True):
+            return generate_flow_report_v2(
+                day=day,
+                flow_results_json_path=flow_results_json_path,
+                flow_results=flow_results,
+                **kwargs,
+            )
+    except FileNotFoundError:
+        raise  # Re-raise FileNotFoundError
+    except Exception as e:
+        logger.error(f"Failed to generate flow report for day {day.value}: {e}", exc_info=True)
+        # Continue with other reports even if flow fails
+    return {}
+
+
+def _generate_day_locations_report(
+    *,
+    run_id: str,
+    day: Day,
+    locations_results_json_path: Path,
+    locations_results: Optional[Dict[str, Any]] = None,
+    reports_path: Path,
+    **kwargs: Any,
+) -> Dict[str, str]:
+    """Locations.csv and its one-pagers for one day (skipped without locations_results)."""
+    try:
+        if locations_results is None and not locations_results_json_path.exists():
+            # Locations report is optional (only generated if locations file provided)
+            logger.debug(
+                f"Issue #600: locations_results.json not found at {locations_results_json_path}, skipping locations report"
+            )
+            return {}
+        
+        with log_span(f"Locations.csv ({day.value})", log=logger, always_info=True):
+            locations_path = generate_locations_report_v2(
+                run_id=run_id,
+                day=day,
+                locations_results_json_path=locations_results_json_path,
+                locations_results=locations_results,
+                reports_path=reports_path,
+                **kwargs,
+            )
+        if not locations_path:
+            logger.warning(
+                f"Locations report generation returned None for day {day.value}"
+            )
+            return {}
+        logger.debug(f"Successfully generated locations report for day {day.value}")
+        
+        # Issue #702 / #871: HTML one-pagers for locations flagged onepage='y'
+        try:
+            from app.one_pager import generate_location_onepagers
+            loc_sheets_dir = reports_path / "loc_sheets"
+            loc_sheets_dir.mkdir(parents=True, exist_ok=True)
+            with log_span(f"Location one-pagers ({day.value})", log=logger, always_info=True):
+                generated = generate_location_onepagers(
+                    run_id=run_id,
+                    day=day.value,
+                    locations_results_json_path=locations_results_json_path,
+                    locations_report_csv_path=locations_path,
+                    output_dir=loc_sheets_dir,
+                    locations_data=(
+                        locations_results.get("locations", []) if locations_results is not None else None
+                    ),
+                )
+            logger.info(
+                f"Generated {generated} HTML one-pagers for day {day.value}"
+            )
+        except Exception as e:
+            logger.warning(
+                f"Issue #702: One-pager generation failed for day {day.value}: {e}"
+            )
+        return {"locations": str(locations_path)}
+    except FileNotFoundError:
+        logger.debug(
+            f"Locations report skipped for day {day.value} (locations_results.json not found)"
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to generate locations report for day {day.value}: {e}",
+            exc_info=True,
+        )
+    return {}
+
+
 def generate_density_report_v2(
     run_id: str,
     day: Day,
@@ -395,7 +468,8 @@ def generate_density_report_v2(
     reports_path: Path,
     data_dir: str,  # Data directory for loading runner files
     segments_df: Optional[Any] = None,  # pd.DataFrame - day-filtered segments
-    segments_file_path: Optional[str] = None  # Issue #553 Phase 6.2: Path to segments file
+    segments_file_path: Optional[str] = None,  # Issue #553 Phase 6.2: Path to segments file
+    all_runners_df: Optional[Any] = None,  # pd.DataFrame - runners already loaded by the pipeline
 ) -> Optional[Path]:
     """
     Generate day-scoped density report (Density.md).
@@ -410,12 +484,13 @@ def generate_density_report_v2(
         density_results: Density analysis results for this day
         reports_path: Path to reports directory for this day
         segments_df: Optional day-filtered segments DataFrame (if None, will load and filter)
+        all_runners_df: Optional runners DataFrame (with ``event`` column) for the
+            start-time runner counts; runner CSVs are read from data_dir when omitted
         
     Returns:
         Path to generated Density.md file, or None if generation failed
     """
     try:
-        import pandas as pd
         from pathlib import Path as PathType
         from app.density_report import generate_density_report_markdown
         from app.core.v2.bins import filter_segments_by_events
@@ -437,7 +512,9 @@ def generate_density_report_v2(
         
         # Issue #519/542: Perform safety check to verify bins are day-scoped (bins should already be day-scoped
         # after Issue #515 fix, but we verify as a safety check and log any issues)
-        bins_df = pd.read_parquet(source_bins_parquet)
+        # Only the segment column is needed here; the report reads the full bins itself
+        from app.core.bin.rollup import read_bins_columns
+        bins_df = read_bins_columns(source_bins_parquet, ["segment_id", "seg_id"])
         
         # Get day-filtered segments
         if segments_df is None:
@@ -501,11 +578,18 @@ def generate_density_report_v2(
             for event in day_events:
                 runner_count = 0
                 try:
-                    # Load runner file for this event to get count
-                    from app.io.loader import load_runners
-                    runner_file = Path(data_dir) / event.runners_file if hasattr(event, 'runners_file') else Path(data_dir) / f"{event.name}_runners.csv"
-                    if runner_file.exists():
-                        runners_df = load_runners(str(runner_file))
+                    runners_df = None
+                    if all_runners_df is not None and "event" in all_runners_df.columns:
+                        runners_df = all_runners_df[
+                            all_runners_df["event"].astype(str).str.lower() == event.name.lower()
+                        ]
+                    else:
+                        # Load runner file for this event to get count
+                        from app.io.loader import load_runners
+                        runner_file = Path(data_dir) / event.runners_file if hasattr(event, 'runners_file') else Path(data_dir) / f"{event.name}_runners.csv"
+                        if runner_file.exists():
+                            runners_df = load_runners(str(runner_file))
+                    if runners_df is not None:
                         # Filter by day if day column exists
                         if 'day' in runners_df.columns:
                             runners_df = runners_df[runners_df['day'].str.lower() == day.value.lower()]
@@ -589,7 +673,8 @@ def generate_flow_report_v2(
     day: Day,
     day_events: List[Event],
     flow_results_json_path: Path,
-    reports_path: Path
+    reports_path: Path,
+    flow_results: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, str]:
     """
     Generate day-scoped flow report (Flow.csv only).
@@ -603,6 +688,8 @@ def generate_flow_report_v2(
         day_events: List of events for this day
         flow_results_json_path: Path to flow_results.json file (Issue #600 - required)
         reports_path: Path to reports directory for this day
+        flow_results: Optional payload already persisted to flow_results_json_path
+            (skips reading it back)
         
     Returns:
         Dictionary with flow_csv path (flow_md key removed per Issue #600)
@@ -616,17 +703,18 @@ def generate_flow_report_v2(
     flow_paths: Dict[str, str] = {}
     
     # Issue #600: Load flow_results.json as SSOT (mandatory)
-    if not flow_results_json_path.exists():
-        raise FileNotFoundError(
-            f"Issue #600: flow_results.json is required (SSOT) but not found at {flow_results_json_path}"
-        )
-    
-    try:
-        flow_results = json.loads(flow_results_json_path.read_text(encoding='utf-8'))
-        logger.debug(f"Issue #600: Loaded flow_results.json from {flow_results_json_path}")
-    except Exception as e:
-        logger.error(f"Failed to load flow_results.json from {flow_results_json_path}: {e}", exc_info=True)
-        raise RuntimeError(f"Issue #600: Failed to load flow_results.json from {flow_results_json_path}: {e}") from e
+    if flow_results is None:
+        if not flow_results_json_path.exists():
+            raise FileNotFoundError(
+                f"Issue #600: flow_results.json is required (SSOT) but not found at {flow_results_json_path}"
+            )
+        
+        try:
+            flow_results = json.loads(flow_results_json_path.read_text(encoding='utf-8'))
+            logger.debug(f"Issue #600: Loaded flow_results.json from {flow_results_json_path}")
+        except Exception as e:
+            logger.error(f"Failed to load flow_results.json from {flow_results_json_path}: {e}", exc_info=True)
+            raise RuntimeError(f"Issue #600: Failed to load flow_results.json from {flow_results_json_path}: {e}") from e
     
     try:
         # Import here to avoid circular dependencies
@@ -747,7 +835,8 @@ def generate_locations_report_v2(
     reports_path: Path,
     segments_df: Optional[Any] = None,  # pd.DataFrame - day-filtered segments
     segments_file_path: Optional[str] = None,  # Issue #616: Path to segments CSV from analysis.json (for fallback only)
-    gpx_paths: Optional[Dict[str, str]] = None  # Issue #655: GPX file paths from analysis.json data_files.gpx
+    gpx_paths: Optional[Dict[str, str]] = None,  # Issue #655: GPX file paths from analysis.json data_files.gpx
+    locations_results: Optional[Dict[str, Any]] = None,
 ) -> Optional[Path]:
     """
     Generate day-scoped locations report (Locations.csv).
@@ -763,6 +852,8 @@ def generate_locations_report_v2(
         all_runners_df: Full runners DataFrame
         reports_path: Path to reports directory for this day
         segments_df: Optional day-filtered segments DataFrame
+        locations_results: Optional payload already persisted to
+            locations_results_json_path (skips reading it back)
         
     Returns:
         Path to generated Locations.csv file, or None if generation failed
@@ -775,13 +866,15 @@ def generate_locations_report_v2(
     import pandas as pd
     
     # Issue #600: Load locations_results.json as SSOT (mandatory)
-    if not locations_results_json_path.exists():
+    if locations_results is None and not locations_results_json_path.exists():
         raise FileNotFoundError(
             f"Issue #600: locations_results.json is required (SSOT) but not found at {locations_results_json_path}"
         )
     
     try:
-        locations_data = json.loads(locations_results_json_path.read_text(encoding='utf-8'))
+        locations_data = locations_results
+        if locations_data is None:
+            locations_data = json.loads(locations_results_json_path.read_text(encoding='utf-8'))
         # Convert JSON to DataFrame: locations_results.json has structure {"locations": [...]}
         locations_df = pd.DataFrame(locations_data.get("locations", []))
         logger.debug(f"Issue #600: Loaded locations_results.json from {locations_results_json_path}: {len(locations_df)} locations")
@@ -879,72 +972,58 @@ def generate_locations_report_v2(
             return None
         
         # Use location_report.py to generate proper Locations.csv
-        # Create temporary files for location_report (it expects CSV file paths)
-        import tempfile
-        import os
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_runners_path = os.path.join(tmpdir, "runners.csv")
-            tmp_segments_path = os.path.join(tmpdir, "segments.csv")
-            tmp_locations_path = os.path.join(tmpdir, "locations.csv")
-            
-            # Save filtered data to temporary CSV files
-            day_runners_df.to_csv(tmp_runners_path, index=False)
-            segments_df.to_csv(tmp_segments_path, index=False)
-            day_locations_df.to_csv(tmp_locations_path, index=False)
-            
-            # Extract start_times from day_events for location_report
-            # location_report.py now handles lowercase event names
-            start_times: Dict[str, float] = {}
-            
-            for event in day_events:
-                # Use lowercase event names (v2 standard)
-                start_times[event.name.lower()] = float(event.start_time)
-            
-            # Generate location report using v1 function
-            # location_report.py expects CSV file paths
-            # NOTE: Do NOT pass run_id to generate_location_report when using v2 structure
-            # because it will use get_runflow_category_path which creates runflow/analysis/{run_id}/reports
-            # instead of runflow/analysis/{run_id}/{day}/reports. We pass output_dir directly instead.
-            
-            # Issue #682: Updated to use runflow/analysis/{run_id} structure
-            
-            # Issue #655: Validate gpx_paths is provided (required for location report)
-            if not gpx_paths:
-                logger.error(f"gpx_paths is required for location report generation but was not provided for day {day.value}")
-                raise ValueError(
-                    f"gpx_paths is required for location report generation. "
-                    "It should be provided from analysis.json data_files.gpx."
-                )
-            
-            logger.debug(f"Calling generate_location_report for day {day.value} with {len(day_locations_df)} locations, {len(day_runners_df)} runners")
-            try:
-                result = generate_location_report(
-                    locations_csv=tmp_locations_path,
-                    runners_csv=tmp_runners_path,
-                    segments_csv=tmp_segments_path,
-                    start_times=start_times,
-                    output_dir=str(reports_path),
-                    run_id=run_id,  # Issue #598: Pass run_id for flag propagation (loads flags.json)
-                    day=day.value,  # Issue #598: Pass day for day-scoped flags.json path
-                    gpx_paths=gpx_paths,  # Issue #655: GPX paths from analysis.json
-                    locations_df=day_locations_df,
-                    runners_df=day_runners_df,
-                    segments_df=segments_df
-                )
-                logger.debug(f"generate_location_report returned for day {day.value}: ok={result.get('ok', False)}")
-            except Exception as e:
-                logger.error(f"Exception in generate_location_report for day {day.value}: {e}", exc_info=True)
-                raise
-            
-            # location_report.py saves to output_dir/Locations.csv via get_report_paths
-            locations_path = reports_path / "Locations.csv"
-            if locations_path.exists():
-                logger.info(f"Generated Locations.csv for day {day.value} at {locations_path}")
-                return locations_path
-            else:
-                logger.warning(f"Location report generation did not create file at {locations_path}")
-                return None
+        # Extract start_times from day_events for location_report
+        # location_report.py now handles lowercase event names
+        start_times: Dict[str, float] = {}
+        
+        for event in day_events:
+            # Use lowercase event names (v2 standard)
+            start_times[event.name.lower()] = float(event.start_time)
+        
+        # Generate location report using v1 function
+        # The filtered DataFrames are passed directly, so no CSV paths are needed
+        # NOTE: Do NOT pass run_id to generate_location_report when using v2 structure
+        # because it will use get_runflow_category_path which creates runflow/analysis/{run_id}/reports
+        # instead of runflow/analysis/{run_id}/{day}/reports. We pass output_dir directly instead.
+        
+        # Issue #682: Updated to use runflow/analysis/{run_id} structure
+        
+        # Issue #655: Validate gpx_paths is provided (required for location report)
+        if not gpx_paths:
+            logger.error(f"gpx_paths is required for location report generation but was not provided for day {day.value}")
+            raise ValueError(
+                f"gpx_paths is required for location report generation. "
+                "It should be provided from analysis.json data_files.gpx."
+            )
+        
+        logger.debug(f"Calling generate_location_report for day {day.value} with {len(day_locations_df)} locations, {len(day_runners_df)} runners")
+        try:
+            result = generate_location_report(
+                locations_csv=None,
+                runners_csv=None,
+                segments_csv=None,
+                start_times=start_times,
+                output_dir=str(reports_path),
+                run_id=run_id,  # Issue #598: Pass run_id for flag propagation (loads flags.json)
+                day=day.value,  # Issue #598: Pass day for day-scoped flags.json path
+                gpx_paths=gpx_paths,  # Issue #655: GPX paths from analysis.json
+                locations_df=day_locations_df,
+                runners_df=day_runners_df,
+                segments_df=segments_df
+            )
+            logger.debug(f"generate_location_report returned for day {day.value}: ok={result.get('ok', False)}")
+        except Exception as e:
+            logger.error(f"Exception in generate_location_report for day {day.value}: {e}", exc_info=True)
+            raise
+        
+        # location_report.py saves to output_dir/Locations.csv via get_report_paths
+        locations_path = reports_path / "Locations.csv"
+        if locations_path.exists():
+            logger.info(f"Generated Locations.csv for day {day.value} at {locations_path}")
+            return locations_path
+        else:
+            logger.warning(f"Location report generation did not create file at {locations_path}")
+            return None
         
     except Exception as e:
         logger.error(f"Failed to generate locations report for day {day.value}: {e}", exc_info=True)
@@ -1,17 +1,22 @@
 """
 Run analysis progress for Overview (#825).
 
-Maps engineer pipeline phases to race-director user stages and persists
-runflow/analysis/{run_id}/progress.json for lightweight polling.
+Maps engineer pipeline phases to race-director user stages. Live progress is
+held in memory by the in-process ``progress_bus`` and pushed to Server-Sent
+Events subscribers; runflow/analysis/{run_id}/progress.json is only rewritten
+at coarse checkpoints (a user stage starts or finishes) and at completion, so
+it stays a durable fallback for polling and for other worker processes.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from app.utils.run_id import get_run_directory
 
@@ -56,6 +61,84 @@ for _phase, _stage in PHASE_TO_USER_STAGE.items():
     STAGE_PHASES.setdefault(_stage, []).append(_phase)
 
 
+TERMINAL_STATUSES = ("PASS", "FAIL")
+
+
+class ProgressBus:
+    """
+    In-process latest-progress store with push delivery to asyncio subscribers.
+
+    Publishers are pipeline threads; subscribers are SSE handlers running on the
+    server event loop, so delivery goes through ``call_soon_threadsafe``. Each
+    subscriber queue only ever needs the newest payload, so a full queue drops
+    its stale entry instead of blocking the publisher.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._subscribers: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+
+    def latest(self, run_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._latest.get(run_id)
+
+    def publish(self, run_id: str, payload: Dict[str, Any]) -> None:
+        """Record ``payload`` as current and push it to subscribers of ``run_id``.
+
+        Terminal payloads are delivered and then dropped from memory; by then
+        progress.json holds the final state.
+        """
+        with self._lock:
+            if payload.get("status") in TERMINAL_STATUSES:
+                self._latest.pop(run_id, None)
+            else:
+                self._latest[run_id] = payload
+            subscribers = list(self._subscribers.get(run_id, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer_latest, queue, payload)
+            except RuntimeError:
+                # Subscriber's loop already closed; unsubscribe() will clean up
+                pass
+
+    def subscribe(self, run_id: str, maxsize: int = 1) -> asyncio.Queue:
+        """Register a queue on the running event loop for ``run_id`` updates."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        entry = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers.setdefault(run_id, set()).add(entry)
+        return queue
+
+    def unsubscribe(self, run_id: str, queue: asyncio.Queue) -> None:
+        with self._lock:
+            entries = self._subscribers.get(run_id)
+            if not entries:
+                return
+            entries.difference_update({e for e in entries if e[1] is queue})
+            if not entries:
+                del self._subscribers[run_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._latest.clear()
+            self._subscribers.clear()
+
+
+def _offer_latest(queue: asyncio.Queue, payload: Dict[str, Any]) -> None:
+    while queue.full():
+        queue.get_nowait()
+    queue.put_nowait(payload)
+
+
+progress_bus = ProgressBus()
+
+
+def clear_progress_bus() -> None:
+    """Drop all in-memory progress state (tests)."""
+    progress_bus.clear()
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -200,7 +283,7 @@ def write_progress(run_id: str, payload: Dict[str, Any]) -> Path:
     return path
 
 
-def read_progress(run_id: str) -> Optional[Dict[str, Any]]:
+def read_progress_file(run_id: str) -> Optional[Dict[str, Any]]:
     path = progress_path(run_id)
     if not path.is_file():
         return None
@@ -213,6 +296,28 @@ def read_progress(run_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def read_progress(run_id: str) -> Optional[Dict[str, Any]]:
+    """Current progress: live in-memory state if this process runs it, else progress.json."""
+    return progress_bus.latest(run_id) or read_progress_file(run_id)
+
+
+def _is_checkpoint(previous: Optional[Dict[str, Any]], payload: Dict[str, Any]) -> bool:
+    """Persist only when the user-visible stage or stage completion changes."""
+    if previous is None:
+        return True
+    return (
+        previous.get("status") != payload.get("status")
+        or previous.get("user_stage") != payload.get("user_stage")
+        or previous.get("step_index") != payload.get("step_index")
+    )
+
+
+def _publish(run_id: str, payload: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> None:
+    if _is_checkpoint(previous, payload):
+        write_progress(run_id, payload)
+    progress_bus.publish(run_id, payload)
+
+
 def init_run_progress(run_id: str) -> Dict[str, Any]:
     """Create initial running progress.json when analysis is accepted."""
     payload = build_progress_payload(
@@ -222,25 +327,46 @@ def init_run_progress(run_id: str) -> Dict[str, Any]:
         current_phase="phase_1_pre_analysis",
         message="Step 1 of 6 — Checking inputs",
     )
-    write_progress(run_id, payload)
+    _publish(run_id, payload, None)
     return payload
 
 
-def _merge_from_disk(run_id: str) -> Dict[str, Any]:
-    existing = read_progress(run_id) or {}
+def _merge_from_current(run_id: str) -> Dict[str, Any]:
+    existing = read_progress(run_id)
     return {
-        "completed_phases": list(existing.get("completed_phases") or []),
-        "started_at": existing.get("started_at"),
+        "completed_phases": list((existing or {}).get("completed_phases") or []),
+        "started_at": (existing or {}).get("started_at"),
         "junctions_note": None,
+        "previous": existing,
     }
 
 
+def mark_run_queued(run_id: Optional[str], jobs_ahead: int) -> None:
+    """Show that the run is waiting for an analysis slot (analysis job queue)."""
+    if not run_id:
+        return
+    try:
+        base = _merge_from_current(run_id)
+        noun = "analysis" if jobs_ahead == 1 else "analyses"
+        payload = build_progress_payload(
+            run_id=run_id,
+            status="running",
+            completed_phases=base["completed_phases"],
+            started_at=base["started_at"],
+            message=f"Waiting to start — {jobs_ahead} {noun} ahead of this one",
+        )
+        # Always persist: the wait can be long and other workers poll the file
+        _publish(run_id, payload, None)
+    except Exception as e:
+        logger.warning("progress mark_run_queued failed for %s: %s", run_id, e)
+
+
 def mark_phase_started(run_id: Optional[str], phase_name: str) -> None:
     phase_name = normalize_phase_name(phase_name) or phase_name
     if not run_id or phase_name not in PHASE_TO_USER_STAGE:
         return
     try:
-        base = _merge_from_disk(run_id)
+        base = _merge_from_current(run_id)
         payload = build_progress_payload(
             run_id=run_id,
             status="running",
@@ -248,7 +374,7 @@ def mark_phase_started(run_id: Optional[str], phase_name: str) -> None:
             current_phase=phase_name,
             started_at=base["started_at"],
         )
-        write_progress(run_id, payload)
+        _publish(run_id, payload, base["previous"])
     except Exception as e:
         logger.warning("progress mark_phase_started failed for %s: %s", run_id, e)
 
@@ -258,7 +384,7 @@ def mark_phase_complete(run_id: Optional[str], phase_name: str) -> None:
     if not run_id or phase_name not in PHASE_TO_USER_STAGE:
         return
     try:
-        base = _merge_from_disk(run_id)
+        base = _merge_from_current(run_id)
         completed = base["completed_phases"]
         if phase_name not in completed:
             completed.append(phase_name)
@@ -269,7 +395,7 @@ def mark_phase_complete(run_id: Optional[str], phase_name: str) -> None:
             current_phase=phase_name,
             started_at=base["started_at"],
         )
-        write_progress(run_id, payload)
+        _publish(run_id, payload, base["previous"])
     except Exception as e:
         logger.warning("progress mark_phase_complete failed for %s: %s", run_id, e)
 
@@ -278,7 +404,7 @@ def mark_run_complete(run_id: Optional[str]) -> None:
     if not run_id:
         return
     try:
-        base = _merge_from_disk(run_id)
+        base = _merge_from_current(run_id)
         # Ensure all known phases appear complete for UI
         all_phases = list(PHASE_TO_USER_STAGE.keys())
         completed = list(dict.fromkeys(base["completed_phases"] + all_phases))
@@ -290,7 +416,7 @@ def mark_run_complete(run_id: Optional[str]) -> None:
             started_at=base["started_at"],
             message="Analysis complete",
         )
-        write_progress(run_id, payload)
+        _publish(run_id, payload, base["previous"])
     except Exception as e:
         logger.warning("progress mark_run_complete failed for %s: %s", run_id, e)
 
@@ -299,7 +425,7 @@ def mark_run_failed(run_id: Optional[str], error: str) -> None:
     if not run_id:
         return
     try:
-        base = _merge_from_disk(run_id)
+        base = _merge_from_current(run_id)
         payload = build_progress_payload(
             run_id=run_id,
             status="FAIL",
@@ -309,7 +435,7 @@ def mark_run_failed(run_id: Optional[str], error: str) -> None:
             message="Analysis could not finish",
             error=(error or "Unknown error")[:500],
         )
-        write_progress(run_id, payload)
+        _publish(run_id, payload, base["previous"])
     except Exception as e:
         logger.warning("progress mark_run_failed failed for %s: %s", run_id, e)
 
@@ -366,3 +492,55 @@ def resolve_progress_for_api(run_id: str) -> Dict[str, Any]:
         )
 
     raise FileNotFoundError(f"Run {run_id} not found")
+
+
+PROGRESS_HEARTBEAT_SECONDS = 15.0
+
+
+def _sse_event(payload: Dict[str, Any]) -> str:
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+async def progress_event_stream(
+    run_id: str,
+    is_disconnected=None,
+    heartbeat_seconds: float = PROGRESS_HEARTBEAT_SECONDS,
+):
+    """
+    Open a Server-Sent Events stream for GET /api/runs/{run_id}/progress/stream.
+
+    Subscribes before resolving the initial payload so no update is missed,
+    and raises FileNotFoundError (before any bytes are sent) for unknown runs.
+    Returns an async iterator of SSE frames that ends after PASS/FAIL.
+    """
+    queue = progress_bus.subscribe(run_id)
+    try:
+        initial = await asyncio.to_thread(resolve_progress_for_api, run_id)
+    except Exception:
+        progress_bus.unsubscribe(run_id, queue)
+        raise
+    return _iter_progress_events(run_id, queue, initial, is_disconnected, heartbeat_seconds)
+
+
+async def _iter_progress_events(run_id, queue, payload, is_disconnected, heartbeat_seconds):
+    try:
+        yield _sse_event(payload)
+        while payload.get("status") not in TERMINAL_STATUSES:
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                if is_disconnected is not None and await is_disconnected():
+                    return
+                # Run is not executing in this process (another worker, or
+                # restarted): follow the progress.json checkpoints instead.
+                if progress_bus.latest(run_id) is None:
+                    on_disk = await asyncio.to_thread(read_progress_file, run_id)
+                    if on_disk and on_disk.get("updated_at") != payload.get("updated_at"):
+                        payload = on_disk
+                        yield _sse_event(payload)
+                        continue
+                yield ": keepalive\n\n"
+                continue
+            yield _sse_event(payload)
+    finally:
+        progress_bus.unsubscribe(run_id, queue)
@@ -8,17 +8,26 @@ Phase 7: UI & API Surface Updates (Issue #501)
 Issue #682: Updated to use runflow/analysis/{run_id} structure
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import logging
 import pandas as pd
 
+from app.core.bin.rollup import FLAGS_COLUMNS, SEGMENT_METRICS_COLUMNS, read_bins_columns
 from app.core.v2.models import Day, Event
 from app.core.v2.performance import log_span
 from app.utils.run_id import get_runflow_root
 
 logger = logging.getLogger(__name__)
 
+# bins.parquet columns used by the UI export: segment metrics, flags, flow.json
+# (segment_id, t_start, t_end, rate) and heatmaps (time, km and density per bin)
+UI_BINS_COLUMNS: Tuple[str, ...] = tuple(dict.fromkeys(
+    SEGMENT_METRICS_COLUMNS
+    + FLAGS_COLUMNS
+    + ("start_time", "end_time", "start_km", "end_km", "density", "flag_severity")
+))
+
 
 def get_ui_artifacts_path(run_id: str, day: Day) -> Path:
     """
@@ -98,7 +107,8 @@ def generate_ui_artifacts_per_day(
     all_runners_df: pd.DataFrame,
     data_dir: str,
     environment: str = "local",
-    analysis_context: Optional[Any] = None
+    analysis_context: Optional[Any] = None,
+    aggregated_bins: Optional[pd.DataFrame] = None,
 ) -> Optional[Path]:
     """
     Generate UI artifacts for a specific day with day-scoped data.
@@ -117,6 +127,9 @@ def generate_ui_artifacts_per_day(
         data_dir: Base directory for data files
         environment: Environment name ("local" or "cloud")
         analysis_context: Optional AnalysisContext instance to reuse (Issue #673: performance optimization)
+        aggregated_bins: All days' bins from aggregate_bins_from_all_days(), when the
+            caller exports several days and reads them once; read from disk if None.
+            Not modified.
         
     Returns:
         Path to UI artifacts directory, or None if generation failed
@@ -214,7 +227,8 @@ def generate_ui_artifacts_per_day(
                 overtaking_segments=overtaking_segments,
                 co_presence_segments=co_presence_segments,
                 environment=environment,
-                analysis_context=analysis_context
+                analysis_context=analysis_context,
+                aggregated_bins=aggregated_bins,
             )
             
             if artifacts_dir:
@@ -245,7 +259,8 @@ def _export_ui_artifacts_v2(
     overtaking_segments: int,
     co_presence_segments: int,
     environment: str,
-    analysis_context: Optional[Any] = None
+    analysis_context: Optional[Any] = None,
+    aggregated_bins: Optional[pd.DataFrame] = None,
 ) -> Optional[Path]:
     """
     Internal wrapper for v1 artifact generation functions adapted for v2 structure.
@@ -303,14 +318,14 @@ def _export_ui_artifacts_v2(
     logger.debug(f"Issue #574: Using organized structure: metadata/, metrics/, geospatial/, visualizations/")
     
     # Aggregate bins.parquet from all days, then filter by day segments
-    aggregated_bins = None
     aggregated_bins_for_flags = None  # Issue #528: Keep original bins with 'rate' column for flagging
     temp_reports = None
     heatmap_reports = None
     
     try:
         # Aggregate bins from all days first
-        aggregated_bins = _aggregate_bins_from_all_days(run_id)
+        if aggregated_bins is None:
+            aggregated_bins = aggregate_bins_from_all_days(run_id)
         if aggregated_bins is not None and not aggregated_bins.empty:
             # Issue #528: Keep a copy with 'rate' column for flagging before renaming
             aggregated_bins_for_flags = aggregated_bins.copy()
@@ -343,12 +358,14 @@ def _export_ui_artifacts_v2(
                     f"for day {day.value} ({len(day_segment_ids)} segments)"
                 )
             
-            # Create temporary reports structure for v1 functions
+            # Create temporary reports structure for v1 functions (flow.json reads it;
+            # segment metrics and flags take the in-memory frames directly).
+            # Issue #528: Saved with the 'rate' column, which flow.json requires.
             temp_reports = ui_path.parent / "reports_temp"
             temp_bins_dir = temp_reports / "bins"
             temp_bins_dir.mkdir(parents=True, exist_ok=True)
-            aggregated_bins.to_parquet(temp_bins_dir / "bins.parquet", index=False)
-            logger.debug(f"   ✅ Saved {len(aggregated_bins)} day-scoped bins to temp_reports")
+            aggregated_bins_for_flags.to_parquet(temp_bins_dir / "bins.parquet", index=False)
+            logger.debug(f"   ✅ Saved {len(aggregated_bins_for_flags)} day-scoped bins to temp_reports")
 
             # Prepare a dedicated reports directory for heatmaps so we can
             # bypass flag-only filtering in v1 load_bin_data when necessary.
@@ -383,7 +400,7 @@ def _export_ui_artifacts_v2(
         logger.debug("2️⃣  Generating segment_metrics.json...")
         try:
             if aggregated_bins is not None and not aggregated_bins.empty and temp_reports:
-                segment_metrics = generate_segment_metrics_json(temp_reports)
+                segment_metrics = generate_segment_metrics_json(temp_reports, bins_df=aggregated_bins)
                 # Issue #603: peak_rate is now computed from worst bin in generate_segment_metrics_json()
                 # No need for separate peak_rate calculation
                 
@@ -439,18 +456,11 @@ def _export_ui_artifacts_v2(
                 if missing_cols:
                     raise ValueError(f"Bins DataFrame missing required columns for flagging: {missing_cols}")
                 else:
-                    # Save bins with 'rate' column to temp_reports for generate_flags_json
-                    # This overwrites the bins.parquet saved earlier (which had 'rate_p_s')
-                    # Note: temp_reports structure is reports_temp/bins/bins.parquet
-                    temp_bins_path = Path(temp_reports) / "bins" / "bins.parquet"
-                    temp_bins_path.parent.mkdir(parents=True, exist_ok=True)
-                    aggregated_bins_for_flags.to_parquet(temp_bins_path, index=False)
-                    logger.debug(f"   📊 Saved {len(aggregated_bins_for_flags)} bins with 'rate' column for flagging")
-                    flags = generate_flags_json(temp_reports, segment_metrics)
+                    flags = generate_flags_json(temp_reports, segment_metrics, bins_df=aggregated_bins_for_flags)
             elif aggregated_bins is not None and not aggregated_bins.empty and temp_reports:
                 # Fallback: try with aggregated_bins if aggregated_bins_for_flags not available
                 logger.warning("   ⚠️  Using aggregated_bins (may have 'rate_p_s' instead of 'rate')")
-                flags = generate_flags_json(temp_reports, segment_metrics)
+                flags = generate_flags_json(temp_reports, segment_metrics, bins_df=aggregated_bins)
             else:
                 flags = []
         except Exception as e:
@@ -804,10 +814,14 @@ def _export_ui_artifacts_v2(
         return None
 
 
-def _aggregate_bins_from_all_days(run_id: str) -> Optional[pd.DataFrame]:
+def aggregate_bins_from_all_days(run_id: str) -> Optional[pd.DataFrame]:
     """
     Aggregate bins.parquet from all days into a single DataFrame.
     
+    Only the UI_BINS_COLUMNS the UI export uses are read. Every day's export
+    works from all days' bins, so the pipeline aggregates once and passes the
+    frame to each generate_ui_artifacts_per_day() call.
+    
     Args:
         run_id: Unique run identifier
         
@@ -822,16 +836,15 @@ def _aggregate_bins_from_all_days(run_id: str) -> Optional[pd.DataFrame]:
         logger.warning(f"Run directory not found: {run_path}")
         return None
     
-    all_bins = []
-    
     # Collect bins from all day directories
     # Issue #574: Bins are stored in {day}/bins/bins.parquet, not {day}/reports/bins.parquet
+    all_bins = []
     for day_dir in run_path.iterdir():
         if day_dir.is_dir() and day_dir.name in ['fri', 'sat', 'sun', 'mon']:
             bins_parquet = day_dir / "bins" / "bins.parquet"
             if bins_parquet.exists():
                 try:
-                    day_bins = pd.read_parquet(bins_parquet)
+                    day_bins = read_bins_columns(bins_parquet, UI_BINS_COLUMNS)
                     all_bins.append(day_bins)
                     logger.debug(f"Loaded {len(day_bins)} bins from {day_dir.name}")
                 except Exception as e:
@@ -9,7 +9,8 @@ Phase 1: Models & Validation Layer (Issue #495)
 
 import os
 from pathlib import Path
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Any
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Any
+import numpy as np
 import pandas as pd
 
 from app.core.v2.models import Day, Event
@@ -24,10 +25,18 @@ class ValidationError(Exception):
     - 400: Bad request (missing required field, invalid format, duplicate event names, invalid day)
     - 404: File not found
     - 422: Unprocessable entity (malformed CSV, invalid data)
+    
+    ``details`` optionally lists per-row problems (e.g. file, row, runner_id).
     """
-    def __init__(self, message: str, code: int = 400):
+    def __init__(
+        self,
+        message: str,
+        code: int = 400,
+        details: Optional[List[Dict[str, Any]]] = None,
+    ):
         self.message = message
         self.code = code
+        self.details = details or []
         super().__init__(self.message)
 
 
@@ -245,7 +254,8 @@ def validate_segment_spans(
     segments_path = Path(data_dir) / segments_file
     
     try:
-        segments_df = pd.read_csv(segments_path)
+        # Only column names are checked, so only the header is read
+        segment_columns = set(_csv_columns(segments_path))
     except Exception as e:
         raise ValidationError(
             f"Failed to read segments.csv: {str(e)}",
@@ -254,7 +264,7 @@ def validate_segment_spans(
     
     # Check for required columns
     required_base_columns = ["seg_id"]
-    missing_base = [col for col in required_base_columns if col not in segments_df.columns]
+    missing_base = [col for col in required_base_columns if col not in segment_columns]
     if missing_base:
         raise ValidationError(
             f"segments.csv missing required columns: {missing_base}",
@@ -271,9 +281,9 @@ def validate_segment_spans(
         to_col = f"{event_name}_to_km"
         
         missing_cols = []
-        if from_col not in segments_df.columns:
+        if from_col not in segment_columns:
             missing_cols.append(from_col)
-        if to_col not in segments_df.columns:
+        if to_col not in segment_columns:
             missing_cols.append(to_col)
         
         if missing_cols:
@@ -283,6 +293,152 @@ def validate_segment_spans(
             )
 
 
+# Runner files are validated in chunks of this many rows, reading only
+# runner_id, so submit-time validation memory stays flat for very large files.
+VALIDATION_CHUNK_ROWS = 250_000
+# Cap on per-row duplicate details attached to a ValidationError
+MAX_DUPLICATE_DETAILS = 50
+
+
+def _csv_columns(path: Path) -> List[str]:
+    """Column names from the CSV header (no data rows are read)."""
+    return pd.read_csv(path, nrows=0).columns.tolist()
+
+
+def _canonical_runner_ids(text_ids: pd.Series) -> pd.Series:
+    """
+    runner_id text in the form the pipeline compares it.
+
+    The pipeline reads runner files with plain ``pd.read_csv``, so ``001``,
+    ``1`` and ``1.0`` all become the number 1. Numeric text is converted to
+    its value (int when integral), anything else stays text.
+    """
+    numeric = pd.to_numeric(text_ids, errors="coerce")
+    values = numeric.to_numpy(dtype="float64", na_value=np.nan)
+    is_number = ~np.isnan(values)
+    finite = np.where(np.isfinite(values), values, 0.5)
+    integral = is_number & (finite == np.floor(finite))
+    canonical = text_ids.to_numpy(dtype=object, copy=True)
+    canonical[is_number] = values[is_number].tolist()
+    canonical[integral] = values[integral].astype(np.int64).tolist()
+    return pd.Series(canonical, index=text_ids.index, name=text_ids.name, dtype=object)
+
+
+def _iter_runner_id_chunks(path: Path) -> Iterator[pd.Series]:
+    """
+    Canonical runner_id values, VALIDATION_CHUNK_ROWS rows at a time.
+
+    The column is read as text rather than inferred: inference runs per chunk,
+    so the same id could read as ``3`` in one chunk and ``"3"`` in the next.
+    Each chunk is then made canonical (see ``_canonical_runner_ids``) so ids
+    the pipeline treats as equal also hash and compare equal here.
+    """
+    reader = pd.read_csv(
+        path,
+        usecols=["runner_id"],
+        dtype={"runner_id": str},
+        chunksize=VALIDATION_CHUNK_ROWS,
+    )
+    with reader:
+        for chunk in reader:
+            yield _canonical_runner_ids(chunk["runner_id"])
+
+
+def _hash_runner_ids(runner_ids: pd.Series) -> np.ndarray:
+    """
+    64-bit hashes of runner_id values.
+
+    Numbers hash by value whatever their dtype (1 == 1.0, as in a dict), so
+    int and float columns from different files can still collide. Hashes
+    only select candidates; equality is decided on the actual values.
+    """
+    if pd.api.types.is_numeric_dtype(runner_ids) and not pd.api.types.is_bool_dtype(runner_ids):
+        return pd.util.hash_array(runner_ids.to_numpy(dtype="float64", na_value=np.nan))
+    return pd.util.hash_pandas_object(runner_ids, index=False).to_numpy()
+
+
+def _duplicate_candidates(hashes: Sequence[np.ndarray]) -> List[np.ndarray]:
+    """
+    Per-file row numbers whose runner_id hash occurs more than once overall.
+
+    All files' hashes are concatenated and checked with a single
+    ``duplicated``; only these candidate rows need their actual ids compared.
+    """
+    if not hashes:
+        return []
+    repeated = pd.Series(np.concatenate(hashes)).duplicated(keep=False).to_numpy()
+    bounds = np.cumsum([0] + [len(h) for h in hashes])
+    return [np.flatnonzero(repeated[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _raise_duplicate_runner_ids(
+    candidates: pd.DataFrame,
+    file_events: Sequence[Tuple[str, str]],
+) -> None:
+    """
+    Raise for the first file (in event order) with a repeated runner_id.
+
+    ``candidates`` has one row per candidate with columns ``file`` (index into
+    ``file_events``), ``row`` (0-based data row) and ``runner_id``. Within-file
+    repeats are reported before ids already used by an earlier event, as the
+    per-file checks always have. The first MAX_DUPLICATE_DETAILS conflicts are
+    attached to the error as ``details`` (file, event, CSV row, runner_id and
+    the earlier event for cross-event repeats).
+    """
+    if candidates.empty:
+        return
+    candidates = candidates.sort_values(["file", "row"], kind="stable", ignore_index=True)
+    in_file = candidates.duplicated(["file", "runner_id"], keep=False)
+    first_file = candidates.groupby("runner_id", dropna=False)["file"].transform("min")
+    conflict = in_file | (candidates["file"] > first_file)
+    if not conflict.any():
+        return  # hash collisions only
+
+    candidates["line"] = candidates["row"] + 2  # 1-based CSV line, after the header
+    candidates["conflicting_event"] = [
+        None if repeat else file_events[first][0] for repeat, first in zip(in_file, first_file)
+    ]
+    conflicts = candidates[conflict]
+    details: List[Dict[str, Any]] = [
+        {
+            "file": file_events[file_idx][1],
+            "event": file_events[file_idx][0],
+            "row": int(line),
+            "runner_id": None if pd.isna(runner_id) else str(runner_id),
+            "conflicting_event": other_event,
+        }
+        for file_idx, line, runner_id, other_event in zip(
+            conflicts["file"][:MAX_DUPLICATE_DETAILS],
+            conflicts["line"][:MAX_DUPLICATE_DETAILS],
+            conflicts["runner_id"][:MAX_DUPLICATE_DETAILS],
+            conflicts["conflicting_event"][:MAX_DUPLICATE_DETAILS],
+        )
+    ]
+
+    file_idx = conflicts["file"].iloc[0]
+    event_name, filename = file_events[file_idx]
+    file_conflicts = conflicts[conflicts["file"] == file_idx]
+    repeated = file_conflicts[in_file[file_conflicts.index]]
+    if not repeated.empty:
+        dup_ids = repeated["runner_id"].unique().tolist()
+        more_ids = f" and {len(dup_ids) - 20} more" if len(dup_ids) > 20 else ""
+        lines = repeated["line"].tolist()
+        shown = ", ".join(str(line) for line in lines[:10]) + (", ..." if len(lines) > 10 else "")
+        message = (
+            f"Duplicate runner_id values in '{filename}' for event '{event_name}': {dup_ids[:20]}{more_ids} "
+            f"(rows {shown})"
+        )
+    else:
+        first = file_conflicts.iloc[0]
+        message = (
+            f"Duplicate runner_id '{first['runner_id']}' found in both event "
+            f"'{first['conflicting_event']}' and event '{event_name}' "
+            f"('{filename}' row {first['line']}). "
+            f"Runner IDs must be unique across all events."
+        )
+    raise ValidationError(message, code=422, details=details)
+
+
 def assert_unique_runner_ids(
     event_frames: Sequence[Tuple[str, pd.DataFrame]],
     *,
@@ -293,8 +449,9 @@ def assert_unique_runner_ids(
 
     Issue #852 / #879: shared uniqueness rule for analysis and dataset create.
     """
-    all_runner_ids: Dict[Any, str] = {}
     names = file_names or {}
+    file_events: List[Tuple[str, str]] = []
+    runner_ids: List[pd.Series] = []
     for event_name, runners_df in event_frames:
         filename = names.get(event_name, f"{event_name}_runners.csv")
         if "runner_id" not in runners_df.columns:
@@ -302,24 +459,17 @@ def assert_unique_runner_ids(
                 f"runners_file '{filename}' for event '{event_name}' missing required columns: ['runner_id']",
                 code=422,
             )
-        duplicates_in_file = runners_df[
-            runners_df.duplicated(subset=["runner_id"], keep=False)
-        ]
-        if not duplicates_in_file.empty:
-            dup_ids = duplicates_in_file["runner_id"].unique().tolist()
-            raise ValidationError(
-                f"Duplicate runner_id values in '{filename}' for event '{event_name}': {dup_ids}",
-                code=422,
-            )
-        for runner_id in runners_df["runner_id"]:
-            if runner_id in all_runner_ids:
-                conflicting_event = all_runner_ids[runner_id]
-                raise ValidationError(
-                    f"Duplicate runner_id '{runner_id}' found in both event '{conflicting_event}' and event '{event_name}'. "
-                    f"Runner IDs must be unique across all events.",
-                    code=422,
-                )
-            all_runner_ids[runner_id] = event_name
+        file_events.append((event_name, filename))
+        runner_ids.append(runners_df["runner_id"].reset_index(drop=True))
+
+    candidate_rows = _duplicate_candidates([_hash_runner_ids(ids) for ids in runner_ids])
+    candidates = [
+        pd.DataFrame({"file": file_idx, "row": rows, "runner_id": runner_ids[file_idx].iloc[rows].to_numpy()})
+        for file_idx, rows in enumerate(candidate_rows)
+        if len(rows)
+    ]
+    if candidates:
+        _raise_duplicate_runner_ids(pd.concat(candidates, ignore_index=True), file_events)
 
 
 def validate_runner_uniqueness(
@@ -329,6 +479,10 @@ def validate_runner_uniqueness(
     """
     Validate no duplicate runner_id across all runner files.
     
+    Files are streamed: the header is checked for required columns, then only
+    runner_id is read in chunks and hashed. Rows whose hash repeats are re-read
+    to report the actual ids with file and row numbers.
+    
     Args:
         events: List of event dictionaries with runners_file
         data_dir: Base directory for data files (default: "data")
@@ -337,8 +491,9 @@ def validate_runner_uniqueness(
         ValidationError (422): If duplicate runner IDs found
     """
     data_path = Path(data_dir)
-    event_frames: List[Tuple[str, pd.DataFrame]] = []
-    file_names: Dict[str, str] = {}
+    file_events: List[Tuple[str, str]] = []
+    runner_paths: List[Path] = []
+    hashes: List[np.ndarray] = []
 
     for event in events:
         event_name = event.get("name", "unknown")
@@ -350,7 +505,7 @@ def validate_runner_uniqueness(
         runners_path = data_path / runners_file
         
         try:
-            runners_df = pd.read_csv(runners_path)
+            columns = _csv_columns(runners_path)
         except Exception as e:
             raise ValidationError(
                 f"Failed to read runners_file '{runners_file}' for event '{event_name}': {str(e)}",
@@ -359,17 +514,41 @@ def validate_runner_uniqueness(
         
         # Check required columns
         required_columns = ["runner_id", "event", "pace", "distance", "start_offset"]
-        missing_cols = [col for col in required_columns if col not in runners_df.columns]
+        missing_cols = [col for col in required_columns if col not in columns]
         if missing_cols:
             raise ValidationError(
                 f"runners_file '{runners_file}' for event '{event_name}' missing required columns: {missing_cols}",
                 code=422
             )
 
-        event_frames.append((event_name, runners_df))
-        file_names[event_name] = str(runners_file)
+        try:
+            file_hashes = [_hash_runner_ids(ids) for ids in _iter_runner_id_chunks(runners_path)]
+        except Exception as e:
+            raise ValidationError(
+                f"Failed to read runners_file '{runners_file}' for event '{event_name}': {str(e)}",
+                code=422
+            )
+        hashes.append(np.concatenate(file_hashes) if file_hashes else np.empty(0, dtype=np.uint64))
+        file_events.append((event_name, str(runners_file)))
+        runner_paths.append(runners_path)
 
-    assert_unique_runner_ids(event_frames, file_names=file_names)
+    candidates = []
+    for file_idx, rows in enumerate(_duplicate_candidates(hashes)):
+        if not len(rows):
+            continue
+        # Second pass over this file only when it has candidate duplicates
+        offset = 0
+        for ids in _iter_runner_id_chunks(runner_paths[file_idx]):
+            local = rows[(rows >= offset) & (rows < offset + len(ids))]
+            if len(local):
+                candidates.append(pd.DataFrame({
+                    "file": file_idx,
+                    "row": local,
+                    "runner_id": ids.iloc[local - offset].to_numpy(),
+                }))
+            offset += len(ids)
+    if candidates:
+        _raise_duplicate_runner_ids(pd.concat(candidates, ignore_index=True), file_events)
 
 
 def validate_description(description: Optional[str]) -> None:
@@ -2045,13 +2045,12 @@ def _apply_flagging_to_bin_features(
                 raise ValueError(error_msg)
             
             try:
-                from app.io.loader import load_segments
                 # Issue #616: Use segments_csv_path from analysis_context instead of hardcoded path
                 logger.warning(
                     f"No schema found in segments dict, falling back to loading '{analysis_context.segments_csv_path}'. "
                     "This should not happen in v2 pipeline - segments should have schema from segments_df."
                 )
-                segments_df = load_segments(analysis_context.segments_csv_path)
+                segments_df = analysis_context.get_segments_df()
                 for _, row in segments_df.iterrows():
                     seg_id = row.get('seg_id')
                     seg_label = row.get('seg_label')
@@ -2179,8 +2178,7 @@ def _add_geometries_to_bin_features(
     
     try:
         from app.core.bin.geometry import generate_bin_polygon
-        from app.core.gpx.processor import load_all_courses, generate_segment_coordinates
-        from app.io.loader import load_segments
+        from app.core.gpx.processor import generate_segment_coordinates
         import pandas as pd
         import json
         
@@ -2206,8 +2204,8 @@ def _add_geometries_to_bin_features(
         
         logger.debug(f"Issue #616: Using segments_csv_path={segments_csv_path} from analysis_context")
         
-        # Load segment metadata for geometry
-        segments_df = load_segments(segments_csv_path)
+        # Load segment metadata for geometry (run-scoped input cache)
+        segments_df = analysis_context.get_segments_df()
         
         # Load GPX courses for centerlines
         events = analysis_context.analysis_config.get("events", [])
@@ -2219,7 +2217,7 @@ def _add_geometries_to_bin_features(
             if not event_name:
                 raise ValueError("analysis.json events missing name for GPX loading in bin geometry generation.")
             gpx_paths[event_name.lower()] = str(analysis_context.gpx_path(event_name))
-        courses = load_all_courses(gpx_paths)
+        courses = analysis_context.get_courses(gpx_paths)
         
         # Convert segments to dict format for GPX processor (#701: all analysis events)
         from app.core.event_discovery import build_segment_event_payload
@@ -2884,18 +2882,14 @@ def build_runner_window_mapping(
     # Load pace data and segments configuration
     # Issue #548: Load from individual event files instead of runners.csv (file no longer exists)
     try:
-        from app.io.loader import load_segments, load_runners_by_event
-        from pathlib import Path
-        
         # Load runners from individual event files based on start_times keys
         all_runners = []
         if not analysis_context:
             raise ValueError("analysis_context is required for runner path resolution in build_runner_window_mapping.")
         for event_name in start_times.keys():
             try:
-                event_runners = load_runners_by_event(analysis_context.runners_csv_path(event_name))
+                event_runners = analysis_context.get_runners_df(event_name)
                 # Ensure event column is lowercase
-                event_runners = event_runners.copy()
                 event_runners["event"] = event_name.lower()
                 all_runners.append(event_runners)
             except FileNotFoundError:
@@ -2920,8 +2914,7 @@ def build_runner_window_mapping(
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        segments_csv_path = analysis_context.segments_csv_path
-        segments_config = load_segments(segments_csv_path)  # Issue #616: Use segments_csv_path from analysis_context
+        segments_config = analysis_context.get_segments_df()  # Issue #616: segments_csv_path from analysis_context
     except Exception as e:
         logger.warning(f"Could not load data for runner mapping: {e}")
         return mapping
@@ -3108,8 +3101,8 @@ def _write_parquet_file(parquet_rows: list, parquet_path: str) -> None:
         import pyarrow.parquet as pq
         
         if parquet_rows:
-            table = pa.Table.from_pylist(parquet_rows)
-            pq.write_table(table, parquet_path, compression='zstd')
+            from app.core.bin.parquet import write_bins_parquet
+            write_bins_parquet(parquet_rows, parquet_path)
         else:
             # Empty dataset
             schema = pa.schema([
@@ -7,14 +7,23 @@ Generates one PDF per analysis day from finish_times.csv:
 - Table: time block, count, operational tier (Low / Moderate / High / Peak)
 
 Uses matplotlib (Agg) + ReportLab; matches existing stack (see one_pager.py).
+
+Each PDF records a signature of its inputs in its keywords; re-rendering an
+unchanged day leaves the existing PDF in place. Charts are reused from the
+image cache when a day's windows and counts are unchanged, and
+:func:`render_finish_area_pdfs` renders several days in a bounded process
+pool (RUNFLOW_RENDER_MAX_WORKERS).
 """
 
 from __future__ import annotations
 
+import concurrent.futures
 import io
 import logging
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from xml.sax.saxutils import escape
 
 import matplotlib
@@ -22,6 +31,7 @@ import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import pandas as pd
+import reportlab
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -35,8 +45,44 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+from app.core.artifacts.image_cache import (
+    evict_image_cache,
+    image_cache_key,
+    load_cached_image_bytes,
+    store_cached_image_bytes,
+)
+
 logger = logging.getLogger(__name__)
 
+FINISH_CHART_CACHE_VERSION = 1
+# Bump when the PDF layout changes so existing PDFs are re-rendered
+FINISH_PDF_VERSION = 1
+_SIGNATURE_PREFIX = "runflow-input-sha256:"
+# A spawned worker takes ~2 s to start and import matplotlib/ReportLab, while
+# a PDF whose chart must be drawn takes ~0.8 s (cached chart: ~0.15 s). The
+# pool only beats rendering in-process from four such PDFs (4 x 0.8 s serial
+# vs ~2 s + 0.8 s), so below that, and for cached/unchanged days, it is skipped.
+PARALLEL_MIN_PDFS = 4
+
+
+def get_render_max_workers() -> int:
+    """Resolve max worker processes for finish-area PDFs (RUNFLOW_RENDER_MAX_WORKERS)."""
+    default_workers = 4
+    raw_value = os.getenv("RUNFLOW_RENDER_MAX_WORKERS", str(default_workers)).strip()
+    try:
+        max_workers = int(raw_value)
+    except ValueError:
+        logger.warning(
+            "Invalid RUNFLOW_RENDER_MAX_WORKERS value '%s', using default %s",
+            raw_value,
+            default_workers,
+        )
+        max_workers = default_workers
+    if max_workers < 1:
+        logger.warning("RUNFLOW_RENDER_MAX_WORKERS must be >= 1 (got %s); using 1", max_workers)
+        max_workers = 1
+    return min(max_workers, os.cpu_count() or max_workers)
+
 
 def _operational_tier(count: int, max_count: int) -> str:
     """Relative-to-peak labels for finish-area demand (same day)."""
@@ -103,6 +149,27 @@ def _build_charts_png(
     return buf
 
 
+def _chart_cache_key(labels: List[str], counts: List[int]) -> str:
+    return image_cache_key(
+        "finish_area_chart",
+        FINISH_CHART_CACHE_VERSION,
+        matplotlib.__version__,
+        labels,
+        counts,
+    )
+
+
+def _chart_png(labels: List[str], counts: List[int]) -> io.BytesIO:
+    """Chart PNG from the image cache, rendering (and storing) it on a miss."""
+    cache_key = _chart_cache_key(labels, counts)
+    cached = load_cached_image_bytes(cache_key)
+    if cached is not None:
+        return io.BytesIO(cached)
+    buf = _build_charts_png(labels, counts)
+    store_cached_image_bytes(cache_key, buf.getvalue())
+    return buf
+
+
 def _takeaway_text(
     day_name: str,
     labels: List[str],
@@ -138,6 +205,66 @@ def _takeaway_text(
     return " ".join(lines)
 
 
+def _load_finish_windows(finish_times_csv: Path) -> Optional[Tuple[List[str], List[int]]]:
+    """(labels, counts) of the event=all windows in time order, or None if unusable."""
+    if not finish_times_csv.exists():
+        logger.warning("finish_area PDF: missing %s", finish_times_csv)
+        return None
+
+    df = pd.read_csv(finish_times_csv)
+    if df.empty:
+        logger.warning("finish_area PDF: empty CSV %s", finish_times_csv)
+        return None
+
+    all_rows = df[df["event"].astype(str).str.lower() == "all"].copy()
+    if all_rows.empty:
+        logger.warning("finish_area PDF: no 'all' rows in %s", finish_times_csv)
+        return None
+
+    all_rows = all_rows.sort_values(
+        ["time_window_start", "time_window_end"]
+    ).reset_index(drop=True)
+
+    labels = [
+        _window_label(str(start), str(end))
+        for start, end in zip(
+            all_rows["time_window_start"].tolist(), all_rows["time_window_end"].tolist()
+        )
+    ]
+    counts = [int(c) for c in all_rows["count"].tolist()]
+    return labels, counts
+
+
+def _pdf_signature(
+    labels: List[str],
+    counts: List[int],
+    day_display_name: str,
+    run_id: str,
+    expected_runner_total: Optional[int],
+) -> str:
+    """Fingerprint of everything a finish-area PDF is built from."""
+    return image_cache_key(
+        "finish_area_pdf",
+        FINISH_PDF_VERSION,
+        FINISH_CHART_CACHE_VERSION,
+        matplotlib.__version__,
+        reportlab.Version,
+        labels,
+        counts,
+        day_display_name,
+        str(run_id),
+        expected_runner_total,
+    )
+
+
+def _has_signature(output_pdf: Path, signature: str) -> bool:
+    """True if ``output_pdf`` was rendered from inputs with this signature."""
+    try:
+        return (_SIGNATURE_PREFIX + signature).encode("ascii") in output_pdf.read_bytes()
+    except OSError:
+        return False
+
+
 def generate_finish_area_demand_pdf(
     *,
     finish_times_csv: Path,
@@ -157,38 +284,24 @@ def generate_finish_area_demand_pdf(
         expected_runner_total: Optional QA total from analysis.json (runners that day)
 
     Returns:
-        True if PDF written.
+        True if PDF written (or already up to date for these inputs).
     """
-    if not finish_times_csv.exists():
-        logger.warning("finish_area PDF: missing %s", finish_times_csv)
-        return False
-
-    df = pd.read_csv(finish_times_csv)
-    if df.empty:
-        logger.warning("finish_area PDF: empty CSV %s", finish_times_csv)
-        return False
-
-    all_rows = df[df["event"].astype(str).str.lower() == "all"].copy()
-    if all_rows.empty:
-        logger.warning("finish_area PDF: no 'all' rows in %s", finish_times_csv)
+    windows = _load_finish_windows(finish_times_csv)
+    if windows is None:
         return False
+    labels, counts = windows
+    signature = _pdf_signature(labels, counts, day_display_name, run_id, expected_runner_total)
+    if _has_signature(output_pdf, signature):
+        logger.info("finish-area PDF inputs unchanged, keeping %s", output_pdf)
+        return True
 
-    all_rows = all_rows.sort_values(
-        ["time_window_start", "time_window_end"]
-    ).reset_index(drop=True)
-
-    labels = [
-        _window_label(str(r["time_window_start"]), str(r["time_window_end"]))
-        for _, r in all_rows.iterrows()
-    ]
-    counts = [int(r["count"]) for _, r in all_rows.iterrows()]
     max_c = max(counts)
 
     tiers = [_operational_tier(c, max_c) for c in counts]
 
     output_pdf.parent.mkdir(parents=True, exist_ok=True)
 
-    chart_buf = _build_charts_png(labels, counts)
+    chart_buf = _chart_png(labels, counts)
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
         "title",
@@ -211,6 +324,7 @@ def generate_finish_area_demand_pdf(
         leftMargin=0.75 * inch,
         topMargin=0.65 * inch,
         bottomMargin=0.65 * inch,
+        keywords=_SIGNATURE_PREFIX + signature,
     )
     story: List[Any] = []
 
@@ -267,6 +381,81 @@ def generate_finish_area_demand_pdf(
     return True
 
 
+def _render_job(job: Dict[str, Any]) -> bool:
+    """One finish-area PDF; failures are logged so other days still render."""
+    try:
+        return generate_finish_area_demand_pdf(**job)
+    except Exception as exc:
+        logger.warning(
+            "finish_area_demand.pdf failed for %s: %s",
+            job.get("output_pdf"),
+            exc,
+            exc_info=True,
+        )
+        return False
+
+
+def _needs_chart_render(job: Dict[str, Any]) -> bool:
+    """True if a job's PDF is out of date and its chart is not in the image cache."""
+    try:
+        windows = _load_finish_windows(Path(job["finish_times_csv"]))
+        if windows is None:
+            return False
+        labels, counts = windows
+        signature = _pdf_signature(
+            labels,
+            counts,
+            job["day_display_name"],
+            job["run_id"],
+            job.get("expected_runner_total"),
+        )
+        if _has_signature(Path(job["output_pdf"]), signature):
+            return False
+        return load_cached_image_bytes(_chart_cache_key(labels, counts)) is None
+    except Exception:
+        return False  # _render_job reports the failure
+
+
+def render_finish_area_pdfs(jobs: List[Dict[str, Any]], max_workers: int = 1) -> List[bool]:
+    """
+    Render several finish-area PDFs (keyword arguments of
+    :func:`generate_finish_area_demand_pdf`, one dict per day).
+
+    Days whose PDF is unchanged or whose chart is cached render in-process.
+    With ``max_workers > 1`` and at least ``PARALLEL_MIN_PDFS`` charts to draw,
+    those days render in a process pool (matplotlib is not thread-safe).
+    Results keep job order.
+    """
+    cold = [i for i, job in enumerate(jobs) if _needs_chart_render(job)]
+    workers = min(max_workers, len(cold))
+    pooled = cold if workers > 1 and len(cold) >= PARALLEL_MIN_PDFS else []
+
+    results: List[Optional[bool]] = [None] * len(jobs)
+    if pooled:
+        logger.debug("finish-area PDFs: %s jobs on %s worker processes", len(pooled), workers)
+        # spawn: the pipeline runs inside a threaded server, where fork is unsafe
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = {i: executor.submit(_render_job, jobs[i]) for i in pooled}
+            for i, job in enumerate(jobs):
+                if i not in futures:
+                    results[i] = _render_job(job)
+            for i, future in futures.items():
+                try:
+                    results[i] = future.result()
+                except Exception as exc:  # e.g. a worker process died
+                    logger.warning(
+                        "finish_area_demand.pdf failed for %s: %s", jobs[i].get("output_pdf"), exc
+                    )
+                    results[i] = False
+    else:
+        results = [_render_job(job) for job in jobs]
+    evict_image_cache()
+    return results
+
+
 def expected_runners_for_day(analysis_config: dict, day_code: str) -> Optional[int]:
     """Sum analysis.json runners field for events on this day."""
     if not analysis_config or "events" not in analysis_config:
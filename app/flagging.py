@@ -116,7 +116,7 @@ def compute_bin_flags(bins: pd.DataFrame, rulebook: Optional[Dict[str, Any]] = N
     flagged = bins[bins['flag_severity'] != 'none'].copy()
     
     bin_flags = []
-    for _, row in flagged.iterrows():
+    for row in flagged.to_dict('records'):
         flag = BinFlag(
             segment_id=str(row['segment_id']),
             t_start=str(row['t_start']),
@@ -250,7 +250,7 @@ def generate_bins_geojson(segments_data: Dict[str, SegmentBinData], analysis_con
     
     # Load real segment coordinates from GPX data
     try:
-        from app.core.gpx.processor import load_all_courses, generate_segment_coordinates
+        from app.core.gpx.processor import generate_segment_coordinates
 
         if not analysis_context:
             raise ValueError("analysis_context is required for generate_bins_geojson.")
@@ -271,7 +271,7 @@ def generate_bins_geojson(segments_data: Dict[str, SegmentBinData], analysis_con
             gpx_paths[event_name.lower()] = str(analysis_context.gpx_path(event_name))
 
         # Load GPX courses
-        courses = load_all_courses(gpx_paths)
+        courses = analysis_context.get_courses(gpx_paths)
 
         # Load segments data to get segment definitions
         segments_df = analysis_context.get_segments_df()
@@ -17,6 +17,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
 
 from shapely.geometry import LineString, Point
@@ -457,6 +458,15 @@ def get_segment_ranges_for_event(
     return ranges
 
 
+@lru_cache(maxsize=16)
+def course_line_utm(course: GPXCourse) -> LineString:
+    """
+    Full course polyline in UTM, transformed once per (shared, read-only) GPX course.
+    """
+    x, y = WGS84_TO_UTM.transform(course.lon, course.lat)
+    return LineString(np.column_stack([x, y]))
+
+
 def project_point_to_course(
     location_point_utm: Point,
     course_polyline_utm: LineString
@@ -506,14 +516,8 @@ def find_nearest_segment(
     if not course:
         return None
     
-    # Convert course to UTM LineString
-    course_points_utm = [
-        WGS84_TO_UTM.transform(p.lon, p.lat) for p in course.points
-    ]
-    course_line_utm = LineString(course_points_utm)
-    
     # Project location onto full course
-    distance_km = project_point_to_course(location_point_utm, course_line_utm)
+    distance_km = project_point_to_course(location_point_utm, course_line_utm(course))
     if distance_km is None:
         return None
     
@@ -644,14 +648,8 @@ def calculate_arrival_times_for_location(
         if not course:
             continue
         
-        # Convert course to UTM LineString
-        course_points_utm = [
-            WGS84_TO_UTM.transform(p.lon, p.lat) for p in course.points
-        ]
-        course_line_utm = LineString(course_points_utm)
-        
         # Project location onto course
-        distance_km = project_point_to_course(location_point_utm, course_line_utm)
+        distance_km = project_point_to_course(location_point_utm, course_line_utm(course))
         if distance_km is None:
             logger.warning(f"Location {location.get('loc_id')} ({event}): Projection failed - could not project point to course")
             continue
@@ -872,9 +870,9 @@ def calculate_arrival_times_for_location(
 
 
 def generate_location_report(
-    locations_csv: str,
-    runners_csv: str,
-    segments_csv: str,
+    locations_csv: Optional[str],
+    runners_csv: Optional[str],
+    segments_csv: Optional[str],
     start_times: Optional[Dict[str, float]] = None,
     output_dir: str = "reports",
     run_id: Optional[str] = None,
@@ -890,9 +888,9 @@ def generate_location_report(
     Issue #277: Main entry point for location report generation.
     
     Args:
-        locations_csv: Path to locations.csv (required)
-        runners_csv: Path to runners.csv (required)
-        segments_csv: Path to segments.csv (required)
+        locations_csv: Path to locations.csv (required unless locations_df is given)
+        runners_csv: Path to runners.csv (required unless runners_df is given)
+        segments_csv: Path to segments.csv (required unless segments_df is given)
         start_times: Dictionary of event start times in minutes (default: from constants)
         output_dir: Output directory for report
         run_id: Optional run ID for runflow structure
@@ -4,6 +4,9 @@ HTML location one-pagers (Issue #702 / #735 / #871).
 Analysis writes volunteer HTML only under loc_sheets/html/{loc_id}.html.
 PDFs and in-run map-tile stitching are not part of the pipeline; Results
 Locations can zip the existing HTML when the user asks.
+
+Each sheet carries a signature of its inputs in a ``<meta>`` tag, so
+re-generating into the same directory leaves unchanged sheets untouched.
 """
 
 from __future__ import annotations
@@ -17,10 +20,14 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from app.core.artifacts.image_cache import image_cache_key
 from app.utils.constants import LOCATION_MAP_TILE_URL
 
 logger = logging.getLogger(__name__)
 
+# Bump when the sheet template changes so existing sheets are re-rendered
+ONEPAGER_HTML_VERSION = 1
+
 
 def generate_location_onepagers(
     run_id: str,
@@ -30,6 +37,7 @@ def generate_location_onepagers(
     output_dir: Path,
     maps_dir: Optional[Path] = None,
     radius_m: float = 0.0,
+    locations_data: Optional[List[Dict[str, Any]]] = None,
 ) -> int:
     """
     Generate HTML one-pagers for locations flagged onepage='y'.
@@ -39,6 +47,8 @@ def generate_location_onepagers(
     loc_id in the group so existing /locsheets/.../{loc_id} URLs keep working.
 
     ``maps_dir`` / ``radius_m`` are unused (#871); kept so older callers do not break.
+    ``locations_data`` is the ``locations`` list of locations_results.json when the
+    caller already has it in memory; otherwise the JSON is read.
 
     Returns:
         Number of Location sheets generated (paired counts as one).
@@ -50,7 +60,8 @@ def generate_location_onepagers(
         time_to_seconds,
     )
 
-    locations_data = _load_locations_results(locations_results_json_path)
+    if locations_data is None:
+        locations_data = _load_locations_results(locations_results_json_path)
     if not locations_data:
         logger.warning(
             f"Issue #702: locations_results.json empty or unreadable at {locations_results_json_path}"
@@ -150,30 +161,70 @@ def generate_location_onepagers(
         )
 
     count = 0
+    unchanged = 0
     for spec in sheet_specs:
         location = spec["location"]
         report_row = spec["report_row"]
         loc_id = spec["sheet_loc_id"]
         html_path = html_dir / f"{loc_id}.html"
+        passes = spec["passes"] if spec["paired"] else None
+        signature = _onepager_signature(location, report_row, day, passes, spec["all_loc_ids"])
+        count += 1
+        if _has_signature(html_path, signature):
+            unchanged += 1
+            continue
         _render_onepager_html(
             location,
             report_row,
             html_path,
             day=day,
-            passes=spec["passes"] if spec["paired"] else None,
+            passes=passes,
             sheet_loc_ids=spec["all_loc_ids"],
+            signature=signature,
         )
-        count += 1
 
     logger.debug(
-        "Issue #702/#735/#871: Generated %s HTML one-pagers for day %s (run %s)",
+        "Issue #702/#735/#871: Generated %s HTML one-pagers for day %s (run %s, %s unchanged)",
         count,
         day,
         run_id,
+        unchanged,
     )
     return count
 
 
+def _onepager_signature(
+    location: Dict[str, Any],
+    report_row: Dict[str, Any],
+    day: str,
+    passes: Optional[List[Tuple[Dict[str, Any], Dict[str, Any]]]],
+    sheet_loc_ids: List[Any],
+) -> str:
+    """Fingerprint of everything a sheet is rendered from."""
+    return image_cache_key(
+        "onepager_html",
+        ONEPAGER_HTML_VERSION,
+        LOCATION_MAP_TILE_URL,
+        location,
+        report_row,
+        str(day),
+        passes,
+        sheet_loc_ids,
+    )
+
+
+def _signature_meta(signature: str) -> str:
+    return f'<meta name="runflow-input" content="{signature}">'
+
+
+def _has_signature(html_path: Path, signature: str) -> bool:
+    """True if ``html_path`` was rendered from inputs with this signature."""
+    try:
+        return _signature_meta(signature) in html_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
 def _pass_instance_id(location: Dict[str, Any]) -> Optional[int]:
     for field in ("pass_id", "id"):
         raw = location.get(field)
@@ -306,6 +357,7 @@ def _render_onepager_html(
     day: str = "",
     passes: Optional[List[Tuple[Dict[str, Any], Dict[str, Any]]]] = None,
     sheet_loc_ids: Optional[List[Any]] = None,
+    signature: str = "",
 ) -> None:
     """Render one-pager as HTML (Issue #735 / #810 / #871). Map tiles load in the browser."""
     loc_id = location.get("loc_id", "")
@@ -393,12 +445,13 @@ def _render_onepager_html(
 
     resources_html = "".join(f"<li>{html.escape(r)}</li>" for r in resources) if resources else "<li>NA</li>"
 
+    signature_meta = f"    {_signature_meta(signature)}\n" if signature else ""
     html_content = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{html.escape(title)}</title>
+{signature_meta}    <title>{html.escape(title)}</title>
     <style>
         body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 1rem 2rem; }}
         h1 {{ font-size: 1.25rem; margin-bottom: 0.5rem; }}
@@ -9,7 +9,7 @@ Architecture: Option 3 - Hybrid Approach
 """
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -23,7 +23,6 @@ from app.common.config import load_rulebook, load_reporting
 from app.utils.auth import require_auth
 from app.utils.run_id import get_latest_run_id, resolve_selected_day
 from app.storage import create_runflow_storage
-from app.utils.metadata import get_run_index
 from app.utils.display_time import format_local_display_datetime
 
 # Issue #283: Import SSOT for flagging logic parity
@@ -360,14 +359,23 @@ async def get_dashboard_summary(
 
 
 @router.get("/api/runs/list")
-async def get_runs_list():
+async def get_runs_list(
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size (default: all runs)"),
+    offset: int = Query(0, ge=0, description="Number of runs to skip"),
+    status: Optional[str] = Query(None, description="Filter by run status"),
+    day: Optional[str] = Query(None, description="Only runs that analysed this day (fri|sat|sun|mon)"),
+    q: Optional[str] = Query(None, description="Search run_id or description"),
+):
     """
-    Get list of all runs from index.json with summary metrics.
+    Get list of runs with summary metrics, newest first.
     
     Issue #565: Returns all runs with event_summary data for Run History Table.
+    Served from the SQLite run catalog (app/utils/run_catalog.py) rather than
+    opening analysis.json / metadata.json for every run on each request; the
+    catalog is rebuilt from disk automatically when index.json changed.
     
     Returns:
-        JSON with list of runs, each containing:
+        JSON with list of runs (plus total/limit/offset for paging), each containing:
         - run_id
         - description (from analysis.json)
         - created_at
@@ -375,78 +383,30 @@ async def get_runs_list():
         - status
     """
     try:
-        runs = get_run_index()
+        from app.utils.run_catalog import list_runs
+        
+        rows, total = list_runs(limit=limit, offset=offset, status=status, day=day, search=q)
         
         runs_list = []
-        for run in runs:
-            run_id = run.get("run_id")
-            if not run_id:
-                continue
-            
-            # Load analysis.json for description (readonly: no data_dir validation; Issue #740 cloud)
-            description = None
-            try:
-                from app.config.loader import load_analysis_config_readonly
-                from app.utils.run_id import get_run_directory
-                cfg = load_analysis_config_readonly(get_run_directory(run_id))
-                description = cfg.get("description")
-            except Exception as e:
-                logger.warning(f"Could not load analysis.json for {run_id}: {e}")
-            
-            # Load root metadata.json for total_elapsed_minutes (Issue #638 follow-up)
-            # Issue #682: Use centralized get_run_directory() for correct path
-            from app.utils.run_id import get_run_directory
-            run_dir = get_run_directory(run_id)
-            metadata_path = run_dir / "metadata.json"
-            total_elapsed_minutes = None
-            if metadata_path.exists():
-                try:
-                    with open(metadata_path, 'r', encoding='utf-8') as f:
-                        metadata_data = json.load(f)
-                        performance = metadata_data.get("performance", {})
-                        stored_format = performance.get("total_elapsed_minutes")
-                        total_elapsed_seconds = performance.get("total_elapsed_seconds")
-                        
-                        # Issue #638: Reformat if stored in old hh:mm format
-                        # Use total_elapsed_seconds to calculate correct mm:ss format
-                        if total_elapsed_seconds is not None and stored_format:
-                            # Check if stored format is legacy hh:mm (e.g., "00:05")
-                            if ':' in str(stored_format):
-                                parts = str(stored_format).split(':')
-                                if len(parts) == 2 and parts[0] == '00' and int(parts[1]) < 60:
-                                    # Legacy hh:mm format - reformat using total_elapsed_seconds
-                                    total_minutes_int = int(total_elapsed_seconds // 60)
-                                    seconds = int(total_elapsed_seconds % 60)
-                                    total_elapsed_minutes = f"{total_minutes_int:02d}:{seconds:02d}"
-                                else:
-                                    # Already in mm:ss format or other format
-                                    total_elapsed_minutes = stored_format
-                            else:
-                                # Not a time format, use as-is (decimal format)
-                                total_elapsed_minutes = stored_format
-                        else:
-                            # Fallback to stored format
-                            total_elapsed_minutes = stored_format
-                except Exception as e:
-                    logger.warning(f"Could not load metadata.json for {run_id}: {e}")
-            
+        for row in rows:
+            run_id = row["run_id"]
             # Format created_at for display (MM-DD HH:MM in DISPLAY_TIMEZONE)
-            created_at = run.get("created_at", "")
+            created_at = row["created_at"]
             formatted_date = format_local_display_datetime(created_at)
             
             run_entry = {
                 "run_id": run_id,
-                "description": description or f"Run {run_id[:8]}...",
+                "description": row["description"] or f"Run {run_id[:8]}...",
                 "created_at": created_at,
                 "formatted_date": formatted_date,
-                "event_summary": run.get("event_summary", {}),
-                "status": run.get("status", "complete"),
-                "total_elapsed_minutes": total_elapsed_minutes  # Issue #638: Add Run Time column
+                "event_summary": row["event_summary"],
+                "status": row["status"],
+                "total_elapsed_minutes": row["total_elapsed_minutes"]  # Issue #638: Add Run Time column
             }
             runs_list.append(run_entry)
         
         return JSONResponse(
-            content={"runs": runs_list},
+            content={"runs": runs_list, "total": total, "limit": limit, "offset": offset},
             headers={"Cache-Control": "public, max-age=60"}
         )
         
@@ -492,6 +452,33 @@ async def get_run_progress(run_id: str):
         raise HTTPException(status_code=500, detail="Failed to load run progress")
 
 
+@router.get("/api/runs/{run_id}/progress/stream")
+async def stream_run_progress(request: Request, run_id: str):
+    """
+    Push analysis progress as Server-Sent Events (one JSON payload per update).
+
+    Same payload as /api/runs/{run_id}/progress, delivered from the in-process
+    progress bus as phases start and finish; the stream ends after PASS/FAIL.
+    """
+    from app.core.v2.run_progress import progress_event_stream
+
+    if not run_id or "/" in run_id or ".." in run_id:
+        raise HTTPException(status_code=400, detail="Invalid run_id")
+    try:
+        events = await progress_event_stream(run_id, is_disconnected=request.is_disconnected)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Run {run_id} not found")
+    except Exception as e:
+        logger.error("Error opening progress stream for %s: %s", run_id, e)
+        raise HTTPException(status_code=500, detail="Failed to load run progress")
+
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/api/runs/{run_id}/summary")
 async def get_run_summary(run_id: str):
     """
@@ -727,6 +714,9 @@ async def update_run_metadata(request: Request, run_id: str, payload: UpdateRunR
     if not description:
         raise HTTPException(status_code=400, detail="Description cannot be empty")
 
+    from app.utils.run_catalog import index_signature, update_run_description
+
+    previous_signature = index_signature()
     entries = _load_analysis_index()
     entry = next((e for e in entries if e.get("run_id") == run_id), None)
     if entry is None:
@@ -749,6 +739,8 @@ async def update_run_metadata(request: Request, run_id: str, payload: UpdateRunR
         except Exception as e:
             logger.warning(f"Could not update analysis.json for {run_id}: {e}")
 
+    update_run_description(run_id, description, previous_signature=previous_signature)
+
     logger.info(f"Updated run {run_id} description to: {description!r}")
     return JSONResponse(content={"ok": True, "run_id": run_id, "description": description})
 
@@ -770,6 +762,9 @@ async def delete_run(request: Request, run_id: str):
             detail="Cannot delete the latest run (latest.json points to it). Run a newer analysis first.",
         )
 
+    from app.utils.run_catalog import index_signature, remove_runs
+
+    previous_signature = index_signature()
     entries = _load_analysis_index()
     remaining = [e for e in entries if e.get("run_id") != run_id]
     in_index = len(remaining) != len(entries)
@@ -792,6 +787,8 @@ async def delete_run(request: Request, run_id: str):
     if in_index:
         _write_analysis_index(remaining)
 
+    remove_runs([run_id], previous_signature=previous_signature)
+
     logger.info(f"Deleted run {run_id} (folder_deleted={folder_deleted}, index_updated={in_index})")
     return JSONResponse(
         content={"ok": True, "run_id": run_id, "folder_deleted": folder_deleted}
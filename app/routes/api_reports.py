@@ -12,7 +12,6 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-from io import BytesIO
 import logging
 import re
 import zipfile
@@ -228,22 +227,148 @@ def export_entries_for_kind(entries: List[Dict[str, Any]], kind: str) -> List[Di
     raise HTTPException(status_code=400, detail="kind must be 'reports' or 'data_files'")
 
 
+# Already-compressed formats are stored as-is; deflating them again costs CPU
+# for no size gain.
+_STORED_EXPORT_SUFFIXES = (".parquet", ".gz", ".zip", ".pdf", ".png", ".jpg", ".jpeg")
+_EXPORT_CHUNK_BYTES = 1024 * 1024
+_EXPORT_CACHE_DIRNAME = "exports"
+
+
+class _ZipChunkSink:
+    """Write-only, non-seekable sink; zipfile then streams with data descriptors."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _export_arcname(entry: Dict[str, Any], kind: str) -> str:
+    name = entry.get("name") or "file"
+    if kind == "reports" and entry.get("day"):
+        return f"{entry['day']}/{name}"
+    return name
+
+
+def _readable_export_files(entries: List[Dict[str, Any]], kind: str) -> List[Tuple[Path, str]]:
+    files = []
+    for entry in entries:
+        local_path = Path(entry["local_path"]) if entry.get("local_path") else None
+        if local_path is None or not local_path.is_file():
+            logger.warning("Skipping missing export file: %s", entry.get("path") or entry.get("name"))
+            continue
+        files.append((local_path, _export_arcname(entry, kind)))
+    return files
+
+
+def iter_export_zip_chunks(
+    entries: List[Dict[str, Any]],
+    kind: str,
+    chunk_size: int = _EXPORT_CHUNK_BYTES,
+):
+    """
+    Yield the export ZIP incrementally: each file is read in ``chunk_size``
+    blocks and its compressed bytes are yielded as soon as zipfile emits them,
+    so memory stays bounded regardless of archive size.
+    """
+    sink = _ZipChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+        for local_path, arcname in _readable_export_files(entries, kind):
+            zinfo = zipfile.ZipInfo.from_file(local_path, arcname=arcname)
+            if local_path.suffix.lower() in _STORED_EXPORT_SUFFIXES:
+                zinfo.compress_type = zipfile.ZIP_STORED
+            else:
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+            with open(local_path, "rb") as src, zf.open(zinfo, "w") as dest:
+                while True:
+                    block = src.read(chunk_size)
+                    if not block:
+                        break
+                    dest.write(block)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            data = sink.drain()
+            if data:
+                yield data
+    # Central directory is written on close
+    data = sink.drain()
+    if data:
+        yield data
+
+
 def build_export_zip_bytes(entries: List[Dict[str, Any]], kind: str) -> bytes:
     """Zip allow-listed artifacts as bytes. Arcnames keep day prefixes for reports."""
-    buf = BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for entry in entries:
-            name = entry.get("name") or "file"
-            local_path = Path(entry["local_path"]) if entry.get("local_path") else None
-            if local_path is None or not local_path.is_file():
-                logger.warning("Skipping missing export file: %s", entry.get("path") or name)
-                continue
-            if kind == "reports" and entry.get("day"):
-                arcname = f"{entry['day']}/{name}"
+    return b"".join(iter_export_zip_chunks(entries, kind))
+
+
+def export_cache_key(entries: List[Dict[str, Any]], kind: str) -> str:
+    """Fingerprint of the export contents (arcname, size, mtime of each file)."""
+    import hashlib
+
+    digest = hashlib.sha256(kind.encode("utf-8"))
+    for local_path, arcname in _readable_export_files(entries, kind):
+        stat = local_path.stat()
+        digest.update(f"\0{arcname}\0{stat.st_size}\0{stat.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def cached_export_path(run_id: str, filename: str, cache_key: str) -> Path:
+    """runflow/analysis/{run_id}/exports/{stem}-{cache_key}.zip"""
+    from app.utils.run_id import get_run_directory
+
+    stem = Path(filename).stem
+    return get_run_directory(run_id) / _EXPORT_CACHE_DIRNAME / f"{stem}-{cache_key}.zip"
+
+
+def iter_export_zip_caching(entries: List[Dict[str, Any]], kind: str, cache_path: Path):
+    """
+    Stream the export ZIP while teeing it into ``cache_path``.
+
+    The cache file only appears (atomic rename) once the whole archive was
+    generated; an aborted download leaves no partial file behind. Older
+    exports for the same file stem are removed when the new one lands.
+    """
+    import tempfile
+
+    tmp_file = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=cache_path.stem, suffix=".tmp", delete=False
+        )
+    except OSError as e:
+        logger.warning("Export cache unavailable at %s: %s", cache_path.parent, e)
+
+    completed = False
+    try:
+        for chunk in iter_export_zip_chunks(entries, kind):
+            if tmp_file is not None:
+                tmp_file.write(chunk)
+            yield chunk
+        completed = True
+    finally:
+        if tmp_file is not None:
+            tmp_file.close()
+            tmp_path = Path(tmp_file.name)
+            if completed:
+                stale_prefix = cache_path.stem.rsplit("-", 1)[0] + "-"
+                for old in cache_path.parent.glob(f"{stale_prefix}*.zip"):
+                    if old.name != cache_path.name:
+                        old.unlink(missing_ok=True)
+                tmp_path.replace(cache_path)
             else:
-                arcname = name
-            zf.write(local_path, arcname=arcname)
-    return buf.getvalue()
+                tmp_path.unlink(missing_ok=True)
 
 
 @router.get("/api/reports/list")
@@ -357,7 +482,12 @@ def export_reports_zip(
     run_id: Optional[str] = Query(None, description="Run ID (defaults to latest)"),
     day: Optional[str] = Query(None, description="Day code (fri|sat|sun|mon)")
 ):
-    """ZIP the Reports-page allow-list for the selected run/day (Issue #891)."""
+    """
+    ZIP the Reports-page allow-list for the selected run/day (Issue #891).
+
+    The archive is streamed as it is built and cached under the run's
+    exports/ folder, keyed by the contents' sizes and mtimes.
+    """
     kind_norm = (kind or "").strip().lower()
     if kind_norm not in {"reports", "data_files"}:
         raise HTTPException(status_code=400, detail="kind must be 'reports' or 'data_files'")
@@ -370,8 +500,7 @@ def export_reports_zip(
             detail=f"No {kind_norm.replace('_', ' ')} available for this run/day."
         )
 
-    zip_bytes = build_export_zip_bytes(entries, kind_norm)
-    if not zip_bytes:
+    if not _readable_export_files(entries, kind_norm):
         raise HTTPException(status_code=404, detail="Export files could not be read.")
 
     run_token = _safe_export_token(listing["run_id"])
@@ -379,10 +508,16 @@ def export_reports_zip(
     day_token = _safe_export_token(days[0] if len(days) == 1 else "all")
     suffix = "reports" if kind_norm == "reports" else "data_files"
     filename = f"runflow_{run_token}_{day_token}_{suffix}.zip"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+    # Serve a previously built export when none of its files changed;
+    # otherwise stream it and keep a copy for the next download.
+    cache_path = cached_export_path(listing["run_id"], filename, export_cache_key(entries, kind_norm))
+    if cache_path.is_file():
+        return FileResponse(cache_path, media_type="application/zip", headers=headers)
 
     return StreamingResponse(
-        BytesIO(zip_bytes),
+        iter_export_zip_caching(entries, kind_norm, cache_path),
         media_type="application/zip",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        headers=headers,
     )
-
@@ -5,13 +5,17 @@ Implements POST /runflow/v2/analyze endpoint with full validation and stubbed pi
 This enables early E2E testing of the API contract while core refactors proceed.
 
 Phase 2: API Route (Issue #496)
+
+Also exposes the analysis job queue (app/core/v2/analysis_queue.py):
+GET /jobs, GET /jobs/{run_id}, POST /jobs/{run_id}/cancel.
 """
 
-from fastapi import APIRouter, BackgroundTasks, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from fastapi.responses import JSONResponse
 import logging
 
 from app.api.models.v2 import V2AnalyzeRequest, V2AnalyzeResponse, V2ErrorResponse
+from app.core.v2.analysis_queue import ACTIVE_JOB_STATES, get_analysis_queue
 from app.core.v2.analysis_submit import submit_v2_analysis
 
 router = APIRouter()
@@ -40,3 +44,38 @@ async def analyze_v2(request: V2AnalyzeRequest, background_tasks: BackgroundTask
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=error_response.model_dump(),
         )
+
+
+@router.get(
+    "/jobs",
+    summary="List analysis jobs",
+    description="Queue limits plus queued, running and recently finished analyses in this process",
+)
+async def list_analysis_jobs() -> JSONResponse:
+    return JSONResponse(content=get_analysis_queue().snapshot(), headers={"Cache-Control": "no-store"})
+
+
+@router.get("/jobs/{run_id}", summary="Get analysis job state")
+async def get_analysis_job(run_id: str) -> JSONResponse:
+    job = get_analysis_queue().get(run_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No analysis job for run {run_id}")
+    return JSONResponse(content=job.to_dict(), headers={"Cache-Control": "no-store"})
+
+
+@router.post(
+    "/jobs/{run_id}/cancel",
+    summary="Cancel analysis job",
+    description="Queued jobs are dropped immediately; running jobs stop at the next phase boundary",
+)
+async def cancel_analysis_job(run_id: str) -> JSONResponse:
+    job = get_analysis_queue().cancel(run_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No analysis job for run {run_id}")
+    if job.state not in ACTIVE_JOB_STATES and not job.cancel_requested.is_set():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Analysis job for run {run_id} already {job.state}",
+        )
+    logger.info("Cancellation requested for run_id=%s (state=%s)", run_id, job.state)
+    return JSONResponse(content=job.to_dict())
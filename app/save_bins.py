@@ -4,8 +4,6 @@ import os, gzip, json, math, typing as t
 from dataclasses import is_dataclass, asdict
 from datetime import datetime, timezone
 
-import pyarrow as pa
-import pyarrow.parquet as pq
 import pandas as pd
 import numpy as np
 
@@ -352,11 +350,11 @@ def _update_features_with_severity(features: t.List[Feature], rows: t.List[JsonD
 
 
 def _write_parquet_file(rows: t.List[JsonDict], output_dir: str, base_name: str) -> str:
-    """Write parquet file from rows."""
-    table = pa.Table.from_pylist(rows)
+    """Write parquet file from rows (segment-sorted, one row group per segment)."""
+    from app.core.bin.parquet import write_bins_parquet
+
     parquet_path = os.path.join(output_dir, f"{base_name}.parquet")
-    pq.write_table(table, parquet_path, compression="zstd", compression_level=3)
-    return parquet_path
+    return write_bins_parquet(rows, parquet_path)
 
 
 def _coerce_metadata(metadata: JsonDict) -> JsonDict:
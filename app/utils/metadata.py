@@ -346,7 +346,7 @@ def update_latest_pointer(run_id: str) -> None:
     print(f"   📌 Updated latest.json → {run_id}")
 
 
-def append_to_run_index(metadata: Dict[str, Any]) -> None:
+def append_to_run_index(metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Append run metadata to runflow/analysis/index.json (Issue #456 Task 2).
     
@@ -361,6 +361,9 @@ def append_to_run_index(metadata: Dict[str, Any]) -> None:
     Args:
         metadata: Metadata dictionary from create_run_metadata()
         
+    Returns:
+        The appended index entry, or None if the run was already indexed
+        
     Format:
         [
           { "run_id": "...", "created_at": "...", "description": "...", "file_counts": {...}, "event_summary": {...}, ... },
@@ -428,7 +431,7 @@ def append_to_run_index(metadata: Dict[str, Any]) -> None:
     
     # Deduplication: Check if run_id already exists
     if any(entry.get("run_id") == run_id for entry in index_data):
-        return  # Already indexed, skip
+        return None  # Already indexed, skip
     
     # Append new entry
     index_data.append(index_entry)
@@ -436,6 +439,7 @@ def append_to_run_index(metadata: Dict[str, Any]) -> None:
     # Write back
     index_path.write_text(json.dumps(index_data, indent=2, default=str))
     print(f"   📊 Appended to index.json ({len(index_data)} total runs)")
+    return index_entry
 
 
 # ===== Phase 5: API Read Helpers (Issue #460) =====
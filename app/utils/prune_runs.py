@@ -2,6 +2,7 @@
 Utility to prune old run_ids from runflow directory.
 
 Issue #541: Keep only the last N runs, removing older run folders and updating index.json.
+The run catalog (app/utils/run_catalog.py) is updated to drop the pruned runs.
 Preserves latest.json to ensure it always points to the most recent run.
 
 Usage:
@@ -18,6 +19,7 @@ from typing import List, Dict, Any, Tuple
 import logging
 
 from app.utils.run_id import get_runflow_root
+from app.utils.run_catalog import index_signature, remove_runs
 
 logger = logging.getLogger(__name__)
 
@@ -272,9 +274,12 @@ def prune_runs(keep_n: int, dry_run: bool = False, confirm: bool = False) -> boo
             logger.warning(f"Only deleted {len(deleted_folders)} of {len(runs_to_delete)} run folders")
         
         # Update index.json
+        previous_signature = index_signature()
         success = update_index_json(runs_to_keep, dry_run=dry_run)
         
         if success:
+            if not dry_run:
+                remove_runs(runs_to_delete, previous_signature=previous_signature)
             if dry_run:
                 logger.info("[DRY-RUN] Pruning preview complete. Use --confirm to apply changes.")
             else:
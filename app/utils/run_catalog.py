@@ -0,0 +1,421 @@
+"""
+SQLite run catalog for the run history listings.
+
+``/api/runs/list`` used to open ``analysis.json`` and ``metadata.json`` for every
+run directory on each request. The catalog materializes the handful of fields the
+listing needs into ``runflow/analysis/catalog.sqlite3`` so a page of runs is one
+indexed query, independent of how many runs are on disk.
+
+index.json remains the source of truth. The catalog is updated when the v2
+pipeline finalizes run metadata and when runs are deleted or pruned, and it is
+rebuilt from disk on demand: whenever index.json changed behind its back (for
+example a manual edit or an older writer) or the catalog file is missing.
+
+Usage:
+    python -m app.utils.run_catalog --rebuild
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.utils.run_id import get_runflow_root
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "catalog.sqlite3"
+
+# Bump when the table layout or derived fields change; forces a rebuild.
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    created_at TEXT,
+    description TEXT,
+    status TEXT,
+    days TEXT NOT NULL DEFAULT '',
+    event_summary TEXT NOT NULL DEFAULT '{}',
+    total_elapsed_minutes TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_position ON runs (position);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_COLUMNS = (
+    "run_id", "position", "created_at", "description", "status",
+    "days", "event_summary", "total_elapsed_minutes",
+)
+
+
+def _analysis_root(runflow_root: Optional[Path]) -> Path:
+    return (runflow_root or get_runflow_root()) / "analysis"
+
+
+def catalog_path(runflow_root: Optional[Path] = None) -> Path:
+    """Path of the catalog database beside index.json."""
+    return _analysis_root(runflow_root) / CATALOG_FILENAME
+
+
+def _index_signature(analysis_root: Path) -> str:
+    """Cheap change marker for index.json (size + mtime, empty if missing)."""
+    index_path = analysis_root / "index.json"
+    try:
+        stat = index_path.stat()
+    except FileNotFoundError:
+        return ""
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def index_signature(runflow_root: Optional[Path] = None) -> str:
+    """
+    Change marker of the current index.json.
+
+    Writers capture it before rewriting index.json and pass it to
+    :func:`record_run` / :func:`remove_runs` / :func:`update_run_description`,
+    so edits made by other writers are never skipped by an incremental update.
+    """
+    return _index_signature(_analysis_root(runflow_root))
+
+
+def _connect(analysis_root: Path) -> sqlite3.Connection:
+    analysis_root.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(analysis_root / CATALOG_FILENAME, timeout=10.0)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute("SELECT value FROM catalog_meta WHERE key = ?", (key,)).fetchone()
+    return row["value"] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+    conn.execute(
+        "INSERT INTO catalog_meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, value),
+    )
+
+
+def format_total_elapsed(performance: Dict[str, Any]) -> Optional[str]:
+    """
+    Run Time column value from the run-level metadata performance block.
+
+    Issue #638: Legacy runs stored total_elapsed_minutes as hh:mm ("00:05");
+    those are reformatted to mm:ss from total_elapsed_seconds.
+    """
+    stored_format = performance.get("total_elapsed_minutes")
+    total_elapsed_seconds = performance.get("total_elapsed_seconds")
+
+    if total_elapsed_seconds is None or not stored_format:
+        return stored_format
+    if ':' not in str(stored_format):
+        # Not a time format, use as-is (decimal format)
+        return stored_format
+    parts = str(stored_format).split(':')
+    if len(parts) == 2 and parts[0] == '00' and int(parts[1]) < 60:
+        total_minutes_int = int(total_elapsed_seconds // 60)
+        seconds = int(total_elapsed_seconds % 60)
+        return f"{total_minutes_int:02d}:{seconds:02d}"
+    return stored_format
+
+
+def _read_json(path: Path, run_id: str) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning(f"Could not load {path.name} for {run_id}: {e}")
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def build_catalog_row(
+    entry: Dict[str, Any],
+    position: int,
+    analysis_root: Path,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Collect the listing fields for one index.json entry.
+
+    Reads the run's analysis.json (description) and, unless ``metadata`` is
+    passed in by the caller that just wrote it, the run-level metadata.json
+    (total elapsed time).
+    """
+    run_id = entry["run_id"]
+    run_dir = analysis_root / run_id
+
+    analysis = _read_json(run_dir / "analysis.json", run_id) or {}
+    if metadata is None:
+        metadata = _read_json(run_dir / "metadata.json", run_id) or {}
+
+    event_summary = entry.get("event_summary") or {}
+    events_by_day = event_summary.get("events_by_day") if isinstance(event_summary, dict) else None
+    days = sorted(events_by_day) if isinstance(events_by_day, dict) else []
+    performance = metadata.get("performance") or {}
+
+    return {
+        "run_id": run_id,
+        "position": position,
+        "created_at": entry.get("created_at") or "",
+        "description": analysis.get("description"),
+        "status": entry.get("status", "complete"),
+        # Comma-wrapped so a day filter is a plain LIKE '%,sat,%'
+        "days": "," + ",".join(str(d).lower() for d in days) + "," if days else "",
+        "event_summary": json.dumps(event_summary, default=str),
+        "total_elapsed_minutes": format_total_elapsed(performance),
+    }
+
+
+def _upsert_rows(conn: sqlite3.Connection, rows: Iterable[Dict[str, Any]]) -> None:
+    placeholders = ", ".join("?" for _ in _COLUMNS)
+    updates = ", ".join(f"{c} = excluded.{c}" for c in _COLUMNS if c != "run_id")
+    conn.executemany(
+        f"INSERT INTO runs ({', '.join(_COLUMNS)}) VALUES ({placeholders}) "
+        f"ON CONFLICT(run_id) DO UPDATE SET {updates}",
+        [tuple(row[c] for c in _COLUMNS) for row in rows],
+    )
+
+
+def _load_index_entries(analysis_root: Path) -> List[Dict[str, Any]]:
+    index_path = analysis_root / "index.json"
+    if not index_path.exists():
+        return []
+    try:
+        entries = json.loads(index_path.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning(f"Could not load index.json for run catalog: {e}")
+        return []
+    if not isinstance(entries, list):
+        return []
+    return [e for e in entries if isinstance(e, dict) and e.get("run_id")]
+
+
+def rebuild_catalog(runflow_root: Optional[Path] = None) -> int:
+    """
+    Rebuild the catalog from index.json and the run directories on disk.
+
+    Returns:
+        Number of runs in the rebuilt catalog
+    """
+    analysis_root = _analysis_root(runflow_root)
+    signature = _index_signature(analysis_root)
+    entries = _load_index_entries(analysis_root)
+    rows = [build_catalog_row(entry, pos, analysis_root) for pos, entry in enumerate(entries)]
+
+    with closing(_connect(analysis_root)) as conn, conn:
+        conn.execute("DELETE FROM runs")
+        _upsert_rows(conn, rows)
+        _set_meta(conn, "schema_version", str(_SCHEMA_VERSION))
+        _set_meta(conn, "index_signature", signature)
+
+    logger.info(f"Rebuilt run catalog: {len(rows)} runs")
+    return len(rows)
+
+
+def ensure_catalog(runflow_root: Optional[Path] = None) -> None:
+    """Rebuild the catalog if it is missing, outdated, or behind index.json."""
+    analysis_root = _analysis_root(runflow_root)
+    if (analysis_root / CATALOG_FILENAME).exists():
+        with closing(_connect(analysis_root)) as conn:
+            fresh = (
+                _get_meta(conn, "schema_version") == str(_SCHEMA_VERSION)
+                and _get_meta(conn, "index_signature") == _index_signature(analysis_root)
+            )
+        if fresh:
+            return
+    rebuild_catalog(runflow_root)
+
+
+def _sync_after_index_write(
+    analysis_root: Path,
+    apply_change,
+    runflow_root: Optional[Path],
+    previous_signature: Optional[str],
+) -> None:
+    """
+    Apply an incremental change for an index.json write the caller just made.
+
+    The incremental path is only valid if the catalog was in sync with
+    index.json as it was before that write (``previous_signature``, captured
+    by the caller with :func:`index_signature`); otherwise, or when the caller
+    did not capture it, fall back to a full rebuild.
+    """
+    with closing(_connect(analysis_root)) as conn, conn:
+        in_sync = (
+            previous_signature is not None
+            and _get_meta(conn, "schema_version") == str(_SCHEMA_VERSION)
+            and _get_meta(conn, "index_signature") == previous_signature
+        )
+        if in_sync:
+            apply_change(conn)
+            _set_meta(conn, "index_signature", _index_signature(analysis_root))
+    if not in_sync:
+        rebuild_catalog(runflow_root)
+
+
+def record_run(
+    entry: Dict[str, Any],
+    metadata: Optional[Dict[str, Any]] = None,
+    runflow_root: Optional[Path] = None,
+    previous_signature: Optional[str] = None,
+) -> None:
+    """
+    Add or refresh one run after its index.json entry was written.
+
+    Called from pipeline finalization with the combined run metadata that was
+    just written, so the run's metadata.json is not re-read.
+    ``previous_signature`` is :func:`index_signature` from before that write.
+    """
+    analysis_root = _analysis_root(runflow_root)
+    try:
+        def apply_change(conn: sqlite3.Connection) -> None:
+            existing = conn.execute(
+                "SELECT position FROM runs WHERE run_id = ?", (entry["run_id"],)
+            ).fetchone()
+            if existing is not None:
+                position = existing["position"]
+            else:
+                position = conn.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM runs"
+                ).fetchone()[0]
+            _upsert_rows(conn, [build_catalog_row(entry, position, analysis_root, metadata)])
+
+        _sync_after_index_write(analysis_root, apply_change, runflow_root, previous_signature)
+    except Exception as e:
+        # The catalog is derived data; ensure_catalog() rebuilds it on next read
+        logger.warning(f"Could not update run catalog for {entry.get('run_id')}: {e}")
+
+
+def remove_runs(
+    run_ids: Iterable[str],
+    runflow_root: Optional[Path] = None,
+    previous_signature: Optional[str] = None,
+) -> None:
+    """Drop deleted runs after index.json was rewritten without them."""
+    run_ids = list(run_ids)
+    if not run_ids:
+        return
+    analysis_root = _analysis_root(runflow_root)
+    try:
+        def apply_change(conn: sqlite3.Connection) -> None:
+            conn.executemany("DELETE FROM runs WHERE run_id = ?", [(r,) for r in run_ids])
+
+        _sync_after_index_write(analysis_root, apply_change, runflow_root, previous_signature)
+    except Exception as e:
+        logger.warning(f"Could not remove {len(run_ids)} runs from run catalog: {e}")
+
+
+def update_run_description(
+    run_id: str,
+    description: str,
+    runflow_root: Optional[Path] = None,
+    previous_signature: Optional[str] = None,
+) -> None:
+    """Refresh the catalog after index.json/analysis.json descriptions changed."""
+    analysis_root = _analysis_root(runflow_root)
+    try:
+        def apply_change(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "UPDATE runs SET description = ? WHERE run_id = ?", (description, run_id)
+            )
+
+        _sync_after_index_write(analysis_root, apply_change, runflow_root, previous_signature)
+    except Exception as e:
+        logger.warning(f"Could not update run catalog description for {run_id}: {e}")
+
+
+def list_runs(
+    limit: Optional[int] = None,
+    offset: int = 0,
+    status: Optional[str] = None,
+    day: Optional[str] = None,
+    search: Optional[str] = None,
+    runflow_root: Optional[Path] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Page through catalogued runs, newest first.
+
+    Args:
+        limit: Page size (None returns every matching run)
+        offset: Number of matching runs to skip
+        status: Exact status filter (e.g. "complete", "failed")
+        day: Only runs that analysed this day code (fri|sat|sun|mon)
+        search: Case-insensitive substring of run_id or description
+
+    Returns:
+        Tuple of (rows, total matching runs). Rows carry run_id, created_at,
+        description, status, event_summary (dict) and total_elapsed_minutes.
+    """
+    ensure_catalog(runflow_root)
+
+    clauses, params = [], []
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    if day:
+        clauses.append("days LIKE ?")
+        params.append(f"%,{day.lower()},%")
+    if search:
+        clauses.append("(run_id LIKE ? OR description LIKE ?)")
+        params.extend([f"%{search}%"] * 2)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    page_sql = f"SELECT * FROM runs {where} ORDER BY position DESC"
+    page_params = list(params)
+    if limit is not None:
+        page_sql += " LIMIT ? OFFSET ?"
+        page_params.extend([int(limit), int(offset)])
+    elif offset:
+        page_sql += " LIMIT -1 OFFSET ?"
+        page_params.append(int(offset))
+
+    with closing(_connect(_analysis_root(runflow_root))) as conn:
+        total = conn.execute(f"SELECT COUNT(*) FROM runs {where}", params).fetchone()[0]
+        rows = conn.execute(page_sql, page_params).fetchall()
+
+    result = []
+    for row in rows:
+        item = {key: row[key] for key in _COLUMNS if key not in ("position", "days")}
+        item["event_summary"] = json.loads(row["event_summary"] or "{}")
+        result.append(item)
+    return result, total
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Maintain the SQLite run catalog")
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Rebuild the catalog from index.json and run folders'
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    if not args.rebuild:
+        parser.print_help()
+        sys.exit(1)
+    count = rebuild_catalog()
+    print(f"Run catalog rebuilt at {catalog_path()}: {count} runs")
+
+
+if __name__ == '__main__':
+    main()
@@ -16,7 +16,7 @@ import pandas as pd
 
 from app.io.loader import load_locations, load_segments
 from app.core.gpx.processor import load_all_courses, generate_segment_coordinates
-from app.location_report import project_point_to_course
+from app.location_report import course_line_utm, project_point_to_course
 from shapely.geometry import LineString, Point
 from pyproj import Transformer
 
@@ -107,14 +107,10 @@ def validate_location_projections(
             # Get full course distance for this location using location_report function
             try:
                 # Get course line coordinates
-                course_points = [(p.lat, p.lon) for p in course.points]
-                if not course_points:
+                if len(course) == 0:
                     continue
                 
-                course_points_utm = [WGS84_TO_UTM.transform(lon, lat) for lat, lon in course_points]
-                course_line_utm = LineString(course_points_utm)
-                
-                distance_km = project_point_to_course(location_point_utm, course_line_utm)
+                distance_km = project_point_to_course(location_point_utm, course_line_utm(course))
                 if distance_km is None:
                     continue
             except Exception as e:
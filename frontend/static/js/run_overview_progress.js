@@ -153,13 +153,16 @@
     }
 
     /**
-     * Poll progress until PASS/FAIL. onComplete(status) when terminal.
+     * Follow progress until PASS/FAIL. onComplete(status) when terminal.
+     * Uses the Server-Sent Events stream when available and falls back to
+     * polling /progress if the stream cannot be opened or drops.
      * Returns a stop() function.
      */
     function watchRunProgress(runId, fetchJson, onComplete) {
         var stopped = false;
         var started = Date.now();
         var timer = null;
+        var source = null;
         var seenRunning = false;
 
         function delayMs() {
@@ -168,38 +171,49 @@
             return 15000;
         }
 
+        function closeStream() {
+            if (source) {
+                source.close();
+                source = null;
+            }
+        }
+
+        // Returns true while progress should keep being followed.
+        function handle(data) {
+            renderProgressCard(data);
+            var status = data && data.status;
+            if (status === 'running') {
+                seenRunning = true;
+                return true;
+            }
+            if (status === 'PASS' || status === 'FAIL') {
+                if (status === 'PASS' && !seenRunning) {
+                    hideProgressCard();
+                    if (typeof onComplete === 'function') onComplete(status, data);
+                    return false;
+                }
+                if (typeof onComplete === 'function') onComplete(status, data);
+                if (status === 'PASS') {
+                    setTimeout(function () {
+                        if (!stopped) hideProgressCard();
+                    }, 3000);
+                }
+                return false;
+            }
+            // Unknown — keep following briefly if we never saw running
+            if (!seenRunning && Date.now() - started < 15000) {
+                return true;
+            }
+            hideProgressCard();
+            return false;
+        }
+
         function tick() {
             if (stopped || !runId) return;
             fetchJson('/api/runs/' + encodeURIComponent(runId) + '/progress')
                 .then(function (data) {
                     if (stopped) return;
-                    renderProgressCard(data);
-                    var status = data && data.status;
-                    if (status === 'running') {
-                        seenRunning = true;
-                        timer = setTimeout(tick, delayMs());
-                        return;
-                    }
-                    if (status === 'PASS' || status === 'FAIL') {
-                        if (status === 'PASS' && !seenRunning) {
-                            hideProgressCard();
-                            if (typeof onComplete === 'function') onComplete(status, data);
-                            return;
-                        }
-                        if (typeof onComplete === 'function') onComplete(status, data);
-                        if (status === 'PASS') {
-                            setTimeout(function () {
-                                if (!stopped) hideProgressCard();
-                            }, 3000);
-                        }
-                        return;
-                    }
-                    // Unknown — keep polling briefly if we never saw running
-                    if (!seenRunning && Date.now() - started < 15000) {
-                        timer = setTimeout(tick, delayMs());
-                    } else {
-                        hideProgressCard();
-                    }
+                    if (handle(data)) timer = setTimeout(tick, delayMs());
                 })
                 .catch(function () {
                     if (stopped) return;
@@ -211,9 +225,37 @@
                 });
         }
 
-        tick();
+        function stream() {
+            if (stopped || !runId) return;
+            if (typeof global.EventSource !== 'function') {
+                tick();
+                return;
+            }
+            source = new global.EventSource(
+                '/api/runs/' + encodeURIComponent(runId) + '/progress/stream',
+                { withCredentials: true }
+            );
+            source.onmessage = function (ev) {
+                if (stopped) return;
+                var data = null;
+                try {
+                    data = JSON.parse(ev.data);
+                } catch (e) {
+                    return;
+                }
+                if (!handle(data)) closeStream();
+            };
+            source.onerror = function () {
+                // Stream refused or dropped (proxy, server restart): poll instead.
+                closeStream();
+                if (!stopped) timer = setTimeout(tick, 1000);
+            };
+        }
+
+        stream();
         return function stop() {
             stopped = true;
+            closeStream();
             if (timer) clearTimeout(timer);
             stopElapsedTicker();
         };
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Golden-Dataset Pipeline Benchmark
+
+Runs the v2 pipeline offline on small / medium / large synthetic races
+(see app/core/v2/benchmark.py), writes per-phase wall time, peak RSS and
+artifact sizes to a results file, and exits non-zero when a phase regresses
+beyond the tolerance against the stored baseline.
+
+Usage:
+    python scripts/benchmark_pipeline.py                        # all datasets
+    python scripts/benchmark_pipeline.py --datasets small medium
+    python scripts/benchmark_pipeline.py --update-baseline      # record a new baseline
+    # Or with Docker:
+    docker exec run-density-dev python scripts/benchmark_pipeline.py --datasets small
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.v2.benchmark import (  # noqa: E402
+    BENCHMARK_DATASETS,
+    DEFAULT_MIN_SECONDS,
+    DEFAULT_RSS_TOLERANCE,
+    DEFAULT_TOLERANCE,
+    compare_to_baseline,
+    run_benchmarks,
+)
+
+DEFAULT_BASELINE = Path(__file__).parent.parent / "benchmarks" / "baseline.json"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the v2 pipeline on golden datasets")
+    parser.add_argument("--datasets", nargs="+", default=list(BENCHMARK_DATASETS),
+                        choices=list(BENCHMARK_DATASETS), help="Datasets to run (default: all)")
+    parser.add_argument("--workdir", type=Path, default=None,
+                        help="Where inputs and run outputs go (default: a temp dir)")
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"),
+                        help="Results file (default: benchmark_results.json)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help=f"Baseline results to compare against (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown per phase (default: %(default)s)")
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS,
+                        help="Ignore phase slowdowns smaller than this (default: %(default)s)")
+    parser.add_argument("--rss-tolerance", type=float, default=DEFAULT_RSS_TOLERANCE,
+                        help="Allowed relative peak RSS growth (default: %(default)s)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write these results as the new baseline instead of comparing")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    if args.workdir is not None:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        results = run_benchmarks(args.datasets, args.workdir)
+    else:
+        with tempfile.TemporaryDirectory(prefix="runflow-bench-") as tmp:
+            results = run_benchmarks(args.datasets, Path(tmp))
+
+    args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Results written to {args.output}")
+    for name, result in results["datasets"].items():
+        print(f"  {name}: {result['runners']} runners, {result['wall_seconds']:.1f}s, "
+              f"peak RSS {result['peak_rss_mb']} MB "
+              f"(largest worker {result.get('peak_worker_rss_mb')} MB), "
+              f"{result['artifacts']['total_bytes'] / 1024 / 1024:.1f} MB artifacts")
+
+    if args.update_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+        baseline_datasets = dict(baseline.get("datasets") or {})
+        baseline_datasets.update(results["datasets"])
+        # Keep hand-tuned per-phase tolerances across baseline refreshes
+        updated = {**results, "datasets": baseline_datasets}
+        if baseline.get("tolerances"):
+            updated["tolerances"] = baseline["tolerances"]
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(updated, indent=2), encoding="utf-8")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare_to_baseline(
+        results,
+        baseline,
+        tolerance=args.tolerance,
+        min_seconds=args.min_seconds,
+        rss_tolerance=args.rss_tolerance,
+    )
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) against {args.baseline}:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print(f"✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
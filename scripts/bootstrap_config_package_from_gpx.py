@@ -22,8 +22,8 @@ from app.core.gpx.processor import parse_gpx_file
 def gpx_to_coordinates(gpx_path: Path) -> tuple[list[list[float]], str, float]:
     gpx = parse_gpx_file(str(gpx_path))
     coords: list[list[float]] = []
-    for p in gpx.points:
-        c = [round(p.lon, 6), round(p.lat, 6)]
+    for lon, lat in zip(gpx.lon.tolist(), gpx.lat.tolist()):
+        c = [round(lon, 6), round(lat, 6)]
         if not coords or c[0] != coords[-1][0] or c[1] != coords[-1][1]:
             coords.append(c)
     return coords, gpx.name, gpx.total_distance_km
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Seed the local map tile store used by segment map snapshots.
+
+Downloads basemap tiles into the tile store (see app/core/artifacts/tile_store.py)
+so segment maps can render offline with RUNFLOW_MAP_TILES_OFFLINE=true.
+
+Usage:
+    python scripts/seed_map_tiles.py --run-id <run_id>            # tiles for every day's segment maps
+    python scripts/seed_map_tiles.py --geojson path/to/segments.geojson
+    python scripts/seed_map_tiles.py --bbox -66.70,45.90,-66.55,46.00 --zooms 12-16
+    # Or with Docker:
+    docker exec run-density-dev python scripts/seed_map_tiles.py --run-id <run_id>
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Set, Tuple
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.artifacts.segment_maps import bbox_tiles, snapshot_tiles  # noqa: E402
+from app.core.artifacts.tile_store import (  # noqa: E402
+    DEFAULT_SEED_WORKERS,
+    get_tile_store_dir,
+    seed_tiles,
+)
+
+
+def _run_geojson_paths(run_id: str) -> List[Path]:
+    from app.utils.run_id import get_run_directory
+
+    return sorted(get_run_directory(run_id).glob("*/ui/geospatial/segments.geojson"))
+
+
+def _parse_zooms(value: str) -> List[int]:
+    if "-" in value:
+        low, high = value.split("-", 1)
+        return list(range(int(low), int(high) + 1))
+    return [int(z) for z in value.split(",")]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Seed the local map tile store")
+    parser.add_argument("--run-id", action="append", default=[], help="Seed tiles for a run's segment maps")
+    parser.add_argument("--geojson", action="append", default=[], type=Path, help="segments.geojson to seed tiles for")
+    parser.add_argument("--bbox", help="min_lon,min_lat,max_lon,max_lat to seed a region")
+    parser.add_argument("--zooms", default="12-16", help="Zoom levels for --bbox, e.g. 12-16 or 13,15 (default: 12-16)")
+    parser.add_argument("--overwrite", action="store_true", help="Re-download tiles already in the store")
+    parser.add_argument("--workers", type=int, default=DEFAULT_SEED_WORKERS, help="Concurrent downloads")
+    args = parser.parse_args()
+
+    geojson_paths = list(args.geojson)
+    for run_id in args.run_id:
+        paths = _run_geojson_paths(run_id)
+        if not paths:
+            print(f"❌ No segments.geojson found for run {run_id}")
+            return 1
+        geojson_paths.extend(paths)
+
+    tiles: Set[Tuple[int, int, int]] = set()
+    for path in geojson_paths:
+        tiles |= snapshot_tiles(json.loads(path.read_text(encoding="utf-8")))
+    if args.bbox:
+        min_lon, min_lat, max_lon, max_lat = (float(v) for v in args.bbox.split(","))
+        tiles |= bbox_tiles(min_lon, min_lat, max_lon, max_lat, _parse_zooms(args.zooms))
+    if not tiles:
+        parser.error("nothing to seed: pass --run-id, --geojson or --bbox")
+
+    print(f"Seeding {len(tiles)} tiles into {get_tile_store_dir()}")
+    counts = seed_tiles(tiles, overwrite=args.overwrite, max_workers=args.workers)
+    print(
+        f"✅ downloaded {counts['downloaded']}, already present {counts['present']}, "
+        f"failed {counts['failed']}"
+    )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Unit tests for the bounded analysis job queue."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.core.v2 import analysis_queue, analysis_submit
+from app.core.v2.analysis_queue import (
+    AnalysisCancelledError,
+    AnalysisJobQueue,
+    clear_analysis_queue,
+    get_analysis_queue,
+    raise_if_cancelled,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_queue(monkeypatch):
+    monkeypatch.setenv("RUNFLOW_ANALYSIS_BASE_MB", "400")
+    monkeypatch.setenv("RUNFLOW_ANALYSIS_MB_PER_1K_RUNNERS", "120")
+    clear_analysis_queue()
+    yield
+    clear_analysis_queue()
+
+
+def _admit_in_background(queue, job):
+    admitted = threading.Event()
+    result = {}
+
+    def wait():
+        result["ok"] = queue.wait_for_slot(job, on_wait=lambda ahead: result.setdefault("ahead", ahead))
+        admitted.set()
+
+    threading.Thread(target=wait, daemon=True).start()
+    return admitted, result
+
+
+def test_concurrency_limit_admits_fifo_as_slots_free():
+    queue = AnalysisJobQueue(max_concurrent=1, memory_budget_mb=None)
+    first, second = queue.submit("r1"), queue.submit("r2")
+
+    assert queue.wait_for_slot(first)
+    admitted, result = _admit_in_background(queue, second)
+    assert not admitted.wait(0.2)
+    assert queue.get("r2").state == "queued"
+
+    queue.finish(first)
+    assert admitted.wait(2.0) and result == {"ok": True, "ahead": 1}
+    snapshot = queue.snapshot()
+    assert [j["state"] for j in snapshot["jobs"]] == ["finished", "running"]
+    assert snapshot["running"] == 1 and snapshot["queued"] == 0
+
+
+def test_memory_budget_holds_back_jobs_that_do_not_fit():
+    queue = AnalysisJobQueue(max_concurrent=4, memory_budget_mb=1000.0)
+    big = queue.submit("big", runners=20000)  # 2800 MB: over budget, but alone
+    assert big.estimated_mb == pytest.approx(2800.0)
+    assert queue.wait_for_slot(big)
+
+    small = queue.submit("small", runners=1000)
+    admitted, _ = _admit_in_background(queue, small)
+    assert not admitted.wait(0.2)
+    queue.finish(big, "failed", "boom")
+    assert admitted.wait(2.0)
+    assert queue.get("big").to_dict()["error"] == "boom"
+
+
+def test_cancel_queued_and_running_jobs():
+    queue = AnalysisJobQueue(max_concurrent=1, memory_budget_mb=None)
+    running, waiting = queue.submit("r1"), queue.submit("r2")
+    assert queue.wait_for_slot(running)
+    admitted, result = _admit_in_background(queue, waiting)
+
+    queue.cancel("r2")
+    assert admitted.wait(2.0) and result["ok"] is False
+    assert queue.get("r2").state == "cancelled"
+
+    assert queue.cancel("r1").state == "running"
+    assert queue.is_cancel_requested("r1")
+    assert queue.cancel("missing") is None
+
+
+def test_phase_boundary_raises_for_cancelled_run():
+    queue = get_analysis_queue()
+    job = queue.submit("r-cancel")
+    assert queue.wait_for_slot(job)
+    raise_if_cancelled("r-cancel")
+
+    queue.cancel("r-cancel")
+    with pytest.raises(AnalysisCancelledError):
+        raise_if_cancelled("r-cancel")
+
+
+def test_enqueue_records_pipeline_outcome(monkeypatch):
+    monkeypatch.setattr(
+        analysis_submit,
+        "run_analysis_background",
+        lambda **kwargs: (analysis_queue.JOB_FAILED, "bad input"),
+    )
+
+    thread = analysis_submit.enqueue_analysis_run(
+        events=[], segments_file="s.csv", locations_file="l.csv", flow_file="f.csv",
+        data_dir="/tmp", run_id="queued-outcome", request_payload={}, runners=5000,
+    )
+    thread.join(timeout=2.0)
+
+    job = get_analysis_queue().get("queued-outcome").to_dict()
+    assert (job["state"], job["error"], job["runners"]) == ("failed", "bad input", 5000)
+    assert job["estimated_mb"] == 1000.0
+
+
+def test_cancel_during_flow_compute_stops_the_run(monkeypatch):
+    from types import SimpleNamespace
+
+    import pandas as pd
+
+    from app.core.v2 import flow as flow_v2
+    from app.core.v2.models import Day
+
+    sat = SimpleNamespace(name="full", day=Day.SAT, start_time=420)
+    sun = SimpleNamespace(name="half", day=Day.SUN, start_time=440)
+    monkeypatch.setattr(flow_v2, "extract_event_pairs_from_flow_csv", lambda df, events: [(sat, sat), (sun, sun)])
+    monkeypatch.setattr(flow_v2, "filter_runners_by_day", lambda df, day, events: pd.DataFrame({"runner_id": [1]}))
+    monkeypatch.setattr(flow_v2, "find_flow_csv_segments_for_pair", lambda *args: pd.DataFrame({"seg_id": ["A1"]}))
+    monkeypatch.setattr(flow_v2, "create_flow_segments_from_flow_csv", lambda *args: pd.DataFrame({"seg_id": ["A1"]}))
+    computed = []
+    monkeypatch.setattr(flow_v2, "analyze_temporal_flow_segments", lambda *a, **k: computed.append(1))
+
+    queue = get_analysis_queue()
+    job = queue.submit("r-flow")
+    assert queue.wait_for_slot(job)
+    started = []
+
+    class Monitor:
+        def start_phase(self, name, **kwargs):
+            started.append(name)
+            if name == "phase_4_2_flow_compute":
+                queue.cancel("r-flow")
+            raise_if_cancelled("r-flow")
+
+        def complete_phase(self, *args, **kwargs):
+            pass
+
+    with pytest.raises(AnalysisCancelledError):
+        flow_v2.analyze_temporal_flow_segments_v2(
+            events=[sat, sun],
+            timelines=[SimpleNamespace(day=Day.SAT), SimpleNamespace(day=Day.SUN)],
+            segments_df=pd.DataFrame(),
+            all_runners_df=pd.DataFrame(),
+            flow_file="flow.csv",
+            data_dir="data",
+            perf_monitor=Monitor(),
+            flow_df=pd.DataFrame({"event_a": ["full"]}),
+        )
+    # Raised at the first day's compute boundary; the second day never starts
+    assert started == ["phase_4_1_flow_build_segments", "phase_4_2_flow_compute"]
+    assert computed == []
@@ -0,0 +1,46 @@
+"""Unit tests for vectorized per-segment bins rollups."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.core.bin.rollup import (
+    flagged_durations_per_segment,
+    read_bins_columns,
+    worst_bin_per_segment,
+)
+
+
+def test_worst_bin_matches_groupby_idxmax_with_ties_and_nan():
+    bins = pd.DataFrame({
+        "segment_id": ["B1", "A1", "A1", "B1", "A1", "B1"],
+        "density": [0.5, 0.9, 0.9, np.nan, 0.1, 0.5],
+        "bin_id": ["b0", "b1", "b2", "b3", "b4", "b5"],
+    })
+    expected = bins.loc[bins.groupby("segment_id")["density"].idxmax()]
+    worst = worst_bin_per_segment(bins, "density")
+    assert worst["bin_id"].tolist() == expected["bin_id"].tolist() == ["b1", "b0"]
+
+
+def test_read_bins_columns_projects_existing_columns(tmp_path: Path):
+    path = tmp_path / "bins.parquet"
+    pd.DataFrame({"segment_id": ["A1"], "density": [1.0], "geometry": ["x"]}).to_parquet(path)
+    df = read_bins_columns(path, ("segment_id", "seg_id", "density"))
+    assert list(df.columns) == ["segment_id", "density"]
+    assert "geometry" in read_bins_columns(path).columns
+
+
+def test_flagged_durations_per_segment_sum_and_span():
+    t0 = pd.Timestamp("2025-10-25T07:00:00Z")
+    flagged = pd.DataFrame({
+        "segment_id": ["A1", "A1", "B1", "B1"],
+        "t_start": [t0, t0 + pd.Timedelta(minutes=5), t0, pd.NaT],
+        "t_end": [t0 + pd.Timedelta(seconds=30), t0 + pd.Timedelta(minutes=5, seconds=30),
+                  t0 + pd.Timedelta(seconds=60), t0],
+    })
+    durations = flagged_durations_per_segment(flagged)
+    assert durations == {"A1": (60.0, 330.0), "B1": (60.0, 60.0)}
+    assert flagged_durations_per_segment(flagged.iloc[0:0]) == {}
@@ -0,0 +1,63 @@
+"""Unit tests for the groupby/column-wise bin summary builder."""
+
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+
+from app.bin_intelligence import FlaggingConfig
+from app.core.bin.summary import format_time_for_display, generate_bin_summary
+
+
+def _per_row_segments(bins_df: pd.DataFrame) -> dict:
+    """Reference: the previous per-segment filter + iterrows construction."""
+    filtered_bins = bins_df[bins_df["flag_severity"] != "none"]
+    segments = {}
+    for segment_id in bins_df["segment_id"].unique():
+        segment_bins = bins_df[bins_df["segment_id"] == segment_id]
+        segment_filtered = filtered_bins[filtered_bins["segment_id"] == segment_id]
+        segments[segment_id] = {
+            "meta": {"total_bins": len(segment_bins), "flagged_bins": len(segment_filtered)},
+            "bins": [
+                {
+                    "start_km": round(float(row["start_km"]), 3),
+                    "end_km": round(float(row["end_km"]), 3),
+                    "start_time": format_time_for_display(str(row["t_start"])),
+                    "end_time": format_time_for_display(str(row["t_end"])),
+                    "density": round(float(row["density"]), 3),
+                    "rate": round(float(row["rate"]), 3),
+                    "los_class": str(row["los_class"]),
+                    "flag": row["flag_reason"] if pd.notna(row["flag_reason"]) else "flagged",
+                }
+                for _, row in segment_filtered.iterrows()
+            ],
+        }
+    return segments
+
+
+def _bins() -> pd.DataFrame:
+    return pd.DataFrame({
+        "segment_id": ["B1", "A1", "B1", "C1", "A1", "B1"],
+        "start_km": [0.0, 1.0005, 0.2, 0.0, 1.2, 0.4],
+        "end_km": [0.2, 1.2, 0.4, 0.2, 1.4, 0.6],
+        "t_start": ["2025-10-26T07:00:00Z", "2025-10-26T07:02:00+00:00", "not-a-time",
+                    "2025-10-26T07:00:00Z", "2025-10-26T07:04:00Z", "2025-10-26T07:02:00Z"],
+        "t_end": ["2025-10-26T07:02:00Z", "2025-10-26T07:04:00+00:00", "not-a-time",
+                  "2025-10-26T07:02:00Z", "2025-10-26T07:06:00Z", "2025-10-26T07:04:00Z"],
+        "density": [0.1235, 2.675, 0.5, 0.01, 1.0004999, 0.3],
+        "rate": [1, 2.0015, 3, 4, 5, 6],
+        "los_class": ["A", "F", "C", "A", "E", None],
+        "flag_severity": ["none", "critical", "watch", "none", "watch", "watch"],
+        "flag_reason": [None, "density", None, None, "rate", "both"],
+    })
+
+
+def test_summary_matches_per_row_construction():
+    bins_df = _bins()
+    summary = generate_bin_summary(bins_df, FlaggingConfig())
+
+    assert json.dumps(summary["segments"]) == json.dumps(_per_row_segments(bins_df))
+    assert list(summary["segments"]) == ["B1", "A1", "C1"]
+    assert summary["segments"]["C1"] == {"meta": {"total_bins": 1, "flagged_bins": 0}, "bins": []}
+    assert summary["segments"]["B1"]["bins"][0]["start_time"] == "not-a-time"
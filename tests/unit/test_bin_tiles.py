@@ -0,0 +1,107 @@
+"""Unit tests for the resident per-window bin tile index behind /api/map/bins."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import math
+import os
+
+import pandas as pd
+
+from app.core.bin.tiles import bbox_to_lonlat, clear_bin_tile_cache, get_bin_tile_index
+
+
+def _square(lon: float, lat: float, size: float = 0.001):
+    return {"type": "Polygon", "coordinates": [[
+        [lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat],
+    ]]}
+
+
+def _write_bins(bins_dir):
+    bins_dir.mkdir(parents=True, exist_ok=True)
+    rows = []
+    for window, start in enumerate(("07:00", "07:02", "07:04")):
+        end = ("07:02", "07:04", "07:06")[window]
+        for seg, km in (("A1", 0.0), ("A1", 0.2), ("B1", 5.0)):
+            rows.append({
+                "bin_id": f"{seg}:{km:.3f}-{km + 0.2:.3f}", "segment_id": seg,
+                "start_km": km, "end_km": km + 0.2,
+                "t_start": f"2025-10-26T{start}:00Z", "t_end": f"2025-10-26T{end}:00Z",
+                "density": 0.1 * (window + 1), "rate": 1.0, "los_class": "A",
+                "flag_severity": "critical" if seg == "B1" else "none", "flag_reason": "none",
+            })
+    # Shuffle so the window-major layout is not just file order
+    pd.DataFrame(rows[::-1]).to_parquet(bins_dir / "bins.parquet")
+    features = [
+        {"type": "Feature", "properties": {"bin_id": "A1:0.000-0.200"}, "geometry": _square(-66.64, 45.96)},
+        {"type": "Feature", "properties": {"bin_id": "A1:0.200-0.400"}, "geometry": _square(-66.63, 45.96)},
+        {"type": "Feature", "properties": {"bin_id": "B1:5.000-5.200"}, "geometry": _square(-66.50, 45.90)},
+    ]
+    with gzip.open(bins_dir / "bins.geojson.gz", "wt", encoding="utf-8") as f:
+        json.dump({"type": "FeatureCollection", "features": features}, f)
+
+
+def test_window_slice_with_viewport_and_severity(tmp_path):
+    clear_bin_tile_cache()
+    _write_bins(tmp_path)
+    index = get_bin_tile_index(tmp_path)
+    assert index.window_count == 3
+
+    everything = index.query(1)
+    assert sorted(f["properties"]["bin_id"] for f in everything) == [
+        "A1:0.000-0.200", "A1:0.200-0.400", "B1:5.000-5.200",
+    ]
+    props = everything[0]["properties"]
+    assert (props["window_idx"], props["t_start_hhmm"], props["t_end_hhmm"]) == (1, "07:02", "07:04")
+    assert props["density"] == 0.2 and everything[0]["geometry"]["type"] == "Polygon"
+
+    viewport = index.query(1, bbox=(-66.645, 45.955, -66.62, 45.97))
+    assert sorted(f["properties"]["bin_id"] for f in viewport) == ["A1:0.000-0.200", "A1:0.200-0.400"]
+
+    critical = index.query(2, severity="critical")
+    assert [f["properties"]["bin_id"] for f in critical] == ["B1:5.000-5.200"]
+    assert index.query(3) == [] and index.query(-1) == []
+
+
+def test_web_mercator_bbox_is_converted():
+    lon, lat = -66.64, 45.96
+    x = 6378137.0 * math.radians(lon)
+    y = 6378137.0 * math.log(math.tan(math.pi / 4.0 + math.radians(lat) / 2.0))
+    minx, miny, _, _ = bbox_to_lonlat((x, y, x + 10.0, y + 10.0))
+    assert abs(minx - lon) < 1e-9 and abs(miny - lat) < 1e-9
+    assert bbox_to_lonlat((-66.7, 45.9, -66.6, 46.0)) == (-66.7, 45.9, -66.6, 46.0)
+
+
+def test_index_is_cached_until_files_change(tmp_path):
+    clear_bin_tile_cache()
+    _write_bins(tmp_path)
+    index = get_bin_tile_index(tmp_path)
+    assert get_bin_tile_index(tmp_path) is index
+
+    parquet = tmp_path / "bins.parquet"
+    stat = parquet.stat()
+    os.utime(parquet, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert get_bin_tile_index(tmp_path) is not index
+
+
+def test_bins_default_to_the_latest_run_day_like_the_manifest(tmp_path, monkeypatch):
+    from app.api import map as map_api
+    from app.utils import run_id as run_id_utils
+
+    run_dir = tmp_path / "runflow" / "analysis" / "run-1"
+    _write_bins(run_dir / "sat" / "bins")
+    legacy_dir = tmp_path / "reports" / "2025-10-26"
+    legacy_dir.mkdir(parents=True)
+    (legacy_dir / "bins.parquet").write_bytes(b"")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(run_id_utils, "get_latest_run_id", lambda: "run-1")
+    monkeypatch.setattr(run_id_utils, "get_run_directory", lambda run_id: run_dir)
+    monkeypatch.setattr(run_id_utils, "resolve_selected_day", lambda run_id, day: (day or "sat", ["sat"]))
+
+    assert map_api._resolve_bin_data_dir(None, None) == run_dir / "sat" / "bins"
+    assert map_api._resolve_bin_data_dir("run-1", "sat") == run_dir / "sat" / "bins"
+
+    # No run to default to: the legacy reports/ directory is still served
+    monkeypatch.setattr(run_id_utils, "get_latest_run_id", lambda: None)
+    assert map_api._resolve_bin_data_dir(None, None).resolve() == legacy_dir.resolve()
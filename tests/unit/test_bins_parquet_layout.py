@@ -0,0 +1,68 @@
+"""Unit tests for the segment-sorted bins.parquet writer and pushdown reader."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from app.core.bin.parquet import write_bins_parquet
+from app.core.bin.rollup import read_bins_columns
+
+
+def _rows():
+    rows = []
+    for seg in ("B2", "A1"):
+        for window in (1, 0):
+            for km in (0.2, 0.0):
+                rows.append({
+                    "bin_id": f"{seg}:{km:.3f}-{km + 0.2:.3f}", "segment_id": seg,
+                    "start_km": km, "end_km": km + 0.2,
+                    "t_start": f"2025-10-26T07:0{2 * window}:00Z", "t_end": f"2025-10-26T07:0{2 * window + 2}:00Z",
+                    "window_idx": window, "density": 0.5 if seg == "A1" else 0.1, "rate": 1,
+                    "los_class": "A", "flag_severity": "watch" if seg == "A1" else "none",
+                    "event": ["full", "half"],
+                })
+    return rows
+
+
+def test_rows_sorted_by_segment_then_window_with_row_group_per_segment(tmp_path):
+    path = tmp_path / "bins.parquet"
+    write_bins_parquet(_rows(), path)
+
+    df = pd.read_parquet(path)
+    # Segments keep first-appearance order; windows and km ascend within each
+    assert df["segment_id"].tolist() == ["B2"] * 4 + ["A1"] * 4
+    assert df["window_idx"].tolist()[:4] == [0, 0, 1, 1]
+    assert df["start_km"].tolist()[:2] == [0.0, 0.2]
+    assert df["rate"].dtype == "float64" and df["t_start"].iloc[0] == "2025-10-26T07:00:00Z"
+    assert list(df["event"].iloc[0]) == ["full", "half"]
+
+    meta = pq.ParquetFile(path).metadata
+    assert meta.num_row_groups == 2
+    seg_col = meta.schema.to_arrow_schema().get_field_index("segment_id")
+    stats = meta.row_group(1).column(seg_col).statistics
+    assert (stats.min, stats.max) == ("A1", "A1")
+
+
+def test_dataframe_input_round_trips(tmp_path):
+    source = pd.DataFrame(_rows()).iloc[::2]  # non-range index, as after a filter
+    path = tmp_path / "bins.parquet"
+    write_bins_parquet(source, path)
+
+    df = pd.read_parquet(path)
+    assert isinstance(df.index, pd.RangeIndex) and len(df) == len(source)
+    assert set(df.columns) == set(source.columns)
+
+
+def test_read_bins_columns_pushes_predicates_down(tmp_path):
+    path = tmp_path / "bins.parquet"
+    write_bins_parquet(_rows(), path)
+
+    df = read_bins_columns(
+        path, ["segment_id", "window_idx", "density", "missing"], segments=["A1"], windows=[1]
+    )
+    assert list(df.columns) == ["segment_id", "window_idx", "density"]
+    assert df["segment_id"].unique().tolist() == ["A1"] and df["window_idx"].unique().tolist() == [1]
+
+    flagged = read_bins_columns(path, ["segment_id"], flagged_only=True)
+    assert len(flagged) == 4 and set(flagged["segment_id"]) == {"A1"}
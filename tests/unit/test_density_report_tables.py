@@ -0,0 +1,95 @@
+"""Unit tests for the column-wise density report table renderer."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from app.core.reports.density.template_engine import DensityReportTemplateEngine
+
+
+def _frames():
+    segments = pd.DataFrame({
+        "segment_id": ["B1", "A1", "C1"], "seg_label": ["Loop", "Start", "Finish"],
+        "width_m": [3.5, 5, 4.0], "segment_type": ["on_course_open", "start_corral", "on_course_open"],
+    })
+    bins = pd.DataFrame({"segment_id": ["A1", "A1", "B1"], "start_km": [0.0, 0.2, 1.0]})
+    summary = pd.DataFrame({
+        "segment_id": ["A1", "B1", "C1"], "seg_label": ["Start", "Loop", "Finish"],
+        "flagged_bins": [3, 1, 0], "total_bins": [40, 80, 10], "flagged_percentage": [7.5, 1.25, 0.0],
+        "worst_bin_start_km": [0.2, 1.0, 0.0], "worst_bin_end_km": [0.4, 1.2, 0.2],
+        "worst_bin_t_start": ["2025-10-26T07:20:00Z", pd.Timestamp("2025-10-26T07:42:00Z"), None],
+        "worst_bin_density": [0.81234, 0.5, 0.1], "worst_bin_los": ["D", "C", "A"],
+        "worst_severity": ["critical", "watch", "none"], "worst_reason": ["density", "rate", "none"],
+        "peak_rate_per_m_per_min": [30.0, 0.0, 1.0], "peak_density": [0.81234, 0.5, 0.1], "peak_los": ["D", "C", "A"],
+    })
+    flagged = pd.DataFrame({
+        "segment_id": ["B1", "A1", "A1", "A1"], "seg_label": ["Loop", "Start", "Start", "Start"],
+        "start_km": [1.0, 0.2, 0.0, 0.2], "end_km": [1.2, 0.4, 0.2, 0.4],
+        "t_start": ["2025-10-26T07:42:00Z", "2025-10-26T07:22:00Z", "2025-10-26T07:20:00Z", "07:24"],
+        "t_end": ["2025-10-26T07:44:00Z", "2025-10-26T07:24:00Z", "2025-10-26T07:22:00Z", "07:26"],
+        "density": [0.5, 0.81234, 0.7, 0.6], "rate": [1, 2.5, 2.25, 2.0], "los_class": ["C", "D", "D", "C"],
+    })
+    windows = pd.DataFrame({
+        "segment_id": ["A1", "A1", "B1"],
+        "t_start": ["2025-10-26T07:00:00Z", "2025-10-26T07:30:00Z", "2025-10-26T07:40:00Z"],
+        "t_end": ["2025-10-26T07:30:00Z", "2025-10-26T08:00:00Z", "2025-10-26T07:50:00Z"],
+    })
+    return segments, bins, summary, flagged, windows
+
+
+@pytest.fixture
+def no_iterrows(monkeypatch):
+    def _fail(self):
+        raise AssertionError("tables must not be built with iterrows")
+
+    monkeypatch.setattr(pd.DataFrame, "iterrows", _fail)
+
+
+def test_flagged_tables_render_column_wise(no_iterrows):
+    segments, _, summary, flagged, _ = _frames()
+    engine = DensityReportTemplateEngine()
+
+    table = engine._generate_flagged_segments_complete(summary, segments).split("\n")[4:]
+    assert table == [
+        "| A1 | Start | 3 | 40 | 7.5% | 0.2-0.4 | 07:20 | 0.8123 | 2.500 | 5% | D | critical | density |",
+        "| B1 | Loop | 1 | 80 | 1.3% | 1.0-1.2 | 07:42 | 0.5000 | N/A | N/A | C | watch | rate |",
+    ]
+    assert engine._generate_flagged_bins_summary(summary).split("\n")[4:] == [
+        "| A1 | Start | 3 | 40 | 7.5% | density |",
+        "| B1 | Loop | 1 | 80 | 1.3% | rate |",
+    ]
+
+    detail = engine._generate_bin_level_detail(flagged).split("\n")
+    assert detail[4:10] == [
+        "### Start (A1)",
+        "",
+        "| Start (km) | End (km) | Start (t) | End (t) | Density (p/m²) | Rate (p/s) | LOS |",
+        "|------------|----------|-----------|---------|----------------|-------------|-----|",
+        "| 0.2 | 0.4 | 07:24 | 07:26 | 0.600 | 2.000 | C |",
+        "| 0.0 | 0.2 | 07:20 | 07:22 | 0.700 | 2.250 | D |",
+    ]
+    assert detail[11:13] == ["", "### Loop (B1)"]
+
+
+def test_course_overview_and_segment_details(no_iterrows):
+    segments, bins, summary, _, windows = _frames()
+    engine = DensityReportTemplateEngine()
+
+    overview = engine._generate_course_overview(segments.drop(columns="segment_type"), windows, bins)
+    assert overview.split("\n")[4:7] == [
+        "| A1 | Start | N/A | 5.0 | 2 |",
+        "| B1 | Loop | N/A | 3.5 | 1 |",
+        "| C1 | Finish | N/A | 4.0 | 0 |",
+    ]
+
+    details = engine._generate_segment_details(segments, windows, summary).split("\n")
+    assert details[2:8] == [
+        "### Loop (B1)",
+        "- **Schema:** on_course_open · **Width:** 3.5 m · **Bins:** 80",
+        "- **Active:** 07:40 → 07:50",
+        "- **Peaks:** Density 0.5000 p/m² (LOS C), Rate 0.00 p/s",
+        "- **Worst Bin:** 1.0-1.2 km at 07:42 — watch (rate)",
+        "- **Mitigations:** Monitor via visual flow sensors",
+    ]
+    assert "- **Worst Bin:** 0.0-0.2 km at N/A — none (none)" in details
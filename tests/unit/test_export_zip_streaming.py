@@ -0,0 +1,66 @@
+"""Unit tests for streamed, cached Overview ZIP exports."""
+
+from __future__ import annotations
+
+import os
+from io import BytesIO
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from app.routes.api_reports import (
+    export_cache_key,
+    iter_export_zip_caching,
+    iter_export_zip_chunks,
+)
+
+
+def _entries(tmp_path):
+    report = tmp_path / "Density.md"
+    report.write_text("density\n" * 5000, encoding="utf-8")
+    bins = tmp_path / "bins.parquet"
+    bins.write_bytes(os.urandom(50_000))
+    return [
+        {"name": "Density.md", "day": "sun", "local_path": str(report)},
+        {"name": "bins.parquet", "day": "sun", "local_path": str(bins)},
+        {"name": "gone.csv", "day": "sun", "local_path": str(tmp_path / "gone.csv")},
+    ]
+
+
+def test_chunks_form_a_zip_with_parquet_stored(tmp_path):
+    entries = _entries(tmp_path)
+    chunks = list(iter_export_zip_chunks(entries, "reports", chunk_size=8192))
+
+    assert len(chunks) > 2
+    with ZipFile(BytesIO(b"".join(chunks))) as zf:
+        assert zf.namelist() == ["sun/Density.md", "sun/bins.parquet"]
+        assert zf.getinfo("sun/bins.parquet").compress_type == ZIP_STORED
+        assert zf.getinfo("sun/Density.md").compress_type == ZIP_DEFLATED
+        assert zf.read("sun/bins.parquet") == (tmp_path / "bins.parquet").read_bytes()
+        assert zf.testzip() is None
+
+
+def test_cache_written_only_after_complete_stream(tmp_path):
+    entries = _entries(tmp_path)
+    cache_dir = tmp_path / "exports"
+    cache_dir.mkdir()
+    stale = cache_dir / "runflow_r_sun_reports-0000.zip"
+    stale.write_bytes(b"old")
+    cache_path = cache_dir / f"runflow_r_sun_reports-{export_cache_key(entries, 'reports')}.zip"
+
+    aborted = iter_export_zip_caching(entries, "reports", cache_path)
+    next(aborted)
+    aborted.close()
+    assert not cache_path.exists() and list(cache_dir.iterdir()) == [stale]
+
+    body = b"".join(iter_export_zip_caching(entries, "reports", cache_path))
+    assert cache_path.read_bytes() == body
+    assert list(cache_dir.iterdir()) == [cache_path]
+
+
+def test_cache_key_tracks_file_changes(tmp_path):
+    entries = _entries(tmp_path)
+    key = export_cache_key(entries, "reports")
+    assert export_cache_key(entries, "reports") == key
+    assert export_cache_key(entries, "data_files") != key
+
+    (tmp_path / "Density.md").write_text("changed", encoding="utf-8")
+    assert export_cache_key(entries, "reports") != key
@@ -0,0 +1,64 @@
+"""Unit tests for the single-pass true-pass convergence search."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from app.core.flow.flow import (
+    _collect_all_true_pass_points,
+    _true_pass_check_points,
+    calculate_convergence_points,
+)
+from app.utils.constants import TRUE_PASS_DETECTION_TOLERANCE_SECONDS
+
+
+def _brute_force_points(df_a, df_b, start_a, start_b, from_km, to_km, step_km):
+    tol = TRUE_PASS_DETECTION_TOLERANCE_SECONDS
+    base_a = start_a + df_a["start_offset"].to_numpy(float)
+    base_b = start_b + df_b["start_offset"].to_numpy(float)
+    pace_a = df_a["pace"].to_numpy(float) * 60.0
+    pace_b = df_b["pace"].to_numpy(float) * 60.0
+    sa, sb = (base_a + pace_a * from_km)[:, None], (base_b + pace_b * from_km)[None, :]
+    ea, eb = (base_a + pace_a * to_km)[:, None], (base_b + pace_b * to_km)[None, :]
+    related = (
+        ((sa > sb) & (ea < eb))
+        | ((sb > sa) & (eb < ea))
+        | ((np.abs(sa - sb) <= 2 * tol) & (np.abs(ea - eb) <= 2 * tol))
+    )
+    points = []
+    for km in _true_pass_check_points(from_km, to_km, step_km):
+        near = np.abs((base_a + pace_a * km)[:, None] - (base_b + pace_b * km)[None, :]) <= tol
+        if np.any(near & related):
+            points.append(float(km))
+    return points
+
+
+def _runners(rng, n):
+    return pd.DataFrame({"pace": rng.uniform(4.0, 8.0, n), "start_offset": rng.uniform(0.0, 60.0, n)})
+
+
+def test_true_pass_points_match_per_point_broadcast():
+    rng = np.random.default_rng(7)
+    for start_b_min in (0.0, 6.0, 15.0, 40.0):
+        df_a, df_b = _runners(rng, 40), _runners(rng, 35)
+        start_times = {"full": 0.0, "half": start_b_min}
+        expected = _brute_force_points(df_a, df_b, 0.0, start_b_min * 60.0, 0.5, 3.0, 0.01)
+        got = _collect_all_true_pass_points(df_a, df_b, "full", "half", start_times, 0.5, 3.0, 0.01)
+        assert got == expected
+
+
+def test_true_pass_points_ignore_runners_without_pace():
+    df_a = pd.DataFrame({"pace": [5.0, np.nan], "start_offset": [0.0, 0.0]})
+    df_b = pd.DataFrame({"pace": [5.0], "start_offset": [0.0]})
+    points = _collect_all_true_pass_points(df_a, df_b, "a", "b", {"a": 0, "b": 0}, 0.0, 0.05, 0.01)
+    assert points == _true_pass_check_points(0.0, 0.05, 0.01)
+
+
+def test_convergence_points_deduplicated_within_tolerance():
+    df = pd.DataFrame({"pace": [5.0, 5.0], "start_offset": [0.0, 1.0]})
+    cps = calculate_convergence_points(df, df, "a", "b", {"a": 0, "b": 0}, 0.0, 1.0, 0.0, 1.0)
+    kms = [cp.km for cp in cps]
+    assert kms[0] == 0.0
+    assert all(b - a >= 0.1 - 1e-9 for a, b in zip(kms, kms[1:]))
+    assert {cp.type for cp in cps} == {"true_pass"}
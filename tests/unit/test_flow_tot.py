@@ -0,0 +1,65 @@
+"""Unit tests for columnar time-over-threshold and distance progression."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from app.core.flow.flow import (
+    _stepped_values,
+    analyze_distance_progression,
+    calculate_tot_metrics,
+    generate_distance_progression_chart,
+)
+
+
+def _runners(rng, n):
+    return pd.DataFrame({
+        "runner_id": range(n),
+        "pace": rng.uniform(4.0, 8.0, n),
+        "start_offset": rng.uniform(0.0, 300.0, n),
+    })
+
+
+def test_stepped_values_match_accumulating_loop():
+    expected, value = [], 0.1
+    while value <= 2.0:
+        expected.append(value)
+        value += 0.03
+    assert _stepped_values(0.1, 2.0, 0.03).tolist() == expected
+    assert _stepped_values(2.0, 1.0, 0.03).tolist() == []
+
+
+def test_tot_counts_and_periods_derive_from_bin_columns():
+    rng = np.random.default_rng(9)
+    df_a, df_b = _runners(rng, 60), _runners(rng, 40)
+    start_times = {"full": 0.0, "half": 3.0}
+
+    tot = calculate_tot_metrics(df_a, df_b, "full", "half", start_times, 2.5,
+                                2.0, 3.0, 2.0, 3.0, 200.0, [5, 30], 20)
+
+    cols = tot["bin_columns"]
+    enter_a = df_a["start_offset"].to_numpy() + df_a["pace"].to_numpy() * 60.0 * 2.4
+    exit_a = df_a["start_offset"].to_numpy() + df_a["pace"].to_numpy() * 60.0 * 2.6
+    t = cols["time_seconds"][:, np.newaxis]
+    assert cols["count_a"].tolist() == ((enter_a <= t) & (exit_a >= t)).sum(axis=1).tolist()
+    assert [row["total_count"] for row in tot["bin_data"]] == cols["total_count"].tolist()
+
+    periods = tot["tot_metrics"]["threshold_5"]["periods"]
+    above = cols["total_count"] >= 5
+    assert len(periods) == int(np.sum(np.diff(np.concatenate(([0], above.astype(int)))) == 1))
+    for period in periods:
+        start = int(np.searchsorted(cols["time_seconds"], period["start_seconds"]))
+        assert above[start] and (start == 0 or not above[start - 1])
+
+
+def test_distance_progression_columns_and_chart():
+    rng = np.random.default_rng(1)
+    df_a, df_b = _runners(rng, 12), _runners(rng, 8)
+
+    progression = analyze_distance_progression(df_a, df_b, "full", "half", {}, 1.0, 1.2, 1.1, 1.3, 0.1)
+
+    assert progression["progression_columns"]["distance_km"].tolist() == [1.0, 1.1, 1.2]
+    assert [row["total_count"] for row in progression["progression_data"]] == [12, 20, 20]
+    chart = generate_distance_progression_chart(progression)
+    assert "full: 12 runners" in chart and "[A+B]" in chart
@@ -0,0 +1,164 @@
+"""Unit tests for the shared per-segment conflict-zone evaluation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from app.core.flow.flow import (
+    ConflictZone,
+    ConflictZoneEvaluator,
+    ConvergencePoint,
+    _detect_temporal_overlap_and_passes,
+    _enclosing_counts,
+    build_segment_flow_cache,
+    calculate_convergence_zone_overlaps_binned,
+    calculate_overtaking_load_arrays,
+    calculate_overtaking_loads,
+    calculate_zone_metrics_vectorized_binned,
+    calculate_zone_metrics_vectorized_direct,
+    validate_per_runner_entry_exit_f1,
+)
+from app.utils.constants import DISTANCE_BIN_SIZE_KM
+
+
+def _runners(rng, prefix, n):
+    return pd.DataFrame({
+        "runner_id": [f"{prefix}{i}" for i in range(n)],
+        "pace": rng.uniform(4.0, 8.0, n),
+        "start_offset": rng.uniform(0.0, 90.0, n),
+        "distance": rng.choice([10.0, 21.1], n),
+    })
+
+
+def test_overtaking_loads_match_pairwise_reference():
+    rng = np.random.default_rng(3)
+    df_a, df_b = _runners(rng, "a", 30), _runners(rng, "b", 25)
+    start_times = {"half": 0.0, "10k": 4.0}
+
+    loads_a, loads_b, avg_a, avg_b, max_a, max_b = calculate_overtaking_loads(
+        df_a, df_b, "half", "10k", start_times, 3.0, 2.0, 5.0, 2.0, 5.0
+    )
+
+    def times(df, start_sec):
+        pace = df["pace"].to_numpy() * 60.0
+        base = start_sec + df["start_offset"].to_numpy()
+        return list(zip(df["runner_id"], base + pace * 2.0, base + pace * 5.0))
+
+    ref_a, ref_b = _detect_temporal_overlap_and_passes(times(df_a, 0.0), times(df_b, 240.0), 5.0)
+    assert loads_a == ref_a and loads_b == ref_b
+    assert max_a == max(ref_a.values()) and max_b == max(ref_b.values())
+    assert avg_a == sum(ref_a.values()) / len(ref_a)
+
+
+def test_enclosing_counts_match_broadcast_across_blocks():
+    rng = np.random.default_rng(5)
+    inner_start = rng.integers(0, 30, 50).astype(float)
+    inner_end = inner_start + rng.integers(0, 30, 50)
+    outer_start = rng.integers(0, 30, 40).astype(float)
+    outer_end = outer_start + rng.integers(0, 30, 40)
+    outer_start[3] = np.nan
+    inner_end[7] = np.nan
+
+    expected = (
+        (outer_start[np.newaxis, :] < inner_start[:, np.newaxis])
+        & (outer_end[np.newaxis, :] > inner_end[:, np.newaxis])
+    ).sum(axis=1)
+    got = _enclosing_counts(inner_start, inner_end, outer_start, outer_end, block=6)
+    assert got.tolist() == expected.tolist()
+
+
+def test_overtaking_load_arrays_skip_runners_short_of_zone_end():
+    df_a = pd.DataFrame({"runner_id": ["a0", "a1"], "pace": [4.0, 4.0],
+                         "start_offset": [100.0, 100.0], "distance": [10.0, 1.0]})
+    df_b = pd.DataFrame({"runner_id": ["b0"], "pace": [6.0], "start_offset": [0.0], "distance": [10.0]})
+
+    loads = calculate_overtaking_load_arrays(df_a, df_b, "half", "10k", {}, 1.0, 0.5, 1.5, 0.5, 1.5)
+
+    assert loads.runner_index_a.tolist() == [0]
+    assert loads.loads_a.tolist() == [1] and loads.loads_b.tolist() == [0]
+    assert (loads.avg_load_a, loads.max_load_a, loads.max_load_b) == (1.0, 1, 0)
+    assert loads.to_dicts() == ({"a0": 1}, {"b0": 0})
+
+
+def test_f1_validation_counts_passes_by_overtaking_runner():
+    # a0 starts behind b0 and finishes ahead of it; a1 and b1 never meet
+    df_a = pd.DataFrame({"runner_id": ["a0", "a1"], "pace": [4.0, 4.0], "start_offset": [100.0, 5000.0]})
+    df_b = pd.DataFrame({"runner_id": ["b0", "b1"], "pace": [6.0, 6.0], "start_offset": [0.0, -5000.0]})
+
+    result = validate_per_runner_entry_exit_f1(df_a, df_b, "half", "10k", {}, 0.0, 2.0, 0.0, 2.0, 1000.0)
+
+    assert (result["overtakes_a"], result["overtakes_b"]) == (1, 0)
+    assert (result["copresence_a"], result["copresence_b"]) == (1, 1)
+    assert result["conflict_zone_a"] == (0.5, 1.5)
+    assert [(p["a_id"], p["b_id"]) for p in result["overlap_pairs"]] == [("a0", "b0")]
+
+
+def test_binned_overlaps_reuse_one_evaluator():
+    rng = np.random.default_rng(11)
+    df_a, df_b = _runners(rng, "a", 20), _runners(rng, "b", 20)
+    start_times = {"half": 0.0, "10k": 2.0}
+    evaluator = ConflictZoneEvaluator(df_a, df_b, "half", "10k", start_times)
+
+    shared = calculate_convergence_zone_overlaps_binned(
+        df_a, df_b, "half", "10k", start_times, 2.5, 2.0, 3.0, 2.0, 3.0,
+        5.0, 200.0, use_time_bins=True, overlap_duration_minutes=25.0, evaluator=evaluator,
+    )
+    fresh = calculate_convergence_zone_overlaps_binned(
+        df_a, df_b, "half", "10k", start_times, 2.5, 2.0, 3.0, 2.0, 3.0,
+        5.0, 200.0, use_time_bins=True, overlap_duration_minutes=25.0,
+    )
+
+    assert shared == fresh
+    assert list(df_a.columns) == ["runner_id", "pace", "start_offset", "distance"]
+
+
+def test_binned_zone_metrics_match_union_of_direct_bins():
+    rng = np.random.default_rng(17)
+    df_a, df_b = _runners(rng, "a", 40), _runners(rng, "b", 30)
+    df_b.loc[0, "runner_id"] = "a0"  # same ID in both events counts once
+    cache = build_segment_flow_cache(df_a, df_b, "half", "10k", {"half": 0.0, "10k": 2.0}, 2.0, 2.5, 2.0, 2.5)
+    zone = ConflictZone(ConvergencePoint(km=2.2, type="true_pass"), 2.1, 2.3, 2.1, 2.3, 0, "true_pass", {})
+
+    binned = calculate_zone_metrics_vectorized_binned(zone, cache, 0.0, 500.0, 0.0, False, True)
+
+    expected = {key: set() for key in ("_a_bibs_overtakes", "_b_bibs_overtakes", "_a_bibs_overtaken",
+                                       "_b_bibs_overtaken", "_a_bibs_copresence", "_b_bibs_copresence")}
+    encounters = 0
+    for bin_idx in range(5):
+        lo, hi = 2.0 + bin_idx * DISTANCE_BIN_SIZE_KM, min(2.0 + (bin_idx + 1) * DISTANCE_BIN_SIZE_KM, 2.5)
+        direct = calculate_zone_metrics_vectorized_direct(
+            ConflictZone(zone.cp, lo, hi, lo, hi, 0, "true_pass", {}), cache, 0.0
+        )
+        for key in expected:
+            expected[key] |= direct[key]
+        encounters += direct["unique_encounters"]
+
+    for key, bibs in expected.items():
+        assert binned[key] == bibs
+    assert binned["overtaking_a"] == len(expected["_a_bibs_overtakes"])
+    assert binned["unique_encounters"] == encounters
+    assert binned["participants_involved"] == len(set().union(*expected.values()))
+
+
+def test_overtaking_loads_combine_repeated_runner_ids():
+    rng = np.random.default_rng(11)
+    df_a, df_b = _runners(rng, "a", 30), _runners(rng, "b", 25)
+    df_a["runner_id"] = [f"a{i % 12}" for i in range(30)]
+    df_b["runner_id"] = [f"b{i % 7}" for i in range(25)]
+    start_times = {"half": 0.0, "10k": 4.0}
+
+    loads = calculate_overtaking_load_arrays(df_a, df_b, "half", "10k", start_times, 3.0, 2.0, 5.0, 2.0, 5.0)
+
+    def times(df, start_sec):
+        pace = df["pace"].to_numpy() * 60.0
+        base = start_sec + df["start_offset"].to_numpy()
+        return list(zip(df["runner_id"], base + pace * 2.0, base + pace * 5.0))
+
+    ref_a, ref_b = _detect_temporal_overlap_and_passes(times(df_a, 0.0), times(df_b, 240.0), 5.0)
+    assert loads.to_dicts() == (ref_a, ref_b)
+    assert loads.runner_loads_a.tolist() == list(ref_a.values())
+    assert loads.runner_loads_b.tolist() == list(ref_b.values())
+    assert (loads.max_load_a, loads.max_load_b) == (max(ref_a.values()), max(ref_b.values()))
+    assert loads.avg_load_a == sum(ref_a.values()) / len(ref_a)
+    assert loads.avg_load_b == sum(ref_b.values()) / len(ref_b)
@@ -0,0 +1,105 @@
+"""Unit tests for the array-backed GPX course model."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.core.gpx.processor import (
+    GPXCourse,
+    GPXPoint,
+    clear_gpx_course_cache,
+    cumulative_km,
+    find_coordinates_at_distance,
+    parse_gpx_file,
+    slice_polyline_by_km,
+)
+
+
+def _write_gpx(path: Path, n: int = 11) -> None:
+    lines = [
+        '<?xml version="1.0"?>',
+        '<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">',
+        "<trk><name>line</name><trkseg>",
+    ]
+    for i in range(n):
+        lines.append(f'<trkpt lat="{45.0 + i * 0.0009}" lon="-66.0"></trkpt>')
+    lines.append("</trkseg></trk></gpx>")
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def test_parse_gpx_file_builds_readonly_arrays(tmp_path: Path):
+    gpx = tmp_path / "c.gpx"
+    _write_gpx(gpx)
+    clear_gpx_course_cache()
+    course = parse_gpx_file(gpx)
+    assert course.name == "line"
+    assert len(course) == 11
+    assert course.km[0] == 0.0
+    assert course.total_distance_km == pytest.approx(course.km[-1])
+    assert course.total_distance_km == pytest.approx(1.0, rel=0.01)
+    assert course.cum_km == pytest.approx(cumulative_km(course.course_points))
+    with pytest.raises(ValueError):
+        course.lat[0] = 0.0
+    assert [p.distance_km for p in course.points] == pytest.approx(course.cum_km)
+
+
+def test_parse_gpx_file_cache_keyed_by_content(tmp_path: Path):
+    a = tmp_path / "a.gpx"
+    b = tmp_path / "b.gpx"
+    _write_gpx(a)
+    _write_gpx(b)
+    clear_gpx_course_cache()
+    assert parse_gpx_file(a) is parse_gpx_file(b)
+    _write_gpx(b, n=5)
+    assert len(parse_gpx_file(b)) == 5
+
+
+def test_coordinates_at_interpolates_and_clamps():
+    # Expected values from the previous per-point linear scan
+    points = [GPXPoint(lat=45.0 + i * 0.0009, lon=-66.0) for i in range(11)]
+    course = GPXCourse(name="line", points=points)
+    assert course.km[3] == pytest.approx(0.30022630194)
+    assert course.km[-1] == pytest.approx(1.0007543398012)
+    kms = np.array([-1.0, 0.0, 0.05, 0.55, course.km[3], course.km[-1], 5.0])
+    lat, lon = course.coordinates_at(kms)
+    expected_lat = [45.0, 45.0, 45.00044966080296, 45.004946268832555, 45.0027, 45.009, 45.009]
+    assert lat.tolist() == pytest.approx(expected_lat, abs=1e-12)
+    assert lon.tolist() == [-66.0] * len(kms)
+
+    assert find_coordinates_at_distance(course, 0.55) == pytest.approx((45.004946268832555, -66.0), abs=1e-12)
+    assert find_coordinates_at_distance(course, 5.0) == pytest.approx((45.009, -66.0), abs=1e-12)
+    assert find_coordinates_at_distance(course, -1.0) is None
+
+
+def test_slice_km_returns_expected_polylines():
+    # Expected (lon, lat) polylines from the previous list-based slicer
+    points = [GPXPoint(lat=45.0 + i * 0.0009, lon=-66.0 + i * 0.0001) for i in range(11)]
+    course = GPXCourse(name="line", points=points)
+    interior = [
+        (-65.99975095588374, 45.002241397046284), (-65.9997, 45.0027), (-65.9996, 45.0036),
+        (-65.9995, 45.0045), (-65.9994, 45.0054), (-65.99935248517535, 45.005827633421866),
+    ]
+    cases = [
+        ((0.0, 1.0), [(-66.0 + i * 0.0001, 45.0 + i * 0.0009) for i in range(10)]
+         + [(-65.999003823181, 45.008965591370966)]),
+        ((0.25, 0.65), interior),
+        ((0.65, 0.25), interior),
+        ((0.3, 0.3), [(-65.99970114705472, 45.00268967650758)]),
+        # Endpoints on vertices: no interpolated duplicates
+        ((course.km[2], course.km[5]), [(-65.9998, 45.0018), (-65.9997, 45.0027), (-65.9996, 45.0036),
+                                        (-65.9995, 45.0045)]),
+        # Clamped at the start and at the end of the course
+        ((-1.0, 0.1), [(-66.0, 45.0), (-65.99990038236113, 45.00089655874979)]),
+        ((0.9, 5.0), [(-65.99910344090594, 45.00806903184656), (-65.9991, 45.0081), (-65.999, 45.009)]),
+    ]
+    for (a, b), expected in cases:
+        for sliced in (
+            course.slice_km(a, b),
+            slice_polyline_by_km(course.course_points, course.cum_km, a, b),
+        ):
+            assert len(sliced) == len(expected), (a, b)
+            for got, want in zip(sliced, expected):
+                assert got == pytest.approx(want, abs=1e-12), (a, b)
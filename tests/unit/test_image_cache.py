@@ -0,0 +1,86 @@
+"""Unit tests for the content-addressed heatmap / segment-map image cache."""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from app.core.artifacts import heatmaps, segment_maps
+from app.core.artifacts.image_cache import (
+    evict_image_cache,
+    image_cache_key,
+    restore_cached_image,
+    store_cached_image,
+)
+
+LOS_COLORS = {"A": "#4CAF50", "B": "#8BC34A", "C": "#FFC107", "D": "#FF9800", "E": "#FF5722", "F": "#F44336"}
+
+
+def test_key_store_restore_and_lru_eviction(tmp_path, monkeypatch):
+    monkeypatch.setenv("RUNFLOW_IMAGE_CACHE_DIR", str(tmp_path / "cache"))
+    matrix = np.array([[0.1, np.nan], [0.3, 0.4]])
+    key = image_cache_key("heatmap", "A1", matrix, {"A": "#fff"})
+    assert key == image_cache_key("heatmap", "A1", matrix.copy(), {"A": "#fff"})
+    assert key != image_cache_key("heatmap", "A1", matrix * 2, {"A": "#fff"})
+
+    source = tmp_path / "render.png"
+    source.write_bytes(b"png-bytes")
+    out = tmp_path / "run" / "A1.png"
+    assert not restore_cached_image(key, out)
+    store_cached_image(key, source)
+    source.write_bytes(b"changed")  # cache holds its own copy
+    assert restore_cached_image(key, out) and out.read_bytes() == b"png-bytes"
+
+    older = image_cache_key("heatmap", "B1")
+    store_cached_image(older, source)
+    entry = tmp_path / "cache" / older[:2] / f"{older}.png"
+    os.utime(entry, ns=(1, 1))
+    assert evict_image_cache(max_bytes=len(b"png-bytes")) == 1
+    assert not entry.exists() and restore_cached_image(key, out)
+
+
+def test_heatmap_reuses_identical_render(tmp_path, monkeypatch):
+    monkeypatch.setenv("RUNFLOW_IMAGE_CACHE_DIR", str(tmp_path / "cache"))
+    bins = pd.DataFrame({
+        "segment_id": ["A1"] * 4,
+        "t_start": ["2025-10-26T07:00:00Z", "2025-10-26T07:00:00Z", "2025-10-26T07:02:00Z", "2025-10-26T07:02:00Z"],
+        "start_km": [0.0, 0.2, 0.0, 0.2],
+        "density": [0.1, 0.5, 0.9, 1.4],
+    })
+    saves = []
+    real_savefig = heatmaps.plt.savefig
+    monkeypatch.setattr(heatmaps.plt, "savefig", lambda *a, **k: (saves.append(a[0]), real_savefig(*a, **k)))
+
+    first, second = tmp_path / "run1" / "A1.png", tmp_path / "run2" / "A1.png"
+    assert heatmaps.generate_segment_heatmap("A1", bins, LOS_COLORS, first)
+    assert heatmaps.generate_segment_heatmap("A1", bins, LOS_COLORS, second)
+    assert saves == [first] and second.read_bytes() == first.read_bytes()
+
+    bins.loc[3, "density"] = 1.5
+    assert heatmaps.generate_segment_heatmap("A1", bins, LOS_COLORS, second)
+    assert len(saves) == 2 and first.read_bytes() != second.read_bytes()
+
+
+def test_segment_map_placeholder_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("RUNFLOW_IMAGE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(segment_maps, "load_reporting", lambda: {"reporting": {"los_colors": LOS_COLORS}})
+    geojson = {"features": [{
+        "properties": {"seg_id": "A1"},
+        "geometry": {"type": "LineString", "coordinates": [[-66.64, 45.96], [-66.63, 45.95]]},
+    }]}
+    metrics = {"A1": {"worst_los": "B"}}
+    fetched = []
+    monkeypatch.setattr(segment_maps, "_fetch_tile", lambda z, x, y: fetched.append((z, x, y)))
+
+    assert segment_maps.export_segment_map_pngs(geojson, metrics, tmp_path / "run1") == 1
+    assert not list((tmp_path / "cache").glob("*/*.png"))
+
+    tile = segment_maps.Image.new("RGB", (256, 256), "#dddddd")
+    monkeypatch.setattr(segment_maps, "_fetch_tile", lambda z, x, y: fetched.append((z, x, y)) or tile)
+    segment_maps.export_segment_map_pngs(geojson, metrics, tmp_path / "run2")
+    calls = len(fetched)
+    segment_maps.export_segment_map_pngs(geojson, metrics, tmp_path / "run3")
+    assert len(fetched) == calls  # served from the cache, no tiles fetched
+    assert (tmp_path / "run3" / "A1.png").read_bytes() == (tmp_path / "run2" / "A1.png").read_bytes()
@@ -0,0 +1,80 @@
+"""Unit tests for the run-scoped input cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.config.input_cache import RunInputCache
+
+
+def _write_inputs(tmp_path: Path) -> dict:
+    segments = tmp_path / "segments.csv"
+    segments.write_text("seg_id,full,width_m\nA1,Y,4\nA2,n,3\n", encoding="utf-8")
+    runners = tmp_path / "full_runners.csv"
+    runners.write_text("runner_id,event,pace\n1,full,5.0\n2,full,6.0\n", encoding="utf-8")
+    gpx = tmp_path / "full.gpx"
+    gpx.write_text(
+        '<?xml version="1.0"?><gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">'
+        '<trk><name>full</name><trkseg>'
+        '<trkpt lat="45.0" lon="-66.0"></trkpt><trkpt lat="45.001" lon="-66.0"></trkpt>'
+        "</trkseg></trk></gpx>",
+        encoding="utf-8",
+    )
+    return {"segments": segments, "runners": runners, "gpx": gpx}
+
+
+def test_each_file_loaded_once_and_counted(tmp_path: Path):
+    paths = _write_inputs(tmp_path)
+    cache = RunInputCache()
+
+    first = cache.segments(paths["segments"])
+    second = cache.segments(str(paths["segments"]))
+    assert first["full"].tolist() == ["y", "n"]
+    assert second["seg_id"].tolist() == ["A1", "A2"]
+    cache.runners(paths["runners"])
+    cache.runners(paths["runners"])
+    cache.courses({"full": str(paths["gpx"])})
+    cache.courses({"full": str(paths["gpx"])})
+
+    stats = cache.stats()
+    by_kind = {f["kind"]: f for f in stats["files"]}
+    assert by_kind["segments"]["loads"] == 1
+    assert by_kind["segments"]["hits"] == 1
+    assert by_kind["runners"]["loads"] == 1
+    assert by_kind["gpx"]["loads"] == 1
+    assert by_kind["gpx"]["hits"] == 1
+    assert by_kind["segments"]["bytes"] == paths["segments"].stat().st_size
+    assert stats["total_loads"] == 3
+    assert stats["total_bytes"] == sum(p.stat().st_size for p in paths.values())
+
+
+def test_frames_are_read_only_views(tmp_path: Path):
+    paths = _write_inputs(tmp_path)
+    cache = RunInputCache()
+
+    view = cache.runners(paths["runners"])
+    # Column replacement stays local to the caller's view
+    view["event"] = "FULL"
+    view["extra"] = 1
+    again = cache.runners(paths["runners"])
+    assert again["event"].tolist() == ["full", "full"]
+    assert "extra" not in again.columns
+
+    # In-place writes into shared arrays are rejected
+    with pytest.raises(ValueError):
+        again.loc[0, "pace"] = 1.0
+    with pytest.raises(ValueError):
+        again.loc[0, "event"] = "half"
+    assert cache.runners(paths["runners"])["pace"].tolist() == [5.0, 6.0]
+
+
+def test_failed_load_is_not_cached(tmp_path: Path):
+    cache = RunInputCache()
+    missing = tmp_path / "missing_runners.csv"
+    with pytest.raises(FileNotFoundError):
+        cache.runners(missing)
+    missing.write_text("runner_id,event\n1,full\n", encoding="utf-8")
+    assert len(cache.runners(missing)) == 1
+    assert cache.stats()["total_loads"] == 1
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import json
+
 import pandas as pd
 
 from app.core.junction_flow.compute import (
     MERGE_PARTNER_EVENTS,
     NODE_DWELL_SEC,
     StreamPresence,
+    _crosstab,
+    _event_mix_rows,
     _unique_with_copresence,
     analyze_interaction,
+    analyze_junction_batches,
     analyze_junctions_doc,
     prepare_runners_by_event,
 )
@@ -60,6 +65,40 @@ def test_copresence_requires_partner_within_dwell():
     assert stats["without_partner"] == 1
 
 
+def _presence(event, ids, times, quintiles=None):
+    return StreamPresence(
+        role="x",
+        seg_id="S1",
+        event=event,
+        runner_ids=np.array(ids),
+        node_times_sec=np.array(times, dtype=float),
+        paces=np.full(len(ids), 5.0),
+        quintiles=np.array(quintiles or [3] * len(ids)),
+    )
+
+
+def test_event_mix_counts_unique_runners_across_partner_events():
+    # "a" transits twice; only its second transit meets "half"
+    primary = _presence("10k", ["a", "b", "a", "c"], [1000.0, 2000.0, 1500.0, 2900.0])
+    full = _presence("full", ["f1"], [1010.0])
+    half = _presence("half", ["h1", "h2"], [1520.0, 2010.0])
+    rows = _event_mix_rows({"10k": primary}, {"full": full, "half": half}, 0.0, 3000.0)
+    assert rows["10k"] == {"vs": {"full": 1, "half": 2}, "unique": 2, "in_two_or_more": 1}
+
+
+def test_crosstab_uses_first_transit_with_nearest_partner():
+    a = _presence("10k", ["a", "a", "b"], [1000.0, 1100.0, 1200.0], [1, 1, 2])
+    # Tie at 1000 resolves to the later partner (quintile 5); b has no partner
+    b = _presence("full", ["x", "y", "z"], [990.0, 1010.0, 1100.0], [4, 5, 1])
+    assert _crosstab(a, b, 0.0, 3000.0) == [
+        {
+            "crossing_or_joining_quintile": 1,
+            "crossed_or_through_quintile": 5,
+            "unique_crossing_or_joining_runners": 1,
+        }
+    ]
+
+
 def test_cross_mix_breakdown_is_union_not_sum():
     nearby = {
         "S28": {
@@ -180,3 +219,66 @@ def test_analyze_junctions_doc_empty():
     assert out["ok"] is True
     assert out["junctions"] == []
     assert out["method"]["node_dwell_sec"] == NODE_DWELL_SEC
+
+
+def test_parallel_junction_batches_match_serial():
+    runners = {
+        "10k": pd.DataFrame(
+            {
+                "runner_id": [f"k{i}" for i in range(20)],
+                "event": ["10k"] * 20,
+                "pace": [5.0] * 20,
+                "start_offset": [float(i * 10) for i in range(20)],
+                "quintile": [1 + i % 5 for i in range(20)],
+            }
+        )
+    }
+    junction = {
+        "nearby_segments": [
+            {"seg_id": "S1", "near_endpoint": "end", "event_kms": {"10k": {"from_km": 1.0, "to_km": 2.0}}},
+            {"seg_id": "S2", "near_endpoint": "start", "event_kms": {"10k": {"from_km": 2.0, "to_km": 3.0}}},
+        ],
+        "interactions": [
+            {"id": "m1", "type": "merge", "from_seg_id": "S1", "to_seg_ids": ["S2"], "events": ["10k"]}
+        ],
+    }
+    doc = {"junctions": [dict(junction, id=f"J{i}") for i in range(5)]}
+    batches = {"sat": (runners, {"10k": 480.0}), "sun": (runners, {"10k": 420.0})}
+
+    serial = analyze_junction_batches(doc, batches, max_workers=1)
+    parallel = analyze_junction_batches(doc, batches, max_workers=2)
+    assert parallel["sat"]["timing"]["mode"] == "process_pool"
+    assert serial["sat"]["timing"]["mode"] == "serial"
+    for day in batches:
+        assert parallel[day]["junctions"] == serial[day]["junctions"]
+        assert [t["junction_id"] for t in parallel[day]["timing"]["junctions"]] == [
+            f"J{i}" for i in range(5)
+        ]
+    assert parallel["sat"]["timing"]["all_batches_total_sec"] == parallel["sun"]["timing"]["all_batches_total_sec"]
+
+
+def test_persisted_day_results_leave_out_wall_clock_timing(tmp_path):
+    from app.core.v2.junction_flow import persist_junction_flow_day
+
+    runners = {"10k": pd.DataFrame({
+        "runner_id": ["k0", "k1"], "event": ["10k", "10k"], "pace": [5.0, 5.0],
+        "start_offset": [0.0, 10.0], "quintile": [1, 2],
+    })}
+    doc = {"junctions": [{
+        "id": "J1",
+        "nearby_segments": [
+            {"seg_id": "S1", "near_endpoint": "end", "event_kms": {"10k": {"from_km": 1.0, "to_km": 2.0}}},
+            {"seg_id": "S2", "near_endpoint": "start", "event_kms": {"10k": {"from_km": 2.0, "to_km": 3.0}}},
+        ],
+        "interactions": [
+            {"id": "m1", "type": "merge", "from_seg_id": "S1", "to_seg_ids": ["S2"], "events": ["10k"]}
+        ],
+    }]}
+    written = []
+    for attempt in ("a", "b"):
+        day_result = analyze_junction_batches(doc, {"sat": (runners, {"10k": 480.0})})["sat"]
+        day_result["timing"]["all_batches_total_sec"] += 1.0 if attempt == "b" else 0.0
+        persist_junction_flow_day(day_path=tmp_path / attempt, day_code="sat", day_result=day_result)
+        written.append((tmp_path / attempt / "computation" / "junction_flow_results.json").read_text())
+    assert written[0] == written[1]
+    assert "timing" not in json.loads(written[0])
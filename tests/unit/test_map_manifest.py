@@ -0,0 +1,75 @@
+"""Unit tests for the precomputed map manifest artifact and its API fallback."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from app.api import map as map_api
+from app.core.v2.map_manifest import (
+    MapManifestError,
+    build_map_manifest,
+    build_segment_index,
+    load_map_manifest,
+    write_map_manifest,
+)
+
+
+def _bins(path):
+    pd.DataFrame({
+        "t_start": ["2025-10-26T07:00:00Z", "2025-10-26T07:00:00Z", "2025-10-26T07:02:00Z"],
+        "t_end": ["2025-10-26T07:02:00Z", "2025-10-26T07:02:00Z", "2025-10-26T07:04:00Z"],
+        "density": [0.1, 0.2, 0.3],
+    }).to_parquet(path)
+    return path
+
+
+def _segments():
+    return pd.DataFrame({
+        "seg_id": ["A1", "B1"], "seg_label": ["Start", "Loop"],
+        "width_m": [5, 3.5], "schema": ["start_corral", "on_course_open"],
+    })
+
+
+def test_build_map_manifest(tmp_path):
+    manifest = build_map_manifest(_bins(tmp_path / "bins.parquet"), _segments(), date_str="sun")
+
+    assert (manifest["window_count"], manifest["window_seconds"], manifest["date"]) == (2, 120, "sun")
+    assert manifest["segments"][1] == {
+        "segment_id": "B1", "segment_label": "Loop", "schema_key": "on_course_open", "width_m": 3.5,
+    }
+    assert manifest["lod"] == {"segments_only": 12, "flagged_bins": 14}
+    assert manifest["metadata"]["total_segments"] == 2
+
+    write_map_manifest(tmp_path, manifest)
+    assert load_map_manifest(tmp_path) == json.loads(json.dumps(manifest))
+    assert load_map_manifest(tmp_path / "missing") is None
+
+
+def test_segment_index_requires_fields():
+    segments = _segments()
+    segments.loc[1, "seg_label"] = None
+    with pytest.raises(MapManifestError, match="B1 missing seg_label"):
+        build_segment_index(segments)
+
+
+def test_api_serves_stored_manifest_before_legacy_computation(tmp_path, monkeypatch):
+    from app.utils import run_id as run_id_utils
+
+    maps_dir = tmp_path / "run1" / "sat" / "maps"
+    maps_dir.mkdir(parents=True)
+    write_map_manifest(maps_dir, {"ok": True, "date": "sat", "window_count": 7})
+    monkeypatch.setattr(run_id_utils, "get_latest_run_id", lambda: "run1")
+    monkeypatch.setattr(run_id_utils, "get_run_directory", lambda rid: tmp_path / rid)
+    monkeypatch.setattr(run_id_utils, "resolve_selected_day", lambda rid, day=None: (day or "sat", ["sat"]))
+
+    response = asyncio.run(map_api.get_map_manifest(run_id=None, day=None))
+    assert json.loads(response.body)["window_count"] == 7
+
+    monkeypatch.setattr(map_api, "_find_latest_bin_data_dir", lambda: None)
+    with pytest.raises(map_api.HTTPException) as excinfo:
+        asyncio.run(map_api.get_map_manifest(run_id="run1", day="sun"))
+    assert excinfo.value.status_code == 404
@@ -9,11 +9,12 @@ from pathlib import Path
 
 import pandas as pd
 
+from app import one_pager
 from app.one_pager import generate_location_onepagers
 from app.utils.loc_sheets_list import zip_loc_sheet_html
 
 
-def test_generate_writes_html_not_pdf(tmp_path: Path) -> None:
+def _write_inputs(tmp_path: Path, notes: str = "Stay visible") -> None:
     loc = {
         "loc_id": 12,
         "pass_id": 12,
@@ -23,7 +24,7 @@ def test_generate_writes_html_not_pdf(tmp_path: Path) -> None:
         "loc_type": "traffic",
         "lat": 45.27,
         "lon": -66.06,
-        "notes": "Stay visible",
+        "notes": notes,
         "equipment": "Radio",
         "contact": "HQ",
         "vol_count": 2,
@@ -46,6 +47,9 @@ def test_generate_writes_html_not_pdf(tmp_path: Path) -> None:
         ]
     ).to_csv(tmp_path / "Locations.csv", index=False)
 
+
+def test_generate_writes_html_not_pdf(tmp_path: Path) -> None:
+    _write_inputs(tmp_path)
     out = tmp_path / "loc_sheets"
     n = generate_location_onepagers(
         run_id="testrun",
@@ -73,3 +77,27 @@ def test_zip_loc_sheet_html_uses_existing_files(tmp_path: Path) -> None:
     with zipfile.ZipFile(BytesIO(payload)) as zf:
         names = set(zf.namelist())
     assert names == {"1.html", "2.html"}
+
+
+def test_unchanged_sheets_are_not_rewritten(tmp_path: Path, monkeypatch) -> None:
+    def generate() -> int:
+        return generate_location_onepagers(
+            run_id="testrun",
+            day="sun",
+            locations_results_json_path=tmp_path / "locations_results.json",
+            locations_report_csv_path=tmp_path / "Locations.csv",
+            output_dir=tmp_path / "loc_sheets",
+        )
+
+    _write_inputs(tmp_path)
+    assert generate() == 1
+    rendered = []
+    render = one_pager._render_onepager_html
+    monkeypatch.setattr(
+        one_pager, "_render_onepager_html", lambda *a, **kw: rendered.append(1) or render(*a, **kw)
+    )
+    assert generate() == 1 and rendered == []
+
+    _write_inputs(tmp_path, notes="Bring a flag")
+    assert generate() == 1 and rendered == [1]
+    assert "Bring a flag" in (tmp_path / "loc_sheets" / "html" / "12.html").read_text(encoding="utf-8")
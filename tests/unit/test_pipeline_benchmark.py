@@ -0,0 +1,70 @@
+"""Unit tests for the golden-dataset pipeline benchmark helpers."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from app.core.v2.benchmark import (
+    BENCHMARK_DATASETS,
+    BenchmarkDataset,
+    build_dataset,
+    collect_artifact_sizes,
+    collect_phase_seconds,
+    compare_to_baseline,
+)
+
+
+def _results(phases, rss=500.0, worker_rss=300.0):
+    return {"datasets": {"small": {"phases": phases, "peak_rss_mb": rss, "peak_worker_rss_mb": worker_rss}}}
+
+
+def test_build_dataset_is_deterministic_and_scaled(tmp_path):
+    dataset = BenchmarkDataset("tiny", ("elite", "open"), scale=2.0, seed=7)
+    payload = build_dataset(dataset, tmp_path / "a")
+    build_dataset(dataset, tmp_path / "b")
+
+    assert [e["name"] for e in payload["events"]] == ["elite", "open"]
+    for name in ("elite_runners.csv", "open_runners.csv"):
+        first = pd.read_csv(tmp_path / "a" / name)
+        pd.testing.assert_frame_equal(first, pd.read_csv(tmp_path / "b" / name))
+        assert len(first) == 2 * len(pd.read_csv(f"data/{name}"))
+    assert (tmp_path / "a" / "segments.csv").exists()
+    assert set(BENCHMARK_DATASETS) == {"small", "medium", "large"}
+
+
+def test_collect_phase_seconds_sums_repeated_phases():
+    performance = {"phases": [
+        {"phase": "density", "elapsed_seconds": 1.25},
+        {"phase": "flow", "elapsed_seconds": 2.0},
+        {"phase": "density", "elapsed_seconds": 0.75},
+    ]}
+    assert collect_phase_seconds(performance) == {"density": 2.0, "flow": 2.0}
+
+
+def test_collect_artifact_sizes_groups_by_day_folder(tmp_path):
+    (tmp_path / "sun" / "bins").mkdir(parents=True)
+    (tmp_path / "sun" / "bins" / "bins.parquet").write_bytes(b"x" * 10)
+    (tmp_path / "metadata.json").write_bytes(b"{}")
+
+    sizes = collect_artifact_sizes(tmp_path)
+    assert sizes == {"total_bytes": 12, "by_kind": {"bins": 10, "metadata.json": 2}}
+
+
+def test_compare_flags_only_meaningful_regressions():
+    baseline = {"datasets": {"small": {"phases": {"density": 10.0, "flow": 0.2, "maps": 4.0},
+                                       "peak_rss_mb": 400.0, "peak_worker_rss_mb": 300.0}},
+                "tolerances": {"maps": 1.0}}
+
+    assert compare_to_baseline(_results({"density": 12.0, "flow": 0.6, "maps": 7.5}), baseline) == []
+
+    regressions = compare_to_baseline(
+        _results({"density": 13.0, "flow": 0.2, "new_phase": 99.0, "maps": 8.5}, rss=600.0, worker_rss=450.0),
+        baseline,
+    )
+    assert regressions == [
+        "small: density 13.00s vs baseline 10.00s (+30%)",
+        "small: maps 8.50s vs baseline 4.00s (+112%)",
+        "small: peak RSS 600 MB vs baseline 400 MB (+50%)",
+        "small: peak worker RSS 450 MB vs baseline 300 MB (+50%)",
+    ]
+    assert compare_to_baseline(_results({"density": 50.0}), {"datasets": {}}) == []
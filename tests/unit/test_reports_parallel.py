@@ -0,0 +1,86 @@
+"""Unit tests for pooled per-day report generation in the v2 reports phase."""
+
+from __future__ import annotations
+
+import threading
+
+import pandas as pd
+import pytest
+
+from app.core.v2 import reports
+from app.core.v2.models import Day, Event
+from app.core.v2.timeline import generate_day_timelines
+
+EVENTS = [
+    Event(name="elite", day=Day.SAT, start_time=480, gpx_file="elite.gpx", runners_file="elite_runners.csv"),
+    Event(name="full", day=Day.SUN, start_time=420, gpx_file="full.gpx", runners_file="full_runners.csv"),
+]
+SEGMENTS = pd.DataFrame({"seg_id": ["A1", "B1"], "elite": ["y", "n"], "full": ["n", "y"]})
+RUNNERS = pd.DataFrame({"runner_id": ["1", "2"], "event": ["elite", "full"]})
+
+
+def _generate(**kwargs):
+    return reports.generate_reports_per_day(
+        run_id="run1",
+        events=EVENTS,
+        timelines=generate_day_timelines(EVENTS),
+        density_results={Day.SAT: {}, Day.SUN: {}},
+        segments_df=SEGMENTS,
+        all_runners_df=RUNNERS,
+        data_dir="data",
+        segments_file_path="segments.csv",
+        flow_file_path="flow.csv",
+        gpx_paths={"elite": "elite.gpx", "full": "full.gpx"},
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def run_root(tmp_path, monkeypatch):
+    monkeypatch.setenv("RUNFLOW_ROOT", str(tmp_path))
+    monkeypatch.setenv("RUNFLOW_ROOT_CONTAINER", str(tmp_path / "no-container"))
+    monkeypatch.setenv("RUNFLOW_REPORT_MAX_WORKERS", "4")
+    monkeypatch.setattr(reports.os, "cpu_count", lambda: 4)
+    return tmp_path / "analysis" / "run1"
+
+
+def test_days_run_concurrently_with_in_memory_payloads(run_root, monkeypatch):
+    both_days = threading.Barrier(2, timeout=5)  # only passes if both days' density runs at once
+    flow_payloads = {Day.SAT: {"ok": True, "day": "sat"}, Day.SUN: {"ok": True, "day": "sun"}}
+    seen = {}
+
+    def fake_density(day, segments_df, all_runners_df, **kwargs):
+        both_days.wait()
+        seen[("density", day)] = list(segments_df["seg_id"])
+        return kwargs["reports_path"] / "Density.md"
+
+    def fake_flow(day, flow_results, reports_path, **kwargs):
+        seen[("flow", day)] = flow_results
+        return {"flow_csv": str(reports_path / "Flow.csv")}
+
+    monkeypatch.setattr(reports, "generate_density_report_v2", fake_density)
+    monkeypatch.setattr(reports, "generate_flow_report_v2", fake_flow)
+
+    result = _generate(flow_results_by_day=flow_payloads, report_kinds=("density", "flow"))
+
+    assert list(result) == [Day.SAT, Day.SUN]
+    assert list(result[Day.SUN]) == ["density", "flow_csv"]
+    assert result[Day.SUN]["density"] == str(run_root / "sun" / "reports" / "Density.md")
+    assert seen[("density", Day.SAT)] == ["A1"] and seen[("density", Day.SUN)] == ["B1"]
+    assert seen[("flow", Day.SAT)] is flow_payloads[Day.SAT]  # no flow_results.json on disk
+
+
+def test_failures_keep_per_report_semantics(run_root, monkeypatch):
+    def failing_density(**kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(reports, "generate_density_report_v2", failing_density)
+    locations = _generate(report_kinds=("density", "locations"))
+    # Density failure is logged; no locations_results.json means no locations report
+    assert locations == {Day.SAT: {}, Day.SUN: {}}
+
+    with pytest.raises(FileNotFoundError, match="flow_results.json"):
+        _generate(
+            flow_results_by_day={Day.SAT: {"ok": False}},
+            report_kinds=("flow",),
+        )
@@ -0,0 +1,123 @@
+"""Unit tests for the SQLite run catalog behind /api/runs/list."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from app.utils import run_catalog
+from app.utils.run_catalog import (
+    CATALOG_FILENAME,
+    format_total_elapsed,
+    index_signature,
+    list_runs,
+    record_run,
+    remove_runs,
+    update_run_description,
+)
+
+
+def _write_run(root: Path, run_id: str, days, description=None, elapsed=None, status="complete"):
+    analysis = root / "analysis"
+    run_dir = analysis / run_id
+    run_dir.mkdir(parents=True)
+    if description is not None:
+        (run_dir / "analysis.json").write_text(json.dumps({"description": description}))
+    if elapsed is not None:
+        (run_dir / "metadata.json").write_text(json.dumps({"performance": elapsed}))
+    entry = {"run_id": run_id, "created_at": f"2025-10-2{len(run_id)}T07:00:00Z",
+             "status": status, "event_summary": {
+                 "days": len(days), "events": len(days),
+                 "events_by_day": {d: {"count": 1, "events": [f"{d}-10k"]} for d in days}}}
+    index_path = analysis / "index.json"
+    entries = json.loads(index_path.read_text()) if index_path.exists() else []
+    index_path.write_text(json.dumps(entries + [entry]))
+    return entry
+
+
+def test_list_runs_builds_catalog_from_disk_newest_first(tmp_path: Path):
+    _write_run(tmp_path, "r1", ["sat"], description="first",
+               elapsed={"total_elapsed_minutes": "00:05", "total_elapsed_seconds": 330.0})
+    _write_run(tmp_path, "r2", ["sat", "sun"], status="failed")
+    _write_run(tmp_path, "r3", ["sun"], description="third run")
+
+    rows, total = list_runs(runflow_root=tmp_path)
+
+    assert total == 3 and [r["run_id"] for r in rows] == ["r3", "r2", "r1"]
+    assert rows[2]["description"] == "first" and rows[2]["total_elapsed_minutes"] == "05:30"
+    assert rows[1]["event_summary"]["events_by_day"]["sun"] == {"count": 1, "events": ["sun-10k"]}
+    assert (tmp_path / "analysis" / CATALOG_FILENAME).exists()
+
+
+def test_list_runs_paginates_and_filters(tmp_path: Path):
+    for i, days in enumerate((["sat"], ["sun"], ["sat", "sun"], ["sat"])):
+        _write_run(tmp_path, f"run{i}", days, description=f"race {i}")
+
+    page, total = list_runs(limit=2, offset=1, runflow_root=tmp_path)
+    assert total == 4 and [r["run_id"] for r in page] == ["run2", "run1"]
+
+    sat, total = list_runs(day="SAT", runflow_root=tmp_path)
+    assert total == 3 and [r["run_id"] for r in sat] == ["run3", "run2", "run0"]
+
+    found, total = list_runs(search="RACE 1", runflow_root=tmp_path)
+    assert total == 1 and found[0]["run_id"] == "run1"
+
+
+def test_incremental_updates_track_index_writes(tmp_path: Path, monkeypatch):
+    _write_run(tmp_path, "r1", ["sat"])
+    list_runs(runflow_root=tmp_path)
+
+    def _no_rebuild(runflow_root=None):
+        raise AssertionError("catalog rebuilt")
+
+    monkeypatch.setattr(run_catalog, "rebuild_catalog", _no_rebuild)
+    before = index_signature(tmp_path)
+    entry = _write_run(tmp_path, "r2", ["sun"], description="new")
+    record_run(entry, metadata={"performance": {"total_elapsed_minutes": "01:10"}}, runflow_root=tmp_path,
+               previous_signature=before)
+    rows, _ = list_runs(runflow_root=tmp_path)
+    assert [r["run_id"] for r in rows] == ["r2", "r1"]
+    assert rows[0]["total_elapsed_minutes"] == "01:10"
+
+    update_run_description("r1", "renamed", runflow_root=tmp_path, previous_signature=index_signature(tmp_path))
+    index_path = tmp_path / "analysis" / "index.json"
+    before = index_signature(tmp_path)
+    index_path.write_text(json.dumps([e for e in json.loads(index_path.read_text()) if e["run_id"] != "r2"]))
+    remove_runs(["r2"], runflow_root=tmp_path, previous_signature=before)
+    rows, total = list_runs(runflow_root=tmp_path)
+    assert total == 1 and rows[0]["description"] == "renamed"
+
+
+def test_record_run_rebuilds_after_an_unseen_index_edit(tmp_path: Path):
+    _write_run(tmp_path, "r1", ["sat"])
+    list_runs(runflow_root=tmp_path)
+
+    # Another writer (e.g. validate_output.update_index_status) marks r1 failed
+    index_path = tmp_path / "analysis" / "index.json"
+    index_path.write_text(json.dumps([{**json.loads(index_path.read_text())[0], "status": "FAIL"}]))
+
+    before = index_signature(tmp_path)
+    entry = _write_run(tmp_path, "r2", ["sun"])
+    record_run(entry, runflow_root=tmp_path, previous_signature=before)
+    rows, _ = list_runs(runflow_root=tmp_path)
+    assert {r["run_id"]: r["status"] for r in rows} == {"r2": "complete", "r1": "FAIL"}
+
+
+def test_external_index_change_triggers_rebuild(tmp_path: Path):
+    _write_run(tmp_path, "r1", ["sat"])
+    assert list_runs(runflow_root=tmp_path)[1] == 1
+
+    _write_run(tmp_path, "r22", ["sun"])
+    index_path = tmp_path / "analysis" / "index.json"
+    stat = index_path.stat()
+    os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    rows, total = list_runs(runflow_root=tmp_path)
+    assert total == 2 and rows[0]["run_id"] == "r22"
+
+
+def test_format_total_elapsed_keeps_modern_values():
+    assert format_total_elapsed({"total_elapsed_minutes": "12:34", "total_elapsed_seconds": 754}) == "12:34"
+    assert format_total_elapsed({"total_elapsed_minutes": 2.5}) == 2.5
+    assert format_total_elapsed({}) is None
@@ -108,3 +108,60 @@ def test_resolve_fallback_from_metadata(tmp_path, monkeypatch):
     (d / "metadata.json").write_text(json.dumps({"status": "PASS", "created_at": "t"}))
     payload = resolve_progress_for_api(run_id)
     assert payload["status"] == "PASS"
+
+
+def test_phase_updates_stay_in_memory_between_checkpoints(tmp_path, monkeypatch):
+    import app.core.v2.run_progress as rp
+
+    monkeypatch.setattr(rp, "get_run_directory", lambda run_id: tmp_path / run_id)
+    writes = []
+    real_write = rp.write_progress
+    monkeypatch.setattr(rp, "write_progress", lambda run_id, payload: writes.append(payload) or real_write(run_id, payload))
+    run_id = "bus837"
+    (tmp_path / run_id).mkdir()
+
+    init_run_progress(run_id)
+    mark_phase_started(run_id, "phase_1_pre_analysis")
+    mark_phase_complete(run_id, "phase_1_pre_analysis")
+    mark_phase_started(run_id, "phase_2_data_loading")
+    assert len(writes) == 1
+    assert read_progress(run_id)["completed_phases"] == ["phase_1_pre_analysis"]
+    assert rp.read_progress_file(run_id)["completed_phases"] == []
+
+    mark_phase_complete(run_id, "phase_2_data_loading")
+    mark_phase_started(run_id, "phase_3_1_density_setup")
+    assert rp.read_progress_file(run_id)["user_stage"] == "density"
+
+    mark_run_complete(run_id)
+    assert rp.progress_bus.latest(run_id) is None
+    assert rp.read_progress_file(run_id)["status"] == "PASS"
+
+
+def test_progress_stream_pushes_updates_until_complete(tmp_path, monkeypatch):
+    import asyncio
+    import json
+    import threading
+
+    import app.core.v2.run_progress as rp
+
+    monkeypatch.setattr(rp, "get_run_directory", lambda run_id: tmp_path / run_id)
+    run_id = "sse837"
+    (tmp_path / run_id).mkdir()
+    init_run_progress(run_id)
+
+    async def collect():
+        events = await rp.progress_event_stream(run_id, heartbeat_seconds=5.0)
+        frames = []
+        async for frame in events:
+            frames.append(json.loads(frame[len("data: "):]))
+            if len(frames) == 1:
+                threading.Thread(target=lambda: (
+                    mark_phase_complete(run_id, "phase_1_pre_analysis"),
+                    mark_run_complete(run_id),
+                )).start()
+        return frames
+
+    frames = asyncio.run(collect())
+    assert frames[0]["status"] == "running"
+    assert frames[-1]["status"] == "PASS"
+    assert not rp.progress_bus._subscribers
@@ -0,0 +1,64 @@
+"""Unit tests for the local map tile store behind segment map snapshots."""
+
+from __future__ import annotations
+
+import io
+
+from PIL import Image
+
+from app.core.artifacts import segment_maps, tile_store
+
+LOS_COLORS = {"A": "#4CAF50", "B": "#8BC34A", "C": "#FFC107", "D": "#FF9800", "E": "#FF5722", "F": "#F44336"}
+GEOJSON = {"features": [{
+    "properties": {"seg_id": "A1"},
+    "geometry": {"type": "LineString", "coordinates": [[-66.64, 45.96], [-66.63, 45.95]]},
+}]}
+
+
+def _png() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (256, 256), "#cccccc").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_offline_reads_store_only_and_online_writes_through(tmp_path, monkeypatch):
+    monkeypatch.setenv("RUNFLOW_TILE_STORE_DIR", str(tmp_path))
+    downloads = []
+    monkeypatch.setattr(tile_store, "download_tile", lambda z, x, y: downloads.append((z, x, y)) or b"tile")
+
+    monkeypatch.setenv("RUNFLOW_MAP_TILES_OFFLINE", "true")
+    assert tile_store.load_tile_bytes(14, 5, 6) is None and downloads == []
+
+    monkeypatch.setenv("RUNFLOW_MAP_TILES_OFFLINE", "false")
+    assert tile_store.load_tile_bytes(14, 5 + 2**14, 6) == b"tile"  # x wraps
+    assert (tmp_path / "14" / "5" / "6.png").read_bytes() == b"tile"
+    assert tile_store.load_tile_bytes(14, 5, 6) == b"tile" and downloads == [(14, 5, 6)]
+    assert tile_store.load_tile_bytes(14, 5, -1) is None
+
+
+def test_seeded_store_renders_segment_maps_offline(tmp_path, monkeypatch):
+    monkeypatch.setenv("RUNFLOW_TILE_STORE_DIR", str(tmp_path / "tiles"))
+    monkeypatch.setenv("RUNFLOW_IMAGE_CACHE_DIR", str(tmp_path / "images"))
+    monkeypatch.setattr(segment_maps, "load_reporting", lambda: {"reporting": {"los_colors": LOS_COLORS}})
+    png = _png()
+    monkeypatch.setattr(tile_store, "download_tile", lambda z, x, y: png)
+
+    tiles = segment_maps.snapshot_tiles(GEOJSON)
+    assert tiles and len({z for z, _, _ in tiles}) == 1
+    assert tile_store.seed_tiles(tiles) == {"downloaded": len(tiles), "present": 0, "failed": 0}
+    assert tile_store.seed_tiles(tiles)["present"] == len(tiles)
+
+    def _no_network(*args, **kwargs):
+        raise AssertionError("network used while offline")
+
+    monkeypatch.setattr(tile_store, "download_tile", _no_network)
+    monkeypatch.setenv("RUNFLOW_MAP_TILES_OFFLINE", "true")
+    assert segment_maps.export_segment_map_pngs(GEOJSON, {"A1": {"worst_los": "C"}}, tmp_path / "out") == 1
+    # Every tile came from the store, so the snapshot is complete and cacheable
+    assert list((tmp_path / "images").glob("*/*.png"))
+
+
+def test_bbox_tiles_cover_each_zoom():
+    tiles = segment_maps.bbox_tiles(-66.70, 45.90, -66.55, 46.00, [12, 13])
+    per_zoom = {z: sum(1 for t in tiles if t[0] == z) for z in (12, 13)}
+    assert per_zoom[12] >= 1 and per_zoom[13] >= per_zoom[12]
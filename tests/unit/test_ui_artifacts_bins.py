@@ -0,0 +1,31 @@
+"""Unit tests for the cross-day bins aggregate used by the UI export."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from app.core.v2 import ui_artifacts
+from app.core.v2.models import Day
+
+
+def test_aggregate_reads_ui_columns_and_is_passed_down(tmp_path, monkeypatch):
+    monkeypatch.setenv("RUNFLOW_ROOT", str(tmp_path))
+    monkeypatch.setenv("RUNFLOW_ROOT_CONTAINER", str(tmp_path / "no-container"))
+    for day, seg in (("sat", "A1"), ("sun", "B1")):
+        bins_dir = tmp_path / "analysis" / "run1" / day / "bins"
+        bins_dir.mkdir(parents=True)
+        pd.DataFrame({"segment_id": [seg], "density": [1.5], "rate": [2.0], "geometry": ["x"]}).to_parquet(
+            bins_dir / "bins.parquet"
+        )
+
+    aggregated = ui_artifacts.aggregate_bins_from_all_days("run1")
+    assert sorted(aggregated["segment_id"]) == ["A1", "B1"]
+    assert set(aggregated.columns) == {"segment_id", "density", "rate"}
+
+    seen = {}
+    monkeypatch.setattr(ui_artifacts, "_export_ui_artifacts_v2", lambda **kwargs: seen.update(kwargs))
+    ui_artifacts.generate_ui_artifacts_per_day(
+        "run1", Day.SAT, [], {}, {}, pd.DataFrame({"seg_id": []}), pd.DataFrame(), "data",
+        aggregated_bins=aggregated,
+    )
+    assert seen["aggregated_bins"] is aggregated
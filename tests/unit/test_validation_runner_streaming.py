@@ -0,0 +1,115 @@
+"""Unit tests for chunked, hash-based runner_id uniqueness validation."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from app.core.v2 import validation
+from app.core.v2.validation import ValidationError, assert_unique_runner_ids, validate_runner_uniqueness
+
+EVENTS = [
+    {"name": "full", "runners_file": "full_runners.csv"},
+    {"name": "half", "runners_file": "half_runners.csv"},
+    {"name": "10k", "runners_file": "10k_runners.csv"},
+]
+
+
+def _write_runners(data_dir, filename, runner_ids):
+    pd.DataFrame({
+        "runner_id": runner_ids,
+        "event": filename.split("_")[0],
+        "pace": 4.0,
+        "distance": 10.0,
+        "start_offset": 0,
+    }).to_csv(data_dir / filename, index=False)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(validation, "VALIDATION_CHUNK_ROWS", 2)
+
+
+def test_cross_event_duplicate_reports_file_and_row(tmp_path):
+    _write_runners(tmp_path, "full_runners.csv", ["1", "2", "3", "4", "5"])
+    _write_runners(tmp_path, "half_runners.csv", ["6", "7", "8"])
+    _write_runners(tmp_path, "10k_runners.csv", ["9", "10", "11", "4", "12", "2"])
+    validate_runner_uniqueness(EVENTS[:2], str(tmp_path))
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_runner_uniqueness(EVENTS, str(tmp_path))
+    err = exc_info.value
+    assert err.code == 422
+    assert "Duplicate runner_id '4' found in both event 'full' and event '10k'" in err.message
+    assert "'10k_runners.csv' row 5" in err.message
+    assert err.details == [
+        {"file": "10k_runners.csv", "event": "10k", "row": 5, "runner_id": "4", "conflicting_event": "full"},
+        {"file": "10k_runners.csv", "event": "10k", "row": 7, "runner_id": "2", "conflicting_event": "full"},
+    ]
+
+
+def test_within_file_repeat_is_reported_first(tmp_path):
+    _write_runners(tmp_path, "full_runners.csv", ["1", "2", "3"])
+    _write_runners(tmp_path, "half_runners.csv", ["3", "4", "5", "4"])
+    _write_runners(tmp_path, "10k_runners.csv", ["6"])
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_runner_uniqueness(EVENTS, str(tmp_path))
+    assert "Duplicate runner_id values in 'half_runners.csv' for event 'half': [4] (rows 3, 5)" in (
+        exc_info.value.message
+    )
+    assert {d["runner_id"]: d["conflicting_event"] for d in exc_info.value.details} == {"4": None, "3": "full"}
+
+
+def test_duplicate_across_chunk_boundary_with_mixed_ids(tmp_path, monkeypatch):
+    # With inferred dtypes the chunk [1, 2, 3] reads as ints and [3, A1] as strings
+    monkeypatch.setattr(validation, "VALIDATION_CHUNK_ROWS", 3)
+    _write_runners(tmp_path, "full_runners.csv", ["1", "2", "3", "3", "A1"])
+    _write_runners(tmp_path, "half_runners.csv", ["7", "B2"])
+    _write_runners(tmp_path, "10k_runners.csv", ["A1", "8"])
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_runner_uniqueness(EVENTS, str(tmp_path))
+    assert "'full_runners.csv' for event 'full': [3] (rows 4, 5)" in exc_info.value.message
+    assert {d["runner_id"]: d["conflicting_event"] for d in exc_info.value.details} == {"3": None, "A1": "full"}
+
+
+def test_ids_equal_as_numbers_collide_across_files(tmp_path):
+    # The pipeline reads these files with plain read_csv: 001, 1 and 1.0 are all 1
+    _write_runners(tmp_path, "full_runners.csv", ["5", "6"])
+    _write_runners(tmp_path, "half_runners.csv", ["1", "2"])
+    _write_runners(tmp_path, "10k_runners.csv", ["3", "001"])
+    with pytest.raises(ValidationError) as exc_info:
+        validate_runner_uniqueness(EVENTS, str(tmp_path))
+    assert "Duplicate runner_id '1' found in both event 'half' and event '10k'" in exc_info.value.message
+
+    _write_runners(tmp_path, "10k_runners.csv", ["3", "4"])
+    _write_runners(tmp_path, "full_runners.csv", ["5", "1.0"])
+    with pytest.raises(ValidationError) as exc_info:
+        validate_runner_uniqueness(EVENTS, str(tmp_path))
+    assert "Duplicate runner_id '1' found in both event 'full' and event 'half'" in exc_info.value.message
+
+    _write_runners(tmp_path, "full_runners.csv", ["5", "1.5", "A1"])
+    validate_runner_uniqueness(EVENTS, str(tmp_path))
+
+
+def test_frames_use_the_same_rule():
+    frames = [
+        ("full", pd.DataFrame({"runner_id": pd.array(["a", "b"], dtype="string")})),
+        ("half", pd.DataFrame({"runner_id": pd.array(["c", "a"], dtype="string")}, index=[10, 11])),
+    ]
+    with pytest.raises(ValidationError) as exc_info:
+        assert_unique_runner_ids(frames, file_names={"half": "half.csv"})
+    assert exc_info.value.details == [
+        {"file": "half.csv", "event": "half", "row": 3, "runner_id": "a", "conflicting_event": "full"},
+    ]
+    assert_unique_runner_ids(frames[:1])
+
+
+def test_numeric_ids_compare_by_value_across_dtypes():
+    frames = [
+        ("full", pd.DataFrame({"runner_id": [1, 2]})),
+        ("half", pd.DataFrame({"runner_id": [float("nan"), 2.0]})),
+    ]
+    with pytest.raises(ValidationError, match="Duplicate runner_id '2.0' found in both event 'full'"):
+        assert_unique_runner_ids(frames)
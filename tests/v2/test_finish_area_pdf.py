@@ -3,14 +3,22 @@
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
+from app import finish_area_pdf
 from app.finish_area_pdf import (
     expected_runners_for_day,
     generate_finish_area_demand_pdf,
+    render_finish_area_pdfs,
     _operational_tier,
 )
 
 
+@pytest.fixture(autouse=True)
+def image_cache_dir(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("RUNFLOW_IMAGE_CACHE_DIR", str(tmp_path / "images"))
+
+
 def test_operational_tier_thresholds():
     assert _operational_tier(0, 100) == "—"
     assert _operational_tier(90, 100) == "Peak / surge"
@@ -56,3 +64,69 @@ def test_generate_finish_area_demand_pdf_writes_file(tmp_path: Path):
     assert ok is True
     assert pdf_path.is_file()
     assert pdf_path.stat().st_size > 500
+
+
+def _write_finish_times(csv_path: Path, counts) -> None:
+    starts = [f"08:{20 * i:02d}:00" for i in range(len(counts))]
+    ends = [f"08:{20 * i + 19:02d}:59" for i in range(len(counts))]
+    pd.DataFrame(
+        {
+            "day": "sat",
+            "time_window_start": starts,
+            "time_window_end": ends,
+            "event": "all",
+            "count": counts,
+        }
+    ).to_csv(csv_path, index=False)
+
+
+def test_unchanged_chart_is_reused_from_image_cache(tmp_path: Path, monkeypatch):
+    csv_path = tmp_path / "finish_times.csv"
+    _write_finish_times(csv_path, [4, 9])
+    kwargs = dict(finish_times_csv=csv_path, day_display_name="Saturday", run_id="r1")
+    assert generate_finish_area_demand_pdf(output_pdf=tmp_path / "a.pdf", **kwargs)
+
+    def _no_render(labels, counts):
+        raise AssertionError("chart re-rendered")
+
+    monkeypatch.setattr(finish_area_pdf, "_build_charts_png", _no_render)
+    assert generate_finish_area_demand_pdf(output_pdf=tmp_path / "b.pdf", **kwargs)
+    assert len(list((tmp_path / "images").glob("*/*.png"))) == 1
+
+
+def test_render_finish_area_pdfs_keeps_job_order(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("RUNFLOW_IMAGE_CACHE_MAX_MB", "0")
+    jobs = []
+    for name, counts in (("sat", [3, 5]), ("sun", []), ("mon", [7])):
+        csv_path = tmp_path / f"{name}.csv"
+        _write_finish_times(csv_path, counts)
+        jobs.append(
+            dict(
+                finish_times_csv=csv_path,
+                output_pdf=tmp_path / f"{name}.pdf",
+                day_display_name=name,
+                run_id="r1",
+            )
+        )
+    jobs.append({**jobs[0], "finish_times_csv": None})  # raises; logged as a failure
+    monkeypatch.setattr(finish_area_pdf, "PARALLEL_MIN_PDFS", 2)  # sat and mon go to the pool
+
+    assert render_finish_area_pdfs(jobs, max_workers=2) == [True, False, True, False]
+    assert (tmp_path / "sat.pdf").is_file() and not (tmp_path / "sun.pdf").exists()
+
+
+def test_unchanged_inputs_keep_the_existing_pdf(tmp_path: Path, monkeypatch):
+    csv_path = tmp_path / "finish_times.csv"
+    pdf_path = tmp_path / "finish_area_demand.pdf"
+    _write_finish_times(csv_path, [4, 9])
+    kwargs = dict(finish_times_csv=csv_path, output_pdf=pdf_path, day_display_name="Saturday")
+    assert generate_finish_area_demand_pdf(run_id="r1", **kwargs)
+    first = pdf_path.read_bytes()
+
+    builds = []
+    monkeypatch.setattr(finish_area_pdf.SimpleDocTemplate, "build", lambda self, story: builds.append(1))
+    assert generate_finish_area_demand_pdf(run_id="r1", **kwargs)
+    assert builds == [] and pdf_path.read_bytes() == first
+
+    assert generate_finish_area_demand_pdf(run_id="r2", **kwargs)
+    assert builds == [1]